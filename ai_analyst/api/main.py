@@ -1452,8 +1452,12 @@ async def get_metrics(request: Request):
     cost, latency, analyst agreement, decision distribution, and recent runs.
 
     Obs P2: additively includes feeder_status for cross-lane visibility.
+    Also reports the hot package cache's and the PriceStore adapter's
+    hit/miss counters.
     """
     from dataclasses import asdict
+    from market_data_officer.feed.hot_cache import HOT_PACKAGE_CACHE
+    from market_data_officer.officer.pricestore import PRICESTORE
     snapshot = metrics_store.snapshot()
 
     # Obs P2: additive feeder status
@@ -1475,6 +1479,8 @@ async def get_metrics(request: Request):
         "server_started_at": metrics_store.started_at,
         "metrics": asdict(snapshot),
         "feeder_status": feeder_status,
+        "hot_package_cache": HOT_PACKAGE_CACHE.stats(),
+        "pricestore": PRICESTORE.stats(),
     })
 
 
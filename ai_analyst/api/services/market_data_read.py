@@ -4,7 +4,8 @@ Reads stored OHLCV CSV data from MDO's hot package layer and projects it
 into frontend-ready Candle format. No writes, no fetches, no scheduler.
 
 Import boundary:
-  ALLOWED: loader (load_timeframe, load_manifest), instrument_registry, feed.config
+  ALLOWED: loader (load_timeframe, load_manifest), officer.serialize,
+           instrument_registry, feed.config
   FORBIDDEN: structural engine, scheduler, pipeline, fetch code
 
 Spec: docs/specs/PR_CHART_1_SPEC.md §6.3
@@ -13,14 +14,17 @@ Spec: docs/specs/PR_CHART_1_SPEC.md §6.3
 from __future__ import annotations
 
 import logging
-import math
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Literal
 
+import numpy as np
+import pandas as pd
+
 from market_data_officer.feed.config import PACKAGES_DIR
 from market_data_officer.instrument_registry import INSTRUMENT_REGISTRY
 from market_data_officer.officer.loader import load_manifest, load_timeframe
+from market_data_officer.officer.serialize import OHLCV_FIELDS, epoch_seconds, valid_ohlcv_mask
 
 from ai_analyst.api.models.market_data import Candle, OHLCVResponse
 
@@ -76,19 +80,31 @@ def discover_timeframes(instrument: str) -> list[str]:
         ) from exc
 
 
-def _is_valid_candle_row(row: dict) -> bool:
-    """Check if a row dict has valid OHLCV numeric values."""
-    for field in ("open", "high", "low", "close", "volume"):
-        val = row.get(field)
-        if val is None:
-            return False
-        try:
-            f = float(val)
-            if math.isnan(f) or math.isinf(f):
-                return False
-        except (TypeError, ValueError):
-            return False
-    return True
+def _tail_candles(df: pd.DataFrame, limit: int) -> tuple[list[Candle], int]:
+    """The last ``limit`` well-formed candles, oldest first, and the well-formed row count.
+
+    Rows with a missing timestamp or a non-numeric / non-finite OHLCV field
+    are dropped. Validity is checked column-wise over the whole frame (it
+    feeds data_state); only the tail is turned into Candle objects.
+    """
+    if df.empty or not isinstance(df.index, pd.DatetimeIndex):
+        return [], 0
+
+    positions = np.flatnonzero(valid_ohlcv_mask(df) & ~df.index.isna())
+    valid_rows = len(positions)
+    epochs = epoch_seconds(df.index[positions])
+    if not df.index.is_monotonic_increasing:
+        order = np.argsort(epochs, kind="stable")
+        positions, epochs = positions[order], epochs[order]
+    positions, epochs = positions[-limit:], epochs[-limit:]
+
+    tail = df.iloc[positions]
+    values = [pd.to_numeric(tail[field]).to_numpy(dtype=np.float64).tolist() for field in OHLCV_FIELDS]
+    candles = [
+        Candle(timestamp=epoch, open=o, high=h, low=lo, close=c, volume=v)
+        for epoch, o, h, lo, c, v in zip(epochs.tolist(), *values)
+    ]
+    return candles, valid_rows
 
 
 def _derive_data_state(
@@ -147,7 +163,6 @@ def read_ohlcv(
         # Empty CSV files cause pandas/loader errors — treat as empty store
         csv_path = pkg_dir / f"{instrument}_{timeframe}_latest.csv"
         if csv_path.exists():
-            import pandas as pd
             try:
                 raw = pd.read_csv(csv_path)
                 if raw.empty:
@@ -178,32 +193,10 @@ def read_ohlcv(
     except FileNotFoundError:
         manifest_found = False
 
-    # Project DataFrame rows to Candle shape, dropping malformed rows
-    candles: list[Candle] = []
-    for ts, row in df.iterrows():
-        row_dict = row.to_dict()
-        if not _is_valid_candle_row(row_dict):
-            continue
-        try:
-            epoch = int(ts.timestamp())
-        except (AttributeError, OSError, ValueError):
-            continue
-        candles.append(Candle(
-            timestamp=epoch,
-            open=float(row_dict["open"]),
-            high=float(row_dict["high"]),
-            low=float(row_dict["low"]),
-            close=float(row_dict["close"]),
-            volume=float(row_dict["volume"]),
-        ))
-
-    valid_rows = len(candles)
+    # Project the tail to Candle shape, dropping malformed rows
+    candles, valid_rows = _tail_candles(df, limit)
     data_state = _derive_data_state(total_source_rows, valid_rows, manifest_found)
 
-    # Sort ascending by timestamp (oldest first) and take tail N
-    candles.sort(key=lambda c: c.timestamp)
-    candles = candles[-limit:]
-
     now_utc = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
     return OHLCVResponse(
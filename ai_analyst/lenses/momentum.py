@@ -17,6 +17,8 @@ Output schema — all fields always present, null where unavailable:
 
 import numpy as np
 
+from market_data_officer.indicators import indicators, sma
+
 from .base import LensBase
 
 # ── Field value contracts ───────────────────────────────────────────────────
@@ -48,7 +50,7 @@ class MomentumLens(LensBase):
             )
 
         # 1. Compute ROC series
-        roc_series = self._compute_roc_series(closes, roc_lookback)
+        roc_series = indicators(price_data).roc(roc_lookback)[roc_lookback:] * 100
 
         # 2. Smooth ROC
         smoothed = self._sma(roc_series, smoothing)
@@ -158,27 +160,13 @@ class MomentumLens(LensBase):
 
     # ── Private computation methods ─────────────────────────────────────────
 
-    @staticmethod
-    def _compute_roc_series(closes: np.ndarray, lookback: int) -> np.ndarray:
-        """Compute ROC series: (close[i] - close[i-lookback]) / close[i-lookback] * 100."""
-        roc = np.empty(len(closes) - lookback, dtype=np.float64)
-        for i in range(lookback, len(closes)):
-            past = closes[i - lookback]
-            if past == 0:
-                roc[i - lookback] = 0.0
-            else:
-                roc[i - lookback] = (closes[i] - past) / past * 100
-        return roc
-
     @staticmethod
     def _sma(data: np.ndarray, period: int) -> np.ndarray:
         """Simple moving average."""
         if len(data) < period:
             return data.copy()
-        kernel = np.ones(period) / period
-        # Use valid convolution to avoid edge effects
-        smoothed = np.convolve(data, kernel, mode="valid")
-        return smoothed
+        # Only complete windows, to avoid edge effects
+        return sma(data, period)[period - 1:]
 
     @staticmethod
     def _classify_direction(smoothed_roc: float) -> str:
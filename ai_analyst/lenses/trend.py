@@ -17,6 +17,8 @@ Output schema — all fields always present, null where unavailable:
 
 import numpy as np
 
+from market_data_officer.indicators import indicators
+
 from .base import LensBase
 
 # ── Field value contracts ───────────────────────────────────────────────────
@@ -50,8 +52,8 @@ class TrendLens(LensBase):
             )
 
         # 1. Compute EMAs
-        ema_fast = self._ema(closes, ema_fast_period)
-        ema_slow = self._ema(closes, ema_slow_period)
+        ema_fast = indicators(price_data).ema(ema_fast_period)
+        ema_slow = indicators(price_data).ema(ema_slow_period)
 
         current_close = float(closes[-1])
         current_fast = float(ema_fast[-1])
@@ -151,16 +153,6 @@ class TrendLens(LensBase):
 
     # ── Private computation methods ─────────────────────────────────────────
 
-    @staticmethod
-    def _ema(data: np.ndarray, period: int) -> np.ndarray:
-        """Compute exponential moving average."""
-        alpha = 2.0 / (period + 1)
-        ema = np.empty_like(data, dtype=np.float64)
-        ema[0] = data[0]
-        for i in range(1, len(data)):
-            ema[i] = alpha * data[i] + (1 - alpha) * ema[i - 1]
-        return ema
-
     @staticmethod
     def _classify_alignment(fast: float, slow: float) -> str:
         """Fast > slow = bullish, fast < slow = bearish, ~equal = neutral."""
@@ -19,6 +19,7 @@ if str(_REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT))
 
 from ai_analyst.lenses.structure import StructureLens
+from market_data_officer.indicators import wilder_atr
 from autotune.shims.structure_shim import AutoTuneStructureLens
 from autotune import data_loader
 
@@ -57,28 +58,7 @@ def compute_atr(highs: np.ndarray, lows: np.ndarray, closes: np.ndarray,
     ATR[period-1] = simple mean of TR[0..period-1].
     ATR[i] for i >= period = ((ATR[i-1] * (period-1)) + TR[i]) / period
     """
-    n = len(highs)
-    tr = np.empty(n, dtype=np.float64)
-    tr[0] = highs[0] - lows[0]  # No previous close for first bar
-    for i in range(1, n):
-        tr[i] = max(
-            highs[i] - lows[i],
-            abs(highs[i] - closes[i - 1]),
-            abs(lows[i] - closes[i - 1]),
-        )
-
-    atr = np.full(n, np.nan, dtype=np.float64)
-    if n < period:
-        return atr
-
-    # Initial ATR: simple mean of first `period` TRs
-    atr[period - 1] = np.mean(tr[:period])
-
-    # Wilder's smoothing
-    for i in range(period, n):
-        atr[i] = ((atr[i - 1] * (period - 1)) + tr[i]) / period
-
-    return atr
+    return wilder_atr(highs, lows, closes, period)
 
 
 def classify_outcome(
@@ -0,0 +1,6 @@
+"""Offline performance benchmarks for the Structure Engine.
+
+synthetic.py generates deterministic OHLCV series; structure_bench.py times
+the structure modules over them and compares runs against a baseline.
+Entry point: run_benchmarks.py.
+"""
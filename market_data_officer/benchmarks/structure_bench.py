@@ -0,0 +1,216 @@
+"""Time the Structure Engine stages over synthetic bars and gate regressions.
+
+Every (scenario, size) gets one synthetic 15m series; each stage is then
+timed on its own, with its inputs (swings, events) computed once outside
+the timer and copied fresh for every run. Results are plain JSON:
+
+    {"format": "structure-bench/1", "created_utc": ..., "environment": {...},
+     "repeat": 3, "seed": 0,
+     "results": [{"scenario": "trending", "bars": 1000,
+                  "function": "detect_swings", "seconds": 0.0012}, ...]}
+
+``seconds`` is the best of ``repeat`` runs. compare_results matches a run
+against a baseline file entry by entry and reports every function that got
+slower by more than the threshold. Nothing here touches the network or the
+hot packages.
+"""
+
+import copy
+import gc
+import json
+import os
+import platform
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from market_data_officer.structure.config import StructureConfig
+from market_data_officer.structure.engine import compute_structure_packet
+from market_data_officer.structure.events import detect_events, update_swing_statuses
+from market_data_officer.structure.imbalance import process_imbalance
+from market_data_officer.structure.liquidity import detect_liquidity
+from market_data_officer.structure.regime import compute_regime
+from market_data_officer.structure.swings import detect_swings
+
+from .synthetic import SCENARIOS
+
+BENCH_FORMAT = "structure-bench/1"
+OUTPUT_PATH = Path("market_data_officer/benchmarks/output/structure_bench.json")
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+FUNCTIONS = (
+    "detect_swings",
+    "detect_events",
+    "detect_liquidity",
+    "process_imbalance",
+    "compute_regime",
+    "compute_structure_packet",
+)
+
+INSTRUMENT = "EURUSD"
+TIMEFRAME = "15m"
+FREQ = "15min"
+
+# Differences below this are timer noise, whatever the ratio
+MIN_REGRESSION_SECONDS = 0.002
+
+
+@dataclass
+class Regression:
+    """A function that got slower than the baseline allows."""
+
+    scenario: str
+    bars: int
+    function: str
+    baseline_s: float
+    current_s: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_s / self.baseline_s
+
+    def __str__(self) -> str:
+        return (f"{self.function} [{self.scenario}, {self.bars} bars]: "
+                f"{self.baseline_s * 1000:.2f}ms -> {self.current_s * 1000:.2f}ms "
+                f"({self.ratio:.2f}x)")
+
+
+def _copies(objects: list) -> list:
+    # Stages only reassign fields (e.g. swing status), so a shallow copy per object is enough
+    return [copy.copy(o) for o in objects]
+
+
+def _stage_calls(bars: pd.DataFrame, config: StructureConfig) -> Dict[str, Callable[[], Callable[[], object]]]:
+    """Per function, a setup that returns a zero-argument call with fresh inputs."""
+    swings = detect_swings(bars, config, timeframe=TIMEFRAME)
+    events = detect_events(bars, _copies(swings), config, timeframe=TIMEFRAME)
+    marked = _copies(swings)
+    update_swing_statuses(marked, events)
+
+    return {
+        "detect_swings": lambda: partial(detect_swings, bars, config, timeframe=TIMEFRAME),
+        "detect_events": lambda: partial(
+            detect_events, bars, _copies(swings), config, timeframe=TIMEFRAME,
+        ),
+        "detect_liquidity": lambda: partial(
+            detect_liquidity, bars, _copies(marked), config,
+            timeframe=TIMEFRAME, instrument=INSTRUMENT,
+        ),
+        "process_imbalance": lambda: partial(
+            process_imbalance, bars, config, instrument=INSTRUMENT, timeframe=TIMEFRAME,
+        ),
+        "compute_regime": lambda: partial(compute_regime, _copies(marked), _copies(events)),
+        "compute_structure_packet": lambda: partial(
+            compute_structure_packet, INSTRUMENT, TIMEFRAME, config, bars=bars,
+        ),
+    }
+
+
+def _best_of(setup: Callable[[], Callable[[], object]], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        call = setup()
+        gc.collect()
+        t0 = time.perf_counter()
+        call()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def run_benchmarks(
+    scenarios: Sequence[str] = tuple(SCENARIOS),
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    functions: Sequence[str] = FUNCTIONS,
+    repeat: int = 3,
+    seed: int = 0,
+    config: Optional[StructureConfig] = None,
+    progress: Optional[Callable[[str], None]] = print,
+) -> dict:
+    """Time ``functions`` on every scenario at every size.
+
+    Raises:
+        ValueError: For an unknown scenario or function name.
+    """
+    unknown = (set(scenarios) - set(SCENARIOS)) | (set(functions) - set(FUNCTIONS))
+    if unknown:
+        raise ValueError(f"Unknown scenario/function: {sorted(unknown)}")
+    config = config or StructureConfig(timeframes=[TIMEFRAME])
+
+    results = []
+    for scenario in scenarios:
+        for size in sizes:
+            bars = SCENARIOS[scenario](size, seed=seed, freq=FREQ)
+            calls = _stage_calls(bars, config)
+            for function in functions:
+                seconds = _best_of(calls[function], repeat)
+                results.append({"scenario": scenario, "bars": size,
+                                "function": function, "seconds": seconds})
+                if progress:
+                    progress(f"  {scenario:<9} {size:>9,} bars  {function:<25} {seconds * 1000:10.2f}ms")
+
+    return {
+        "format": BENCH_FORMAT,
+        "created_utc": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "repeat": repeat,
+        "seed": seed,
+        "results": results,
+    }
+
+
+def write_results(results: dict, path: Path = OUTPUT_PATH) -> None:
+    """Write a results dict as JSON, atomically."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(results, indent=2))
+    os.replace(tmp, path)
+
+
+def load_results(path: Path) -> dict:
+    """Read a results file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        ValueError: If it is not a structure benchmark results file.
+    """
+    with open(path, encoding="utf-8") as f:
+        results = json.load(f)
+    if not isinstance(results, dict) or results.get("format") != BENCH_FORMAT:
+        raise ValueError(f"Not a {BENCH_FORMAT} results file: {path}")
+    return results
+
+
+def compare_results(
+    current: dict,
+    baseline: dict,
+    threshold: float = 0.25,
+    min_seconds: float = MIN_REGRESSION_SECONDS,
+) -> List[Regression]:
+    """Entries of ``current`` slower than ``baseline`` by more than ``threshold``.
+
+    A regression must also exceed the baseline by ``min_seconds``. Entries
+    missing from either side are not compared.
+    """
+    base = {(r["scenario"], r["bars"], r["function"]): r["seconds"] for r in baseline["results"]}
+    regressions = []
+    for r in current["results"]:
+        before = base.get((r["scenario"], r["bars"], r["function"]))
+        if before is None:
+            continue
+        after = r["seconds"]
+        if after > before * (1 + threshold) and after - before > min_seconds:
+            regressions.append(Regression(r["scenario"], r["bars"], r["function"], before, after))
+    return regressions
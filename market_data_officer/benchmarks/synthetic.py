@@ -0,0 +1,110 @@
+"""Deterministic synthetic OHLCV series for benchmarks.
+
+Each generator returns ``n`` bars at ``freq`` as a UTC-indexed OHLCV frame
+(index "timestamp_utc") that passes feed.validate.validate_ohlcv. The same
+(n, seed, freq) always gives the same bars.
+
+    trending   random walk with a drift that flips every few hundred bars
+    ranging    driftless walk reflected off the edges of a fixed band
+    gappy      trending, with runs of missing bars and price jumps across them
+    weekend    trending on an FX calendar (Sun 21:00 - Fri 21:00 UTC), with
+               a weekend gap at every Sunday open
+"""
+
+from typing import Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+START = pd.Timestamp("2020-01-05 21:00", tz="UTC")  # a Sunday, FX week open
+BASE_PRICE = 1.085
+BAR_VOLATILITY = 0.0006
+
+
+def _bars_from_closes(close: np.ndarray, index: pd.DatetimeIndex, rng: np.random.Generator,
+                      open_: np.ndarray = None) -> pd.DataFrame:
+    n = len(close)
+    if open_ is None:
+        open_ = np.concatenate(([close[0]], close[:-1]))
+    wick = rng.exponential(BAR_VOLATILITY * 0.6, size=(2, n))
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + wick[0],
+            "low": np.minimum(open_, close) - wick[1],
+            "close": close,
+            "volume": rng.uniform(100, 5000, n).round(),
+        },
+        index=index.rename("timestamp_utc"),
+    )
+
+
+def _drifting_steps(n: int, rng: np.random.Generator) -> np.ndarray:
+    """Log returns with a drift whose sign flips every ``regime_len`` bars."""
+    regime_len = 400
+    drift = rng.choice([-1.0, 1.0], size=n // regime_len + 1).repeat(regime_len)[:n]
+    return drift * BAR_VOLATILITY * 0.15 + rng.normal(0, BAR_VOLATILITY, n)
+
+
+def trending(n: int, seed: int = 0, freq: str = "15min") -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = BASE_PRICE * np.exp(np.cumsum(_drifting_steps(n, rng)))
+    return _bars_from_closes(close, pd.date_range(START, periods=n, freq=freq), rng)
+
+
+def ranging(n: int, seed: int = 0, freq: str = "15min") -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    # Reflect a driftless walk off the edges of the band (a triangle-wave fold)
+    band = BAR_VOLATILITY * 60
+    walk = np.cumsum(rng.normal(0, BAR_VOLATILITY, n)) + band / 2
+    close = BASE_PRICE - band / 2 + band - np.abs(np.mod(walk, 2 * band) - band)
+    return _bars_from_closes(close, pd.date_range(START, periods=n, freq=freq), rng)
+
+
+def gappy(n: int, seed: int = 0, freq: str = "15min") -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    # Lay out ~1.3n slots and drop runs of 1-40 bars starting at ~2% of them
+    slots = int(n * 1.3) + 64
+    starts = np.flatnonzero(rng.random(slots) < 0.02)
+    dropped = np.zeros(slots + 41, dtype=np.int64)
+    np.add.at(dropped, starts, 1)
+    np.add.at(dropped, starts + rng.integers(1, 40, len(starts)), -1)
+    positions = np.flatnonzero(np.cumsum(dropped)[:slots] == 0)[:n]
+    if len(positions) < n:
+        positions = np.concatenate((positions, np.arange(slots, slots + n - len(positions))))
+
+    steps = _drifting_steps(n, rng)
+    jump = np.diff(positions, prepend=positions[0] - 1) > 1
+    steps[jump] += rng.normal(0, BAR_VOLATILITY * 8, jump.sum())
+    close = BASE_PRICE * np.exp(np.cumsum(steps))
+    index = pd.DatetimeIndex(START + pd.to_timedelta(positions * pd.to_timedelta(freq).value))
+    return _bars_from_closes(close, index, rng)
+
+
+def weekend(n: int, seed: int = 0, freq: str = "15min") -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    week = pd.Timedelta(days=7)
+    open_span = pd.Timedelta(days=5)  # Sun 21:00 -> Fri 21:00
+    per_week = int(open_span / pd.to_timedelta(freq))
+    weeks = -(-n // per_week)
+    offsets = (np.arange(weeks)[:, None] * week.value
+               + np.arange(per_week)[None, :] * pd.to_timedelta(freq).value).ravel()[:n]
+    index = pd.DatetimeIndex(START + pd.to_timedelta(offsets))
+
+    steps = _drifting_steps(n, rng)
+    sunday_open = np.arange(n) % per_week == 0
+    sunday_open[0] = False
+    steps[sunday_open] += rng.normal(0, BAR_VOLATILITY * 15, sunday_open.sum())
+    close = BASE_PRICE * np.exp(np.cumsum(steps))
+    # The Sunday bar opens at the gap, away from Friday's close
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    open_[sunday_open] = close[sunday_open] * (1 - rng.normal(0, BAR_VOLATILITY, sunday_open.sum()))
+    return _bars_from_closes(close, index, rng, open_=open_)
+
+
+SCENARIOS: Dict[str, Callable[..., pd.DataFrame]] = {
+    "trending": trending,
+    "ranging": ranging,
+    "gappy": gappy,
+    "weekend": weekend,
+}
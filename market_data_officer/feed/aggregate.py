@@ -1,7 +1,64 @@
 """Aggregation layer — converts tick-level data to 1-minute OHLCV bars."""
 
+from typing import Sequence, Union
+
+import numpy as np
 import pandas as pd
 
+from .decode import TickArrays
+
+_MINUTE_NS = 60_000_000_000
+
+
+def tick_arrays_to_1m_ohlcv(
+    ticks: Union[TickArrays, Sequence[TickArrays]],
+) -> pd.DataFrame:
+    """Aggregate decoded tick arrays into 1-minute OHLCV in a single pass.
+
+    Accepts one hour of TickArrays or a sequence of them (e.g. a whole day
+    of hours), which are concatenated and aggregated in one call. Minute
+    buckets come from integer division of the ns timestamps; open/close are
+    the first/last tick of each bucket and high/low/volume use ufunc
+    reduceat over the bucket starts. Only occupied minutes are emitted.
+
+    Output: DataFrame indexed by timestamp_utc with columns
+    [open, high, low, close, volume]. Returns empty DataFrame if no ticks.
+    """
+    if isinstance(ticks, TickArrays):
+        timestamp_ns, mid, volume = ticks.timestamp_ns, ticks.mid, ticks.volume
+    else:
+        if not ticks:
+            return pd.DataFrame()
+        timestamp_ns = np.concatenate([t.timestamp_ns for t in ticks])
+        mid = np.concatenate([t.mid for t in ticks])
+        volume = np.concatenate([t.volume for t in ticks])
+
+    if len(timestamp_ns) == 0:
+        return pd.DataFrame()
+
+    if np.any(timestamp_ns[1:] < timestamp_ns[:-1]):
+        order = np.argsort(timestamp_ns, kind="stable")
+        timestamp_ns, mid, volume = timestamp_ns[order], mid[order], volume[order]
+
+    bucket = timestamp_ns // _MINUTE_NS
+    starts = np.concatenate(([0], np.flatnonzero(bucket[1:] != bucket[:-1]) + 1))
+    ends = np.append(starts[1:], len(bucket)) - 1
+
+    index = pd.DatetimeIndex(
+        (bucket[starts] * _MINUTE_NS).view("datetime64[ns]"), name="timestamp_utc"
+    ).tz_localize("UTC")
+
+    return pd.DataFrame(
+        {
+            "open": mid[starts],
+            "high": np.maximum.reduceat(mid, starts),
+            "low": np.minimum.reduceat(mid, starts),
+            "close": mid[ends],
+            "volume": np.add.reduceat(volume, starts),
+        },
+        index=index,
+    )
+
 
 def ticks_to_1m_ohlcv(tick_df: pd.DataFrame) -> pd.DataFrame:
     """Aggregate a tick DataFrame (with mid and volume columns) into 1-minute OHLCV.
@@ -14,16 +71,15 @@ def ticks_to_1m_ohlcv(tick_df: pd.DataFrame) -> pd.DataFrame:
     if tick_df.empty:
         return pd.DataFrame()
 
-    ohlcv = tick_df["mid"].resample("1min").agg(
-        open="first",
-        high="max",
-        low="min",
-        close="last",
-    )
-
-    ohlcv["volume"] = tick_df["volume"].resample("1min").sum()
-
-    # Drop minutes with no ticks
-    ohlcv = ohlcv.dropna(subset=["open"])
+    index = tick_df.index
+    ohlcv = tick_arrays_to_1m_ohlcv(TickArrays(
+        timestamp_ns=index.as_unit("ns").asi8,
+        mid=tick_df["mid"].to_numpy(dtype=np.float64),
+        volume=tick_df["volume"].to_numpy(dtype=np.float64),
+    ))
 
+    # Keep the caller's index name and timezone, as resample did
+    ohlcv.index = ohlcv.index.tz_convert(index.tz) if index.tz is not None \
+        else ohlcv.index.tz_localize(None)
+    ohlcv.index.name = index.name
     return ohlcv
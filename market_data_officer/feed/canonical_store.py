@@ -0,0 +1,287 @@
+"""Partitioned canonical store — append-only bar history split by month or day.
+
+Layout under CANONICAL_DIR (1m) and DERIVED_DIR/<SYMBOL>/<tf> (derived):
+    <SYMBOL>/_meta.json                    watermark + per-partition summary
+    <SYMBOL>/<yyyy>/<mm>.parquet           partition="month" (default)
+    <SYMBOL>/<yyyy>/<mm>/<dd>.parquet      partition="day"
+
+The legacy single-file layout (``<SYMBOL>_<tf>.parquet``) is still readable
+and can be migrated in place with ``CanonicalStore.migrate_legacy``.
+
+Write policy:
+  - History is append-only: existing bars win on merge upstream, so a
+    partition only changes by gaining rows. ``write`` compares each
+    partition's row count and span with the metadata and rewrites only the
+    partitions that differ, plus any at or after ``dirty_from`` (derived
+    timeframes update their last, still-open bar in place).
+  - Partition files are written to a temp file and swapped in with
+    os.replace. The metadata file is replaced last and is the commit point:
+    readers only see partitions listed there and bars up to its watermark.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .config import CANONICAL_DIR, CANONICAL_PARTITION, DERIVED_DIR
+from .validate import validate_ohlcv
+
+META_FILENAME = "_meta.json"
+META_VERSION = 1
+PARTITION_SCHEMES = ("month", "day")
+
+
+def legacy_canonical_path(symbol: str, root: Optional[Path] = None, timeframe: str = "1m") -> Path:
+    """Path of the pre-partitioning single-file parquet for one timeframe."""
+    if root is None:
+        root = CANONICAL_DIR if timeframe == "1m" else DERIVED_DIR
+    return Path(root) / f"{symbol}_{timeframe}.parquet"
+
+
+def _read_parquet_utc(path: Path) -> pd.DataFrame:
+    df = pd.read_parquet(path)
+    df.index = pd.to_datetime(df.index, utc=True)
+    return df
+
+
+def _iso(ts: pd.Timestamp) -> str:
+    return ts.isoformat()
+
+
+class CanonicalStore:
+    """Partitioned bar store for one symbol and timeframe.
+
+    timeframe="1m" is the canonical history under CANONICAL_DIR/<SYMBOL>;
+    derived labels ("5m", "1h", ...) live under DERIVED_DIR/<SYMBOL>/<tf>.
+
+    Usage:
+        store = CanonicalStore("EURUSD")
+        store.watermark()               # last committed bar, from metadata only
+        df = store.read(since=ts)       # whole partitions reaching ts onwards
+        store.write(merged)             # rewrites only changed partitions
+    """
+
+    def __init__(
+        self,
+        symbol: str,
+        root: Optional[Path] = None,
+        partition: str = CANONICAL_PARTITION,
+        timeframe: str = "1m",
+    ) -> None:
+        if partition not in PARTITION_SCHEMES:
+            raise ValueError(f"Unknown partition scheme: {partition}. Available: {list(PARTITION_SCHEMES)}")
+        self.symbol = symbol
+        self.timeframe = timeframe
+        if timeframe == "1m":
+            self.root = Path(root) if root is not None else CANONICAL_DIR
+            self.dir = self.root / symbol
+            self.label = f"canonical_{symbol}_1m"
+        else:
+            self.root = Path(root) if root is not None else DERIVED_DIR
+            self.dir = self.root / symbol / timeframe
+            self.label = f"derived_{symbol}_{timeframe}"
+        self.meta_path = self.dir / META_FILENAME
+        self.legacy_path = legacy_canonical_path(symbol, self.root, timeframe)
+
+        meta = self.load_meta()
+        # An existing store keeps the scheme it was created with
+        self.partition = meta["partition"] if meta else partition
+
+    # ── Metadata ──────────────────────────────────────────────────────
+
+    def load_meta(self) -> Optional[Dict]:
+        """Read the store metadata, returning None if absent or unreadable."""
+        if not self.meta_path.exists():
+            return None
+        try:
+            meta = json.loads(self.meta_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if meta.get("version") != META_VERSION:
+            return None
+        return meta
+
+    def exists(self) -> bool:
+        return self.load_meta() is not None
+
+    def watermark(self) -> Optional[pd.Timestamp]:
+        """Timestamp of the last committed bar, without touching partition files."""
+        meta = self.load_meta()
+        if not meta or not meta.get("watermark_utc"):
+            return None
+        return pd.Timestamp(meta["watermark_utc"])
+
+    def _write_meta(self, partitions: Dict[str, Dict]) -> None:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        ordered = dict(sorted(partitions.items()))
+        firsts = [p["first_utc"] for p in ordered.values()]
+        lasts = [p["last_utc"] for p in ordered.values()]
+        meta = {
+            "version": META_VERSION,
+            "symbol": self.symbol,
+            "timeframe": self.timeframe,
+            "partition": self.partition,
+            "first_utc": min(firsts, key=pd.Timestamp) if firsts else None,
+            "watermark_utc": max(lasts, key=pd.Timestamp) if lasts else None,
+            "rows": sum(p["rows"] for p in ordered.values()),
+            "updated_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "partitions": ordered,
+        }
+        tmp = self.meta_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(meta, indent=1))
+        os.replace(tmp, self.meta_path)
+
+    # ── Partitioning ──────────────────────────────────────────────────
+
+    def partition_path(self, key: str) -> Path:
+        return self.dir / f"{key}.parquet"
+
+    def _partition_codes(self, index: pd.DatetimeIndex) -> np.ndarray:
+        codes = index.year.to_numpy() * 100 + index.month.to_numpy()
+        if self.partition == "day":
+            codes = codes * 100 + index.day.to_numpy()
+        return codes
+
+    def _code_to_key(self, code: int) -> str:
+        if self.partition == "day":
+            return f"{code // 10000:04d}/{code // 100 % 100:02d}/{code % 100:02d}"
+        return f"{code // 100:04d}/{code % 100:02d}"
+
+    def split(self, df: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """Split a frame into {partition key: rows}, in time order."""
+        if df.empty:
+            return {}
+        codes = self._partition_codes(df.index)
+        bounds = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+        starts = np.concatenate(([0], bounds))
+        ends = np.append(bounds, len(codes))
+        return {
+            self._code_to_key(int(codes[s])): df.iloc[s:e]
+            for s, e in zip(starts, ends)
+        }
+
+    # ── Read path ─────────────────────────────────────────────────────
+
+    def read(self, since: Optional[pd.Timestamp] = None) -> Optional[pd.DataFrame]:
+        """Return committed history as one DataFrame, or None if there is none.
+
+        With ``since``, only partitions holding bars at or after it are read.
+        Whole partitions are returned, so the frame starts on a partition
+        boundary and can be merged and written back. Falls back to the
+        legacy single file when the store has not been created yet.
+        """
+        meta = self.load_meta()
+        if meta is None:
+            if not self.legacy_path.exists():
+                return None
+            df = _read_parquet_utc(self.legacy_path)
+            if since is not None:
+                df = df[df.index >= since.floor("D")]
+            return df
+
+        watermark = pd.Timestamp(meta["watermark_utc"]) if meta.get("watermark_utc") else None
+        frames = [
+            _read_parquet_utc(self.partition_path(key))
+            for key, info in sorted(meta["partitions"].items())
+            if since is None or pd.Timestamp(info["last_utc"]) >= since
+        ]
+        if not frames:
+            return None
+        df = pd.concat(frames) if len(frames) > 1 else frames[0]
+        if watermark is not None:
+            # Rows written after the last metadata commit are not visible
+            df = df[df.index <= watermark]
+        return df
+
+    def tail(self, n: int) -> Optional[pd.DataFrame]:
+        """Last ``n`` committed bars, reading partitions newest-first until covered."""
+        meta = self.load_meta()
+        if meta is None:
+            df = self.read()
+            return df.tail(n) if df is not None else None
+
+        since = None
+        remaining = n
+        for key, info in sorted(meta["partitions"].items(), reverse=True):
+            since = pd.Timestamp(info["first_utc"])
+            remaining -= info["rows"]
+            if remaining <= 0:
+                break
+        df = self.read(since=since) if since is not None else None
+        return df.tail(n) if df is not None else None
+
+    # ── Write path ────────────────────────────────────────────────────
+
+    def write(self, df: pd.DataFrame, dirty_from: Optional[pd.Timestamp] = None) -> List[str]:
+        """Persist the partitions of ``df`` that differ from the store.
+
+        ``df`` may cover only the tail of history, but must hold whole
+        partitions (as returned by ``read``). Partitions absent from ``df``
+        are left untouched. Partitions holding bars at or after
+        ``dirty_from`` are rewritten even when their shape is unchanged.
+        Returns the keys that were rewritten.
+
+        Raises ValueError if a partition would lose rows.
+        """
+        meta = self.load_meta()
+        partitions: Dict[str, Dict] = dict(meta["partitions"]) if meta else {}
+
+        changed: List[str] = []
+        for key, part in self.split(df).items():
+            info = {
+                "rows": len(part),
+                "first_utc": _iso(part.index[0]),
+                "last_utc": _iso(part.index[-1]),
+            }
+            current = partitions.get(key)
+            dirty = dirty_from is not None and part.index[-1] >= dirty_from
+            if current == info and not dirty:
+                continue
+            if current is not None and info["rows"] < current["rows"]:
+                raise ValueError(
+                    f"[{self.label}] partition {key} would shrink from "
+                    f"{current['rows']} to {info['rows']} rows; the store is append-only"
+                )
+
+            validate_ohlcv(part, f"{self.label}_{key}")
+            path = self.partition_path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".parquet.tmp")
+            part.to_parquet(tmp, compression="zstd")
+            os.replace(tmp, path)
+            partitions[key] = info
+            changed.append(key)
+
+        if changed or meta is None:
+            self._write_meta(partitions)
+        return changed
+
+    def migrate_legacy(self, keep_legacy: bool = False) -> int:
+        """Split the legacy single-file parquet into partitions.
+
+        The legacy file (and a derived timeframe's CSV copy) is renamed to
+        ``*.migrated`` unless ``keep_legacy`` is set. Returns the number of
+        bars migrated.
+        """
+        if not self.legacy_path.exists():
+            return 0
+        df = _read_parquet_utc(self.legacy_path).sort_index()
+        df = df[~df.index.duplicated(keep="first")]
+        self.write(df)
+        if not keep_legacy:
+            os.replace(self.legacy_path, self.legacy_path.with_suffix(".parquet.migrated"))
+            csv_copy = self.legacy_path.with_suffix(".csv")
+            if csv_copy.exists():
+                os.replace(csv_copy, csv_copy.with_suffix(".csv.migrated"))
+        print(f"[canonical] migrated {self.legacy_path} → {self.dir} ({len(df)} bars)")
+        return len(df)
+
+
+def read_canonical(symbol: str, root: Optional[Path] = None) -> Optional[pd.DataFrame]:
+    """Compatibility reader: full canonical history from either layout."""
+    return CanonicalStore(symbol, root=root).read()
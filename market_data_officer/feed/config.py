@@ -1,6 +1,7 @@
 """Configuration and instrument metadata for the market data feed pipeline."""
 
 from pathlib import Path
+from typing import Optional
 
 from market_data_officer.instrument_registry import INSTRUMENT_REGISTRY, InstrumentMeta
 
@@ -61,6 +62,15 @@ DERIVED_DIR = DATA_ROOT / "derived"
 PACKAGES_DIR = DATA_ROOT / "packages" / "latest"
 REPORTS_DIR = DATA_ROOT / "reports"
 
+# Canonical 1m store partitioning (feed/canonical_store.py): "month" or "day".
+CANONICAL_PARTITION = "month"
+
+# Raw bi5 read-through cache (feed/raw_cache.py): hours that ended more than
+# this many hours ago are treated as immutable and served from disk.
+RAW_CACHE_IMMUTABLE_HOURS = 48
+# Per-symbol archive size cap for LRU eviction; None disables eviction.
+RAW_CACHE_MAX_BYTES: Optional[int] = None
+
 # Rolling tail window sizes for hot package export
 HOT_WINDOW_SIZES = {
     "1m": 3000,
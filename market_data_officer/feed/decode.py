@@ -1,15 +1,24 @@
 """Dukascopy bi5 tick decode layer — decompresses and parses tick structs."""
 
 import lzma
-import struct
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import datetime
 from typing import Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from .config import TICK_STRUCT_SIZE, InstrumentMeta
 
+# Zero-copy view of the 20-byte big-endian tick struct (>IIIff).
+TICK_DTYPE = np.dtype([
+    ("time_ms", ">u4"),
+    ("ask_raw", ">u4"),
+    ("bid_raw", ">u4"),
+    ("ask_vol", ">f4"),
+    ("bid_vol", ">f4"),
+])
+
 
 @dataclass
 class DecodeStats:
@@ -35,64 +44,96 @@ class DecodeStats:
 # InstrumentMeta — the struct format is universal but the semantics are not.
 
 
-def decode_dukascopy_ticks(
+@dataclass
+class TickArrays:
+    """Columnar decoded ticks for one hour, in payload order.
+
+    timestamp_ns is int64 nanoseconds since the UTC epoch; mid and volume
+    are float64. All three arrays have the same length.
+    """
+
+    timestamp_ns: np.ndarray
+    mid: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamp_ns)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Build the [mid, volume] tick DataFrame indexed by timestamp_utc."""
+        if len(self) == 0:
+            return pd.DataFrame()
+        index = pd.DatetimeIndex(
+            self.timestamp_ns.view("datetime64[ns]"), name="timestamp_utc"
+        ).tz_localize("UTC")
+        df = pd.DataFrame({"mid": self.mid, "volume": self.volume}, index=index)
+        if not index.is_monotonic_increasing:
+            df = df.sort_index(kind="stable")
+        return df
+
+
+def _empty_tick_arrays() -> TickArrays:
+    return TickArrays(
+        timestamp_ns=np.empty(0, dtype=np.int64),
+        mid=np.empty(0, dtype=np.float64),
+        volume=np.empty(0, dtype=np.float64),
+    )
+
+
+def decode_tick_arrays(
     raw_bytes: bytes,
     hour_start: datetime,
     meta: InstrumentMeta,
-) -> pd.DataFrame:
-    """Decode a Dukascopy bi5 payload into a tick DataFrame.
+) -> TickArrays:
+    """Decode a Dukascopy bi5 payload into columnar tick arrays.
 
-    Returns a DataFrame with columns [mid, volume] indexed by timestamp_utc.
-    Returns an empty DataFrame on corrupt or empty input.
+    The decompressed buffer is read zero-copy through TICK_DTYPE; any
+    trailing partial struct is ignored. Returns empty arrays on corrupt
+    or empty input.
     """
     if hour_start.tzinfo is None:
         raise ValueError("hour_start must be timezone-aware (UTC)")
 
     if not raw_bytes:
-        return pd.DataFrame()
+        return _empty_tick_arrays()
 
     try:
         decompressed = lzma.decompress(raw_bytes)
     except lzma.LZMAError:
         print(f"[decode] LZMA decompression failed for {meta.symbol} at {hour_start}")
-        return pd.DataFrame()
-
-    if len(decompressed) == 0:
-        return pd.DataFrame()
+        return _empty_tick_arrays()
 
     n_ticks = len(decompressed) // TICK_STRUCT_SIZE
     if n_ticks == 0:
-        return pd.DataFrame()
+        return _empty_tick_arrays()
 
-    ticks = []
-    for i in range(n_ticks):
-        offset = i * TICK_STRUCT_SIZE
-        chunk = decompressed[offset : offset + TICK_STRUCT_SIZE]
-        if len(chunk) < TICK_STRUCT_SIZE:
-            break
+    ticks = np.frombuffer(decompressed, dtype=TICK_DTYPE, count=n_ticks)
 
-        time_ms, ask_raw, bid_raw, ask_vol, bid_vol = struct.unpack(">IIIff", chunk)
+    hour_ns = pd.Timestamp(hour_start).as_unit("ns").value
+    timestamp_ns = hour_ns + ticks["time_ms"].astype(np.int64) * 1_000_000
 
-        ts = hour_start + timedelta(milliseconds=time_ms)
-        ask = ask_raw / meta.price_scale
-        bid = bid_raw / meta.price_scale
-        mid = (ask + bid) / 2.0
+    ask = ticks["ask_raw"].astype(np.float64) / meta.price_scale
+    bid = ticks["bid_raw"].astype(np.float64) / meta.price_scale
+    mid = (ask + bid) / 2.0
 
-        volume = ask_vol + bid_vol
-        if meta.volume_divisor is not None:
-            volume = volume / meta.volume_divisor
+    volume = ticks["ask_vol"].astype(np.float64) + ticks["bid_vol"].astype(np.float64)
+    if meta.volume_divisor is not None:
+        volume = volume / meta.volume_divisor
 
-        ticks.append({"timestamp_utc": ts, "mid": mid, "volume": volume})
+    return TickArrays(timestamp_ns=timestamp_ns, mid=mid, volume=volume)
 
-    if not ticks:
-        return pd.DataFrame()
 
-    df = pd.DataFrame(ticks)
-    df["timestamp_utc"] = pd.to_datetime(df["timestamp_utc"], utc=True)
-    df = df.set_index("timestamp_utc")
-    df = df.sort_index()
+def decode_dukascopy_ticks(
+    raw_bytes: bytes,
+    hour_start: datetime,
+    meta: InstrumentMeta,
+) -> pd.DataFrame:
+    """Decode a Dukascopy bi5 payload into a tick DataFrame.
 
-    return df
+    Returns a DataFrame with columns [mid, volume] indexed by timestamp_utc.
+    Returns an empty DataFrame on corrupt or empty input.
+    """
+    return decode_tick_arrays(raw_bytes, hour_start, meta).to_frame()
 
 
 def decode_with_diagnostics(
@@ -102,8 +143,8 @@ def decode_with_diagnostics(
 ) -> Tuple[pd.DataFrame, DecodeStats]:
     """Decode a bi5 payload and return both the tick DataFrame and decode stats.
 
-    Wraps decode_dukascopy_ticks, capturing price range, tick count, and
-    volume totals for the diagnostics layer.
+    Stats (price range, tick count, volume total) are taken directly from
+    the decoded arrays rather than from the DataFrame.
     """
     if not raw_bytes:
         return pd.DataFrame(), DecodeStats(
@@ -112,23 +153,28 @@ def decode_with_diagnostics(
         )
 
     try:
-        df = decode_dukascopy_ticks(raw_bytes, hour_start, meta)
+        arrays = decode_tick_arrays(raw_bytes, hour_start, meta)
     except Exception as exc:
         return pd.DataFrame(), DecodeStats(
             tick_count=0, price_min=None, price_max=None,
             volume_total=None, error=str(exc),
         )
 
-    if df.empty:
-        return df, DecodeStats(
+    return arrays.to_frame(), tick_stats(arrays)
+
+
+def tick_stats(arrays: TickArrays) -> DecodeStats:
+    """Compute DecodeStats for a successfully decoded set of tick arrays."""
+    if len(arrays) == 0:
+        return DecodeStats(
             tick_count=0, price_min=None, price_max=None,
             volume_total=None, error="",
         )
 
-    return df, DecodeStats(
-        tick_count=len(df),
-        price_min=float(df["mid"].min()),
-        price_max=float(df["mid"].max()),
-        volume_total=float(df["volume"].sum()),
+    return DecodeStats(
+        tick_count=len(arrays),
+        price_min=float(arrays.mid.min()),
+        price_max=float(arrays.mid.max()),
+        volume_total=float(arrays.volume.sum()),
         error="",
     )
@@ -12,6 +12,7 @@ from pathlib import Path
 from typing import Dict, List, Optional
 
 from .config import DATA_ROOT, RAW_DIR, REPORTS_DIR
+from .raw_cache import load_index
 
 
 @dataclass
@@ -26,6 +27,7 @@ class FetchRecord:
     fetch_utc: str  # ISO format, empty string if skipped
     cached_path: str  # relative path if saved to raw cache, empty string otherwise
     error: str  # empty string if no error
+    from_cache: bool = False  # True when served by the raw read-through cache
 
 
 @dataclass
@@ -41,6 +43,17 @@ class DecodeRecord:
     decode_error: str  # empty string if no error
 
 
+@dataclass
+class StageRecord:
+    """Per-hour stage timings captured by the staged pipeline (feed/staged.py)."""
+
+    hour_utc: str  # ISO format
+    fetch_s: Optional[float] = None  # fetch result wait on the writer thread
+    decode_s: Optional[float] = None  # decompress + decode + aggregate in the worker
+    queue_depth: Optional[int] = None  # decode jobs outstanding when this hour was queued
+    writer_wait_s: Optional[float] = None  # writer blocked on this hour's decode job
+
+
 @dataclass
 class HourDiagnostic:
     """Combined fetch + decode diagnostic for a single hour slot."""
@@ -48,6 +61,7 @@ class HourDiagnostic:
     hour_utc: str
     fetch: FetchRecord
     decode: Optional[DecodeRecord]
+    stage: Optional[StageRecord] = None
 
 
 class DiagnosticsCollector:
@@ -74,6 +88,7 @@ class DiagnosticsCollector:
         payload: bytes,
         cached_path: str = "",
         error: str = "",
+        from_cache: bool = False,
     ) -> None:
         """Record fetch metadata for one hour slot."""
         hour_key = hour_utc.isoformat()
@@ -88,6 +103,7 @@ class DiagnosticsCollector:
             fetch_utc=datetime.now(timezone.utc).isoformat(),
             cached_path=cached_path,
             error=error,
+            from_cache=from_cache,
         )
 
         if hour_key in self._hours:
@@ -154,6 +170,17 @@ class DiagnosticsCollector:
                 hour_utc=hour_key, fetch=dummy_fetch, decode=decode_rec
             )
 
+    def record_stage(self, hour_utc: datetime, **timings: Optional[float]) -> None:
+        """Merge staged-pipeline timings (see StageRecord) into one hour slot."""
+        hour_key = hour_utc.isoformat()
+        diag = self._hours.get(hour_key)
+        if diag is None:
+            return
+        if diag.stage is None:
+            diag.stage = StageRecord(hour_utc=hour_key)
+        for name, value in timings.items():
+            setattr(diag.stage, name, value)
+
     def build_report(self) -> Dict:
         """Build a JSON-serializable diagnostics report."""
         hours_sorted = sorted(self._hours.values(), key=lambda h: h.hour_utc)
@@ -165,6 +192,7 @@ class DiagnosticsCollector:
         errors = [h for h in hours_sorted if h.fetch.error and h.fetch.http_status == 0]
         empty_payloads = [h for h in fetched if h.fetch.payload_bytes == 0]
         with_ticks = [h for h in hours_sorted if h.decode and h.decode.tick_count > 0]
+        cache_hits = [h for h in hours_sorted if h.fetch.from_cache]
 
         total_bytes = sum(h.fetch.payload_bytes for h in hours_sorted)
         total_ticks = sum(h.decode.tick_count for h in hours_sorted if h.decode)
@@ -185,6 +213,7 @@ class DiagnosticsCollector:
                 "skipped_incremental": len(skipped),
                 "fetch_errors": len(errors),
                 "empty_payloads": len(empty_payloads),
+                "cache_hits": len(cache_hits),
                 "hours_with_ticks": len(with_ticks),
                 "total_payload_bytes": total_bytes,
                 "total_ticks_decoded": total_ticks,
@@ -194,6 +223,10 @@ class DiagnosticsCollector:
             "hours": [_hour_to_dict(h) for h in hours_sorted],
         }
 
+        stages = [h.stage for h in hours_sorted if h.stage is not None]
+        if stages:
+            report["summary"]["stages"] = _stage_summary(stages)
+
         return report
 
     def save_report(self, output_dir: Optional[Path] = None) -> Path:
@@ -213,14 +246,43 @@ def _hour_to_dict(h: HourDiagnostic) -> Dict:
     result = {"hour_utc": h.hour_utc, "fetch": asdict(h.fetch)}
     if h.decode is not None:
         result["decode"] = asdict(h.decode)
+    if h.stage is not None:
+        result["stage"] = asdict(h.stage)
     return result
 
 
+def _percentile(values: List[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * pct))], 6)
+
+
+def _stage_summary(stages: List[StageRecord]) -> Dict:
+    """Queue depth, latency percentiles and backpressure across staged hours."""
+    fetch_s = [s.fetch_s for s in stages if s.fetch_s is not None]
+    decode_s = [s.decode_s for s in stages if s.decode_s is not None]
+    depths = [s.queue_depth for s in stages if s.queue_depth is not None]
+    waits = [s.writer_wait_s for s in stages if s.writer_wait_s is not None]
+    return {
+        "hours_staged": len(stages),
+        "max_queue_depth": max(depths) if depths else 0,
+        "mean_queue_depth": round(sum(depths) / len(depths), 3) if depths else 0,
+        "fetch_s_p50": _percentile(fetch_s, 0.5),
+        "fetch_s_p95": _percentile(fetch_s, 0.95),
+        "decode_s_p50": _percentile(decode_s, 0.5),
+        "decode_s_p95": _percentile(decode_s, 0.95),
+        "backpressure_s_total": round(sum(waits), 6),
+    }
+
+
 def generate_cache_inventory(symbol: str, raw_dir: Optional[Path] = None) -> Dict:
     """Scan the raw bi5 cache directory and build an inventory report.
 
     Returns a JSON-serializable dict listing every cached file with its
-    size, along with summary statistics.
+    size, along with summary statistics. Hashes recorded in the raw cache
+    index are reused for files whose size still matches, so only
+    unindexed archives are re-read.
     """
     base = (raw_dir or RAW_DIR) / symbol
 
@@ -241,6 +303,12 @@ def generate_cache_inventory(symbol: str, raw_dir: Optional[Path] = None) -> Dic
     files: List[Dict] = []
     total_bytes = 0
     years_seen: set = set()
+    index = load_index(base)
+    indexed_hashes = {
+        entry.path: (entry.bytes, entry.sha256)
+        for entry in index.values() if not entry.is_negative
+    }
+    negative_entries = sum(1 for entry in index.values() if entry.is_negative)
 
     for bi5_path in sorted(base.rglob("*.bi5")):
         rel = bi5_path.relative_to(base)
@@ -252,7 +320,11 @@ def generate_cache_inventory(symbol: str, raw_dir: Optional[Path] = None) -> Dic
         year = parts[0] if len(parts) >= 1 else "?"
         years_seen.add(year)
 
-        content_hash = hashlib.sha256(bi5_path.read_bytes()).hexdigest()
+        indexed = indexed_hashes.get(rel.as_posix())
+        if indexed is not None and indexed[0] == size:
+            content_hash = indexed[1]
+        else:
+            content_hash = hashlib.sha256(bi5_path.read_bytes()).hexdigest()
 
         files.append({
             "path": str(rel),
@@ -269,6 +341,7 @@ def generate_cache_inventory(symbol: str, raw_dir: Optional[Path] = None) -> Dic
             "total_files": len(files),
             "total_bytes": total_bytes,
             "years": sorted(years_seen),
+            "negative_entries": negative_entries,
         },
         "files": files,
     }
@@ -1,6 +1,7 @@
-"""Export layer — writes hot package CSVs and JSON manifest."""
+"""Export layer — writes hot package CSVs, their binary twins and the JSON manifest."""
 
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Optional, Set
@@ -8,6 +9,7 @@ from typing import Dict, Optional, Set
 import pandas as pd
 
 from .config import HOT_WINDOW_SIZES, PACKAGES_DIR
+from .hot_package import HOT_BINARY_COLUMNS, HOT_BINARY_FORMAT, hot_binary_path, write_hot_binary
 from .validate import validate_ohlcv
 
 
@@ -21,6 +23,8 @@ def export_hot_packages(
 
     dataframes: mapping from timeframe label (e.g. "1m", "5m") to DataFrame.
     Only OHLCV columns are exported in the CSVs (no metadata columns).
+    Each CSV gets a memory-mappable binary twin (see hot_package), listed
+    under the window's "binary" key in the manifest.
     vendors: set of data vendor names used (e.g. {"dukascopy", "yfinance"}).
     """
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -42,13 +46,24 @@ def export_hot_packages(
         filepath = output_dir / filename
 
         validate_ohlcv(export_df, f"hot_{tf_label}")
-        export_df.to_csv(filepath)
+        tmp = filepath.with_suffix(".csv.tmp")
+        export_df.to_csv(tmp)
+        os.replace(tmp, filepath)
 
         windows_manifest[tf_label] = {
             "count": len(export_df),
             "file": filename,
         }
 
+        # Binary twin, written after the CSV so it is never the older file
+        if all(c in export_df.columns for c in HOT_BINARY_COLUMNS):
+            binary_path = hot_binary_path(output_dir, symbol, tf_label)
+            write_hot_binary(export_df, binary_path)
+            windows_manifest[tf_label]["binary"] = {
+                "file": binary_path.name,
+                "format": HOT_BINARY_FORMAT,
+            }
+
     # Write JSON manifest
     manifest = {
         "instrument": symbol,
@@ -59,5 +74,7 @@ def export_hot_packages(
     }
 
     manifest_path = output_dir / f"{symbol}_hot.json"
-    manifest_path.write_text(json.dumps(manifest, indent=2))
+    tmp = manifest_path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp, manifest_path)
     print(f"[export] wrote manifest: {manifest_path}")
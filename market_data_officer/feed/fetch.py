@@ -1,13 +1,18 @@
 """Dukascopy bi5 fetch layer — downloads hourly tick archives."""
 
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+from urllib.parse import urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .config import DUKASCOPY_BASE_URL, RAW_DIR
+from .raw_cache import Bi5Cache, raw_archive_relpath
 
 
 @dataclass
@@ -19,6 +24,7 @@ class FetchResult:
     http_status: int  # 0 = network error
     cached_path: str  # relative path if saved, empty string otherwise
     error: str  # empty string if no error
+    from_cache: bool = False  # True when served by the raw read-through cache
 
 # Dukascopy requires a browser-like User-Agent to avoid Cloudflare 403 blocks
 _HEADERS = {
@@ -27,6 +33,70 @@ _HEADERS = {
 }
 
 
+def make_session(pool_size: int = 10) -> requests.Session:
+    """Build a keep-alive session shared by every fetch in a pipeline run.
+
+    The connection pool is sized to the number of concurrent fetchers so
+    workers never block waiting for a free connection to the same host.
+    """
+    session = requests.Session()
+    session.headers.update(_HEADERS)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class HostRateLimiter:
+    """Thread-safe per-host request pacing.
+
+    Each host gets evenly spaced request slots at most ``max_per_second``
+    apart; callers sleep outside the lock until their slot arrives.
+    """
+
+    def __init__(self, max_per_second: float) -> None:
+        if max_per_second <= 0:
+            raise ValueError("max_per_second must be positive")
+        self._interval = 1.0 / max_per_second
+        self._next_slot: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, url: str) -> None:
+        """Block until the next request slot for the URL's host."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self._interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _http_get(
+    url: str,
+    timeout: int,
+    session: Optional[requests.Session],
+    rate_limiter: Optional[HostRateLimiter],
+) -> requests.Response:
+    """GET a bi5 URL, retrying once without SSL verification on SSLError.
+
+    Raises requests.RequestException if both attempts fail.
+    """
+    client = session if session is not None else requests
+    if rate_limiter is not None:
+        rate_limiter.wait(url)
+
+    try:
+        return client.get(url, timeout=timeout, headers=_HEADERS)
+    except requests.exceptions.SSLError:
+        # Fallback: retry without SSL verification (some environments have
+        # DNS/certificate mismatches with Cloudflare-fronted origins)
+        import urllib3
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+        return client.get(url, timeout=timeout, headers=_HEADERS, verify=False)
+
+
 def build_bi5_url(symbol: str, hour_dt: datetime) -> str:
     """Build the Dukascopy bi5 URL for a given symbol and hour.
 
@@ -40,53 +110,67 @@ def build_bi5_url(symbol: str, hour_dt: datetime) -> str:
     )
 
 
+def _save_raw_archive(
+    data: bytes, symbol: str, hour_dt: datetime, raw_dir: Optional[Path],
+) -> Path:
+    """Write a payload into the raw archive layout and return its path."""
+    file_path = (raw_dir or RAW_DIR) / symbol / raw_archive_relpath(hour_dt)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(data)
+    return file_path
+
+
 def fetch_bi5(
     symbol: str,
     hour_dt: datetime,
     save_raw: bool = False,
     raw_dir: Optional[Path] = None,
     timeout: int = 30,
+    session: Optional[requests.Session] = None,
+    rate_limiter: Optional[HostRateLimiter] = None,
+    cache: Optional[Bi5Cache] = None,
 ) -> bytes:
     """Fetch a bi5 tick archive for the given symbol and hour.
 
     Returns raw bytes on success, empty bytes on HTTP error or empty response.
     Never raises on network/HTTP errors — returns b"" instead.
+
+    Pass a shared ``session`` (see make_session) to reuse connections across
+    hours, and a ``rate_limiter`` to pace requests per host. With a ``cache``
+    (see raw_cache.Bi5Cache) immutable hours are served from disk and every
+    network outcome is recorded back into it.
     """
     if hour_dt.tzinfo is None:
         raise ValueError("hour_dt must be timezone-aware (UTC)")
 
+    if cache is not None:
+        hit = cache.lookup(symbol, hour_dt)
+        if hit is not None:
+            return hit.data
+
     url = build_bi5_url(symbol, hour_dt)
 
     try:
-        resp = requests.get(url, timeout=timeout, headers=_HEADERS)
-    except requests.exceptions.SSLError:
-        # Fallback: retry without SSL verification (some environments have
-        # DNS/certificate mismatches with Cloudflare-fronted origins)
-        try:
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            resp = requests.get(url, timeout=timeout, headers=_HEADERS, verify=False)
-        except requests.RequestException as exc:
-            print(f"[fetch] network error for {url}: {exc}")
-            return b""
+        resp = _http_get(url, timeout, session, rate_limiter)
     except requests.RequestException as exc:
         print(f"[fetch] network error for {url}: {exc}")
         return b""
 
     if resp.status_code == 404 or resp.status_code >= 400:
+        if cache is not None:
+            cache.store(symbol, hour_dt, b"", resp.status_code, f"http_{resp.status_code}")
         return b""
 
     data = resp.content
     if not data:
+        if cache is not None:
+            cache.store(symbol, hour_dt, b"", resp.status_code, "empty_response")
         return b""
 
-    if save_raw:
-        out_dir = (raw_dir or RAW_DIR) / symbol
-        month_zero = hour_dt.month - 1
-        file_dir = out_dir / str(hour_dt.year) / f"{month_zero:02d}" / f"{hour_dt.day:02d}"
-        file_dir.mkdir(parents=True, exist_ok=True)
-        file_path = file_dir / f"{hour_dt.hour:02d}h_ticks.bi5"
-        file_path.write_bytes(data)
+    if cache is not None:
+        cache.store(symbol, hour_dt, data, resp.status_code)
+    elif save_raw:
+        _save_raw_archive(data, symbol, hour_dt, raw_dir)
 
     return data
 
@@ -97,11 +181,15 @@ def fetch_bi5_detailed(
     save_raw: bool = False,
     raw_dir: Optional[Path] = None,
     timeout: int = 30,
+    session: Optional[requests.Session] = None,
+    rate_limiter: Optional[HostRateLimiter] = None,
+    cache: Optional[Bi5Cache] = None,
 ) -> FetchResult:
     """Fetch a bi5 tick archive with full diagnostic metadata.
 
     Like fetch_bi5 but returns a FetchResult with HTTP status, URL,
-    cached path, and error info for the diagnostics layer.
+    cached path, and error info for the diagnostics layer. Cache hits
+    replay the recorded status/error and set from_cache=True.
     """
     if hour_dt.tzinfo is None:
         raise ValueError("hour_dt must be timezone-aware (UTC)")
@@ -109,18 +197,17 @@ def fetch_bi5_detailed(
     url = build_bi5_url(symbol, hour_dt)
     cached_path = ""
 
-    try:
-        resp = requests.get(url, timeout=timeout, headers=_HEADERS)
-    except requests.exceptions.SSLError:
-        try:
-            import urllib3
-            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-            resp = requests.get(url, timeout=timeout, headers=_HEADERS, verify=False)
-        except requests.RequestException as exc:
+    if cache is not None:
+        hit = cache.lookup(symbol, hour_dt)
+        if hit is not None:
             return FetchResult(
-                data=b"", url=url, http_status=0,
-                cached_path="", error=f"network_error:{exc}",
+                data=hit.data, url=url, http_status=hit.entry.http_status,
+                cached_path=str(hit.path) if hit.path else "",
+                error=hit.entry.error, from_cache=True,
             )
+
+    try:
+        resp = _http_get(url, timeout, session, rate_limiter)
     except requests.RequestException as exc:
         return FetchResult(
             data=b"", url=url, http_status=0,
@@ -130,6 +217,8 @@ def fetch_bi5_detailed(
     status = resp.status_code
 
     if status == 404 or status >= 400:
+        if cache is not None:
+            cache.store(symbol, hour_dt, b"", status, f"http_{status}")
         return FetchResult(
             data=b"", url=url, http_status=status,
             cached_path="", error=f"http_{status}",
@@ -137,19 +226,17 @@ def fetch_bi5_detailed(
 
     data = resp.content
     if not data:
+        if cache is not None:
+            cache.store(symbol, hour_dt, b"", status, "empty_response")
         return FetchResult(
             data=b"", url=url, http_status=status,
             cached_path="", error="empty_response",
         )
 
-    if save_raw:
-        out_dir = (raw_dir or RAW_DIR) / symbol
-        month_zero = hour_dt.month - 1
-        file_dir = out_dir / str(hour_dt.year) / f"{month_zero:02d}" / f"{hour_dt.day:02d}"
-        file_dir.mkdir(parents=True, exist_ok=True)
-        file_path = file_dir / f"{hour_dt.hour:02d}h_ticks.bi5"
-        file_path.write_bytes(data)
-        cached_path = str(file_path)
+    if cache is not None:
+        cached_path = str(cache.store(symbol, hour_dt, data, status))
+    elif save_raw:
+        cached_path = str(_save_raw_archive(data, symbol, hour_dt, raw_dir))
 
     return FetchResult(
         data=data, url=url, http_status=status,
@@ -1,13 +1,17 @@
 """Gap detection and reporting for canonical 1m data."""
 
 import json
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
-from .config import CANONICAL_DIR, DATA_ROOT
+from market_data_officer.market_hours import FAMILY_SESSION_POLICY, INSTRUMENT_FAMILY, SessionPolicy
+
+from .canonical_store import read_canonical
+from .config import DATA_ROOT
 
 
 # FX market hours: Sunday 22:00 UTC → Friday 22:00 UTC
@@ -19,6 +23,11 @@ _FX_WEEK_CLOSE_HOUR = 22
 
 GAP_REPORT_DIR = DATA_ROOT / "reports"
 
+_NS_PER_MINUTE = 60 * 10**9
+_NS_PER_HOUR = 60 * _NS_PER_MINUTE
+_NS_PER_WEEK = 7 * 24 * _NS_PER_HOUR
+_EPOCH_MONDAY_NS = 4 * 24 * _NS_PER_HOUR  # 1970-01-05, first Monday after the epoch
+
 
 def is_fx_trading_hour(dt: datetime) -> bool:
     """Return True if dt falls within expected FX trading hours."""
@@ -41,6 +50,90 @@ def is_fx_trading_hour(dt: datetime) -> bool:
     return True
 
 
+def session_intervals(policy: SessionPolicy, start_ns: int, end_ns: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Weekly session windows overlapping [start_ns, end_ns], as UTC epoch ns.
+
+    Returns sorted, disjoint (opens, closes) arrays with half-open
+    [open, close) intervals. A session runs from the open day/hour to the
+    next close day/hour, so Sun 22:00 → Fri 22:00 for FX and Metals.
+    """
+    open_off = (policy.week_open_dow * 24 + policy.week_open_hour) * _NS_PER_HOUR
+    close_off = (policy.week_close_dow * 24 + policy.week_close_hour) * _NS_PER_HOUR
+    if close_off <= open_off:
+        close_off += _NS_PER_WEEK
+    first_week = (start_ns - _EPOCH_MONDAY_NS) // _NS_PER_WEEK - 1
+    last_week = (end_ns - _EPOCH_MONDAY_NS) // _NS_PER_WEEK
+    week_starts = _EPOCH_MONDAY_NS + np.arange(first_week, last_week + 1, dtype=np.int64) * _NS_PER_WEEK
+    return week_starts + open_off, week_starts + close_off
+
+
+def session_policy_for(symbol: str) -> SessionPolicy:
+    """Session policy of a symbol's family, defaulting to the FX window."""
+    family = INSTRUMENT_FAMILY.get(symbol, "FX")
+    return FAMILY_SESSION_POLICY.get(family, FAMILY_SESSION_POLICY["FX"])
+
+
+def _index_ns(index: pd.DatetimeIndex) -> np.ndarray:
+    # Scale the raw int64 values; as_unit("ns") on a tz-aware index is slow
+    return index.asi8 * pd.Timedelta(1, unit=index.unit).value
+
+
+def _to_utc_ns(value) -> int:
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize("UTC")
+    return ts.value
+
+
+def _gap_runs(index: pd.DatetimeIndex, start_ns: int, end_ns: int) -> Tuple[np.ndarray, np.ndarray]:
+    """First and last missing minute (epoch minutes) of every gap in [start, end].
+
+    Works on minute numbers: with sentinels one minute outside the range,
+    every step of np.diff larger than one minute is a gap.
+    """
+    ts = _index_ns(index)
+    lo = -(-start_ns // _NS_PER_MINUTE)  # first whole minute at or after start
+    hi = end_ns // _NS_PER_MINUTE
+    present = ts[(ts % _NS_PER_MINUTE == 0) & (ts >= start_ns) & (ts <= end_ns)] // _NS_PER_MINUTE
+    if len(present) > 1 and not np.all(present[1:] > present[:-1]):
+        present = np.unique(present)
+    minutes = np.concatenate(([lo - 1], present, [hi + 1]))
+    steps = np.diff(minutes)
+    at = np.flatnonzero(steps > 1)
+    return minutes[at] + 1, minutes[at + 1] - 1
+
+
+def _weekend_mask(first: np.ndarray, last: np.ndarray, policy: SessionPolicy) -> np.ndarray:
+    """True for gaps that do not touch any session minute.
+
+    Each gap [first, last + 1min) is intersected with the session intervals:
+    the candidate is the first session closing after the gap starts, and the
+    gap is in-session iff that session opens before the gap ends.
+    """
+    if len(first) == 0:
+        return np.zeros(0, dtype=bool)
+    gap_open = first * _NS_PER_MINUTE
+    gap_close = (last + 1) * _NS_PER_MINUTE
+    opens, closes = session_intervals(policy, int(gap_open.min()), int(gap_close.max()))
+    j = np.searchsorted(closes, gap_open, side="right")
+    overlaps = opens[np.minimum(j, len(opens) - 1)] < gap_close
+    return ~((j < len(opens)) & overlaps)
+
+
+def _gap_records(first: np.ndarray, last: np.ndarray, weekend: np.ndarray) -> List[Dict]:
+    starts = pd.to_datetime(first * _NS_PER_MINUTE, unit="ns", utc=True)
+    ends = pd.to_datetime(last * _NS_PER_MINUTE, unit="ns", utc=True)
+    return [
+        {
+            "gap_start": gap_start.isoformat(),
+            "gap_end": gap_end.isoformat(),
+            "missing_minutes": int(n),
+            "classification": "weekend" if is_weekend else "trading_hours",
+        }
+        for gap_start, gap_end, n, is_weekend in zip(starts, ends, last - first + 1, weekend)
+    ]
+
+
 def detect_gaps(
     canonical_df: pd.DataFrame,
     symbol: str,
@@ -56,67 +149,41 @@ def detect_gaps(
       - classification: 'weekend' | 'trading_hours'
 
     Gaps are contiguous runs of missing minutes. Weekend gaps are classified
-    separately from unexpected trading-hour gaps.
+    separately from unexpected trading-hour gaps: a gap is 'weekend' when it
+    does not overlap the symbol's weekly session (market_hours.SessionPolicy).
+    Cost is one pass over the index plus O(gaps log weeks).
     """
     if canonical_df.empty:
         return []
 
-    if start is None:
-        start = canonical_df.index[0].to_pydatetime()
-    if end is None:
-        end = canonical_df.index[-1].to_pydatetime()
-
-    if start.tzinfo is None:
-        start = start.replace(tzinfo=timezone.utc)
-    if end.tzinfo is None:
-        end = end.replace(tzinfo=timezone.utc)
-
-    # Build the full expected minute range
-    expected = pd.date_range(start=start, end=end, freq="1min", tz="UTC")
-    present = set(canonical_df.index)
-    missing = sorted(set(expected) - present)
-
-    if not missing:
-        return []
-
-    # Group contiguous missing minutes into gap runs
-    gaps: List[Dict] = []
-    run_start = missing[0]
-    prev = missing[0]
-
-    for ts in missing[1:]:
-        if ts - prev > timedelta(minutes=1):
-            # Close current run
-            gaps.append(_make_gap_record(run_start, prev))
-            run_start = ts
-        prev = ts
+    start_ns = _to_utc_ns(canonical_df.index[0] if start is None else start)
+    end_ns = _to_utc_ns(canonical_df.index[-1] if end is None else end)
 
-    # Close final run
-    gaps.append(_make_gap_record(run_start, prev))
+    first, last = _gap_runs(canonical_df.index, start_ns, end_ns)
+    return _gap_records(first, last, _weekend_mask(first, last, session_policy_for(symbol)))
 
-    return gaps
 
-
-def _make_gap_record(gap_start: pd.Timestamp, gap_end: pd.Timestamp) -> Dict:
-    """Build a single gap record with classification."""
-    minutes = int((gap_end - gap_start).total_seconds() / 60) + 1
-
-    # Classify: if the entire gap falls outside FX trading hours → weekend
-    # Otherwise → trading_hours (unexpected)
-    all_weekend = True
-    current = gap_start.to_pydatetime()
-    end_dt = gap_end.to_pydatetime()
-    while current <= end_dt:
-        if is_fx_trading_hour(current):
-            all_weekend = False
-            break
-        current += timedelta(minutes=1)
+def _build_report(symbol: str, first: str, last: str, total_bars: int, gaps: List[Dict]) -> Dict:
+    weekend_gaps = [g for g in gaps if g["classification"] == "weekend"]
+    trading_gaps = [g for g in gaps if g["classification"] == "trading_hours"]
 
     return {
-        "gap_start": gap_start.isoformat(),
-        "gap_end": gap_end.isoformat(),
-        "missing_minutes": minutes,
-        "classification": "weekend" if all_weekend else "trading_hours",
+        "symbol": symbol,
+        "generated_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "canonical_range": {
+            "first": first,
+            "last": last,
+            "total_bars": total_bars,
+        },
+        "summary": {
+            "total_gaps": len(gaps),
+            "weekend_gaps": len(weekend_gaps),
+            "trading_hour_gaps": len(trading_gaps),
+            "total_missing_minutes": sum(g["missing_minutes"] for g in gaps),
+            "trading_hour_missing_minutes": sum(g["missing_minutes"] for g in trading_gaps),
+        },
+        "trading_hour_gaps": trading_gaps,
+        "weekend_gaps": weekend_gaps,
     }
 
 
@@ -130,40 +197,89 @@ def generate_gap_report(
     with summary statistics and gap details.
     """
     if canonical_df is None:
-        path = CANONICAL_DIR / f"{symbol}_1m.parquet"
-        if not path.exists():
+        canonical_df = read_canonical(symbol)
+        if canonical_df is None:
             return {"symbol": symbol, "error": "no canonical data found"}
-        canonical_df = pd.read_parquet(path)
-        canonical_df.index = pd.to_datetime(canonical_df.index, utc=True)
 
     if canonical_df.empty:
         return {"symbol": symbol, "error": "canonical data is empty"}
 
     gaps = detect_gaps(canonical_df, symbol)
+    return _build_report(
+        symbol,
+        canonical_df.index[0].isoformat(),
+        canonical_df.index[-1].isoformat(),
+        len(canonical_df),
+        gaps,
+    )
 
-    weekend_gaps = [g for g in gaps if g["classification"] == "weekend"]
-    trading_gaps = [g for g in gaps if g["classification"] == "trading_hours"]
-
-    report = {
-        "symbol": symbol,
-        "generated_utc": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
-        "canonical_range": {
-            "first": canonical_df.index[0].isoformat(),
-            "last": canonical_df.index[-1].isoformat(),
-            "total_bars": len(canonical_df),
-        },
-        "summary": {
-            "total_gaps": len(gaps),
-            "weekend_gaps": len(weekend_gaps),
-            "trading_hour_gaps": len(trading_gaps),
-            "total_missing_minutes": sum(g["missing_minutes"] for g in gaps),
-            "trading_hour_missing_minutes": sum(g["missing_minutes"] for g in trading_gaps),
-        },
-        "trading_hour_gaps": trading_gaps,
-        "weekend_gaps": weekend_gaps,
-    }
 
-    return report
+def update_gap_report(
+    report: Dict,
+    canonical_df: pd.DataFrame,
+    since: datetime,
+) -> Optional[Dict]:
+    """Refresh a saved gap report for bars ingested at or after ``since``.
+
+    Only the window from ``since`` (or the start of a saved gap straddling
+    it, which the new bars may have partly filled) to the last bar is
+    rescanned; gaps ending before it are kept as they are. ``canonical_df``
+    may be a tail of history but must reach back to that point.
+
+    Returns None when the report cannot be extended — it is an error report,
+    ``since`` precedes its first bar, or the window starts too late — and
+    the caller should regenerate the full report instead.
+    """
+    if "error" in report or canonical_df.empty:
+        return None
+
+    first = pd.Timestamp(report["canonical_range"]["first"])
+    prior_last = pd.Timestamp(report["canonical_range"]["last"])
+    since = pd.Timestamp(since)
+    if since.tzinfo is None:
+        since = since.tz_localize("UTC")
+    if since <= first:
+        return None
+
+    one_minute = pd.Timedelta(minutes=1)
+    resume = min(since, prior_last + one_minute)
+    saved = report["trading_hour_gaps"] + report["weekend_gaps"]
+    for gap in saved:
+        gap_start, gap_end = pd.Timestamp(gap["gap_start"]), pd.Timestamp(gap["gap_end"])
+        if gap_start < resume <= gap_end:
+            resume = gap_start
+    if canonical_df.index[0] > resume:
+        return None
+
+    kept = [g for g in saved if pd.Timestamp(g["gap_end"]) < resume]
+    kept.sort(key=lambda g: pd.Timestamp(g["gap_start"]))
+
+    # Bars at or after resume are recounted from the window
+    dropped_missing = sum(g["missing_minutes"] for g in saved if pd.Timestamp(g["gap_end"]) >= resume)
+    prior_rescanned = max(int((prior_last - resume) / one_minute) + 1, 0) - dropped_missing
+    window = canonical_df[canonical_df.index >= resume]
+    total_bars = report["canonical_range"]["total_bars"] - prior_rescanned + len(window)
+
+    symbol = report["symbol"]
+    fresh = detect_gaps(window, symbol, start=resume, end=canonical_df.index[-1]) if not window.empty else []
+    return _build_report(
+        symbol,
+        report["canonical_range"]["first"],
+        canonical_df.index[-1].isoformat(),
+        total_bars,
+        kept + fresh,
+    )
+
+
+def load_gap_report(symbol: str) -> Optional[Dict]:
+    """Read a saved gap report, returning None if absent or unreadable."""
+    path = GAP_REPORT_DIR / f"{symbol}_gap_report.json"
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
 
 
 def save_gap_report(symbol: str, report: Dict) -> Path:
@@ -0,0 +1,150 @@
+"""Process-wide cache of parsed hot package frames.
+
+The officer loader, the Structure Engine and the API chart reader all read
+the same <SYMBOL>_<tf>_latest.csv (or its binary twin) many times between
+feed refreshes. HOT_PACKAGE_CACHE keeps each parsed frame keyed by the CSV
+path and fingerprinted by the (mtime_ns, size) of both the CSV and the
+binary twin, so a frame is parsed again only after the feed rewrites one
+of them. Entries are evicted least-recently-used once their total size
+passes the byte budget (HOT_PACKAGE_CACHE_MB, default 256).
+
+A change of an instrument's manifest as_of_utc also drops its frames: it
+is the feed's explicit refresh signal, and covers filesystems whose mtime
+is too coarse to tell two writes apart.
+
+Cached frames are shared. Callers get a shallow copy, so adding or
+replacing columns or the index never reaches the cache, but the values
+must be treated as read-only.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from .hot_package import hot_binary_path, read_hot_frame
+
+DEFAULT_MAX_BYTES = int(os.environ.get("HOT_PACKAGE_CACHE_MB", "256")) * 1024 * 1024
+
+Fingerprint = Tuple[Optional[Tuple[int, int]], ...]
+
+
+def _stat_key(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class HotPackageCache:
+    """Memory-bounded LRU of parsed hot package frames, safe across threads."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # csv path -> (fingerprint, frame, nbytes), least recently used first
+        self._entries: "OrderedDict[Path, Tuple[Fingerprint, pd.DataFrame, int]]" = OrderedDict()
+        self._bytes = 0
+        self._manifest_as_of: Dict[Tuple[Path, str], Optional[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def load(self, csv_path: Path, binary_path: Path, parse: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """The frame ``parse()`` gives for the current CSV and binary files.
+
+        ``parse`` runs only on a miss, outside the lock; whatever it raises
+        propagates and nothing is cached.
+        """
+        csv_path = Path(csv_path)
+        fingerprint = (_stat_key(csv_path), _stat_key(Path(binary_path)))
+        with self._lock:
+            entry = self._entries.get(csv_path)
+            if entry is not None and entry[0] == fingerprint:
+                self._entries.move_to_end(csv_path)
+                self.hits += 1
+                return entry[1].copy(deep=False)
+            self.misses += 1
+
+        frame = parse()
+        if fingerprint == (None, None):
+            return frame
+        nbytes = int(frame.memory_usage(index=True, deep=False).sum())
+        with self._lock:
+            self._drop(csv_path)
+            if nbytes <= self.max_bytes:
+                self._entries[csv_path] = (fingerprint, frame, nbytes)
+                self._bytes += nbytes
+                while self._bytes > self.max_bytes:
+                    self._drop(next(iter(self._entries)))
+                    self.evictions += 1
+        return frame.copy(deep=False)
+
+    def note_manifest(self, packages_dir: Path, instrument: str, as_of_utc: Optional[str]) -> None:
+        """Record a manifest's as_of_utc; drop the instrument's frames when it changed."""
+        key = (Path(packages_dir), instrument)
+        with self._lock:
+            previous = self._manifest_as_of.get(key, as_of_utc)
+            self._manifest_as_of[key] = as_of_utc
+        if previous != as_of_utc:
+            self.invalidate(packages_dir, instrument)
+
+    def invalidate(self, packages_dir: Optional[Path] = None, instrument: Optional[str] = None) -> int:
+        """Drop the frames of one directory (and instrument), or all. Returns how many."""
+        with self._lock:
+            doomed = [
+                path for path in self._entries
+                if (packages_dir is None or path.parent == Path(packages_dir))
+                and (instrument is None or path.name.startswith(f"{instrument}_"))
+            ]
+            for path in doomed:
+                self._drop(path)
+            self.invalidations += len(doomed)
+            return len(doomed)
+
+    def clear(self) -> None:
+        """Drop every frame and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._manifest_as_of.clear()
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> dict:
+        """Counters and occupancy, for /metrics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _drop(self, path: Path) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+
+HOT_PACKAGE_CACHE = HotPackageCache()
+
+
+def load_hot_frame(packages_dir: Path, instrument: str, tf: str) -> pd.DataFrame:
+    """read_hot_frame for one instrument/timeframe, through HOT_PACKAGE_CACHE.
+
+    Raises:
+        FileNotFoundError: If there is no current binary and no CSV.
+    """
+    csv_path = Path(packages_dir) / f"{instrument}_{tf}_latest.csv"
+    binary_path = hot_binary_path(packages_dir, instrument, tf)
+    return HOT_PACKAGE_CACHE.load(csv_path, binary_path, lambda: read_hot_frame(csv_path, binary_path))
@@ -0,0 +1,103 @@
+"""Binary hot package — a memory-mappable twin of each <SYMBOL>_<tf>_latest.csv.
+
+Layout of ``<SYMBOL>_<tf>_latest.npy`` (format "ohlcv-npy/1"):
+    one C-contiguous int64 array of shape (6, rows)
+    row 0      bar start, UTC epoch nanoseconds
+    rows 1-5   open, high, low, close, volume as float64 bit patterns
+
+A single .npy keeps the standard numpy header (dtype, shape) and lets a
+reader map the file and hand pandas one (5, rows) float64 block plus the
+timestamp row without parsing or copying. The export writes the CSV first
+and the binary second, each to a temp file swapped in with os.replace, so a
+binary at least as new as its CSV always holds the same bars. Readers fall
+back to the CSV when the binary is missing, older than the CSV (a writer
+that only knows CSVs has been there since) or unreadable; read_hot_frame
+does both.
+"""
+
+import os
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+HOT_BINARY_FORMAT = "ohlcv-npy/1"
+HOT_BINARY_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+# Windows cannot replace a file that is still mapped, which would make the
+# next export fail while a reader holds a frame; load into memory there
+_MMAP_MODE = None if os.name == "nt" else "c"
+
+
+def hot_binary_path(packages_dir: Path, instrument: str, tf: str) -> Path:
+    return Path(packages_dir) / f"{instrument}_{tf}_latest.npy"
+
+
+def write_hot_binary(df: pd.DataFrame, path: Path) -> None:
+    """Write OHLCV bars to ``path`` in the fixed binary layout, atomically."""
+    index = pd.DatetimeIndex(df.index)
+    if index.tz is not None:
+        index = index.tz_convert("UTC")
+    packed = np.empty((6, len(df)), dtype=np.int64)
+    packed[0] = index.asi8 * pd.Timedelta(1, unit=index.unit).value
+    packed[1:] = np.ascontiguousarray(
+        df[HOT_BINARY_COLUMNS].to_numpy(dtype=np.float64).T
+    ).view(np.int64)
+
+    tmp = path.with_suffix(".npy.tmp")
+    with open(tmp, "wb") as f:
+        np.save(f, packed)
+    os.replace(tmp, path)
+
+
+def read_hot_binary(path: Path, csv_path: Optional[Path] = None) -> Optional[pd.DataFrame]:
+    """Map a binary hot package into a UTC-indexed OHLCV DataFrame.
+
+    Returns None when the file is missing, not in the expected layout, or
+    older than ``csv_path`` — callers then read the CSV. The frame's columns
+    are copy-on-write views of the mapped file.
+    """
+    try:
+        if csv_path is not None and csv_path.exists():
+            if path.stat().st_mtime_ns < csv_path.stat().st_mtime_ns:
+                return None
+        packed = np.load(path, mmap_mode=_MMAP_MODE, allow_pickle=False)
+    except (OSError, ValueError):
+        return None
+    if packed.dtype != np.int64 or packed.ndim != 2 or packed.shape[0] != 6:
+        return None
+
+    index = pd.DatetimeIndex(packed[0].view("datetime64[ns]"), name="timestamp_utc").tz_localize("UTC")
+    return pd.DataFrame(
+        packed[1:].view(np.float64).T,
+        index=index,
+        columns=HOT_BINARY_COLUMNS,
+        copy=False,
+    )
+
+
+def read_hot_frame(csv_path: Path, binary_path: Path) -> pd.DataFrame:
+    """Read a hot package: the binary twin when current, else the CSV.
+
+    Raises:
+        FileNotFoundError: If there is no current binary and no CSV.
+        ValueError: If the CSV holds no rows.
+    """
+    df = read_hot_binary(binary_path, csv_path)
+    if df is not None:
+        return df
+
+    if not csv_path.exists():
+        raise FileNotFoundError(f"Hot package CSV not found: {csv_path}")
+
+    df = pd.read_csv(csv_path, index_col=0, parse_dates=True)
+    if df.empty:
+        raise ValueError(f"Empty data file: {csv_path}")
+
+    # Ensure UTC-aware index
+    if df.index.tzinfo is None:
+        df.index = df.index.tz_localize("UTC")
+
+    df.index.name = "timestamp_utc"
+    return df
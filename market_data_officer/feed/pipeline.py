@@ -1,17 +1,20 @@
 """Pipeline orchestration — ties fetch, decode, aggregate, validate, resample, export."""
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from pathlib import Path
-from typing import Optional, Set
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 import pandas as pd
 import requests
 
 from .aggregate import ticks_to_1m_ohlcv
+from .canonical_store import CanonicalStore
 from .config import (
-    CANONICAL_DIR,
-    DERIVED_DIR,
     DERIVED_TIMEFRAMES,
+    HOT_WINDOW_SIZES,
     INSTRUMENTS,
     PACKAGES_DIR,
     TIMEFRAME_LABELS,
@@ -20,53 +23,90 @@ from .config import (
 from .decode import decode_dukascopy_ticks, decode_with_diagnostics
 from .diagnostics import DiagnosticsCollector, save_cache_inventory, verify_decode_assumptions
 from .export import export_hot_packages
-from .fetch import build_bi5_url, fetch_bi5, fetch_bi5_detailed
+from .fetch import (
+    FetchResult,
+    HostRateLimiter,
+    build_bi5_url,
+    fetch_bi5,
+    fetch_bi5_detailed,
+    make_session,
+)
 from .yfinance_fallback import fetch_1m_ohlcv_yfinance
-from .gaps import generate_gap_report, save_gap_report
-from .resample import resample_from_1m
+from .gaps import generate_gap_report, load_gap_report, save_gap_report, update_gap_report
+from .raw_cache import Bi5Cache
+from .staged import ingest_staged, merge_hour
+from .resample import resample_cascade
+from .rollup import IncrementalRollup
 from .validate import validate_ohlcv
 
+# History loaded ahead of the requested start on incremental runs: covers the
+# 1m hot window (HOT_WINDOW_SIZES["1m"] bars) across a weekend or holiday.
+_CANONICAL_TAIL_MARGIN = pd.Timedelta(days=7)
+
+
+def _load_existing_canonical(
+    symbol: str,
+    since: Optional[pd.Timestamp] = None,
+) -> Optional[pd.DataFrame]:
+    """Load existing canonical 1m history, migrating a legacy single file first.
 
-def _load_existing_canonical(symbol: str) -> Optional[pd.DataFrame]:
-    """Load existing canonical parquet if it exists."""
-    path = CANONICAL_DIR / f"{symbol}_1m.parquet"
-    if path.exists():
-        df = pd.read_parquet(path)
-        df.index = pd.to_datetime(df.index, utc=True)
-        return df
-    return None
+    With ``since``, only the partitions reaching that timestamp are loaded.
+    """
+    store = CanonicalStore(symbol)
+    if not store.exists() and store.legacy_path.exists():
+        store.migrate_legacy()
+    return store.read(since=since)
 
 
 def _load_existing_derived(symbol: str, tf_label: str) -> Optional[pd.DataFrame]:
-    """Load existing derived parquet if it exists."""
-    path = DERIVED_DIR / f"{symbol}_{tf_label}.parquet"
-    if path.exists():
-        df = pd.read_parquet(path)
-        df.index = pd.to_datetime(df.index, utc=True)
-        return df
-    return None
+    """Load an existing derived timeframe, migrating a legacy single file first."""
+    store = CanonicalStore(symbol, timeframe=tf_label)
+    if not store.exists() and store.legacy_path.exists():
+        store.migrate_legacy()
+    return store.read()
 
 
 def _save_canonical(df: pd.DataFrame, symbol: str) -> None:
-    """Save canonical 1m OHLCV to parquet with validation."""
-    CANONICAL_DIR.mkdir(parents=True, exist_ok=True)
-    validate_ohlcv(df, f"canonical_{symbol}_1m")
-    path = CANONICAL_DIR / f"{symbol}_1m.parquet"
-    df.to_parquet(path, compression="zstd")
-    print(f"[pipeline] saved canonical: {path} ({len(df)} bars)")
+    """Save canonical 1m OHLCV, rewriting only the partitions that changed."""
+    store = CanonicalStore(symbol)
+    changed = store.write(df)
+    print(f"[pipeline] saved canonical: {store.dir} "
+          f"({len(changed)} partition(s) rewritten, {len(df)} bars in window)")
 
 
-def _save_derived(df: pd.DataFrame, symbol: str, tf_label: str) -> None:
-    """Save a derived timeframe as both parquet and CSV."""
-    DERIVED_DIR.mkdir(parents=True, exist_ok=True)
-    validate_ohlcv(df[["open", "high", "low", "close", "volume"]], f"derived_{symbol}_{tf_label}")
+def _canonical_load_from(symbol: str, start: datetime) -> Optional[pd.Timestamp]:
+    """Earliest timestamp an incremental run needs from the canonical store.
+
+    New bars start no earlier than ``start``; the derived rebuild needs the
+    1D boundary before them and the 1m hot tail. Returns None (load all)
+    when there is no partitioned store yet or a derived timeframe is
+    missing and would have to be rebuilt from full history.
+    """
+    watermark = CanonicalStore(symbol).watermark()
+    if watermark is None:
+        return None
+    for rule in DERIVED_TIMEFRAMES:
+        derived = CanonicalStore(symbol, timeframe=TIMEFRAME_LABELS[rule])
+        if not derived.exists() and not derived.legacy_path.exists():
+            return None
+    return min(pd.Timestamp(start).floor("D"), watermark.floor("D")) - _CANONICAL_TAIL_MARGIN
 
-    parquet_path = DERIVED_DIR / f"{symbol}_{tf_label}.parquet"
-    csv_path = DERIVED_DIR / f"{symbol}_{tf_label}.csv"
 
-    df.to_parquet(parquet_path, compression="zstd")
-    df.to_csv(csv_path)
-    print(f"[pipeline] saved derived {tf_label}: {parquet_path} ({len(df)} bars)")
+def _save_derived(
+    df: pd.DataFrame,
+    symbol: str,
+    tf_label: str,
+    dirty_from: Optional[pd.Timestamp] = None,
+) -> None:
+    """Save a derived timeframe, rewriting partitions from ``dirty_from`` on.
+
+    Without ``dirty_from`` every partition of ``df`` is rewritten.
+    """
+    store = CanonicalStore(symbol, timeframe=tf_label)
+    validate_ohlcv(df[["open", "high", "low", "close", "volume"]], f"derived_{symbol}_{tf_label}")
+    changed = store.write(df, dirty_from=dirty_from if dirty_from is not None else df.index[0])
+    print(f"[pipeline] saved derived {tf_label}: {store.dir} "
+          f"({len(changed)} partition(s) rewritten, {len(df)} bars)")
 
 
 def _derive_affected_window(
@@ -84,41 +124,74 @@ def _derive_affected_window(
 
     Returns the full derived DataFrame or None if empty.
     """
-    if canonical_ohlcv.empty:
-        return None
-
-    existing_derived = _load_existing_derived(symbol, tf_label)
+    return _derive_timeframes(canonical_ohlcv, symbol, new_data_start, {rule: tf_label})[rule]
 
-    # If no new data or no existing derived, do a full resample
-    if new_data_start is None or existing_derived is None or existing_derived.empty:
-        derived = resample_from_1m(canonical_ohlcv, rule)
-        return derived if not derived.empty else None
 
-    # Find the derived bar boundary that contains new_data_start.
-    # Resample a tiny slice to find where the boundary falls.
-    boundary = _find_resample_boundary(new_data_start, rule)
-
-    # Split existing derived into unaffected prefix and affected suffix
-    unaffected = existing_derived[existing_derived.index < boundary]
-
-    # Resample only the canonical data from the boundary onwards
-    affected_canonical = canonical_ohlcv[canonical_ohlcv.index >= boundary]
-    if affected_canonical.empty:
-        return existing_derived
-
-    new_derived = resample_from_1m(affected_canonical, rule)
-    if new_derived.empty:
-        return existing_derived if not existing_derived.empty else None
+def _derive_timeframes(
+    canonical_ohlcv: pd.DataFrame,
+    symbol: str,
+    new_data_start: Optional[pd.Timestamp],
+    timeframes: Optional[Dict[str, str]] = None,
+) -> Dict[str, Optional[pd.DataFrame]]:
+    """Derive several timeframes from one cascaded resample of the affected window.
+
+    timeframes maps rule → label (default: every DERIVED_TIMEFRAMES rule).
+    Each timeframe follows the _derive_affected_window policy; the canonical
+    slice from the earliest boundary any of them needs is resampled once
+    with resample_cascade, and each takes its bars from its own boundary.
+    """
+    if timeframes is None:
+        timeframes = {rule: TIMEFRAME_LABELS[rule] for rule in DERIVED_TIMEFRAMES}
+    if canonical_ohlcv.empty:
+        return {rule: None for rule in timeframes}
+
+    # Split existing derived at the bar containing new_data_start; rules with
+    # no existing derived (or no new_data_start) are rebuilt in full.
+    existing: Dict[str, Optional[pd.DataFrame]] = {}
+    boundaries: Dict[str, Optional[pd.Timestamp]] = {}
+    for rule, tf_label in timeframes.items():
+        existing[rule] = _load_existing_derived(symbol, tf_label)
+        selective = (
+            new_data_start is not None
+            and existing[rule] is not None and not existing[rule].empty
+        )
+        boundaries[rule] = _find_resample_boundary(new_data_start, rule) if selective else None
 
-    # Merge: unaffected prefix + newly resampled suffix
-    if unaffected.empty:
-        derived = new_derived
+    if any(boundary is None for boundary in boundaries.values()):
+        window = canonical_ohlcv
     else:
-        derived = pd.concat([unaffected, new_derived])
-        derived = derived[~derived.index.duplicated(keep="last")]
-        derived = derived.sort_index()
+        window = canonical_ohlcv[canonical_ohlcv.index >= min(boundaries.values())]
+    fresh = resample_cascade(window, list(timeframes))
+
+    derived_by_rule: Dict[str, Optional[pd.DataFrame]] = {}
+    for rule, boundary in boundaries.items():
+        if boundary is None:
+            derived = fresh[rule]
+            derived_by_rule[rule] = derived if not derived.empty else None
+            continue
+
+        existing_derived = existing[rule]
+        unaffected = existing_derived[existing_derived.index < boundary]
+
+        # Bars from the boundary onwards come from the fresh resample
+        if window.empty or window.index[-1] < boundary:
+            derived_by_rule[rule] = existing_derived
+            continue
+        new_derived = fresh[rule][fresh[rule].index >= boundary]
+        if new_derived.empty:
+            derived_by_rule[rule] = existing_derived
+            continue
+
+        # Merge: unaffected prefix + newly resampled suffix
+        if unaffected.empty:
+            derived = new_derived
+        else:
+            derived = pd.concat([unaffected, new_derived])
+            derived = derived[~derived.index.duplicated(keep="last")]
+            derived = derived.sort_index()
+        derived_by_rule[rule] = derived if not derived.empty else None
 
-    return derived if not derived.empty else None
+    return derived_by_rule
 
 
 def _find_resample_boundary(ts: pd.Timestamp, rule: str) -> pd.Timestamp:
@@ -148,6 +221,46 @@ def _find_resample_boundary(ts: pd.Timestamp, rule: str) -> pd.Timestamp:
     return pd.Timestamp(result, tz="UTC")
 
 
+def _iter_hour_fetches(
+    fetch_fn: Callable,
+    symbol: str,
+    hours: List[datetime],
+    workers: int,
+    **fetch_kwargs,
+) -> Iterator[Tuple[datetime, Callable]]:
+    """Yield (hour, result) pairs in hour order.
+
+    ``result`` is a zero-argument callable returning what ``fetch_fn``
+    returned for that hour, or raising what it raised, so callers handle
+    fetch errors exactly as if they had made the call themselves.
+
+    With workers <= 1 each fetch runs lazily when its result is requested
+    (the original serial behaviour). Otherwise up to ``workers`` hours are
+    in flight on a thread pool while earlier hours are being processed,
+    and results are still handed back strictly in hour order.
+    """
+    if workers <= 1:
+        for hour in hours:
+            yield hour, partial(fetch_fn, symbol, hour, **fetch_kwargs)
+        return
+
+    pending = iter(hours)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bi5-fetch") as pool:
+        in_flight: deque = deque()
+        for hour in pending:
+            in_flight.append((hour, pool.submit(fetch_fn, symbol, hour, **fetch_kwargs)))
+            if len(in_flight) >= workers:
+                break
+        while in_flight:
+            hour, future = in_flight.popleft()
+            next_hour = next(pending, None)
+            if next_hour is not None:
+                in_flight.append(
+                    (next_hour, pool.submit(fetch_fn, symbol, next_hour, **fetch_kwargs))
+                )
+            yield hour, future.result
+
+
 def run_pipeline(
     symbol: str,
     start_date: datetime,
@@ -156,12 +269,17 @@ def run_pipeline(
     gap_report: bool = False,
     hot_only: bool = False,
     diagnostics: bool = False,
+    fetch_workers: int = 1,
+    max_requests_per_second: Optional[float] = None,
+    raw_cache: Optional[Bi5Cache] = None,
+    decode_workers: int = 0,
 ) -> None:
     """Run the full ingestion pipeline for one instrument over a date range.
 
-    1. Load existing canonical data (if any) for incremental append
+    1. Load existing canonical data (if any) for incremental append —
+       only the recent partitions when the store and derived files exist
     2. Fetch + decode + aggregate new hourly data
-    3. Merge with existing, deduplicate, validate, save canonical
+    3. Merge with existing, deduplicate, validate, save changed partitions
     4. Derive higher timeframes (selective: only affected windows)
     5. Export hot packages
     6. Optionally generate gap report
@@ -169,14 +287,27 @@ def run_pipeline(
 
     If hot_only=True, skip fetching and just regenerate derived + hot packages
     from existing canonical data.
+
+    fetch_workers > 1 keeps that many hours downloading concurrently over a
+    shared keep-alive session; decode, fallback and diagnostics still run
+    in hour order. max_requests_per_second paces requests per host.
+
+    With a raw_cache, immutable hours are read from the local bi5 archive
+    (no network) and every fetched hour is written back to it.
+
+    decode_workers > 0 moves decompress + decode + 1m aggregation onto a
+    process pool of that size (see staged.py), leaving fetch threads free
+    for I/O; 0 keeps the inline path.
     """
     if symbol not in INSTRUMENTS:
         raise ValueError(f"Unknown instrument: {symbol}. Available: {list(INSTRUMENTS.keys())}")
 
     meta = INSTRUMENTS[symbol]
 
-    # Load existing canonical
-    existing = _load_existing_canonical(symbol)
+    # Load existing canonical — only the recent partitions on incremental runs
+    start_utc = start_date if start_date.tzinfo else start_date.replace(tzinfo=timezone.utc)
+    load_from = None if hot_only else _canonical_load_from(symbol, start_utc)
+    existing = _load_existing_canonical(symbol, since=load_from)
 
     # Hot-only mode: skip fetching, just rebuild derived + hot packages
     if hot_only:
@@ -217,6 +348,7 @@ def run_pipeline(
     skip_count = 0
     vendors_seen: Set[str] = set()
 
+    hours_to_fetch: List[datetime] = []
     while current <= end:
         # Incremental: skip hours already covered
         if last_ts is not None:
@@ -227,126 +359,96 @@ def run_pipeline(
                     collector.record_skipped(current)
                 current += timedelta(hours=1)
                 continue
+        hours_to_fetch.append(current)
+        current += timedelta(hours=1)
 
-        if collector:
-            # Diagnostics-enabled path: use detailed fetch + decode
-            try:
-                # --- Primary provider: Dukascopy ---
-                dukascopy_failed = False
-                try:
-                    result = fetch_bi5_detailed(symbol, current, save_raw=save_raw)
-                    fetch_count += 1
-                except requests.RequestException as exc:
-                    print(f"[pipeline] dukascopy transport error at {current}: {exc}")
-                    from .fetch import FetchResult
-                    result = FetchResult(
-                        data=b"",
-                        url=build_bi5_url(symbol, current),
-                        http_status=0,
-                        cached_path="",
-                        error=f"transport_error:{exc}",
-                    )
-                    fetch_count += 1
-                    dukascopy_failed = True
-
-                collector.record_fetch(
-                    hour_utc=current,
-                    url=result.url,
-                    http_status=result.http_status,
-                    payload=result.data,
-                    cached_path=result.cached_path,
-                    error=result.error,
-                )
-
-                if not result.data:
-                    dukascopy_failed = True
-
-                if result.data:
-                    ticks, stats = decode_with_diagnostics(result.data, current, meta)
-                    bars_produced = 0
-                    if not ticks.empty:
-                        bars = ticks_to_1m_ohlcv(ticks)
-                        if not bars.empty:
-                            bars["vendor"] = meta.primary_provider
-                            all_bars.append(bars)
-                            vendors_seen.add(meta.primary_provider)
-                            bars_produced = len(bars)
-
-                    collector.record_decode(
-                        hour_utc=current,
-                        tick_count=stats.tick_count,
-                        bars_produced=bars_produced,
-                        price_min=stats.price_min,
-                        price_max=stats.price_max,
-                        volume_total=stats.volume_total,
-                        decode_error=stats.error,
-                    )
-                else:
-                    collector.record_decode(
-                        hour_utc=current,
-                        tick_count=0,
-                        bars_produced=0,
-                        decode_error=result.error or "no_payload",
-                    )
-
-                # --- AC-3 fallback: per-instrument policy (transport failures only) ---
-                if dukascopy_failed and meta.fallback_enabled:
-                    fb = fetch_1m_ohlcv_yfinance(symbol, current)
-                    if not fb.empty:
-                        fb["vendor"] = meta.fallback_provider
-                        all_bars.append(fb)
-                        vendors_seen.add(meta.fallback_provider)
-                        print(f"[pipeline] fallback: {meta.fallback_provider} supplied "
-                              f"{len(fb)} bars for {current}")
-            except Exception as exc:
-                print(f"[pipeline] error at {current}: {exc}")
-                collector.record_fetch(
-                    hour_utc=current,
-                    url=build_bi5_url(symbol, current),
-                    http_status=0,
-                    payload=b"",
-                    error=f"pipeline_error:{exc}",
-                )
+    fetch_fn = fetch_bi5_detailed if collector else fetch_bi5
+    rate_limiter = (
+        HostRateLimiter(max_requests_per_second) if max_requests_per_second else None
+    )
+    with make_session(pool_size=max(fetch_workers, 1)) as session:
+        fetches = _iter_hour_fetches(
+            fetch_fn, symbol, hours_to_fetch, fetch_workers,
+            save_raw=save_raw, session=session, rate_limiter=rate_limiter,
+            cache=raw_cache,
+        )
+        if decode_workers > 0:
+            fetch_count += ingest_staged(
+                fetches, symbol, meta, collector, all_bars, vendors_seen,
+                fallback_fn=fetch_1m_ohlcv_yfinance, decode_workers=decode_workers,
+            )
         else:
-            # Standard path: original fetch + decode (no diagnostics overhead)
-            try:
-                # --- Primary provider: Dukascopy ---
-                dukascopy_failed = False
-                try:
-                    raw = fetch_bi5(symbol, current, save_raw=save_raw)
-                    fetch_count += 1
-                except requests.RequestException as exc:
-                    # Transport-layer failure after SSL retry exhausted
-                    print(f"[pipeline] dukascopy transport error at {current}: {exc}")
-                    raw = b""
-                    fetch_count += 1
-                    dukascopy_failed = True
-
-                if not raw:
-                    dukascopy_failed = True
-
-                if raw:
-                    ticks = decode_dukascopy_ticks(raw, current, meta)
-                    if not ticks.empty:
-                        bars = ticks_to_1m_ohlcv(ticks)
-                        if not bars.empty:
-                            bars["vendor"] = meta.primary_provider
-                            all_bars.append(bars)
-                            vendors_seen.add(meta.primary_provider)
-
-                # --- AC-3 fallback: per-instrument policy (transport failures only) ---
-                if dukascopy_failed and meta.fallback_enabled:
-                    fb = fetch_1m_ohlcv_yfinance(symbol, current)
-                    if not fb.empty:
-                        fb["vendor"] = meta.fallback_provider
-                        all_bars.append(fb)
-                        vendors_seen.add(meta.fallback_provider)
-                        print(f"[pipeline] fallback: {meta.fallback_provider} supplied "
-                              f"{len(fb)} bars for {current}")
-            except Exception as exc:
-                print(f"[pipeline] error at {current}: {exc}")
-
-        current += timedelta(hours=1)
+            for current, fetched in fetches:
+                if collector:
+                    # Diagnostics-enabled path: use detailed fetch + decode
+                    try:
+                        # --- Primary provider: Dukascopy ---
+                        try:
+                            result = fetched()
+                            fetch_count += 1
+                        except requests.RequestException as exc:
+                            print(f"[pipeline] dukascopy transport error at {current}: {exc}")
+                            result = FetchResult(
+                                data=b"",
+                                url=build_bi5_url(symbol, current),
+                                http_status=0,
+                                cached_path="",
+                                error=f"transport_error:{exc}",
+                            )
+                            fetch_count += 1
+
+                        collector.record_fetch(
+                            hour_utc=current,
+                            url=result.url,
+                            http_status=result.http_status,
+                            payload=result.data,
+                            cached_path=result.cached_path,
+                            error=result.error,
+                            from_cache=result.from_cache,
+                        )
+
+                        bars = stats = None
+                        if result.data:
+                            ticks, stats = decode_with_diagnostics(result.data, current, meta)
+                            bars = ticks_to_1m_ohlcv(ticks) if not ticks.empty else pd.DataFrame()
+
+                        merge_hour(current, bars, stats, result.error, symbol, meta, collector,
+                                   all_bars, vendors_seen, fetch_1m_ohlcv_yfinance)
+                    except Exception as exc:
+                        print(f"[pipeline] error at {current}: {exc}")
+                        collector.record_fetch(
+                            hour_utc=current,
+                            url=build_bi5_url(symbol, current),
+                            http_status=0,
+                            payload=b"",
+                            error=f"pipeline_error:{exc}",
+                        )
+                else:
+                    # Standard path: original fetch + decode (no diagnostics overhead)
+                    try:
+                        # --- Primary provider: Dukascopy ---
+                        try:
+                            raw = fetched()
+                            fetch_count += 1
+                        except requests.RequestException as exc:
+                            # Transport-layer failure after SSL retry exhausted
+                            print(f"[pipeline] dukascopy transport error at {current}: {exc}")
+                            raw = b""
+                            fetch_count += 1
+
+                        bars = None
+                        if raw:
+                            ticks = decode_dukascopy_ticks(raw, current, meta)
+                            bars = ticks_to_1m_ohlcv(ticks) if not ticks.empty else pd.DataFrame()
+
+                        merge_hour(current, bars, None, "", symbol, meta, None,
+                                   all_bars, vendors_seen, fetch_1m_ohlcv_yfinance)
+                    except Exception as exc:
+                        print(f"[pipeline] error at {current}: {exc}")
+
+    if raw_cache is not None:
+        raw_cache.flush()
+        print(f"[pipeline] raw cache: {raw_cache.hits} hit(s), {raw_cache.misses} miss(es)")
 
     print(f"[pipeline] fetched {fetch_count} hours, skipped {skip_count} already-ingested")
 
@@ -384,6 +486,9 @@ def run_pipeline(
         print(f"[pipeline] new data from {new_data_start} ({len(new_df)} new bars)")
     else:
         canonical = existing
+        if load_from is not None:
+            # A full derived regeneration needs the whole history
+            canonical = _load_existing_canonical(symbol)
         print("[pipeline] no new data fetched — regenerating derived from existing canonical")
 
     # Save canonical
@@ -392,9 +497,10 @@ def run_pipeline(
     # Rebuild derived timeframes and hot packages
     _rebuild_derived_and_export(canonical, symbol, new_data_start, vendors_seen)
 
-    # Gap report
+    # Gap report — rescans only the new window when a saved report exists
     if gap_report:
-        _run_gap_report(canonical, symbol)
+        partial_scan = new_data_start is not None and load_from is not None
+        _run_gap_report(canonical, symbol, since=new_data_start, partial=partial_scan)
 
     # Diagnostics report (Phase 1D)
     if collector:
@@ -408,7 +514,9 @@ def run_pipeline(
             print(f"[diagnostics] {n_anomalies} decode anomaly(ies) detected — see report")
 
         # Save cache inventory if raw cache was enabled
-        if save_raw:
+        if raw_cache is not None:
+            save_cache_inventory(symbol, raw_dir=raw_cache.root)
+        elif save_raw:
             save_cache_inventory(symbol)
 
         summary = diag_report.get("summary", {})
@@ -425,7 +533,13 @@ def _rebuild_derived_and_export(
     new_data_start: Optional[pd.Timestamp],
     vendors: Optional[Set[str]] = None,
 ) -> None:
-    """Rebuild derived timeframes (selectively if possible) and export hot packages."""
+    """Update derived timeframes and export hot packages.
+
+    When the rollup state is current, new 1m bars are folded into the open
+    derived bars and only the changed tails are written. Otherwise derived
+    timeframes are rebuilt (selectively if possible) and the rollup is
+    re-seeded from the result.
+    """
     canonical_ohlcv = canonical[["open", "high", "low", "close", "volume"]]
 
     # Determine vendor set from canonical data if not provided
@@ -438,22 +552,57 @@ def _rebuild_derived_and_export(
             vendors = {inst_meta.primary_provider} if inst_meta else {"dukascopy"}
 
     hot_dfs = {"1m": canonical_ohlcv}
-
-    for rule in DERIVED_TIMEFRAMES:
-        tf_label = TIMEFRAME_LABELS[rule]
-        derived = _derive_affected_window(
-            canonical_ohlcv, symbol, rule, tf_label, new_data_start
-        )
-        if derived is not None and not derived.empty:
-            _save_derived(derived, symbol, tf_label)
-            hot_dfs[tf_label] = derived[["open", "high", "low", "close", "volume"]]
+    rollup = IncrementalRollup(symbol)
+
+    if rollup.can_fold(canonical_ohlcv, new_data_start):
+        n_new = int((canonical_ohlcv.index > rollup.watermark).sum())
+        changed = rollup.update(canonical_ohlcv)
+        print(f"[pipeline] rolled up {n_new} new 1m bar(s) into "
+              f"{', '.join(f'{label}:{len(df)}' for label, df in changed.items())} tail bar(s)")
+        for rule in DERIVED_TIMEFRAMES:
+            tf_label = TIMEFRAME_LABELS[rule]
+            tail = rollup.store(tf_label).tail(HOT_WINDOW_SIZES.get(tf_label, 0))
+            if tail is not None and not tail.empty:
+                hot_dfs[tf_label] = tail[["open", "high", "low", "close", "volume"]]
+    else:
+        rebuilt: Dict[str, pd.DataFrame] = {}
+        derived_by_rule = _derive_timeframes(canonical_ohlcv, symbol, new_data_start)
+        for rule in DERIVED_TIMEFRAMES:
+            tf_label = TIMEFRAME_LABELS[rule]
+            derived = derived_by_rule[rule]
+            if derived is not None and not derived.empty:
+                dirty_from = (
+                    _find_resample_boundary(new_data_start, rule)
+                    if new_data_start is not None else None
+                )
+                _save_derived(derived, symbol, tf_label, dirty_from=dirty_from)
+                hot_dfs[tf_label] = derived[["open", "high", "low", "close", "volume"]]
+                rebuilt[tf_label] = derived
+        if not canonical_ohlcv.empty:
+            rollup.seed(rebuilt, canonical_ohlcv.index[-1])
 
     export_hot_packages(hot_dfs, symbol, vendors=vendors)
 
 
-def _run_gap_report(canonical: pd.DataFrame, symbol: str) -> None:
-    """Generate and save gap report for the canonical data."""
-    report = generate_gap_report(symbol, canonical)
+def _run_gap_report(
+    canonical: pd.DataFrame,
+    symbol: str,
+    since: Optional[pd.Timestamp] = None,
+    partial: bool = False,
+) -> None:
+    """Generate and save gap report for the canonical data.
+
+    With ``since``, the saved report is extended over the bars from there
+    on. ``partial`` marks ``canonical`` as a tail of history, in which case
+    a full regeneration reads the whole store instead.
+    """
+    report = None
+    if since is not None:
+        previous = load_gap_report(symbol)
+        if previous is not None:
+            report = update_gap_report(previous, canonical, since)
+    if report is None:
+        report = generate_gap_report(symbol, None if partial else canonical)
     save_gap_report(symbol, report)
 
     summary = report.get("summary", {})
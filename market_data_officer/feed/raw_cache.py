@@ -0,0 +1,292 @@
+"""Read-through raw bi5 cache — serves archived hours from disk before Dukascopy.
+
+Payloads stay in the existing raw archive layout
+(``<root>/<symbol>/<yyyy>/<mm>/<dd>/<hh>h_ticks.bi5``, zero-based month), so
+archives written by ``fetch_bi5(save_raw=True)`` are reused as-is. Each
+symbol directory carries a JSON index (``_index.json``) that records, per
+hour, the payload's content sha256, size, HTTP outcome and last access.
+Reads are verified against the recorded hash; a mismatch is a miss.
+
+Cache policy:
+  - Only hours that ended more than ``immutable_after`` ago are served from
+    cache; recent hours always go to the network and refresh their entry.
+  - An entry counts only if it was stored after its hour became immutable,
+    so a partial archive captured while the hour was still live is
+    re-fetched once and then pinned.
+  - 404 and empty responses are kept as negative entries (no payload file).
+  - With ``max_bytes`` set, each symbol's archive is kept under that size by
+    evicting least-recently-accessed entries.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from .config import RAW_CACHE_IMMUTABLE_HOURS, RAW_CACHE_MAX_BYTES, RAW_DIR
+
+INDEX_FILENAME = "_index.json"
+INDEX_VERSION = 1
+
+
+def raw_archive_relpath(hour_dt: datetime) -> Path:
+    """Relative archive path for one hour, using Dukascopy's zero-based month."""
+    month_zero = hour_dt.month - 1
+    return (
+        Path(str(hour_dt.year)) / f"{month_zero:02d}" / f"{hour_dt.day:02d}"
+        / f"{hour_dt.hour:02d}h_ticks.bi5"
+    )
+
+
+@dataclass
+class CacheEntry:
+    """Index record for one cached hour."""
+
+    hour_utc: str  # ISO format
+    path: str  # archive path relative to the symbol dir, empty for negative entries
+    sha256: str  # hex digest, empty for negative entries
+    bytes: int
+    http_status: int
+    error: str  # empty string for positive entries
+    stored_utc: str  # ISO format
+    last_access_utc: str  # ISO format
+
+    @property
+    def is_negative(self) -> bool:
+        return self.bytes == 0
+
+
+@dataclass
+class CacheHit:
+    """A cache lookup result: the payload (b"" for negative entries) and its record."""
+
+    data: bytes
+    entry: CacheEntry
+    path: Optional[Path]
+
+
+def load_index(symbol_dir: Path) -> Dict[str, CacheEntry]:
+    """Read a symbol's cache index, returning {} if absent or unreadable."""
+    path = symbol_dir / INDEX_FILENAME
+    if not path.exists():
+        return {}
+    try:
+        raw = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    if raw.get("version") != INDEX_VERSION:
+        return {}
+    return {key: CacheEntry(**value) for key, value in raw.get("entries", {}).items()}
+
+
+def _write_index(symbol_dir: Path, entries: Dict[str, CacheEntry]) -> None:
+    symbol_dir.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": INDEX_VERSION,
+        "entries": {key: asdict(entry) for key, entry in sorted(entries.items())},
+    }
+    tmp = symbol_dir / f"{INDEX_FILENAME}.tmp"
+    tmp.write_text(json.dumps(payload, indent=1))
+    os.replace(tmp, symbol_dir / INDEX_FILENAME)
+
+
+class Bi5Cache:
+    """Thread-safe read-through cache over the raw bi5 archive.
+
+    Usage:
+        cache = Bi5Cache()
+        data = fetch_bi5(symbol, hour, cache=cache)   # disk first, then network
+        cache.flush()                                 # persist index updates
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        immutable_after: timedelta = timedelta(hours=RAW_CACHE_IMMUTABLE_HOURS),
+        max_bytes: Optional[int] = RAW_CACHE_MAX_BYTES,
+        now_fn: Optional[Callable[[], datetime]] = None,
+    ) -> None:
+        self.root = Path(root) if root is not None else RAW_DIR
+        self.immutable_after = immutable_after
+        self.max_bytes = max_bytes
+        self._now = now_fn or (lambda: datetime.now(timezone.utc))
+        self._indexes: Dict[str, Dict[str, CacheEntry]] = {}
+        self._dirty: set = set()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    # ── Paths and policy ──────────────────────────────────────────────
+
+    def symbol_dir(self, symbol: str) -> Path:
+        return self.root / symbol
+
+    def archive_path(self, symbol: str, hour_dt: datetime) -> Path:
+        return self.symbol_dir(symbol) / raw_archive_relpath(hour_dt)
+
+    def immutable_since(self, hour_dt: datetime) -> datetime:
+        """Moment from which an hour's archive can no longer change."""
+        return hour_dt + timedelta(hours=1) + self.immutable_after
+
+    def is_immutable(self, hour_dt: datetime) -> bool:
+        return self._now() >= self.immutable_since(hour_dt)
+
+    def _index(self, symbol: str) -> Dict[str, CacheEntry]:
+        if symbol not in self._indexes:
+            self._indexes[symbol] = load_index(self.symbol_dir(symbol))
+        return self._indexes[symbol]
+
+    # ── Read path ─────────────────────────────────────────────────────
+
+    def lookup(self, symbol: str, hour_dt: datetime) -> Optional[CacheHit]:
+        """Return the cached payload for an immutable hour, or None on a miss."""
+        if hour_dt.tzinfo is None:
+            raise ValueError("hour_dt must be timezone-aware (UTC)")
+
+        if not self.is_immutable(hour_dt):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        key = hour_dt.isoformat()
+        with self._lock:
+            index = self._index(symbol)
+            entry = index.get(key)
+            if entry is None:
+                entry = self._adopt_archive(symbol, hour_dt)
+            if entry is None or (
+                datetime.fromisoformat(entry.stored_utc) < self.immutable_since(hour_dt)
+            ):
+                self.misses += 1
+                return None
+
+            path: Optional[Path] = None
+            data = b""
+            if not entry.is_negative:
+                path = self.symbol_dir(symbol) / entry.path
+                try:
+                    data = path.read_bytes()
+                except OSError:
+                    data = b""
+                if not data or hashlib.sha256(data).hexdigest() != entry.sha256:
+                    del index[key]
+                    self._dirty.add(symbol)
+                    self.misses += 1
+                    return None
+
+            entry.last_access_utc = self._now().isoformat()
+            self._dirty.add(symbol)
+            self.hits += 1
+            return CacheHit(data=data, entry=entry, path=path)
+
+    def _adopt_archive(self, symbol: str, hour_dt: datetime) -> Optional[CacheEntry]:
+        """Index an archive written by save_raw before this cache existed.
+
+        The file's mtime stands in for its stored time, so archives captured
+        while the hour was still live are not trusted.
+        """
+        path = self.archive_path(symbol, hour_dt)
+        try:
+            stat = path.stat()
+            data = path.read_bytes()
+        except OSError:
+            return None
+        if not data:
+            return None
+
+        stored = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+        entry = CacheEntry(
+            hour_utc=hour_dt.isoformat(),
+            path=raw_archive_relpath(hour_dt).as_posix(),
+            sha256=hashlib.sha256(data).hexdigest(),
+            bytes=len(data),
+            http_status=200,
+            error="",
+            stored_utc=stored.isoformat(),
+            last_access_utc=stored.isoformat(),
+        )
+        self._index(symbol)[hour_dt.isoformat()] = entry
+        self._dirty.add(symbol)
+        return entry
+
+    # ── Write path ────────────────────────────────────────────────────
+
+    def store(
+        self,
+        symbol: str,
+        hour_dt: datetime,
+        data: bytes,
+        http_status: int,
+        error: str = "",
+    ) -> Optional[Path]:
+        """Record a network outcome for one hour.
+
+        Non-empty payloads are written atomically to the archive path, which
+        is returned. Only 404 and empty-200 outcomes become negative entries;
+        other failures are not cached.
+        """
+        if not data and http_status not in (200, 404):
+            return None
+
+        now_iso = self._now().isoformat()
+        rel = raw_archive_relpath(hour_dt)
+        path: Optional[Path] = None
+        if data:
+            path = self.symbol_dir(symbol) / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".bi5.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+
+        entry = CacheEntry(
+            hour_utc=hour_dt.isoformat(),
+            path=rel.as_posix() if data else "",
+            sha256=hashlib.sha256(data).hexdigest() if data else "",
+            bytes=len(data),
+            http_status=http_status,
+            error=error,
+            stored_utc=now_iso,
+            last_access_utc=now_iso,
+        )
+        with self._lock:
+            self._index(symbol)[hour_dt.isoformat()] = entry
+            self._dirty.add(symbol)
+            if self.max_bytes is not None:
+                self._evict(symbol, keep=hour_dt.isoformat())
+        return path
+
+    def total_bytes(self, symbol: str) -> int:
+        with self._lock:
+            return sum(entry.bytes for entry in self._index(symbol).values())
+
+    def _evict(self, symbol: str, keep: str) -> None:
+        """Drop least-recently-accessed payloads until under max_bytes."""
+        index = self._index(symbol)
+        total = sum(entry.bytes for entry in index.values())
+        if total <= self.max_bytes:
+            return
+
+        candidates = sorted(
+            (entry for key, entry in index.items() if key != keep and not entry.is_negative),
+            key=lambda entry: entry.last_access_utc,
+        )
+        for entry in candidates:
+            if total <= self.max_bytes:
+                break
+            try:
+                (self.symbol_dir(symbol) / entry.path).unlink()
+            except OSError:
+                pass
+            del index[entry.hour_utc]
+            total -= entry.bytes
+
+    def flush(self) -> None:
+        """Persist index changes for every symbol touched since the last flush."""
+        with self._lock:
+            for symbol in sorted(self._dirty):
+                _write_index(self.symbol_dir(symbol), self._indexes.get(symbol, {}))
+            self._dirty.clear()
@@ -1,10 +1,169 @@
 """Resample layer — derives higher timeframes from canonical 1m OHLCV."""
 
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
 import pandas as pd
+from pandas.tseries.frequencies import to_offset
 
+from .config import DERIVED_TIMEFRAMES
 from .validate import validate_ohlcv
 
 
+@dataclass(frozen=True)
+class Alignment:
+    """Bucketing rule for one timeframe: bar = floor((t - anchor) / period).
+
+    Times are UTC epoch nanoseconds. ``anchor`` shifts bar starts away from
+    UTC midnight, e.g. Alignment(1 day, 22h) would give FX-session days.
+    """
+
+    period: pd.Timedelta
+    anchor: pd.Timedelta = pd.Timedelta(0)
+
+    def nests_in(self, parent: "Alignment") -> bool:
+        """True if every bar of this alignment is a union of whole parent bars."""
+        return (
+            self.period.value % parent.period.value == 0
+            and (self.anchor - parent.anchor).value % parent.period.value == 0
+        )
+
+
+# Explicit bar alignment for every derived rule. All are anchored at UTC
+# midnight, which is what resample_from_1m (pandas origin="start_day")
+# produces for periods that divide a day:
+#   4h bars start at 00/04/08/12/16/20 UTC; 1D bars are UTC calendar days.
+TIMEFRAME_ALIGNMENT: Dict[str, Alignment] = {
+    "5min": Alignment(pd.Timedelta(minutes=5)),
+    "15min": Alignment(pd.Timedelta(minutes=15)),
+    "1h": Alignment(pd.Timedelta(hours=1)),
+    "4h": Alignment(pd.Timedelta(hours=4)),
+    "1D": Alignment(pd.Timedelta(days=1)),
+}
+
+
+@dataclass
+class OHLCVArrays:
+    """Column arrays for a bar series, indexed by int64 UTC ns bar starts."""
+
+    timestamp_ns: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.timestamp_ns)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "OHLCVArrays":
+        # Scale the raw int64 values; as_unit("ns") on a tz-aware index is slow
+        to_ns = pd.Timedelta(1, unit=df.index.unit).value
+        return cls(
+            timestamp_ns=df.index.asi8 * to_ns,
+            **{col: df[col].to_numpy(dtype=np.float64)
+               for col in ("open", "high", "low", "close", "volume")},
+        )
+
+    def to_frame(self, unit: str = "ns", name: Optional[str] = None) -> pd.DataFrame:
+        index = pd.DatetimeIndex(
+            self.timestamp_ns.view("datetime64[ns]"), name=name,
+        ).tz_localize("UTC").as_unit(unit)
+        return pd.DataFrame(
+            {"open": self.open, "high": self.high, "low": self.low,
+             "close": self.close, "volume": self.volume},
+            index=index,
+        )
+
+
+def aggregate_ohlcv(bars: OHLCVArrays, alignment: Alignment) -> OHLCVArrays:
+    """Aggregate sorted bars into ``alignment`` buckets in one reduceat pass.
+
+    open/close take the first/last bar of each bucket, high/low the max/min
+    and volume the sum. Only occupied buckets are emitted.
+    """
+    if len(bars) == 0:
+        return bars
+    period, anchor = alignment.period.value, alignment.anchor.value
+    bucket = (bars.timestamp_ns - anchor) // period
+    starts = np.concatenate(([0], np.flatnonzero(bucket[1:] != bucket[:-1]) + 1))
+    ends = np.append(starts[1:], len(bucket)) - 1
+    return OHLCVArrays(
+        timestamp_ns=bucket[starts] * period + anchor,
+        open=bars.open[starts],
+        high=np.maximum.reduceat(bars.high, starts),
+        low=np.minimum.reduceat(bars.low, starts),
+        close=bars.close[ends],
+        volume=np.add.reduceat(bars.volume, starts),
+    )
+
+
+def cascade_plan(
+    rules: Sequence[str],
+    alignments: Optional[Dict[str, Alignment]] = None,
+) -> List[tuple]:
+    """Order rules finest-first and pick each one's source rule.
+
+    Returns [(rule, source_rule or None for 1m)], where the source is the
+    coarsest already-built timeframe whose bars nest inside the rule's bars.
+    """
+    alignments = alignments or TIMEFRAME_ALIGNMENT
+    ordered = sorted(rules, key=lambda r: alignments[r].period)
+    plan = []
+    for i, rule in enumerate(ordered):
+        source = None
+        for candidate in reversed(ordered[:i]):
+            if alignments[rule].nests_in(alignments[candidate]):
+                source = candidate
+                break
+        plan.append((rule, source))
+    return plan
+
+
+def add_derived_metadata(resampled: pd.DataFrame) -> pd.DataFrame:
+    """Add the vendor/build_method/quality_flag columns of a derived frame."""
+    resampled["vendor"] = "derived"
+    resampled["build_method"] = "resample_from_1m"
+    resampled["quality_flag"] = "ok"
+    return resampled
+
+
+def resample_cascade(
+    canonical_df: pd.DataFrame,
+    rules: Sequence[str] = DERIVED_TIMEFRAMES,
+    alignments: Optional[Dict[str, Alignment]] = None,
+) -> Dict[str, pd.DataFrame]:
+    """Resample canonical 1m OHLCV to every rule in one cascaded pass.
+
+    The 1m arrays are extracted once; each timeframe is then aggregated from
+    the next-lower one that nests inside it (1m→5m→15m→1h→4h→1D with the
+    default alignment) rather than rescanning the 1m data. Output frames
+    match resample_from_1m, including metadata columns. Open/high/low/close
+    are identical; volume is summed in a different order, so it can differ
+    in the last bits.
+    """
+    alignments = alignments or TIMEFRAME_ALIGNMENT
+    if canonical_df.empty:
+        return {rule: pd.DataFrame() for rule in rules}
+
+    unit, name = canonical_df.index.unit, canonical_df.index.name
+    built: Dict[Optional[str], OHLCVArrays] = {None: OHLCVArrays.from_frame(canonical_df)}
+    for rule, source in cascade_plan(rules, alignments):
+        built[rule] = aggregate_ohlcv(built[source], alignments[rule])
+
+    frames: Dict[str, pd.DataFrame] = {}
+    for rule in rules:
+        bars = built[rule]
+        frame = bars.to_frame(unit, name)
+        # pandas keeps the rule as the index freq when no bucket was empty
+        if len(bars) and np.all(np.diff(bars.timestamp_ns) == alignments[rule].period.value):
+            frame.index.freq = to_offset(rule)
+        frames[rule] = add_derived_metadata(frame)
+    return frames
+
+
 def resample_from_1m(canonical_df: pd.DataFrame, rule: str) -> pd.DataFrame:
     """Resample canonical 1m OHLCV to a higher timeframe.
 
@@ -25,9 +184,4 @@ def resample_from_1m(canonical_df: pd.DataFrame, rule: str) -> pd.DataFrame:
     # Drop bars with no data
     resampled = resampled.dropna(subset=["open"])
 
-    # Add metadata columns
-    resampled["vendor"] = "derived"
-    resampled["build_method"] = "resample_from_1m"
-    resampled["quality_flag"] = "ok"
-
-    return resampled
+    return add_derived_metadata(resampled)
@@ -0,0 +1,183 @@
+"""Incremental rollup — folds new canonical 1m bars into the derived timeframes.
+
+The rollup keeps, per symbol, the 1m watermark it has folded up to and the
+last (possibly still open) bar of every derived timeframe. A refresh takes
+the canonical bars after the watermark, cascades them up the timeframes, merges
+the first bucket into the open bar when they share a start, and writes back
+only the tail partitions of each derived store. Cost is O(new bars), not
+O(history).
+
+State lives in DERIVED_DIR/<SYMBOL>/_rollup.json and is written after the
+derived partitions, so it only ever claims bars that are already persisted.
+Anything the rollup cannot fold forward — no state yet, bars arriving at or
+before the watermark, a canonical window that does not reach back to the
+watermark — is left to the caller's full/selective rebuild, after which
+``seed`` re-establishes the state.
+"""
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+import pandas as pd
+
+from .canonical_store import CanonicalStore
+from .config import DERIVED_DIR, DERIVED_TIMEFRAMES, TIMEFRAME_LABELS
+from .resample import resample_cascade
+
+ROLLUP_FILENAME = "_rollup.json"
+ROLLUP_VERSION = 1
+
+_OHLCV = ["open", "high", "low", "close", "volume"]
+
+
+@dataclass
+class OpenBar:
+    """Last derived bar of one timeframe; may still be receiving 1m bars."""
+
+    start_utc: str  # ISO format
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+@dataclass
+class RollupState:
+    """Folded-up-to watermark and the open bar of every derived timeframe."""
+
+    watermark_utc: str  # ISO format, last 1m bar folded
+    open_bars: Dict[str, OpenBar]  # keyed by tf label ("5m", "1h", ...)
+
+
+def load_state(symbol: str, root: Optional[Path] = None) -> Optional[RollupState]:
+    """Read a symbol's rollup state, returning None if absent or unreadable."""
+    path = (Path(root) if root is not None else DERIVED_DIR) / symbol / ROLLUP_FILENAME
+    if not path.exists():
+        return None
+    try:
+        raw = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if raw.get("version") != ROLLUP_VERSION:
+        return None
+    return RollupState(
+        watermark_utc=raw["watermark_utc"],
+        open_bars={label: OpenBar(**bar) for label, bar in raw["open_bars"].items()},
+    )
+
+
+def _write_state(symbol: str, root: Path, state: RollupState) -> None:
+    symbol_dir = root / symbol
+    symbol_dir.mkdir(parents=True, exist_ok=True)
+    payload = {"version": ROLLUP_VERSION, **asdict(state)}
+    tmp = symbol_dir / f"{ROLLUP_FILENAME}.tmp"
+    tmp.write_text(json.dumps(payload, indent=1))
+    os.replace(tmp, symbol_dir / ROLLUP_FILENAME)
+
+
+def _merge_open_bar(folded: pd.DataFrame, open_bar: Optional[OpenBar]) -> pd.DataFrame:
+    """Merge the first folded bar into ``open_bar`` when they share a start."""
+    if open_bar is not None and not folded.empty and folded.index[0] == pd.Timestamp(open_bar.start_utc):
+        first = folded.index[0]
+        folded.loc[first, "open"] = open_bar.open
+        folded.loc[first, "high"] = max(open_bar.high, folded.at[first, "high"])
+        folded.loc[first, "low"] = min(open_bar.low, folded.at[first, "low"])
+        folded.loc[first, "volume"] = open_bar.volume + folded.at[first, "volume"]
+    return folded
+
+
+def _open_bar(df: pd.DataFrame) -> OpenBar:
+    last = df.iloc[-1]
+    return OpenBar(
+        start_utc=df.index[-1].isoformat(),
+        **{col: float(last[col]) for col in _OHLCV},
+    )
+
+
+class IncrementalRollup:
+    """Maintains every derived timeframe of one symbol from new 1m bars.
+
+    Usage:
+        rollup = IncrementalRollup("EURUSD")
+        if rollup.can_fold(canonical, new_data_start):
+            tails = rollup.update(canonical)    # {tf label: changed bars}
+        else:
+            ...full or selective rebuild...
+            rollup.seed(derived_by_label, canonical.index[-1])
+    """
+
+    def __init__(self, symbol: str, root: Optional[Path] = None) -> None:
+        self.symbol = symbol
+        self.root = Path(root) if root is not None else DERIVED_DIR
+        self.rules = {TIMEFRAME_LABELS[rule]: rule for rule in DERIVED_TIMEFRAMES}
+        self.state = load_state(symbol, self.root)
+
+    @property
+    def watermark(self) -> Optional[pd.Timestamp]:
+        return pd.Timestamp(self.state.watermark_utc) if self.state else None
+
+    def store(self, tf_label: str) -> CanonicalStore:
+        return CanonicalStore(self.symbol, root=self.root, timeframe=tf_label)
+
+    def can_fold(self, canonical: pd.DataFrame, new_data_start: Optional[pd.Timestamp]) -> bool:
+        """True if the bars after the watermark can be folded forward.
+
+        Requires state for every derived timeframe, new data strictly after
+        the watermark, and a canonical window that reaches back to it.
+        """
+        if self.state is None or set(self.state.open_bars) != set(self.rules):
+            return False
+        if new_data_start is None or canonical.empty:
+            return False
+        return new_data_start > self.watermark and canonical.index[0] <= self.watermark
+
+    def update(self, canonical: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+        """Fold canonical bars past the watermark and persist the changed tails.
+
+        Returns {tf label: changed bars}, each starting with the (updated)
+        previously open bar or the first new bar.
+        """
+        new_1m = canonical.loc[canonical.index > self.watermark, _OHLCV]
+        if new_1m.empty:
+            return {}
+
+        folded = resample_cascade(new_1m, list(self.rules.values()))
+        changed: Dict[str, pd.DataFrame] = {}
+        for tf_label, rule in self.rules.items():
+            tail = _merge_open_bar(folded[rule], self.state.open_bars[tf_label])
+            self._persist_tail(tf_label, tail)
+            self.state.open_bars[tf_label] = _open_bar(tail)
+            changed[tf_label] = tail
+
+        self.state.watermark_utc = new_1m.index[-1].isoformat()
+        _write_state(self.symbol, self.root, self.state)
+        return changed
+
+    def _persist_tail(self, tf_label: str, tail: pd.DataFrame) -> None:
+        store = self.store(tf_label)
+        first = tail.index[0]
+        watermark = store.watermark()
+        # Merge into the partition holding the stored last bar, even when the
+        # new bars open a fresh bucket after it
+        existing = store.read(since=min(first, watermark)) if watermark is not None else None
+        if existing is not None:
+            tail = pd.concat([existing[existing.index < first], tail])
+        store.write(tail, dirty_from=first)
+
+    def seed(self, derived: Dict[str, pd.DataFrame], watermark: pd.Timestamp) -> None:
+        """Reset the state from freshly rebuilt derived frames.
+
+        ``derived`` maps every tf label to its full frame, whose last row is
+        the open bar; ``watermark`` is the last 1m bar they were built from.
+        """
+        if set(derived) != set(self.rules) or any(df.empty for df in derived.values()):
+            return
+        self.state = RollupState(
+            watermark_utc=watermark.isoformat(),
+            open_bars={label: _open_bar(df) for label, df in derived.items()},
+        )
+        _write_state(self.symbol, self.root, self.state)
@@ -0,0 +1,238 @@
+"""Staged ingestion — network fetch, CPU decode/aggregate and bar merge run as separate stages.
+
+Fetcher threads (pipeline._iter_hour_fetches) hand raw bi5 payloads to a
+bounded queue of decode jobs on a ProcessPoolExecutor, where LZMA
+decompression, tick decode and 1m aggregation run off the I/O threads. A
+single writer — the calling thread — drains finished jobs strictly in hour
+order and hands each to merge_hour, which the inline path uses too: it
+appends bars, records diagnostics and applies the provider fallback policy.
+
+Backpressure: when ``max_pending`` decode jobs are outstanding the writer
+blocks on the oldest one before accepting another payload, which in turn
+stops fetch results being consumed and new hours being submitted.
+"""
+
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Deque, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+import requests
+
+from .aggregate import tick_arrays_to_1m_ohlcv
+from .config import InstrumentMeta
+from .decode import DecodeStats, decode_tick_arrays, tick_stats
+from .diagnostics import DiagnosticsCollector
+from .fetch import FetchResult, build_bi5_url
+
+
+def decode_hour_to_bars(
+    raw_bytes: bytes,
+    hour_start: datetime,
+    meta: InstrumentMeta,
+) -> Tuple[pd.DataFrame, DecodeStats, float]:
+    """Decompress, decode and aggregate one hour. Runs in a worker process.
+
+    Returns (1m bars, decode stats, seconds spent).
+    """
+    t0 = time.perf_counter()
+    try:
+        arrays = decode_tick_arrays(raw_bytes, hour_start, meta)
+    except Exception as exc:
+        stats = DecodeStats(
+            tick_count=0, price_min=None, price_max=None,
+            volume_total=None, error=str(exc),
+        )
+        return pd.DataFrame(), stats, time.perf_counter() - t0
+
+    stats = tick_stats(arrays)
+    bars = tick_arrays_to_1m_ohlcv(arrays)
+    return bars, stats, time.perf_counter() - t0
+
+
+def merge_hour(
+    hour: datetime,
+    bars: Optional[pd.DataFrame],
+    stats: Optional[DecodeStats],
+    payload_error: str,
+    symbol: str,
+    meta: InstrumentMeta,
+    collector: Optional[DiagnosticsCollector],
+    all_bars: List[pd.DataFrame],
+    vendors_seen: Set[str],
+    fallback_fn: Callable[[str, datetime], pd.DataFrame],
+) -> None:
+    """Merge one hour's Dukascopy bars and apply the provider fallback policy.
+
+    ``bars`` is None when Dukascopy returned no payload (a transport failure
+    leaves none either); ``payload_error`` is then the fetch error recorded
+    for the hour. ``stats`` is the decode stats when there was a payload.
+    Used by both the inline and the staged ingest paths.
+    """
+    bars_produced = 0
+    if bars is not None and not bars.empty:
+        bars["vendor"] = meta.primary_provider
+        all_bars.append(bars)
+        vendors_seen.add(meta.primary_provider)
+        bars_produced = len(bars)
+
+    if collector:
+        if bars is None:
+            collector.record_decode(
+                hour_utc=hour,
+                tick_count=0,
+                bars_produced=0,
+                decode_error=payload_error or "no_payload",
+            )
+        else:
+            collector.record_decode(
+                hour_utc=hour,
+                tick_count=stats.tick_count,
+                bars_produced=bars_produced,
+                price_min=stats.price_min,
+                price_max=stats.price_max,
+                volume_total=stats.volume_total,
+                decode_error=stats.error,
+            )
+
+    # --- AC-3 fallback: per-instrument policy (transport failures only) ---
+    if bars is None and meta.fallback_enabled:
+        fb = fallback_fn(symbol, hour)
+        if not fb.empty:
+            fb["vendor"] = meta.fallback_provider
+            all_bars.append(fb)
+            vendors_seen.add(meta.fallback_provider)
+            print(f"[pipeline] fallback: {meta.fallback_provider} supplied "
+                  f"{len(fb)} bars for {hour}")
+
+
+@dataclass
+class _PendingHour:
+    hour: datetime
+    result: FetchResult
+    fetch_s: float
+    queue_depth: int
+    job: Optional[Future]
+
+
+def ingest_staged(
+    fetches: Iterable[Tuple[datetime, Callable]],
+    symbol: str,
+    meta: InstrumentMeta,
+    collector: Optional[DiagnosticsCollector],
+    all_bars: List[pd.DataFrame],
+    vendors_seen: Set[str],
+    fallback_fn: Callable[[str, datetime], pd.DataFrame],
+    decode_workers: int,
+    max_pending: Optional[int] = None,
+) -> int:
+    """Run the decode stage on a process pool; return the number of hours fetched.
+
+    ``fetches`` yields (hour, result) pairs in hour order, where result()
+    returns either raw bytes (fetch_bi5) or a FetchResult
+    (fetch_bi5_detailed). Bars are appended to ``all_bars`` in hour order.
+    """
+    max_pending = max_pending or decode_workers * 2
+    window: Deque[_PendingHour] = deque()
+    fetch_count = 0
+    backpressure_s = 0.0
+
+    with ProcessPoolExecutor(max_workers=decode_workers) as pool:
+
+        def drain_oldest() -> None:
+            nonlocal backpressure_s
+            pending = window.popleft()
+            t_wait = time.perf_counter()
+            if pending.job is not None:
+                pending.job.exception()  # block until done without raising
+            waited = time.perf_counter() - t_wait
+            backpressure_s += waited
+            if collector:
+                collector.record_stage(
+                    pending.hour, fetch_s=pending.fetch_s,
+                    queue_depth=pending.queue_depth, writer_wait_s=waited,
+                )
+            _finish_hour(pending, symbol, meta, collector, all_bars, vendors_seen, fallback_fn)
+
+        for hour, fetched in fetches:
+            t0 = time.perf_counter()
+            try:
+                value = fetched()
+            except requests.RequestException as exc:
+                print(f"[pipeline] dukascopy transport error at {hour}: {exc}")
+                value = FetchResult(
+                    data=b"", url=build_bi5_url(symbol, hour), http_status=0,
+                    cached_path="", error=f"transport_error:{exc}",
+                )
+            except Exception as exc:
+                print(f"[pipeline] error at {hour}: {exc}")
+                if collector:
+                    collector.record_fetch(
+                        hour_utc=hour, url=build_bi5_url(symbol, hour),
+                        http_status=0, payload=b"", error=f"pipeline_error:{exc}",
+                    )
+                continue
+            fetch_s = time.perf_counter() - t0
+            fetch_count += 1
+
+            result = value if isinstance(value, FetchResult) else FetchResult(
+                data=value, url="", http_status=0, cached_path="", error="",
+            )
+            if collector:
+                collector.record_fetch(
+                    hour_utc=hour,
+                    url=result.url,
+                    http_status=result.http_status,
+                    payload=result.data,
+                    cached_path=result.cached_path,
+                    error=result.error,
+                    from_cache=result.from_cache,
+                )
+
+            job = pool.submit(decode_hour_to_bars, result.data, hour, meta) if result.data else None
+            window.append(_PendingHour(
+                hour=hour, result=result, fetch_s=fetch_s, queue_depth=len(window) + 1, job=job,
+            ))
+            while len(window) >= max_pending:
+                drain_oldest()
+
+        while window:
+            drain_oldest()
+
+    print(f"[pipeline] staged decode: {decode_workers} worker(s), "
+          f"writer blocked {backpressure_s:.2f}s on decode backpressure")
+    return fetch_count
+
+
+def _finish_hour(
+    pending: _PendingHour,
+    symbol: str,
+    meta: InstrumentMeta,
+    collector: Optional[DiagnosticsCollector],
+    all_bars: List[pd.DataFrame],
+    vendors_seen: Set[str],
+    fallback_fn: Callable[[str, datetime], pd.DataFrame],
+) -> None:
+    """Writer step for one hour: merge decoded bars, then apply fallback policy."""
+    hour, result = pending.hour, pending.result
+    try:
+        bars = stats = None
+        if pending.job is not None:
+            bars, stats, decode_s = pending.job.result()
+            if collector:
+                collector.record_stage(hour, decode_s=decode_s)
+        merge_hour(hour, bars, stats, result.error, symbol, meta, collector,
+                   all_bars, vendors_seen, fallback_fn)
+    except Exception as exc:
+        print(f"[pipeline] error at {hour}: {exc}")
+        if collector:
+            collector.record_fetch(
+                hour_utc=hour,
+                url=build_bi5_url(symbol, hour),
+                http_status=0,
+                payload=b"",
+                error=f"pipeline_error:{exc}",
+            )
@@ -0,0 +1,210 @@
+"""Shared indicator kernels — true range, ATR, moving averages, ROC, quantiles.
+
+The kernels are NumPy functions over the last axis, so a single series and
+a stack of series (one per row, padded with NaN) go through the same code.
+Rolling means come from cumulative sums in bar order: a window holding a
+NaN is NaN, as in a pandas rolling mean, and a series gets identical values
+alone or as a padded row of a stack.
+
+Indicators(source) computes each indicator of one OHLCV source (a DataFrame
+or the dict of arrays lenses take) at most once per parameter set. Inside
+``with indicator_scope():`` indicators(source) returns the same Indicators
+for the same source object, so the features, state summary and lenses of
+one packet build share what they compute. Results are shared: treat them
+as read-only.
+"""
+
+import warnings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, Optional, Sequence, Union
+
+import numpy as np
+
+ATR_METHODS = ("sma", "wilder")
+
+
+def true_range(high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+    """True range along the last axis; the first bar's is its high - low.
+
+    NaN terms are skipped, as in a row-wise pandas max.
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+    prev_close = np.full_like(close, np.nan)
+    prev_close[..., 1:] = close[..., :-1]
+    return np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+
+def sma(values: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average along the last axis.
+
+    NaN for the first ``period - 1`` bars and for every window holding a NaN.
+    """
+    if period < 1:
+        raise ValueError(f"period must be at least 1, got {period}")
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(values.shape, np.nan)
+    if values.shape[-1] < period:
+        return out
+    missing = np.isnan(values)
+    pad = [(0, 0)] * (values.ndim - 1) + [(1, 0)]
+    sums = np.pad(np.cumsum(np.where(missing, 0.0, values), axis=-1), pad)
+    gaps = np.pad(np.cumsum(missing, axis=-1), pad)
+    window_sum = sums[..., period:] - sums[..., :-period]
+    complete = gaps[..., period:] == gaps[..., :-period]
+    out[..., period - 1:] = np.where(complete, window_sum / period, np.nan)
+    return out
+
+
+def ema(values: np.ndarray, period: int) -> np.ndarray:
+    """Exponential moving average of a 1-D series, seeded with its first value."""
+    values = np.asarray(values, dtype=np.float64)
+    alpha = 2.0 / (period + 1)
+    out = np.empty_like(values)
+    if len(values) == 0:
+        return out
+    prev = values[0]
+    smoothed = [prev]
+    for value in values[1:].tolist():
+        prev = alpha * value + (1 - alpha) * prev
+        smoothed.append(prev)
+    out[:] = smoothed
+    return out
+
+
+def wilder_atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = 14) -> np.ndarray:
+    """ATR of a 1-D series with Wilder's smoothing.
+
+    NaN before index ``period - 1``, which holds the simple mean of the
+    first ``period`` true ranges; after that
+    ATR[i] = (ATR[i-1] * (period - 1) + TR[i]) / period.
+    """
+    tr = true_range(high, low, close)
+    out = np.full(len(tr), np.nan)
+    if len(tr) < period:
+        return out
+    prev = np.mean(tr[:period])
+    smoothed = [prev]
+    for value in tr[period:].tolist():
+        prev = (prev * (period - 1) + value) / period
+        smoothed.append(prev)
+    out[period - 1:] = smoothed
+    return out
+
+
+def roc(values: np.ndarray, lookback: int) -> np.ndarray:
+    """Rate of change (fraction) over ``lookback`` bars along the last axis.
+
+    NaN for the first ``lookback`` bars; 0.0 where the base value is 0.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    out = np.full(values.shape, np.nan)
+    if values.shape[-1] <= lookback:
+        return out
+    base = values[..., :-lookback] if lookback else values
+    with np.errstate(divide="ignore", invalid="ignore"):
+        change = (values[..., lookback:] - base) / base
+    out[..., lookback:] = np.where(base == 0, 0.0, change)
+    return out
+
+
+def tail_quantile(
+    values: np.ndarray,
+    q: Union[float, Sequence[float]],
+    window: int,
+) -> np.ndarray:
+    """Quantile(s) of the last ``window`` non-NaN values along the last axis.
+
+    Linear interpolation, as pandas Series.quantile. A sequence ``q``
+    adds a leading axis, as in numpy. NaN where there are no values.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(values)
+    from_end = np.flip(np.cumsum(np.flip(valid, axis=-1), axis=-1), axis=-1)
+    tail = np.where(valid & (from_end <= window), values, np.nan)
+    if tail.shape[-1] == 0:
+        return np.full(np.shape(q) + tail.shape[:-1], np.nan)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN rows
+        return np.nanquantile(tail, q, axis=-1)
+
+
+class Indicators:
+    """Indicators of one OHLCV source, each computed once per parameter set.
+
+    ``source`` is anything indexable by column name: a DataFrame, or the
+    dict of arrays lenses take.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self._memo: Dict[tuple, np.ndarray] = {}
+
+    def _get(self, key: tuple, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        value = self._memo.get(key)
+        if value is None:
+            value = self._memo[key] = compute()
+        return value
+
+    def column(self, name: str) -> np.ndarray:
+        """A source column as a float64 array."""
+        return self._get(("column", name), lambda: np.asarray(self.source[name], dtype=np.float64))
+
+    def true_range(self) -> np.ndarray:
+        return self._get(
+            ("true_range",),
+            lambda: true_range(self.column("high"), self.column("low"), self.column("close")),
+        )
+
+    def atr(self, period: int = 14, method: str = "sma") -> np.ndarray:
+        """ATR series: a simple mean of true range ("sma") or Wilder's ("wilder")."""
+        if method not in ATR_METHODS:
+            raise ValueError(f"Unknown ATR method: {method!r} (expected one of {ATR_METHODS})")
+        if method == "wilder":
+            return self._get(
+                ("atr", period, method),
+                lambda: wilder_atr(self.column("high"), self.column("low"), self.column("close"), period),
+            )
+        return self._get(("atr", period, method), lambda: sma(self.true_range(), period))
+
+    def sma(self, period: int, column: str = "close") -> np.ndarray:
+        return self._get(("sma", period, column), lambda: sma(self.column(column), period))
+
+    def ema(self, period: int, column: str = "close") -> np.ndarray:
+        return self._get(("ema", period, column), lambda: ema(self.column(column), period))
+
+    def roc(self, lookback: int, column: str = "close") -> np.ndarray:
+        return self._get(("roc", lookback, column), lambda: roc(self.column(column), lookback))
+
+
+_SCOPE: ContextVar[Optional[Dict[int, Indicators]]] = ContextVar("indicator_scope", default=None)
+
+
+@contextmanager
+def indicator_scope() -> Iterator[None]:
+    """Share Indicators per source object until the block exits.
+
+    Nested scopes join the outermost one. Each thread or task has its own.
+    """
+    if _SCOPE.get() is not None:
+        yield
+        return
+    token = _SCOPE.set({})
+    try:
+        yield
+    finally:
+        _SCOPE.reset(token)
+
+
+def indicators(source) -> Indicators:
+    """The Indicators of ``source``: shared within an indicator_scope, else new."""
+    scope = _SCOPE.get()
+    if scope is None:
+        return Indicators(source)
+    # Entries keep their source alive, so an id is not reused within a scope
+    entry = scope.get(id(source))
+    if entry is None or entry.source is not source:
+        entry = scope[id(source)] = Indicators(source)
+    return entry
@@ -8,6 +8,8 @@ from datetime import datetime, timezone
 
 import pandas as pd
 
+from market_data_officer.indicators import indicator_scope, indicators, tail_quantile
+
 from .contracts import CoreFeatures
 
 # Swing detection lookback (bars on each side of pivot)
@@ -48,18 +50,7 @@ def compute_atr(df: pd.DataFrame, period: int = ATR_PERIOD) -> float:
     """
     if len(df) < period + 1:
         return 0.0
-
-    high = df["high"]
-    low = df["low"]
-    close = df["close"]
-
-    tr1 = high - low
-    tr2 = (high - close.shift(1)).abs()
-    tr3 = (low - close.shift(1)).abs()
-
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    atr = true_range.rolling(period).mean().iloc[-1]
-    return float(atr)
+    return float(indicators(df).atr(period)[-1])
 
 
 def compute_volatility_regime(
@@ -80,21 +71,13 @@ def compute_volatility_regime(
     if len(df) < period + rolling_window:
         return "normal"
 
-    high = df["high"]
-    low = df["low"]
-    close = df["close"]
-
-    tr1 = high - low
-    tr2 = (high - close.shift(1)).abs()
-    tr3 = (low - close.shift(1)).abs()
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    rolling_atr = true_range.rolling(period).mean()
-
-    current_atr = rolling_atr.iloc[-1]
-    atr_history = rolling_atr.dropna().tail(rolling_window)
-
-    low_threshold = atr_history.quantile(VOLATILITY_LOW_PERCENTILE / 100)
-    high_threshold = atr_history.quantile(VOLATILITY_HIGH_PERCENTILE / 100)
+    rolling_atr = indicators(df).atr(period)
+    current_atr = rolling_atr[-1]
+    low_threshold, high_threshold = tail_quantile(
+        rolling_atr,
+        (VOLATILITY_LOW_PERCENTILE / 100, VOLATILITY_HIGH_PERCENTILE / 100),
+        rolling_window,
+    )
 
     if current_atr < low_threshold:
         return "low"
@@ -115,9 +98,7 @@ def compute_momentum(df: pd.DataFrame, period: int = MOMENTUM_PERIOD) -> float:
     """
     if len(df) < period + 1:
         return 0.0
-    close = df["close"]
-    roc = (close.iloc[-1] - close.iloc[-1 - period]) / close.iloc[-1 - period]
-    return float(roc)
+    return float(indicators(df).roc(period)[-1])
 
 
 def compute_swing_high(df: pd.DataFrame, lookback: int = SWING_LOOKBACK) -> float:
@@ -230,17 +211,19 @@ def compute_core_features(
     if as_of_utc is None:
         as_of_utc = datetime.now(timezone.utc)
 
-    atr_14 = compute_atr(df_1h, ATR_PERIOD)
-    volatility_regime = compute_volatility_regime(df_1h)
-    momentum = compute_momentum(df_1h, MOMENTUM_PERIOD)
-
-    # Moving averages — graceful on insufficient data
-    ma_50 = 0.0
-    ma_200 = 0.0
-    if len(df_1h) >= 50:
-        ma_50 = float(df_1h["close"].rolling(50).mean().iloc[-1])
-    if len(df_1h) >= 200:
-        ma_200 = float(df_1h["close"].rolling(200).mean().iloc[-1])
+    # True range, ATR and moving averages are computed once for the frame
+    with indicator_scope():
+        atr_14 = compute_atr(df_1h, ATR_PERIOD)
+        volatility_regime = compute_volatility_regime(df_1h)
+        momentum = compute_momentum(df_1h, MOMENTUM_PERIOD)
+
+        # Moving averages — graceful on insufficient data
+        ma_50 = 0.0
+        ma_200 = 0.0
+        if len(df_1h) >= 50:
+            ma_50 = float(indicators(df_1h).sma(50)[-1])
+        if len(df_1h) >= 200:
+            ma_200 = float(indicators(df_1h).sma(200)[-1])
 
     swing_high = compute_swing_high(df_1h)
     swing_low = compute_swing_low(df_1h)
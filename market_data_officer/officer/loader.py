@@ -1,7 +1,10 @@
 """Package loader — reads OHLCV data from PriceStore (default) or hot package CSVs (fallback).
 
-Primary path: PriceStore via PriceStoreAdapter (trading-data-pipeline).
-Fallback path: CSV hot packages from market_data/packages/latest/.
+Primary path: PriceStore via PriceStoreAdapter (trading-data-pipeline),
+one adapter per process with a short-lived cache of its bars (PRICESTORE).
+Fallback path: CSV hot packages from market_data/packages/latest/, read
+through their binary twins when the feed has written them and kept parsed
+in the process-wide HOT_PACKAGE_CACHE until the feed rewrites them.
 
 Fallback activates only on infrastructure unavailability (TDP not installed,
 not configured, or data dir missing) — NOT on empty data from PriceStore.
@@ -9,14 +12,16 @@ not configured, or data dir missing) — NOT on empty data from PriceStore.
 
 import json
 import logging
-import os
 from pathlib import Path
 from typing import Dict, Optional
 
 import pandas as pd
 
+from market_data_officer.feed.hot_cache import HOT_PACKAGE_CACHE, load_hot_frame
 from market_data_officer.instrument_registry import INSTRUMENT_REGISTRY
 
+from .pricestore import PRICESTORE
+
 logger = logging.getLogger(__name__)
 
 # Default hot package directory (matches feed config)
@@ -46,41 +51,12 @@ def get_expected_timeframes(instrument: str) -> list[str]:
 
 
 def _get_pricestore_adapter():
-    """Get PriceStoreAdapter instance. Returns None if TDP unavailable.
+    """Get the process-wide PriceStoreAdapter. Returns None if TDP unavailable.
 
-    Wiring: uses TDP_SRC_DIR for sys.path import, TDP_DATA_DIR for
-    PipelineConfig construction. Does NOT call TDP's load_config() to
-    avoid DATA_DIR env var collision (D-25).
+    The adapter is built once and re-built only after a failed health
+    check or a change of TDP_SRC_DIR / TDP_DATA_DIR (officer/pricestore.py).
     """
-    try:
-        from pipeline.adapters.mdo_adapter import PriceStoreAdapter
-        from pipeline.config import PipelineConfig
-        from pipeline.stores.price_store import PriceStore
-    except ImportError:
-        tdp_src = os.getenv("TDP_SRC_DIR", "")
-        if tdp_src:
-            import sys
-            if tdp_src not in sys.path:
-                sys.path.insert(0, tdp_src)
-            try:
-                from pipeline.adapters.mdo_adapter import PriceStoreAdapter
-                from pipeline.config import PipelineConfig
-                from pipeline.stores.price_store import PriceStore
-            except ImportError:
-                return None
-        else:
-            return None
-
-    tdp_data_dir = os.getenv("TDP_DATA_DIR", "")
-    if not tdp_data_dir or not Path(tdp_data_dir).exists():
-        return None
-
-    try:
-        config = PipelineConfig(data_dir=Path(tdp_data_dir))
-        store = PriceStore(config)
-        return PriceStoreAdapter(store)
-    except Exception:
-        return None
+    return PRICESTORE.adapter()
 
 
 def load_from_pricestore(
@@ -100,6 +76,9 @@ def load_from_pricestore(
     Source selection: if source/price_basis are not specified,
     PriceStoreAdapter applies its documented default precedence
     (bid > mid, capital > oanda).
+
+    Results are cached per (instrument, timeframe, source, price_basis)
+    for PRICESTORE_CACHE_TTL_S seconds; treat the frames as read-only.
     """
     adapter = _get_pricestore_adapter()
     if adapter is None:
@@ -108,8 +87,8 @@ def load_from_pricestore(
     if timeframes is None:
         timeframes = tuple(get_expected_timeframes(instrument))
 
-    return adapter.get_timeframes(
-        instrument, timeframes, source=source, price_basis=price_basis,
+    return PRICESTORE.get_timeframes(
+        adapter, instrument, timeframes, source=source, price_basis=price_basis,
     )
 
 
@@ -120,6 +99,8 @@ def load_manifest(instrument: str, packages_dir: Path = PACKAGES_DIR) -> dict:
         instrument: Instrument symbol, e.g. 'EURUSD'.
         packages_dir: Path to the hot packages directory.
 
+    A changed as_of_utc drops the instrument's cached frames.
+
     Returns:
         Parsed manifest dict with keys: instrument, as_of_utc, schema, windows.
 
@@ -132,7 +113,9 @@ def load_manifest(instrument: str, packages_dir: Path = PACKAGES_DIR) -> dict:
             f"Hot package manifest not found for {instrument}. "
             f"Has the feed pipeline run? Expected: {manifest_path}"
         )
-    return json.loads(manifest_path.read_text())
+    manifest = json.loads(manifest_path.read_text())
+    HOT_PACKAGE_CACHE.note_manifest(packages_dir, instrument, manifest.get("as_of_utc"))
+    return manifest
 
 
 def load_timeframe(
@@ -140,7 +123,11 @@ def load_timeframe(
     tf: str,
     packages_dir: Path = PACKAGES_DIR,
 ) -> pd.DataFrame:
-    """Load a single timeframe CSV from the hot package.
+    """Load a single timeframe from the hot package.
+
+    Prefers the memory-mapped binary twin of the CSV (feed/hot_package.py)
+    and parses the CSV only when the binary is missing or stale. The parsed
+    frame is cached until either file changes; treat its values as read-only.
 
     Args:
         instrument: Instrument symbol, e.g. 'EURUSD'.
@@ -153,18 +140,7 @@ def load_timeframe(
     Raises:
         FileNotFoundError: If the CSV file does not exist.
     """
-    csv_path = packages_dir / f"{instrument}_{tf}_latest.csv"
-    if not csv_path.exists():
-        raise FileNotFoundError(f"Hot package CSV not found: {csv_path}")
-
-    df = pd.read_csv(csv_path, index_col=0, parse_dates=True)
-
-    # Ensure UTC-aware index
-    if df.index.tzinfo is None:
-        df.index = df.index.tz_localize("UTC")
-
-    df.index.name = "timestamp_utc"
-    return df
+    return load_hot_frame(packages_dir, instrument, tf)
 
 
 def _load_from_csv(
@@ -0,0 +1,209 @@
+"""Process-wide PriceStore adapter and a TTL cache of the bars it returns.
+
+Building a PriceStoreAdapter imports the trading-data-pipeline (TDP)
+modules, may extend sys.path and opens a PriceStore over TDP_DATA_DIR.
+PRICESTORE does that once per process, on first use, under a lock, and
+hands every caller the same adapter. The adapter is health-checked at
+most every PRICESTORE_HEALTH_CHECK_S seconds (TDP_DATA_DIR still exists,
+and the adapter's own health_check() passes when it has one) and is
+re-created when a check fails, when TDP_SRC_DIR or TDP_DATA_DIR change,
+or after a read through it raised. An unavailable TDP is remembered for
+the same interval, so the imports are not retried on every packet build.
+
+Bars are cached per (instrument, timeframe, source, price_basis) for
+PRICESTORE_CACHE_TTL_S seconds (0 disables the cache); only the expired
+or missing timeframes are read. Callers get shallow copies of the cached
+frames, so the values must be treated as read-only.
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+DEFAULT_TTL_S = float(os.environ.get("PRICESTORE_CACHE_TTL_S", "30"))
+DEFAULT_HEALTH_CHECK_S = float(os.environ.get("PRICESTORE_HEALTH_CHECK_S", "30"))
+
+
+def _tdp_settings() -> Tuple[str, str]:
+    return os.getenv("TDP_SRC_DIR", ""), os.getenv("TDP_DATA_DIR", "")
+
+
+def build_pricestore_adapter():
+    """Build a new PriceStoreAdapter. Returns None if TDP unavailable.
+
+    Wiring: uses TDP_SRC_DIR for sys.path import, TDP_DATA_DIR for
+    PipelineConfig construction. Does NOT call TDP's load_config() to
+    avoid DATA_DIR env var collision (D-25).
+    """
+    try:
+        from pipeline.adapters.mdo_adapter import PriceStoreAdapter
+        from pipeline.config import PipelineConfig
+        from pipeline.stores.price_store import PriceStore
+    except ImportError:
+        tdp_src = os.getenv("TDP_SRC_DIR", "")
+        if tdp_src:
+            import sys
+            if tdp_src not in sys.path:
+                sys.path.insert(0, tdp_src)
+            try:
+                from pipeline.adapters.mdo_adapter import PriceStoreAdapter
+                from pipeline.config import PipelineConfig
+                from pipeline.stores.price_store import PriceStore
+            except ImportError:
+                return None
+        else:
+            return None
+
+    tdp_data_dir = os.getenv("TDP_DATA_DIR", "")
+    if not tdp_data_dir or not Path(tdp_data_dir).exists():
+        return None
+
+    try:
+        config = PipelineConfig(data_dir=Path(tdp_data_dir))
+        store = PriceStore(config)
+        return PriceStoreAdapter(store)
+    except Exception:
+        return None
+
+
+def _healthy(adapter) -> bool:
+    """TDP_DATA_DIR still exists and the adapter's health_check(), if any, passes."""
+    data_dir = os.getenv("TDP_DATA_DIR", "")
+    if not data_dir or not Path(data_dir).exists():
+        return False
+    check = getattr(adapter, "health_check", None)
+    if not callable(check):
+        return True
+    try:
+        return bool(check())
+    except Exception:
+        return False
+
+
+class PriceStoreConnection:
+    """Lazily built, shared PriceStore adapter plus a TTL cache of its bars."""
+
+    def __init__(
+        self,
+        factory: Callable[[], object] = build_pricestore_adapter,
+        ttl_s: float = DEFAULT_TTL_S,
+        health_check_s: float = DEFAULT_HEALTH_CHECK_S,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.factory = factory
+        self.ttl_s = ttl_s
+        self.health_check_s = health_check_s
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._adapter = None
+        self._settings: Optional[Tuple[str, str]] = None
+        self._next_check = 0.0
+        # (instrument, tf, source, price_basis) -> (expires_at, frame)
+        self._results: Dict[tuple, Tuple[float, pd.DataFrame]] = {}
+        self._results_owner = None
+        self.creations = 0
+        self.hits = 0
+        self.misses = 0
+
+    def adapter(self):
+        """The shared adapter, built or re-built as needed; None if TDP unavailable."""
+        settings = _tdp_settings()
+        with self._lock:
+            now = self._clock()
+            if self._settings == settings:
+                if now < self._next_check:
+                    return self._adapter
+                if self._adapter is not None and _healthy(self._adapter):
+                    self._next_check = now + self.health_check_s
+                    return self._adapter
+            # First use, changed settings, failed check, or TDP was unavailable
+            self._adapter = self.factory()
+            self._settings = settings
+            self._next_check = now + self.health_check_s
+            self.creations += 1
+            return self._adapter
+
+    def get_timeframes(
+        self,
+        adapter,
+        instrument: str,
+        timeframes: tuple[str, ...],
+        source: Optional[str] = None,
+        price_basis: Optional[str] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """adapter.get_timeframes, reading only the timeframes not cached.
+
+        A read that raises marks the adapter for re-creation and propagates.
+        """
+        now = self._clock()
+        found: Dict[str, pd.DataFrame] = {}
+        missing = []
+        with self._lock:
+            if adapter is not self._results_owner:
+                self._results.clear()
+                self._results_owner = adapter
+            for tf in timeframes:
+                entry = self._results.get((instrument, tf, source, price_basis))
+                if entry is not None and entry[0] > now:
+                    found[tf] = entry[1]
+                    self.hits += 1
+                else:
+                    missing.append(tf)
+                    self.misses += 1
+
+        if missing:
+            try:
+                fetched = adapter.get_timeframes(
+                    instrument, tuple(missing), source=source, price_basis=price_basis,
+                )
+            except Exception:
+                self.discard(adapter)
+                raise
+            with self._lock:
+                if self.ttl_s > 0 and adapter is self._results_owner:
+                    for tf, df in fetched.items():
+                        self._results[(instrument, tf, source, price_basis)] = (now + self.ttl_s, df)
+            found.update(fetched)
+
+        ordered = {tf: found[tf] for tf in timeframes if tf in found}
+        ordered.update(found)
+        return {tf: df.copy(deep=False) for tf, df in ordered.items()}
+
+    def discard(self, adapter) -> None:
+        """Forget ``adapter`` and its cached bars; the next adapter() builds anew."""
+        with self._lock:
+            if adapter is self._adapter:
+                self._adapter = None
+                self._settings = None
+            if adapter is self._results_owner:
+                self._results.clear()
+
+    def clear(self) -> None:
+        """Drop the adapter and every cached frame, and reset the counters."""
+        with self._lock:
+            self._adapter = None
+            self._settings = None
+            self._results.clear()
+            self._results_owner = None
+            self.creations = self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        """Counters and occupancy, for /metrics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "available": self._adapter is not None,
+                "creations": self.creations,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+                "entries": len(self._results),
+                "ttl_s": self.ttl_s,
+            }
+
+
+PRICESTORE = PriceStoreConnection()
@@ -0,0 +1,92 @@
+"""Column-wise serialization of OHLCV frames for packets and read APIs.
+
+Timestamps are formatted for the whole index at once (ISO 8601 with a "Z"
+suffix, or epoch seconds) and prices are converted one column at a time,
+so building rows costs a few array operations plus one dict per row
+instead of a pandas Series per row. Callers slice to the tail they need
+before serializing.
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+ROW_LAYOUTS = ("rows", "columnar")
+
+
+def iso_timestamps(index: pd.DatetimeIndex) -> list:
+    """``ts.isoformat()`` for every timestamp, with "+00:00" written as "Z".
+
+    Fractional seconds appear only where non-zero, as microseconds or
+    nanoseconds, exactly as Timestamp.isoformat gives them.
+    """
+    index = pd.DatetimeIndex(index)
+    if len(index) == 0:
+        return []
+    if index.tz is not None and str(index.tz) != "UTC":
+        return [ts.isoformat().replace("+00:00", "Z") for ts in index]
+
+    ns = index.as_unit("ns").asi8
+    wall = index.tz_localize(None) if index.tz is not None else index
+    text = np.datetime_as_string(wall.as_unit("s").to_numpy(), unit="s").astype(object)
+
+    fraction = ns % 10**9
+    has_fraction = fraction != 0
+    if has_fraction.any():
+        micro = has_fraction & (fraction % 1000 == 0)
+        nano = has_fraction & ~micro
+        text[micro] += np.char.mod(".%06d", fraction[micro] // 1000).astype(object)
+        text[nano] += np.char.mod(".%09d", fraction[nano]).astype(object)
+    # Aware UTC timestamps end in "+00:00", written as "Z"; naive ones in nothing
+    return (text + ("Z" if index.tz is not None else "")).tolist()
+
+
+def epoch_seconds(index: pd.DatetimeIndex) -> np.ndarray:
+    """Whole UTC epoch seconds per timestamp (int64), as int(ts.timestamp())."""
+    ns = pd.DatetimeIndex(index).as_unit("ns").asi8
+    # int() truncates toward zero, floor division does not before 1970
+    return np.where(ns < 0, -(-ns // 10**9), ns // 10**9)
+
+
+def valid_ohlcv_mask(df: pd.DataFrame) -> np.ndarray:
+    """True for rows whose OHLCV fields are all finite numbers.
+
+    Non-numeric values count as malformed, as does a missing column.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for field in OHLCV_FIELDS:
+        if field not in df.columns:
+            return np.zeros(len(df), dtype=bool)
+        values = pd.to_numeric(df[field], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        mask &= np.isfinite(values)
+    return mask
+
+
+def serialize_ohlcv(df: pd.DataFrame, layout: str = "rows", limit: Optional[int] = None):
+    """The timeframe rows of a market packet, for the last ``limit`` bars.
+
+    Args:
+        df: OHLCV DataFrame with DatetimeIndex.
+        layout: "rows" for a list of {timestamp_utc, open, ..., volume}
+            dicts, or "columnar" for one list per field under the same keys.
+        limit: Keep only the last ``limit`` bars; None keeps all.
+
+    Raises:
+        ValueError: For an unknown layout.
+    """
+    if layout not in ROW_LAYOUTS:
+        raise ValueError(f"Unknown row layout: {layout!r} (expected one of {ROW_LAYOUTS})")
+    if limit is not None:
+        df = df.iloc[len(df) - min(limit, len(df)):]
+
+    columns = {"timestamp_utc": iso_timestamps(df.index)}
+    for field in OHLCV_FIELDS:
+        columns[field] = df[field].to_numpy(dtype=np.float64).tolist()
+
+    if layout == "columnar":
+        return columns
+    keys = tuple(columns)
+    return [dict(zip(keys, values)) for values in zip(*columns.values())]
@@ -6,6 +6,7 @@ Does not implement any of the above directly — delegates to each module.
 
 import json
 import os
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -28,7 +29,9 @@ from .contracts import (
 from .features import compute_core_features
 from .loader import EXPECTED_TIMEFRAMES, PACKAGES_DIR, get_expected_timeframes, load_all_timeframes, load_manifest
 from .quality import check_package_quality
+from .serialize import ROW_LAYOUTS, serialize_ohlcv
 from .summarizer import build_state_summary
+from market_data_officer.indicators import indicator_scope
 from market_data_officer.structure.reader import load_structure_summary, structure_is_available
 from market_data_officer.instrument_registry import INSTRUMENT_REGISTRY
 
@@ -101,18 +104,14 @@ def _build_timeframe_rows(df: pd.DataFrame) -> list:
     Returns:
         List of row dicts with timestamp_utc, open, high, low, close, volume.
     """
-    rows = []
-    for ts, row in df.iterrows():
-        ts_str = ts.isoformat().replace("+00:00", "Z")
-        rows.append({
-            "timestamp_utc": ts_str,
-            "open": float(row["open"]),
-            "high": float(row["high"]),
-            "low": float(row["low"]),
-            "close": float(row["close"]),
-            "volume": float(row["volume"]),
-        })
-    return rows
+    return serialize_ohlcv(df)
+
+
+def _build_timeframe_entry(df: pd.DataFrame, row_layout: str) -> dict:
+    """The packet's entry for one timeframe: its rows, or one array per field."""
+    if row_layout == "columnar":
+        return {"count": len(df), "columns": serialize_ohlcv(df, layout="columnar")}
+    return {"count": len(df), "rows": _build_timeframe_rows(df)}
 
 
 def _get_canonical_tf(instrument: str, timeframes_data: dict[str, pd.DataFrame]) -> str:
@@ -296,6 +295,7 @@ def build_market_packet(
     instrument: str,
     packages_dir: Path = PACKAGES_DIR,
     structure_output_dir: Path | None = None,
+    row_layout: str = "rows",
 ) -> MarketPacketV2:
     """Build a complete Market Packet v2 for the given instrument.
 
@@ -306,10 +306,18 @@ def build_market_packet(
         instrument: Instrument symbol, e.g. 'EURUSD'.
         packages_dir: Path to the hot packages directory.
         structure_output_dir: Optional custom structure output directory.
+        row_layout: "rows" (default) gives each timeframe a list of row
+            dicts under "rows"; "columnar" gives one array per field under
+            "columns" instead, for consumers that read arrays.
 
     Returns:
         MarketPacketV2 instance ready for serialization.
+
+    Raises:
+        ValueError: For an unknown row_layout.
     """
+    if row_layout not in ROW_LAYOUTS:
+        raise ValueError(f"Unknown row layout: {row_layout!r} (expected one of {ROW_LAYOUTS})")
     now_utc = datetime.now(timezone.utc)
     as_of_utc = now_utc.isoformat().replace("+00:00", "Z")
 
@@ -371,6 +379,7 @@ def build_market_packet(
                 ),
                 structure=StructureBlock.unavailable(),
             )
+        timeframes_data = load_all_timeframes(instrument, packages_dir)
     else:
         # Load all timeframes first — needed for both quality and packet
         timeframes_data = load_all_timeframes(instrument, packages_dir)
@@ -403,37 +412,27 @@ def build_market_packet(
         data_quality = "validated"
         source_quality = "validated"
 
-    # Load timeframes if not already loaded above (unverified path)
-    if "timeframes_data" not in dir():
-        timeframes_data = load_all_timeframes(instrument, packages_dir)
-
     # Build timeframe section for packet — use per-instrument expected TFs
     expected_tfs = get_expected_timeframes(instrument)
     timeframes_packet: Dict[str, dict] = {}
     for tf in expected_tfs:
         if tf in timeframes_data:
-            df = timeframes_data[tf]
-            timeframes_packet[tf] = {
-                "count": len(df),
-                "rows": _build_timeframe_rows(df),
-            }
+            timeframes_packet[tf] = _build_timeframe_entry(timeframes_data[tf], row_layout)
     # Also include any legacy TFs present but not in expected (backward compat)
     for tf in timeframes_data:
         if tf not in timeframes_packet:
-            df = timeframes_data[tf]
-            timeframes_packet[tf] = {
-                "count": len(df),
-                "rows": _build_timeframe_rows(df),
-            }
-
-    # Compute core features from 1h bars
-    df_1h = timeframes_data.get("1h", pd.DataFrame())
-    core_features = compute_core_features(df_1h, as_of_utc=now_utc)
-
-    # Build state summary
-    state_summary = build_state_summary(
-        core_features, timeframes_data, data_quality=data_quality
-    )
+            timeframes_packet[tf] = _build_timeframe_entry(timeframes_data[tf], row_layout)
+
+    # Features and the state summary share indicators of the same frames
+    with indicator_scope():
+        # Compute core features from 1h bars
+        df_1h = timeframes_data.get("1h", pd.DataFrame())
+        core_features = compute_core_features(df_1h, as_of_utc=now_utc)
+
+        # Build state summary
+        state_summary = build_state_summary(
+            core_features, timeframes_data, data_quality=data_quality
+        )
 
     # Log quality issues
     for flag in quality_block.flags:
@@ -454,8 +453,7 @@ def build_market_packet(
         structure_block = StructureBlock.unavailable()
 
     # Vendor label: PriceStore path reflects adapter source, CSV path uses manifest
-    _using_pricestore = "timeframes_data" in dir() and os.getenv("TDP_DATA_DIR", "")
-    if _using_pricestore:
+    if os.getenv("TDP_DATA_DIR", ""):
         vendor_label = "pricestore"
     else:
         vendor_label = (
@@ -482,6 +480,74 @@ def build_market_packet(
     )
 
 
+@dataclass
+class PacketBuildResult:
+    """Outcome of building one instrument's packet in build_each_market_packet.
+
+    status is "ok" or "failed" (the build raised; error holds the message).
+    wall_s is the time the instrument's build took.
+    """
+
+    instrument: str
+    status: str
+    packet: MarketPacketV2 | None = None
+    error: str | None = None
+    wall_s: float | None = None
+
+
+def build_each_market_packet(
+    instruments: list[str],
+    packages_dir: Path = PACKAGES_DIR,
+    structure_output_dir: Path | None = None,
+    row_layout: str = "rows",
+) -> Dict[str, PacketBuildResult]:
+    """Call build_market_packet for each instrument, isolating failures.
+
+    A convenience wrapper, not a batched build: instruments are built one
+    after another, each with its own loads and feature pass. An exception
+    marks that instrument "failed" and the rest are still built.
+
+    Args:
+        instruments: Instrument symbols, e.g. ['EURUSD', 'XAUUSD'].
+        packages_dir: Path to the hot packages directory.
+        structure_output_dir: Optional custom structure output directory.
+        row_layout: "rows" or "columnar", as for build_market_packet.
+
+    Returns:
+        Dict mapping instrument to its PacketBuildResult, in input order.
+
+    Raises:
+        ValueError: For an unknown row_layout.
+    """
+    if row_layout not in ROW_LAYOUTS:
+        raise ValueError(f"Unknown row layout: {row_layout!r} (expected one of {ROW_LAYOUTS})")
+    results: Dict[str, PacketBuildResult] = {}
+    for instrument in dict.fromkeys(instruments):
+        t0 = time.perf_counter()
+        try:
+            packet = build_market_packet(
+                instrument,
+                packages_dir=packages_dir,
+                structure_output_dir=structure_output_dir,
+                row_layout=row_layout,
+            )
+        except Exception as e:
+            results[instrument] = PacketBuildResult(
+                instrument=instrument,
+                status="failed",
+                error=f"{type(e).__name__}: {e}",
+                wall_s=time.perf_counter() - t0,
+            )
+            continue
+        results[instrument] = PacketBuildResult(
+            instrument=instrument,
+            status="ok",
+            packet=packet,
+            wall_s=time.perf_counter() - t0,
+        )
+    return results
+
+
 def refresh_from_latest_exports(
     instrument: str,
     packages_dir: Path = PACKAGES_DIR,
@@ -7,6 +7,8 @@ from typing import Dict
 
 import pandas as pd
 
+from market_data_officer.indicators import indicators
+
 from .contracts import CoreFeatures, StateSummary
 
 # Momentum thresholds for state classification
@@ -26,8 +28,8 @@ def derive_trend(df: pd.DataFrame) -> str:
     if len(df) < 200:
         return "neutral"
     close = df["close"].iloc[-1]
-    ma50 = df["close"].rolling(50).mean().iloc[-1]
-    ma200 = df["close"].rolling(200).mean().iloc[-1]
+    ma50 = indicators(df).sma(50)[-1]
+    ma200 = indicators(df).sma(200)[-1]
     if close > ma50 > ma200:
         return "bullish"
     if close < ma50 < ma200:
@@ -0,0 +1,122 @@
+"""Structure Engine benchmark CLI — offline, on synthetic bars.
+
+Usage:
+    python run_benchmarks.py
+    python run_benchmarks.py --sizes 1000 10000 --scenarios trending gappy
+    python run_benchmarks.py --output baseline.json
+    python run_benchmarks.py --sizes 1000 10000 --baseline baseline.json --threshold 0.25
+    python run_benchmarks.py --help
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from market_data_officer.benchmarks.structure_bench import (
+    DEFAULT_SIZES,
+    FUNCTIONS,
+    OUTPUT_PATH,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    write_results,
+)
+from market_data_officer.benchmarks.synthetic import SCENARIOS
+
+
+def main() -> None:
+    """Run the structure benchmarks and optionally gate against a baseline."""
+    parser = argparse.ArgumentParser(
+        description="Time the Structure Engine stages on synthetic OHLCV bars",
+    )
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=list(SCENARIOS),
+        default=list(SCENARIOS),
+        help="Synthetic series to run (default: all)",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=list(DEFAULT_SIZES),
+        help="Bar counts (default: 1000 10000 100000 1000000)",
+    )
+    parser.add_argument(
+        "--functions",
+        nargs="+",
+        choices=list(FUNCTIONS),
+        default=list(FUNCTIONS),
+        help="Stages to time (default: all)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Runs per measurement; the best is kept (default: 3)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Synthetic series seed (default: 0)",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=str(OUTPUT_PATH),
+        help=f"Results JSON path (default: {OUTPUT_PATH})",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        default=None,
+        help="Baseline results JSON; exit 1 if any stage regresses past --threshold",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown against the baseline, as a fraction (default: 0.25)",
+    )
+
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        try:
+            baseline = load_results(Path(args.baseline))
+        except (FileNotFoundError, ValueError) as e:
+            print(f"ERROR: {e}")
+            sys.exit(2)
+
+    print("Structure Engine benchmarks")
+    print(f"  Scenarios: {', '.join(args.scenarios)}")
+    print(f"  Sizes:     {', '.join(f'{n:,}' for n in args.sizes)}")
+    print()
+
+    results = run_benchmarks(
+        scenarios=args.scenarios,
+        sizes=args.sizes,
+        functions=args.functions,
+        repeat=args.repeat,
+        seed=args.seed,
+    )
+    write_results(results, Path(args.output))
+    print()
+    print(f"Results written to {args.output}")
+
+    if baseline is None:
+        return
+    regressions = compare_results(results, baseline, threshold=args.threshold)
+    if regressions:
+        print(f"FAIL: {len(regressions)} regression(s) beyond {args.threshold:.0%} against {args.baseline}")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+    print(f"OK: no regression beyond {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
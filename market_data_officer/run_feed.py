@@ -123,12 +123,42 @@ def main() -> None:
         default=False,
         help="Generate cache diagnostics report (per-hour fetch/decode audit trail)",
     )
+    parser.add_argument(
+        "--raw-cache",
+        action="store_true",
+        default=False,
+        help="Serve immutable hours from the local raw bi5 archive (read-through cache)",
+    )
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=1,
+        help="Number of hours to download concurrently (default: 1, serial)",
+    )
+    parser.add_argument(
+        "--decode-workers",
+        type=int,
+        default=0,
+        help="Processes for decompress/decode/aggregate (default: 0, inline on the fetch path)",
+    )
+    parser.add_argument(
+        "--max-rps",
+        type=float,
+        default=None,
+        help="Maximum requests per second per host when fetching",
+    )
     parser.add_argument(
         "--fixture",
         action="store_true",
         default=False,
         help="Seed a synthetic hot package fixture for dev/test (no network required)",
     )
+    parser.add_argument(
+        "--migrate-canonical",
+        action="store_true",
+        default=False,
+        help="Split the legacy single-file canonical parquet into the partitioned store and exit",
+    )
 
     args = parser.parse_args()
 
@@ -136,6 +166,15 @@ def main() -> None:
         _seed_fixture(args.instrument)
         return
 
+    if args.migrate_canonical:
+        from market_data_officer.feed.canonical_store import CanonicalStore
+        store = CanonicalStore(args.instrument)
+        if store.exists():
+            print(f"[canonical] {store.dir} already partitioned — nothing to migrate")
+        elif not store.migrate_legacy():
+            print(f"[canonical] no legacy file at {store.legacy_path}")
+        return
+
     if not args.start_date or not args.end_date:
         parser.error("--start-date and --end-date are required (unless using --fixture)")
 
@@ -152,6 +191,7 @@ def main() -> None:
 
     # Import here to avoid import errors when just running --help
     from market_data_officer.feed.pipeline import run_pipeline
+    from market_data_officer.feed.raw_cache import Bi5Cache
 
     run_pipeline(
         symbol=args.instrument,
@@ -161,6 +201,10 @@ def main() -> None:
         gap_report=args.gap_report,
         hot_only=args.hot_only,
         diagnostics=args.diagnostics,
+        fetch_workers=args.fetch_workers,
+        max_requests_per_second=args.max_rps,
+        raw_cache=Bi5Cache() if args.raw_cache else None,
+        decode_workers=args.decode_workers,
     )
 
 
@@ -3,23 +3,25 @@
 Usage:
     python run_officer.py --instrument EURUSD
     python run_officer.py --instrument EURUSD --output-path state/packets/
+    python run_officer.py --instrument EURUSD GBPUSD XAUUSD
 """
 
 import argparse
 from pathlib import Path
 
-from market_data_officer.officer.service import build_market_packet, write_packet
+from market_data_officer.officer.service import build_each_market_packet, write_packet
 
 
 def main() -> None:
-    """Run the Market Data Officer to build and write a market packet."""
+    """Run the Market Data Officer to build and write market packets."""
     parser = argparse.ArgumentParser(
         description="Market Data Officer — build structured market packets from validated feed data."
     )
     parser.add_argument(
         "--instrument",
         required=True,
-        help="Instrument symbol, e.g. EURUSD",
+        nargs="+",
+        help="Instrument symbol(s), e.g. EURUSD XAUUSD",
     )
     parser.add_argument(
         "--output-path",
@@ -28,28 +30,38 @@ def main() -> None:
     )
     args = parser.parse_args()
 
-    instrument = args.instrument.upper()
+    instruments = [instrument.upper() for instrument in args.instrument]
     output_dir = Path(args.output_path)
 
-    print(f"[officer] Building market packet v2 for {instrument}...")
-
-    packet = build_market_packet(instrument)
-
-    # Write packet to file
-    output_path = write_packet(packet, output_dir)
-    print(f"[officer] Packet written to: {output_path}")
-
-    # Print summary
-    print(f"\nMarket packet v2 built: {instrument}")
-    print(f"  schema_version: market_packet_v2")
-    print(f"  as_of_utc: {packet.as_of_utc}")
-    print(f"  data_quality: {packet.state_summary.data_quality}")
-    print(f"  stale: {packet.quality.stale}")
-    print(f"  partial: {packet.quality.partial}")
-    print(f"  flags: {packet.quality.flags}")
-    print(f"  trusted: {packet.is_trusted()}")
-    print(f"  structure_available: {packet.structure.available}")
-    print(f"  has_structure: {packet.has_structure()}")
+    print(f"[officer] Building market packet v2 for {', '.join(instruments)}...")
+
+    results = build_each_market_packet(instruments)
+    failed = False
+    for instrument, result in results.items():
+        if result.status != "ok":
+            failed = True
+            print(f"[officer] ERROR: {instrument}: {result.error}")
+            continue
+        packet = result.packet
+
+        # Write packet to file
+        output_path = write_packet(packet, output_dir)
+        print(f"[officer] Packet written to: {output_path}")
+
+        # Print summary
+        print(f"\nMarket packet v2 built: {instrument} ({result.wall_s:.2f}s)")
+        print(f"  schema_version: market_packet_v2")
+        print(f"  as_of_utc: {packet.as_of_utc}")
+        print(f"  data_quality: {packet.state_summary.data_quality}")
+        print(f"  stale: {packet.quality.stale}")
+        print(f"  partial: {packet.quality.partial}")
+        print(f"  flags: {packet.quality.flags}")
+        print(f"  trusted: {packet.is_trusted()}")
+        print(f"  structure_available: {packet.structure.available}")
+        print(f"  has_structure: {packet.has_structure()}")
+
+    if failed:
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
@@ -3,6 +3,9 @@
 Usage:
     python run_structure.py --instrument EURUSD --timeframes 15m 1h 4h
     python run_structure.py --instrument XAUUSD --timeframes 15m 1h 4h
+    python run_structure.py --instrument EURUSD --incremental
+    python run_structure.py --instrument EURUSD XAUUSD --workers 4
+    python run_structure.py --instrument EURUSD GBPUSD XAUUSD --batch
     python run_structure.py --help
 """
 
@@ -11,6 +14,7 @@ from pathlib import Path
 
 from market_data_officer.structure.config import StructureConfig
 from market_data_officer.structure.engine import run_engine
+from market_data_officer.structure.incremental import STATE_DIR
 
 
 def main() -> None:
@@ -20,9 +24,9 @@ def main() -> None:
     )
     parser.add_argument(
         "--instrument",
-        type=str,
+        nargs="+",
         required=True,
-        help="Instrument symbol (e.g. EURUSD, XAUUSD)",
+        help="Instrument symbol(s) (e.g. EURUSD, XAUUSD)",
     )
     parser.add_argument(
         "--timeframes",
@@ -54,8 +58,32 @@ def main() -> None:
         default=None,
         help="Custom output directory (default: market_data_officer/structure/output)",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Fold new bars into kept per-timeframe state instead of recomputing",
+    )
+    parser.add_argument(
+        "--state-dir",
+        type=str,
+        default=None,
+        help="Incremental state directory (default: market_data_officer/structure/output/state)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for instrument/timeframe tasks (default: 1, in-process)",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Compute each timeframe for all instruments at once on a stacked bar array",
+    )
 
     args = parser.parse_args()
+    if args.batch and args.incremental:
+        parser.error("--batch cannot be combined with --incremental")
 
     config = StructureConfig(
         pivot_left_bars=args.pivot_left,
@@ -64,23 +92,33 @@ def main() -> None:
     )
 
     print(f"Phase 3A Structure Engine")
-    print(f"  Instrument: {args.instrument}")
+    print(f"  Instrument: {', '.join(args.instrument)}")
     print(f"  Timeframes: {', '.join(args.timeframes)}")
     print(f"  Pivot: {config.pivot_left_bars}L / {config.pivot_right_bars}R")
     print()
 
     packages_dir = Path(args.packages_dir) if args.packages_dir else None
     output_dir = Path(args.output_dir) if args.output_dir else None
+    state_dir = None
+    if args.incremental:
+        state_dir = Path(args.state_dir) if args.state_dir else STATE_DIR
 
     results = run_engine(
-        instruments=[args.instrument],
+        instruments=args.instrument,
         config=config,
         packages_dir=packages_dir,
         output_dir=output_dir,
+        state_dir=state_dir,
+        workers=args.workers,
+        batch=args.batch,
     )
 
+    written = [r for r in results.values() if r.status == "ok"]
     print()
-    print(f"Done. {len(results)} packet(s) written.")
+    print(f"Done. {len(written)} packet(s) written.")
+    if written:
+        slowest = max(written, key=lambda r: r.wall_s)
+        print(f"  Slowest task: {slowest.instrument}_{slowest.timeframe} ({slowest.wall_s:.2f}s)")
 
 
 if __name__ == "__main__":
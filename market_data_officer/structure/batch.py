@@ -0,0 +1,332 @@
+"""Batch Structure Engine — one timeframe for many instruments at once.
+
+Every instrument's hot package for a timeframe is loaded into a BarStack:
+one (instruments × bars) array per OHLCV column on the union timestamp
+grid, NaN where an instrument has no bar, plus a ``present`` mask.
+
+Swings and FVGs are defined on each instrument's own bar sequence, not on
+grid slots (a missing bar is not a bar), so the kernels run on a packed
+view: every row's present bars moved to the left, NaN-padded on the right,
+with each row's length bounding its valid positions. Pivot and gap masks
+come from the same array code the single-instrument modules use, applied
+along the bar axis of the whole stack; only the objects for the pivots and
+gaps found, and the path-dependent stages (events, liquidity, regime),
+are built per instrument. Fill tracking of the new FVGs is batched too:
+each zone's first touch and full fill are first-passage searches, answered
+for every zone of every instrument at once from sparse min/max tables.
+Packets are identical to compute_structure_packet on each instrument's
+bars alone.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import StructureConfig
+from .engine import assemble_packet
+from .events import detect_events, update_swing_statuses
+from .imbalance import build_active_zone_registry, build_fvgs, fvg_gaps, fvg_min_size
+from .io import PACKAGES_DIR, load_bars
+from .liquidity import detect_liquidity
+from .regime import compute_regime
+from .schemas import StructurePacket
+from .swings import build_swings, pivot_mask
+
+COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass
+class BarStack:
+    """OHLCV bars of several instruments aligned on one timestamp grid.
+
+    values maps each OHLCV column to an (instruments × grid) float64 array,
+    NaN wherever ``present`` is False.
+    """
+
+    instruments: List[str]
+    timeframe: str
+    timestamps: pd.DatetimeIndex
+    values: Dict[str, np.ndarray]
+    present: np.ndarray
+    _packed: Dict[str, np.ndarray] = field(default_factory=dict, init=False, repr=False)
+
+    @classmethod
+    def from_frames(cls, frames: Dict[str, pd.DataFrame], timeframe: str) -> "BarStack":
+        """Stack per-instrument OHLCV frames (UTC DatetimeIndex), in ``frames`` order.
+
+        Raises:
+            ValueError: If a frame lacks an OHLCV column or its index is not
+                strictly increasing.
+        """
+        stamps = []
+        for instrument, bars in frames.items():
+            missing = set(COLUMNS) - set(bars.columns)
+            if missing:
+                raise ValueError(f"{instrument}: missing required columns: {missing}")
+            if not (bars.index.is_monotonic_increasing and bars.index.is_unique):
+                raise ValueError(f"{instrument}: bar index is not strictly increasing")
+            stamps.append(bars.index.as_unit("ns").asi8)
+
+        grid = np.unique(np.concatenate(stamps)) if stamps else np.empty(0, dtype=np.int64)
+        present = np.zeros((len(frames), len(grid)), dtype=bool)
+        values = {c: np.full((len(frames), len(grid)), np.nan) for c in COLUMNS}
+        for row, (bars, ns) in enumerate(zip(frames.values(), stamps)):
+            slots = np.searchsorted(grid, ns)
+            present[row, slots] = True
+            for c in COLUMNS:
+                values[c][row, slots] = bars[c].to_numpy(dtype=np.float64)
+
+        timestamps = pd.DatetimeIndex(pd.to_datetime(grid, utc=True), name="timestamp_utc")
+        return cls(list(frames), timeframe, timestamps, values, present)
+
+    @property
+    def lengths(self) -> np.ndarray:
+        """Bars per instrument."""
+        return self.present.sum(axis=1)
+
+    def packed(self, column: str) -> np.ndarray:
+        """``column`` with each row's bars left-aligned, NaN-padded to the longest row."""
+        if column not in self._packed:
+            values = self.values[column]
+            if self.present.all():
+                self._packed[column] = values
+            else:
+                rows, slots = np.nonzero(self.present)
+                lengths = self.lengths
+                starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+                rank = np.arange(len(rows)) - np.repeat(starts, lengths)
+                packed = np.full((len(self.instruments), lengths.max(initial=0)), np.nan)
+                packed[rows, rank] = values[rows, slots]
+                self._packed[column] = packed
+        return self._packed[column]
+
+    def bar_timestamps(self, row: int) -> pd.DatetimeIndex:
+        return self.timestamps[self.present[row]]
+
+    def frame(self, row: int) -> pd.DataFrame:
+        """One instrument's bars as the OHLCV DataFrame load_bars would give."""
+        n = int(self.present[row].sum())
+        return pd.DataFrame(
+            {c: self.packed(c)[row, :n] for c in COLUMNS},
+            index=self.bar_timestamps(row),
+        )
+
+
+def load_bar_stack(
+    instruments: Sequence[str],
+    timeframe: str,
+    packages_dir: Path = PACKAGES_DIR,
+) -> Tuple[BarStack, Dict[str, Exception]]:
+    """Load one timeframe's hot packages for ``instruments`` into a BarStack.
+
+    Returns:
+        The stack of every instrument that loaded, and the exception
+        load_bars raised for each that did not.
+    """
+    frames, errors = {}, {}
+    for instrument in instruments:
+        try:
+            frames[instrument] = load_bars(instrument, timeframe, packages_dir=packages_dir)
+        except Exception as e:
+            errors[instrument] = e
+    return BarStack.from_frames(frames, timeframe), errors
+
+
+def _row_positions(mask: np.ndarray, offset: int) -> List[np.ndarray]:
+    """Per row, the flagged positions of a 2-D mask plus ``offset``."""
+    rows, cols = np.nonzero(mask)
+    bounds = np.searchsorted(rows, np.arange(len(mask) + 1))
+    return [cols[bounds[r]:bounds[r + 1]] + offset for r in range(len(mask))]
+
+
+def _before(lengths: np.ndarray, width: int) -> np.ndarray:
+    """(rows × width) mask of the positions below each row's length."""
+    return np.arange(width)[None, :] < lengths[:, None]
+
+
+def batch_pivots(stack: BarStack, config: StructureConfig) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+    """Pivot-high and pivot-low anchor positions for every instrument.
+
+    Positions index each instrument's own bars, as detect_swings sees them.
+    """
+    left, right = config.pivot_left_bars, config.pivot_right_bars
+    window = left + 1 + right
+    highs, lows = stack.packed("high"), stack.packed("low")
+    if highs.shape[1] < window:
+        empty = [np.empty(0, dtype=np.int64) for _ in stack.instruments]
+        return empty, list(empty)
+
+    # Only windows that end on one of the row's own bars
+    valid = _before(stack.lengths - window + 1, highs.shape[1] - window + 1)
+    return (
+        _row_positions(pivot_mask(highs, left, right, is_high=True) & valid, left),
+        _row_positions(pivot_mask(lows, left, right, is_high=False) & valid, left),
+    )
+
+
+def _sparse_table(values: np.ndarray, reduce) -> List[np.ndarray]:
+    """Level p holds ``reduce`` over each run of 2**p values along the last axis."""
+    table = [values]
+    width = 1
+    while 2 * width <= values.shape[-1]:
+        prev = table[-1]
+        table.append(reduce(prev[:, :-width], prev[:, width:]))
+        width *= 2
+    return table
+
+
+def _first_hit(table: List[np.ndarray], rows: np.ndarray, starts: np.ndarray, ends: np.ndarray, hit) -> np.ndarray:
+    """Per query, the first position in [start, end) whose value hits, else end.
+
+    Binary lifting: from the widest level down, skip every run in which
+    ``hit(run extreme)`` is False for no value can hit there either.
+    """
+    pos = starts.copy()
+    for p in range(len(table) - 1, -1, -1):
+        width = 1 << p
+        level = table[p]
+        fits = pos + width <= ends
+        extreme = level[rows, np.where(fits, pos, 0)]
+        pos = np.where(fits & ~hit(extreme), pos + width, pos)
+    return pos
+
+
+def _range_reduce(table: List[np.ndarray], reduce, rows: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """``reduce`` over positions [lo, hi] (inclusive, non-empty) per query."""
+    p = np.log2(hi - lo + 1).astype(np.int64)
+    out = np.empty(len(rows))
+    for level in np.unique(p):
+        q = np.flatnonzero(p == level)
+        values = table[level]
+        out[q] = reduce(values[rows[q], lo[q]], values[rows[q], hi[q] - (1 << level) + 1])
+    return out
+
+
+def batch_fvg_fills(stack: BarStack, zones: List[list], starts: List[np.ndarray]) -> None:
+    """Track fills of newly detected (open) FVGs for every instrument, in place.
+
+    ``zones[row]`` are an instrument's zones and ``starts[row]`` the position
+    of the first bar after each zone's confirmation. Transitions, times and
+    fill extremes are those update_zone_fills gives: the first close into
+    the zone makes it partially filled, the first close at or beyond the
+    far edge from there on invalidates it, and the fill extreme runs over
+    the closes in between (NaN closes never hit and never count).
+    """
+    closes = stack.packed("close")
+    lengths = stack.lengths
+    counts = [len(z) for z in zones]
+    if not sum(counts) or closes.shape[1] == 0:
+        return
+
+    flat = [zone for row_zones in zones for zone in row_zones]
+    rows = np.repeat(np.arange(len(zones)), counts)
+    start = np.concatenate(starts).astype(np.int64)
+    end = lengths[rows]
+    bullish = np.array([z.fvg_type == "bullish_fvg" for z in flat])
+    high = np.array([z.zone_high for z in flat], dtype=np.float64)
+    low = np.array([z.zone_low for z in flat], dtype=np.float64)
+
+    touch = np.empty(len(flat), dtype=np.int64)
+    full = np.empty(len(flat), dtype=np.int64)
+    extreme = np.full(len(flat), np.nan)
+    for side, reduce in ((bullish, np.fmin), (~bullish, np.fmax)):
+        q = np.flatnonzero(side)
+        if not len(q):
+            continue
+        table = _sparse_table(closes, reduce)
+        lower = reduce is np.fmin
+        if lower:
+            # Bullish: enter below zone_high, fully fill at or below zone_low
+            touch[q] = _first_hit(table, rows[q], start[q], end[q], lambda v: v < high[q])
+            full[q] = _first_hit(table, rows[q], touch[q], end[q], lambda v: v <= low[q])
+        else:
+            touch[q] = _first_hit(table, rows[q], start[q], end[q], lambda v: v > low[q])
+            full[q] = _first_hit(table, rows[q], touch[q], end[q], lambda v: v >= high[q])
+        touched = q[touch[q] < end[q]]
+        last = np.minimum(full[touched], end[touched] - 1)
+        extreme[touched] = _range_reduce(table, reduce, rows[touched], touch[touched], last)
+
+    offset = 0
+    for row, row_zones in enumerate(zones):
+        n = lengths[row]
+        span = slice(offset, offset + len(row_zones))
+        offset += len(row_zones)
+        if n == 0:
+            continue
+        # Box each row's transition times in one go, not bar by bar
+        index = stack.bar_timestamps(row)
+        touch_times = index[np.minimum(touch[span], n - 1)]
+        full_times = index[np.minimum(full[span], n - 1)]
+        for zone, t, f, bull, value, touch_time, full_time in zip(
+            row_zones, touch[span], full[span], bullish[span], extreme[span], touch_times, full_times,
+        ):
+            if t >= n:
+                continue
+            zone.status = "partially_filled"
+            zone.first_touch_time = zone.partial_fill_time = touch_time
+            if bull:
+                zone.fill_low = value
+            else:
+                zone.fill_high = value
+            if f < n:
+                zone.status = "invalidated"
+                zone.full_fill_time = full_time
+
+
+def compute_structure_packets(stack: BarStack, config: StructureConfig) -> Dict[str, StructurePacket]:
+    """Compute a structure packet for every instrument in ``stack``.
+
+    Each packet equals compute_structure_packet(instrument, stack.timeframe,
+    config, bars=<that instrument's bars>), up to as_of.
+    """
+    timeframe = stack.timeframe
+    lengths = stack.lengths
+    high_anchors, low_anchors = batch_pivots(stack, config)
+
+    opens, closes = stack.packed("open"), stack.packed("close")
+    if opens.shape[1] >= 3:
+        bullish, bearish, gap_size, edges = fvg_gaps(opens, closes)
+        min_size = np.array([fvg_min_size(instrument, config) for instrument in stack.instruments])
+        keep = _row_positions(
+            (bullish | bearish) & (gap_size >= min_size[:, None]) & _before(lengths - 2, bullish.shape[1]),
+            0,
+        )
+    else:
+        keep = [np.empty(0, dtype=np.int64) for _ in stack.instruments]
+
+    zones = [
+        build_fvgs(
+            stack.bar_timestamps(row), keep[row], bullish[row], gap_size[row],
+            tuple(edge[row] for edge in edges), timeframe,
+        ) if len(keep[row]) else []
+        for row in range(len(stack.instruments))
+    ]
+    # Candle 3 of the zone found at k is bar k + 2; fills start after it
+    batch_fvg_fills(stack, zones, [k + 3 for k in keep])
+
+    packets = {}
+    for row, instrument in enumerate(stack.instruments):
+        bars = stack.frame(row)
+        swings = build_swings(
+            bars.index, bars["high"].to_numpy(), bars["low"].to_numpy(),
+            high_anchors[row], low_anchors[row], config, timeframe,
+        )
+
+        # Path-dependent stages, per instrument as in compute_structure_packet
+        events = detect_events(bars, swings, config, timeframe=timeframe)
+        update_swing_statuses(swings, events)
+        liquidity_levels, sweep_events = detect_liquidity(
+            bars, swings, config, timeframe=timeframe, instrument=instrument,
+        )
+        active_zones = build_active_zone_registry(zones[row])
+        regime = compute_regime(swings, events)
+
+        packets[instrument] = assemble_packet(
+            instrument, timeframe, config, int(lengths[row]),
+            swings, events, liquidity_levels, sweep_events,
+            zones[row], active_zones, regime,
+        )
+    return packets
@@ -0,0 +1,136 @@
+"""Compact structure packet sidecar — a fast-to-read twin of each packet JSON.
+
+Layout of ``<instrument>_<tf>_structure.pkt`` (format version 1):
+    bytes 0-3    magic b"SPKT"
+    bytes 4-5    format version, uint16 little-endian
+    bytes 6-9    header length, uint32 little-endian
+    header       compact JSON: codec, schema_version, instrument, timeframe,
+                 as_of
+    body         the packet dict, encoded with the header's codec
+
+The codec is orjson or msgpack when installed (in that order), else compact
+stdlib JSON. NumPy scalars are written as the numbers they hold, with every
+codec and in the JSON, so the sidecar decodes to the same dict. The header is plain JSON so a staleness check reads a few
+hundred bytes and never decodes the body. The pretty-printed JSON stays the
+human-readable copy: it is written first and the sidecar second, each swapped
+in with os.replace, and readers ignore a sidecar older than its JSON.
+"""
+
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+PACKET_MAGIC = b"SPKT"
+PACKET_FORMAT_VERSION = 1
+
+_PREFIX = struct.Struct("<4sHI")
+_HEADER_FIELDS = ("schema_version", "instrument", "timeframe", "as_of")
+
+
+def default_codec() -> str:
+    """The fastest codec available in this environment."""
+    if orjson is not None:
+        return "orjson"
+    if msgpack is not None:
+        return "msgpack"
+    return "json"
+
+
+def json_default(value):
+    """Encoder fallback: NumPy scalars as their Python value, else str()."""
+    if isinstance(value, (np.integer, np.floating, np.bool_)):
+        return value.item()
+    return str(value)
+
+
+def sidecar_path(json_path) -> Path:
+    return Path(json_path).with_suffix(".pkt")
+
+
+def _encode_body(packet: dict, codec: str) -> bytes:
+    if codec == "orjson":
+        return orjson.dumps(packet, default=json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    if codec == "msgpack":
+        return msgpack.packb(packet, default=json_default, use_bin_type=True)
+    return json.dumps(packet, separators=(",", ":"), default=json_default).encode("utf-8")
+
+
+def _decode_body(body: bytes, codec: str) -> Optional[dict]:
+    """Decode a body, or None when its codec is not installed here."""
+    if codec == "orjson":
+        return orjson.loads(body) if orjson is not None else json.loads(body)
+    if codec == "msgpack":
+        return msgpack.unpackb(body, raw=False) if msgpack is not None else None
+    if codec == "json":
+        return json.loads(body)
+    return None
+
+
+def encode_packet(packet: dict, codec: Optional[str] = None) -> bytes:
+    """Serialize a packet dict into the sidecar layout."""
+    codec = codec or default_codec()
+    header = {"codec": codec, **{key: packet.get(key) for key in _HEADER_FIELDS}}
+    header_bytes = json.dumps(header, separators=(",", ":"), default=json_default).encode("utf-8")
+    prefix = _PREFIX.pack(PACKET_MAGIC, PACKET_FORMAT_VERSION, len(header_bytes))
+    return prefix + header_bytes + _encode_body(packet, codec)
+
+
+def write_packet_sidecar(packet: dict, json_path, codec: Optional[str] = None) -> Path:
+    """Write the sidecar for ``json_path`` atomically and return its path."""
+    path = sidecar_path(json_path)
+    tmp = path.with_suffix(".pkt.tmp")
+    with open(tmp, "wb") as f:
+        f.write(encode_packet(packet, codec))
+    os.replace(tmp, path)
+    return path
+
+
+def _read_header(f) -> Optional[dict]:
+    prefix = f.read(_PREFIX.size)
+    if len(prefix) < _PREFIX.size:
+        return None
+    magic, version, length = _PREFIX.unpack(prefix)
+    if magic != PACKET_MAGIC or version != PACKET_FORMAT_VERSION:
+        return None
+    header = json.loads(f.read(length))
+    return header if isinstance(header, dict) else None
+
+
+def read_packet_header(path) -> Optional[dict]:
+    """Read only the header of a sidecar. None if missing or not a sidecar."""
+    try:
+        with open(path, "rb") as f:
+            return _read_header(f)
+    except (OSError, ValueError):
+        return None
+
+
+def read_packet_sidecar(path) -> Optional[dict]:
+    """Decode a whole sidecar into the packet dict.
+
+    Returns None when the file is missing, not in the expected layout, or
+    encoded with a codec that is not installed — callers then read the JSON.
+    """
+    try:
+        with open(path, "rb") as f:
+            header = _read_header(f)
+            if header is None:
+                return None
+            packet = _decode_body(f.read(), header.get("codec"))
+    except Exception:
+        return None
+    return packet if isinstance(packet, dict) else None
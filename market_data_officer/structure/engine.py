@@ -6,19 +6,29 @@ swings → events → liquidity/sweeps → regime → packet assembly.
 Does not implement any module's logic directly.
 """
 
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
 
 import pandas as pd
 
 from .config import StructureConfig
 from .events import detect_events, update_swing_statuses
+from .frame import StructureFrame
 from .imbalance import process_imbalance
 from .io import get_output_path, load_bars, write_packet_atomic
 from .liquidity import detect_liquidity
 from .regime import compute_regime
-from .schemas import StructurePacket
+from .schemas import RegimeSummary, StructurePacket
 from .swings import detect_swings
 
 
@@ -77,6 +87,27 @@ def compute_structure_packet(
     regime = compute_regime(swings, events)
 
     # Step 7: Assemble packet
+    return assemble_packet(
+        instrument, timeframe, config, len(bars),
+        swings, events, liquidity_levels, sweep_events,
+        imbalance_zones, active_zones, regime,
+    )
+
+
+def assemble_packet(
+    instrument: str,
+    timeframe: str,
+    config: StructureConfig,
+    bars_processed: int,
+    swings: list,
+    events: list,
+    liquidity_levels: list,
+    sweep_events: list,
+    imbalance_zones: list,
+    active_zones: dict,
+    regime: RegimeSummary,
+) -> StructurePacket:
+    """Wrap computed structure objects in a packet with build info and diagnostics."""
     tolerance = config.eqh_eql_tolerance.get(instrument, 0.00010)
     build_info = {
         "engine_version": "phase_3c",
@@ -93,7 +124,7 @@ def compute_structure_packet(
     mss_count = sum(1 for e in events if "mss" in e.type)
 
     diagnostics = {
-        "bars_processed": len(bars),
+        "bars_processed": bars_processed,
         "swings_confirmed": len(swings),
         "bos_events": bos_count,
         "mss_events": mss_count,
@@ -103,7 +134,7 @@ def compute_structure_packet(
         "active_fvg_zones": active_zones["count"],
     }
 
-    packet = StructurePacket(
+    return StructurePacket(
         schema_version="structure_packet_v1",
         instrument=instrument,
         timeframe=timeframe,
@@ -119,7 +150,172 @@ def compute_structure_packet(
         diagnostics=diagnostics,
     )
 
-    return packet
+
+@dataclass
+class StructureTaskResult:
+    """Outcome of computing one instrument/timeframe packet.
+
+    status is "ok", "skipped" (no hot package), "error" (invalid bars) or
+    "failed" (the task raised anything else or its worker died). The packet
+    is kept column-wise, which is also what a pool worker sends back.
+    """
+
+    instrument: str
+    timeframe: str
+    status: str
+    frame: Optional[StructureFrame] = None
+    error: Optional[str] = None
+    wall_s: Optional[float] = None
+    peak_rss_bytes: Optional[int] = None
+
+    @property
+    def packet(self) -> Optional[StructurePacket]:
+        return self.frame.to_packet() if self.frame is not None else None
+
+
+def _reset_peak_rss() -> None:
+    """Restart the process's peak-RSS high-water mark where Linux allows it."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        pass
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    """Peak RSS since the last reset (Linux), else since process start."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, kilobytes elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _run_task(
+    instrument: str,
+    tf: str,
+    config: StructureConfig,
+    packages_dir: Optional[Path],
+    output_dir: Optional[Path],
+    state_dir: Optional[Path],
+) -> StructureTaskResult:
+    """Compute and write one packet. Runs in-process or in a pool worker."""
+    _reset_peak_rss()
+    t0 = time.perf_counter()
+    result = StructureTaskResult(instrument, tf, status="ok")
+    try:
+        kwargs = {}
+        if packages_dir is not None:
+            kwargs["packages_dir"] = packages_dir
+        if state_dir is not None:
+            # Deferred: the incremental engine builds on this module
+            from .incremental import IncrementalStructureEngine
+
+            engine = IncrementalStructureEngine(
+                instrument, tf, config, state_dir=state_dir, **kwargs,
+            )
+            packet = engine.update(load_bars(instrument, tf, **kwargs))
+        else:
+            packet = compute_structure_packet(
+                instrument, tf, config, **kwargs,
+            )
+
+        # Write JSON packet
+        path_kwargs = {}
+        if output_dir:
+            path_kwargs["output_dir"] = output_dir
+        out_path = get_output_path(instrument, tf, **path_kwargs)
+        result.frame = StructureFrame.from_packet(packet)
+        write_packet_atomic(result.frame.to_dict(), out_path)
+
+    except FileNotFoundError as e:
+        result.status, result.error = "skipped", str(e)
+    except ValueError as e:
+        result.status, result.error = "error", str(e)
+    except Exception as e:
+        result.status, result.error = "failed", f"{type(e).__name__}: {e}"
+
+    result.wall_s = time.perf_counter() - t0
+    result.peak_rss_bytes = _peak_rss_bytes()
+    return result
+
+
+def _run_batch_task(
+    instruments: list,
+    tf: str,
+    config: StructureConfig,
+    packages_dir: Optional[Path],
+    output_dir: Optional[Path],
+) -> list:
+    """Compute and write one timeframe's packets for all instruments as a batch.
+
+    Each ok result's wall_s is its own split-and-write time plus an even
+    share of the load and shared kernel time.
+    """
+    # Deferred: the batch engine builds on this module
+    from .batch import compute_structure_packets, load_bar_stack
+
+    _reset_peak_rss()
+    t0 = time.perf_counter()
+    kwargs = {"packages_dir": packages_dir} if packages_dir is not None else {}
+    stack, load_errors = load_bar_stack(instruments, tf, **kwargs)
+    packets = compute_structure_packets(stack, config) if stack.instruments else {}
+    shared_s = (time.perf_counter() - t0) / max(len(packets), 1)
+
+    path_kwargs = {"output_dir": output_dir} if output_dir else {}
+    results = []
+    for instrument in instruments:
+        error = load_errors.get(instrument)
+        if error is not None:
+            if isinstance(error, FileNotFoundError):
+                status, message = "skipped", str(error)
+            elif isinstance(error, ValueError):
+                status, message = "error", str(error)
+            else:
+                status, message = "failed", f"{type(error).__name__}: {error}"
+            results.append(StructureTaskResult(instrument, tf, status=status, error=message))
+            continue
+        t1 = time.perf_counter()
+        result = StructureTaskResult(instrument, tf, status="ok")
+        result.frame = StructureFrame.from_packet(packets[instrument])
+        write_packet_atomic(result.frame.to_dict(), get_output_path(instrument, tf, **path_kwargs))
+        result.wall_s = shared_s + time.perf_counter() - t1
+        results.append(result)
+
+    peak = _peak_rss_bytes()
+    for result in results:
+        result.peak_rss_bytes = peak
+    return results
+
+
+def _report(result: StructureTaskResult) -> None:
+    timing = ""
+    if result.wall_s is not None:
+        timing = f" [{result.wall_s:.2f}s"
+        if result.peak_rss_bytes is not None:
+            timing += f", peak RSS {result.peak_rss_bytes / 2**20:.0f} MB"
+        timing += "]"
+
+    if result.status == "ok":
+        frame = result.frame
+        print(f"    -> {len(frame.swings)} swings, "
+              f"{len(frame.events)} events, "
+              f"{len(frame.liquidity)} levels, "
+              f"{len(frame.sweep_events)} sweeps, "
+              f"{len(frame.imbalance)} FVGs{timing}")
+    elif result.status == "skipped":
+        print(f"    -> SKIPPED: {result.error}")
+    elif result.status == "error":
+        print(f"    -> ERROR: {result.error}")
+    else:
+        print(f"    -> FAILED: {result.error}")
 
 
 def run_engine(
@@ -127,51 +323,121 @@ def run_engine(
     config: StructureConfig,
     packages_dir: Optional[Path] = None,
     output_dir: Optional[Path] = None,
-) -> dict:
+    state_dir: Optional[Path] = None,
+    workers: int = 1,
+    batch: bool = False,
+) -> Dict[str, StructureTaskResult]:
     """Run the Structure Engine for all instruments and timeframes.
 
+    Every instrument × timeframe combination is an independent task. With
+    ``workers`` > 1 they run on a process pool of that size. In either mode
+    a task that raises, or whose worker dies, is reported as "failed"
+    without affecting the others.
+
     Args:
         instruments: List of instrument symbols to process.
         config: Structure engine configuration.
         packages_dir: Optional custom packages directory.
         output_dir: Optional custom output directory.
+        state_dir: If given, fold each hot package into the
+            IncrementalStructureEngine state kept there instead of
+            recomputing from scratch.
+        workers: Number of worker processes; 1 runs tasks in-process.
+        batch: Compute each timeframe for all instruments at once on a
+            stacked bar array (structure.batch); the tasks are then the
+            timeframes. Not combinable with ``state_dir``.
 
     Returns:
-        Dict mapping '{instrument}_{tf}' to the computed StructurePacket.
+        Dict mapping '{instrument}_{tf}' to its StructureTaskResult (packet
+        frame, status, wall time and peak RSS), in task order.
+
+    Raises:
+        ValueError: If both ``batch`` and ``state_dir`` are given.
     """
-    results = {}
+    if batch:
+        if state_dir is not None:
+            raise ValueError("Batch mode recomputes from scratch; it cannot use incremental state")
+        return _run_batches(instruments, config, packages_dir, output_dir, workers)
 
-    for instrument in instruments:
-        for tf in config.timeframes:
+    tasks = [(instrument, tf) for instrument in instruments for tf in config.timeframes]
+    results: Dict[str, StructureTaskResult] = {}
+
+    if workers <= 1 or len(tasks) <= 1:
+        for instrument, tf in tasks:
             key = f"{instrument}_{tf}"
             print(f"  Computing structure: {key}...")
+            results[key] = _run_task(instrument, tf, config, packages_dir, output_dir, state_dir)
+            _report(results[key])
+        return results
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+        futures = {}
+        for instrument, tf in tasks:
+            futures[f"{instrument}_{tf}"] = pool.submit(
+                _run_task, instrument, tf, config, packages_dir, output_dir, state_dir,
+            )
 
+        for (instrument, tf), (key, future) in zip(tasks, futures.items()):
             try:
-                kwargs = {}
-                if packages_dir is not None:
-                    kwargs["packages_dir"] = packages_dir
-                packet = compute_structure_packet(
-                    instrument, tf, config, **kwargs,
+                results[key] = future.result()
+            except Exception as e:
+                results[key] = StructureTaskResult(
+                    instrument, tf, status="failed", error=f"{type(e).__name__}: {e}",
                 )
+            print(f"  Computing structure: {key}...")
+            _report(results[key])
+
+    return results
+
 
-                # Write JSON packet
-                out_dir = output_dir if output_dir else None
-                path_kwargs = {}
-                if out_dir:
-                    path_kwargs["output_dir"] = out_dir
-                out_path = get_output_path(instrument, tf, **path_kwargs)
-                write_packet_atomic(packet.to_dict(), out_path)
-
-                results[key] = packet
-                print(f"    -> {len(packet.swings)} swings, "
-                      f"{len(packet.events)} events, "
-                      f"{len(packet.liquidity)} levels, "
-                      f"{len(packet.sweep_events)} sweeps, "
-                      f"{len(packet.imbalance)} FVGs")
-
-            except FileNotFoundError as e:
-                print(f"    -> SKIPPED: {e}")
-            except ValueError as e:
-                print(f"    -> ERROR: {e}")
+def _failed_batch(instruments: list, tf: str, error: Exception) -> list:
+    """A "failed" result per instrument for a batch task that raised."""
+    return [
+        StructureTaskResult(instrument, tf, status="failed", error=f"{type(error).__name__}: {error}")
+        for instrument in instruments
+    ]
 
+
+def _run_batches(
+    instruments: list,
+    config: StructureConfig,
+    packages_dir: Optional[Path],
+    output_dir: Optional[Path],
+    workers: int,
+) -> Dict[str, StructureTaskResult]:
+    """run_engine in batch mode: one task per timeframe, results in instrument × timeframe order."""
+    by_key: Dict[str, StructureTaskResult] = {}
+    timeframes = list(config.timeframes)
+
+    if workers <= 1 or len(timeframes) <= 1:
+        for tf in timeframes:
+            print(f"  Computing structure batch: {len(instruments)} instrument(s) × {tf}...")
+            try:
+                batch_results = _run_batch_task(instruments, tf, config, packages_dir, output_dir)
+            except Exception as e:
+                batch_results = _failed_batch(instruments, tf, e)
+            for result in batch_results:
+                by_key[f"{result.instrument}_{tf}"] = result
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(timeframes))) as pool:
+            futures = {
+                tf: pool.submit(_run_batch_task, instruments, tf, config, packages_dir, output_dir)
+                for tf in timeframes
+            }
+            for tf, future in futures.items():
+                print(f"  Computing structure batch: {len(instruments)} instrument(s) × {tf}...")
+                try:
+                    batch_results = future.result()
+                except Exception as e:
+                    batch_results = _failed_batch(instruments, tf, e)
+                for result in batch_results:
+                    by_key[f"{result.instrument}_{tf}"] = result
+
+    results = {}
+    for instrument in instruments:
+        for tf in timeframes:
+            key = f"{instrument}_{tf}"
+            results[key] = by_key[key]
+            print(f"  {key}:")
+            _report(results[key])
     return results
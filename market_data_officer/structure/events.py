@@ -6,10 +6,16 @@ trigger BOS in 3A.
 
 MSS (Market Structure Shift): confirmed when a BOS fires in the opposite
 direction of the established structural bias.
+
+Detection is a single forward sweep: swings join an active stack once a
+bar passes their confirm_time and leave it when broken, and closes are
+scanned with NumPy between admissions, so cost is O(bars + swings).
+The sweep state (EventSweep) can be kept and resumed over later bars.
 """
 
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 
 from .config import StructureConfig
@@ -44,102 +50,193 @@ def detect_events(
     if missing:
         raise ValueError(f"Missing required columns: {missing}")
 
-    events: List[StructureEvent] = []
-
-    # Track the most recent confirmed swing high and swing low
-    # that are eligible for BOS (confirmed before the current bar)
-    swing_highs = sorted(
-        [s for s in swings if s.type == "swing_high"],
-        key=lambda s: s.confirm_time,
-    )
-    swing_lows = sorted(
-        [s for s in swings if s.type == "swing_low"],
-        key=lambda s: s.confirm_time,
-    )
-
-    # Track current structural bias for MSS detection
-    current_bias: Optional[str] = None
-    # Track which swings have already been broken to avoid duplicate BOS
-    broken_swing_ids: set = set()
-
-    closes = bars["close"].values
+    closes = bars["close"].to_numpy(dtype=np.float64)
     timestamps = bars.index
+    bar_ns = timestamps.asi8 * pd.Timedelta(1, unit=timestamps.unit).value
 
-    for bar_idx in range(len(bars)):
-        bar_time = timestamps[bar_idx].to_pydatetime()
-        bar_close = float(closes[bar_idx])
-
-        # Find the most recent confirmed swing high before this bar
-        active_sh = None
-        for sh in reversed(swing_highs):
-            if sh.confirm_time < bar_time and sh.id not in broken_swing_ids:
-                active_sh = sh
-                break
-
-        # Find the most recent confirmed swing low before this bar
-        active_sl = None
-        for sl in reversed(swing_lows):
-            if sl.confirm_time < bar_time and sl.id not in broken_swing_ids:
-                active_sl = sl
-                break
-
-        # Check for bullish BOS: close above prior swing high
-        if active_sh and bar_close > active_sh.price:
-            compact_time = bar_time.strftime("%Y%m%dT%H%M")
-            event_type = "bos_bull"
-            prior_bias_val = None
-
-            # Check if this is an MSS (direction change)
-            if current_bias == "bearish":
-                event_type = "mss_bull"
-                prior_bias_val = "bearish"
-
-            event_id = f"ev_{timeframe}_{compact_time}_{event_type}"
-            events.append(StructureEvent(
-                id=event_id,
-                type=event_type,
-                time=bar_time,
-                timeframe=timeframe,
-                reference_swing_id=active_sh.id,
-                reference_price=active_sh.price,
-                break_close=bar_close,
-                prior_bias=prior_bias_val,
-                status="confirmed",
-            ))
-            broken_swing_ids.add(active_sh.id)
-            current_bias = "bullish"
-
-        # Check for bearish BOS: close below prior swing low
-        if active_sl and bar_close < active_sl.price:
-            compact_time = bar_time.strftime("%Y%m%dT%H%M")
-            event_type = "bos_bear"
-            prior_bias_val = None
-
-            # Check if this is an MSS (direction change)
-            if current_bias == "bullish":
-                event_type = "mss_bear"
-                prior_bias_val = "bullish"
-
-            event_id = f"ev_{timeframe}_{compact_time}_{event_type}"
-            events.append(StructureEvent(
-                id=event_id,
-                type=event_type,
-                time=bar_time,
-                timeframe=timeframe,
-                reference_swing_id=active_sl.id,
-                reference_price=active_sl.price,
-                break_close=bar_close,
-                prior_bias=prior_bias_val,
-                status="confirmed",
-            ))
-            broken_swing_ids.add(active_sl.id)
-            current_bias = "bearish"
+    sweep = EventSweep(timeframe)
+    sweep.add_swings(swings, bar_ns)
+    sweep.run(closes, timestamps, 0, len(bars))
 
     # Sort by time for deterministic ordering
+    events = sweep.events
     events.sort(key=lambda e: e.time)
     return events
 
 
+class EventSweep:
+    """Resumable state of the forward BOS/MSS sweep.
+
+    Holds the active swing stacks of both sides, the structural bias, the
+    broken swing ids and the events emitted so far. ``run`` processes bars
+    ``[start, end)``; a later call continues from ``end`` once the swings
+    confirmed by the new bars have been added with ``add_swings``.
+    """
+
+    def __init__(self, timeframe: str) -> None:
+        self.timeframe = timeframe
+        # Each side is a stack of admitted, unbroken swings in confirm order;
+        # its top is the newest swing eligible for BOS. Only the top can
+        # break, so retiring it exposes the next eligible swing.
+        self.highs = _ActiveSwings()
+        self.lows = _ActiveSwings()
+        self.events: List[StructureEvent] = []
+        # Track current structural bias for MSS detection
+        self.current_bias: Optional[str] = None
+        # Track which swings have already been broken to avoid duplicate BOS
+        self.broken_swing_ids: set = set()
+
+    def add_swings(self, swings: List[SwingPoint], bar_ns: np.ndarray) -> None:
+        """Queue swings for admission; they must confirm after every queued swing."""
+        by_confirm = sorted(swings, key=lambda s: s.confirm_time)
+        self.highs.extend([s for s in by_confirm if s.type == "swing_high"], bar_ns)
+        self.lows.extend([s for s in by_confirm if s.type == "swing_low"], bar_ns)
+
+    def copy(self) -> "EventSweep":
+        clone = EventSweep(self.timeframe)
+        clone.highs, clone.lows = self.highs.copy(), self.lows.copy()
+        clone.events = list(self.events)
+        clone.current_bias = self.current_bias
+        clone.broken_swing_ids = set(self.broken_swing_ids)
+        return clone
+
+    def run(self, closes: np.ndarray, timestamps: pd.DatetimeIndex, start: int, end: int) -> None:
+        """Sweep bars ``start .. end - 1``, appending events in time order."""
+        timeframe = self.timeframe
+        highs, lows = self.highs, self.lows
+        events = self.events
+        broken_swing_ids = self.broken_swing_ids
+
+        bar_idx = start
+        while bar_idx < end:
+            highs.admit(bar_idx, broken_swing_ids)
+            lows.admit(bar_idx, broken_swing_ids)
+            active_sh = highs.active(broken_swing_ids)
+            active_sl = lows.active(broken_swing_ids)
+
+            # Active swings are fixed until the next admission: find the first
+            # bar before then whose close breaks either of them
+            segment_end = min(highs.next_admission(end), lows.next_admission(end))
+            segment = closes[bar_idx:segment_end]
+            candidates = []
+            if active_sh is not None:
+                candidates.append(_first_true(segment > active_sh.price))
+            if active_sl is not None:
+                candidates.append(_first_true(segment < active_sl.price))
+            hits = [c for c in candidates if c is not None]
+            if not hits:
+                bar_idx = segment_end
+                continue
+
+            bar_idx += min(hits)
+            bar_time = timestamps[bar_idx].to_pydatetime()
+            bar_close = float(closes[bar_idx])
+
+            # Check for bullish BOS: close above prior swing high
+            if active_sh and bar_close > active_sh.price:
+                compact_time = bar_time.strftime("%Y%m%dT%H%M")
+                event_type = "bos_bull"
+                prior_bias_val = None
+
+                # Check if this is an MSS (direction change)
+                if self.current_bias == "bearish":
+                    event_type = "mss_bull"
+                    prior_bias_val = "bearish"
+
+                event_id = f"ev_{timeframe}_{compact_time}_{event_type}"
+                events.append(StructureEvent(
+                    id=event_id,
+                    type=event_type,
+                    time=bar_time,
+                    timeframe=timeframe,
+                    reference_swing_id=active_sh.id,
+                    reference_price=active_sh.price,
+                    break_close=bar_close,
+                    prior_bias=prior_bias_val,
+                    status="confirmed",
+                ))
+                broken_swing_ids.add(active_sh.id)
+                self.current_bias = "bullish"
+
+            # Check for bearish BOS: close below prior swing low
+            if active_sl and bar_close < active_sl.price:
+                compact_time = bar_time.strftime("%Y%m%dT%H%M")
+                event_type = "bos_bear"
+                prior_bias_val = None
+
+                # Check if this is an MSS (direction change)
+                if self.current_bias == "bullish":
+                    event_type = "mss_bear"
+                    prior_bias_val = "bullish"
+
+                event_id = f"ev_{timeframe}_{compact_time}_{event_type}"
+                events.append(StructureEvent(
+                    id=event_id,
+                    type=event_type,
+                    time=bar_time,
+                    timeframe=timeframe,
+                    reference_swing_id=active_sl.id,
+                    reference_price=active_sl.price,
+                    break_close=bar_close,
+                    prior_bias=prior_bias_val,
+                    status="confirmed",
+                ))
+                broken_swing_ids.add(active_sl.id)
+                self.current_bias = "bearish"
+
+            bar_idx += 1
+
+
+def _first_true(mask: np.ndarray) -> Optional[int]:
+    if not mask.any():
+        return None
+    return int(mask.argmax())
+
+
+class _ActiveSwings:
+    """Swings of one side, admitted as bars pass their confirm_time.
+
+    A swing becomes eligible on the first bar strictly after its
+    confirm_time; swings must be added in confirm_time order and the bars
+    be in time order.
+    """
+
+    def __init__(self) -> None:
+        self.swings: List[SwingPoint] = []
+        self.admit_at: List[int] = []
+        self.next = 0
+        self.stack: List[SwingPoint] = []
+
+    def extend(self, swings: List[SwingPoint], bar_ns: np.ndarray) -> None:
+        confirm_ns = np.array([pd.Timestamp(s.confirm_time).value for s in swings], dtype=np.int64)
+        self.admit_at.extend(np.searchsorted(bar_ns, confirm_ns, side="right").tolist())
+        self.swings.extend(swings)
+
+    def copy(self) -> "_ActiveSwings":
+        clone = _ActiveSwings()
+        clone.swings, clone.admit_at = list(self.swings), list(self.admit_at)
+        clone.next, clone.stack = self.next, list(self.stack)
+        return clone
+
+    def admit(self, bar_idx: int, broken_ids: set) -> None:
+        while self.next < len(self.swings) and self.admit_at[self.next] <= bar_idx:
+            swing = self.swings[self.next]
+            if swing.id not in broken_ids:
+                self.stack.append(swing)
+            self.next += 1
+
+    def active(self, broken_ids: set) -> Optional[SwingPoint]:
+        while self.stack and self.stack[-1].id in broken_ids:
+            self.stack.pop()
+        return self.stack[-1] if self.stack else None
+
+    def next_admission(self, end: int) -> int:
+        """Bar index of the next admission, or ``end`` if none is due before it."""
+        if self.next < len(self.swings):
+            return min(self.admit_at[self.next], end)
+        return end
+
+
 def update_swing_statuses(
     swings: List[SwingPoint],
     events: List[StructureEvent],
@@ -0,0 +1,422 @@
+"""Columnar structure packets — each entity type as parallel NumPy arrays.
+
+A StructurePacket holds its swings, events, levels, sweeps and FVGs as lists
+of dataclass objects, each with its own datetimes and dict on the way out.
+StructureFrame keeps the same packet as one EntityTable per entity type:
+
+    time fields      int64 UTC epoch nanoseconds (None -> NaT sentinel)
+    float fields     float64 (optional fields: None -> NaN)
+    int fields       int64 (optional fields: None -> int64 min)
+    categorical      int8 codes into a per-column category tuple (None -> -1)
+                     e.g. type, status, timeframe, outcome
+    ids              ASCII bytes arrays (None -> b"")
+    lists            object arrays
+
+``to_dict`` builds the packet JSON straight from the columns and matches
+StructurePacket.to_dict exactly for UTC times. Object views are built on
+first access of a table and cached, so callers that still want SwingPoint
+& co. can index or iterate a table as if it were the list.
+"""
+
+from dataclasses import dataclass
+from operator import attrgetter
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .schemas import (
+    FairValueGap,
+    LiquidityLevel,
+    RegimeSummary,
+    StructureEvent,
+    StructurePacket,
+    SweepEvent,
+    SwingPoint,
+)
+
+_NAT = np.iinfo(np.int64).min
+_NO_INT = np.iinfo(np.int64).min
+_SECOND_NS = 1_000_000_000
+
+
+@dataclass(frozen=True, slots=True)
+class EntitySpec:
+    """Column layout of one entity type, in its to_dict key order.
+
+    Kinds: "str", "cat", "time", "float", "int", "list"; a trailing "?"
+    marks an optional column whose None needs a sentinel.
+    ``trailing`` columns are emitted only when ``trailing_if`` is non-empty
+    (LiquidityLevel's EQH/EQL membership).
+    """
+
+    cls: type
+    columns: Tuple[Tuple[str, str], ...]
+    trailing: Tuple[Tuple[str, str], ...] = ()
+    trailing_if: Optional[str] = None
+
+
+SWING_SPEC = EntitySpec(SwingPoint, (
+    ("id", "str"), ("type", "cat"), ("price", "float"),
+    ("anchor_time", "time"), ("confirm_time", "time"), ("timeframe", "cat"),
+    ("confirmation_method", "cat"), ("left_bars", "int"), ("right_bars", "int"),
+    ("strength", "int"), ("status", "cat"),
+))
+
+EVENT_SPEC = EntitySpec(StructureEvent, (
+    ("id", "str"), ("type", "cat"), ("time", "time"), ("timeframe", "cat"),
+    ("reference_swing_id", "str"), ("reference_price", "float"),
+    ("break_close", "float"), ("prior_bias", "cat"), ("status", "cat"),
+))
+
+LIQUIDITY_SPEC = EntitySpec(
+    LiquidityLevel,
+    (
+        ("id", "str"), ("type", "cat"), ("price", "float"),
+        ("origin_time", "time"), ("timeframe", "cat"), ("status", "cat"),
+        ("swept_time", "time"), ("sweep_type", "cat"),
+        ("liquidity_scope", "cat"), ("outcome", "cat"),
+        ("reclaim_time", "time"), ("reclaim_window_bars", "int?"),
+    ),
+    trailing=(("member_swing_ids", "list"), ("tolerance_used", "float?")),
+    trailing_if="member_swing_ids",
+)
+
+SWEEP_SPEC = EntitySpec(SweepEvent, (
+    ("id", "str"), ("type", "cat"), ("time", "time"), ("timeframe", "cat"),
+    ("liquidity_level_id", "str"), ("sweep_price", "float"),
+    ("sweep_type", "cat"), ("status", "cat"), ("linked_liquidity_id", "str?"),
+    ("post_sweep_close", "float?"), ("reclaim_time", "time"),
+    ("outcome", "cat"), ("reclaim_window_bars", "int?"),
+))
+
+FVG_SPEC = EntitySpec(FairValueGap, (
+    ("id", "str"), ("fvg_type", "cat"), ("zone_high", "float"),
+    ("zone_low", "float"), ("zone_size", "float"), ("origin_time", "time"),
+    ("confirm_time", "time"), ("timeframe", "cat"), ("status", "cat"),
+    ("fill_high", "float?"), ("fill_low", "float?"),
+    ("first_touch_time", "time"), ("partial_fill_time", "time"),
+    ("full_fill_time", "time"),
+))
+
+
+def _encode(kind: str, values: list):
+    """Column values -> array (and categories for "cat")."""
+    if kind == "time":
+        index = pd.DatetimeIndex(pd.to_datetime(values, utc=True, format="ISO8601"))
+        ns = index.asi8 * pd.Timedelta(1, unit=index.unit).value
+        ns[index.isna()] = _NAT
+        return ns
+    if kind == "cat":
+        codes, uniques = pd.factorize(np.array(values, dtype=object))
+        dtype = np.int8 if len(uniques) < 128 else np.int32
+        return codes.astype(dtype), tuple(uniques)
+    if kind in ("float", "float?"):
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+    if kind in ("int", "int?"):
+        return np.array([_NO_INT if v is None else v for v in values], dtype=np.int64)
+    if kind in ("str", "str?"):
+        # Ids are ASCII: one byte per character beats a str object per row
+        try:
+            return np.array([v or "" for v in values], dtype=object).astype(np.bytes_)
+        except UnicodeEncodeError:
+            pass
+    out = np.empty(len(values), dtype=object)
+    out[:] = [list(v) for v in values] if kind == "list" else values
+    return out
+
+
+def _iso_times(ns: np.ndarray) -> list:
+    """int64 UTC ns -> datetime.isoformat() strings, None for NaT."""
+    missing = ns == _NAT
+    stamps = np.where(missing, 0, ns).view("datetime64[ns]")
+    whole = ns % _SECOND_NS == 0
+    text = np.datetime_as_string(stamps, unit="s").astype(object)
+    if not whole.all():
+        # datetime only prints fractions when there are any, in microseconds
+        text[~whole] = np.datetime_as_string(stamps[~whole], unit="us")
+    text = text + "+00:00"
+    if missing.any():
+        text[missing] = None
+    return text.tolist()
+
+
+def _shared_iso_times(tables: Sequence["EntityTable"]) -> List[Dict[str, list]]:
+    """Every time column of ``tables`` as text, formatting each distinct time once.
+
+    Packet times are bar times, so the columns repeat a few thousand values.
+    """
+    refs = [(i, name) for i, table in enumerate(tables)
+            for name, kind in table.spec.columns if kind == "time"]
+    columns = [tables[i].columns[name] for i, name in refs]
+    distinct, inverse = np.unique(np.concatenate(columns), return_inverse=True)
+    text = np.array(_iso_times(distinct), dtype=object)[inverse].tolist()
+
+    out: List[Dict[str, list]] = [{} for _ in tables]
+    start = 0
+    for (i, name), column in zip(refs, columns):
+        out[i][name] = text[start:start + len(column)]
+        start += len(column)
+    return out
+
+
+class EntityTable:
+    """One entity type of a packet, stored column-wise.
+
+    Behaves as a read-only sequence of the entity's dataclass objects, which
+    are built on first access. Changes to a view are not written back to the
+    columns.
+    """
+
+    __slots__ = ("spec", "columns", "categories", "_views")
+
+    def __init__(self, spec: EntitySpec, columns: Dict[str, np.ndarray],
+                 categories: Dict[str, tuple]):
+        self.spec = spec
+        self.columns = columns
+        self.categories = categories
+        self._views: Optional[list] = None
+
+    @classmethod
+    def from_records(cls, spec: EntitySpec, records: Sequence) -> "EntityTable":
+        """Build from dataclass objects or their to_dict() dicts."""
+        names = [name for name, _ in spec.columns]
+        if not records:
+            rows = [()] * 0
+        elif isinstance(records[0], dict):
+            rows = [tuple(r[name] for name in names) + tuple(r.get(name) for name, _ in spec.trailing)
+                    for r in records]
+        else:
+            rows = list(map(attrgetter(*names, *(name for name, _ in spec.trailing)), records))
+        values = list(zip(*rows)) or [()] * (len(spec.columns) + len(spec.trailing))
+
+        columns, categories = {}, {}
+        for (name, kind), column in zip(spec.columns + spec.trailing, values):
+            if kind == "list":
+                column = [v or [] for v in column]
+            encoded = _encode(kind, column)
+            if kind == "cat":
+                columns[name], categories[name] = encoded
+            else:
+                columns[name] = encoded
+        return cls(spec, columns, categories)
+
+    def __len__(self) -> int:
+        return len(self.columns["id"])
+
+    def __getitem__(self, i):
+        return self.views()[i]
+
+    def __iter__(self):
+        return iter(self.views())
+
+    def views(self) -> list:
+        """The rows as dataclass objects, built column-wise on first use."""
+        if self._views is None:
+            names = [name for name, _ in self.spec.columns + self.spec.trailing]
+            values = [self._python_values(name, kind) for name, kind in self.spec.columns + self.spec.trailing]
+            cls = self.spec.cls
+            self._views = [cls(**dict(zip(names, row))) for row in zip(*values)]
+        return self._views
+
+    def __getstate__(self):
+        return self.spec, self.columns, self.categories
+
+    def __setstate__(self, state):
+        self.spec, self.columns, self.categories = state
+        self._views = None
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays (object columns: pointers only)."""
+        return sum(col.nbytes for col in self.columns.values())
+
+    def _python_values(self, name: str, kind: str) -> list:
+        col = self.columns[name]
+        if kind == "time":
+            naive = col.view("datetime64[ns]").astype("datetime64[us]").astype(object)
+            return [None if d is None else d.replace(tzinfo=timezone.utc) for d in naive.tolist()]
+        if kind == "list":
+            return [list(v) for v in col]
+        return self._column_values(name, kind)
+
+    def _column_values(self, name: str, kind: str) -> list:
+        """JSON-safe Python values of one column."""
+        col = self.columns[name]
+        if kind == "time":
+            return _iso_times(col)
+        if kind == "cat":
+            lookup = np.array(self.categories[name] + (None,), dtype=object)
+            return lookup[col].tolist()
+        if kind == "float?":
+            values = col.astype(object)
+            values[np.isnan(col)] = None
+            return values.tolist()
+        if kind == "int?":
+            values = col.astype(object)
+            values[col == _NO_INT] = None
+            return values.tolist()
+        if kind == "list":
+            return [list(v) for v in col]
+        if col.dtype.kind == "S":
+            values = col.astype(np.str_).tolist()
+            return [v or None for v in values] if kind == "str?" else values
+        return col.tolist()
+
+    def to_records(self, times: Optional[Dict[str, list]] = None) -> List[dict]:
+        """The to_dict() of every row, built column-wise.
+
+        ``times`` may supply the time columns already formatted.
+        """
+        if not len(self):
+            return []
+        times = times or {}
+        keys = [name for name, _ in self.spec.columns]
+        values = [times[name] if name in times else self._column_values(name, kind)
+                  for name, kind in self.spec.columns]
+        records = [dict(zip(keys, row)) for row in zip(*values)]
+        if self.spec.trailing:
+            flags = self.columns[self.spec.trailing_if]
+            extra = [(name, self._column_values(name, kind)) for name, kind in self.spec.trailing]
+            for i in np.flatnonzero([len(v) > 0 for v in flags]).tolist():
+                for name, column in extra:
+                    records[i][name] = column[i]
+        return records
+
+
+@dataclass(slots=True)
+class StructureFrame:
+    """A StructurePacket held column-wise; see the module docstring.
+
+    Active zones are kept as positions into ``imbalance`` when they are
+    members of it (as process_imbalance builds them), otherwise as given.
+    """
+
+    schema_version: str
+    instrument: str
+    timeframe: str
+    as_of: datetime
+    build: dict
+    swings: EntityTable
+    events: EntityTable
+    liquidity: EntityTable
+    sweep_events: EntityTable
+    imbalance: EntityTable
+    active_zone_index: Optional[np.ndarray]
+    active_zones_raw: Optional[list]
+    regime: RegimeSummary
+    diagnostics: dict
+
+    @classmethod
+    def from_packet(cls, packet: StructurePacket) -> "StructureFrame":
+        zones = packet.active_zones["zones"]
+        position = {id(z): i for i, z in enumerate(packet.imbalance)}
+        index, raw = None, None
+        if all(id(z) in position for z in zones):
+            index = np.array([position[id(z)] for z in zones], dtype=np.int64)
+        else:
+            raw = list(zones)
+        return cls(
+            schema_version=packet.schema_version,
+            instrument=packet.instrument,
+            timeframe=packet.timeframe,
+            as_of=packet.as_of,
+            build=packet.build,
+            swings=EntityTable.from_records(SWING_SPEC, packet.swings),
+            events=EntityTable.from_records(EVENT_SPEC, packet.events),
+            liquidity=EntityTable.from_records(LIQUIDITY_SPEC, packet.liquidity),
+            sweep_events=EntityTable.from_records(SWEEP_SPEC, packet.sweep_events),
+            imbalance=EntityTable.from_records(FVG_SPEC, packet.imbalance),
+            active_zone_index=index,
+            active_zones_raw=raw,
+            regime=packet.regime,
+            diagnostics=packet.diagnostics,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StructureFrame":
+        """Build from a packet dict as written by to_dict (e.g. a JSON file)."""
+        imbalance = data["imbalance"]
+        position = {z["id"]: i for i, z in enumerate(imbalance)}
+        zones = data["active_zones"]["zones"]
+        index, raw = None, None
+        if all(isinstance(z, dict) and position.get(z.get("id")) is not None for z in zones):
+            index = np.array([position[z["id"]] for z in zones], dtype=np.int64)
+        else:
+            raw = list(zones)
+        return cls(
+            schema_version=data["schema_version"],
+            instrument=data["instrument"],
+            timeframe=data["timeframe"],
+            as_of=datetime.fromisoformat(data["as_of"]),
+            build=data["build"],
+            swings=EntityTable.from_records(SWING_SPEC, data["swings"]),
+            events=EntityTable.from_records(EVENT_SPEC, data["events"]),
+            liquidity=EntityTable.from_records(LIQUIDITY_SPEC, data["liquidity"]),
+            sweep_events=EntityTable.from_records(SWEEP_SPEC, data["sweep_events"]),
+            imbalance=EntityTable.from_records(FVG_SPEC, imbalance),
+            active_zone_index=index,
+            active_zones_raw=raw,
+            regime=RegimeSummary(**data["regime"]),
+            diagnostics=data["diagnostics"],
+        )
+
+    @property
+    def active_zones(self) -> dict:
+        """The packet's active zone registry, as object views."""
+        if self.active_zone_index is None:
+            zones = list(self.active_zones_raw)
+        else:
+            zones = [self.imbalance[i] for i in self.active_zone_index.tolist()]
+        return {"count": len(zones), "zones": zones}
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the entity columns."""
+        return sum(t.nbytes for t in (self.swings, self.events, self.liquidity,
+                                      self.sweep_events, self.imbalance))
+
+    def to_packet(self) -> StructurePacket:
+        """Materialize the object packet (views are cached on the tables)."""
+        return StructurePacket(
+            schema_version=self.schema_version,
+            instrument=self.instrument,
+            timeframe=self.timeframe,
+            as_of=self.as_of,
+            build=self.build,
+            swings=list(self.swings),
+            events=list(self.events),
+            liquidity=list(self.liquidity),
+            sweep_events=list(self.sweep_events),
+            imbalance=list(self.imbalance),
+            active_zones=self.active_zones,
+            regime=self.regime,
+            diagnostics=self.diagnostics,
+        )
+
+    def to_dict(self) -> dict:
+        """Serialize to the same JSON-safe dictionary as StructurePacket.to_dict."""
+        tables = (self.swings, self.events, self.liquidity, self.sweep_events, self.imbalance)
+        swings, events, liquidity, sweep_events, imbalance = (
+            table.to_records(times) for table, times in zip(tables, _shared_iso_times(tables))
+        )
+        if self.active_zone_index is None:
+            zones = [z.to_dict() if hasattr(z, "to_dict") else z for z in self.active_zones_raw]
+        else:
+            zones = [dict(imbalance[i]) for i in self.active_zone_index.tolist()]
+        return {
+            "schema_version": self.schema_version,
+            "instrument": self.instrument,
+            "timeframe": self.timeframe,
+            "as_of": self.as_of.isoformat(),
+            "build": self.build,
+            "swings": swings,
+            "events": events,
+            "liquidity": liquidity,
+            "sweep_events": sweep_events,
+            "imbalance": imbalance,
+            "active_zones": {"count": len(zones), "zones": zones},
+            "regime": self.regime.to_dict(),
+            "diagnostics": self.diagnostics,
+        }
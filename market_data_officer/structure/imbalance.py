@@ -2,8 +2,12 @@
 
 Detects Fair Value Gaps using body-only logic, tracks fill progression
 through partial and full states, and maintains an active zone registry.
+Detection compares shifted body arrays for all bars at once.
 """
 
+from typing import List, Optional
+
+import numpy as np
 import pandas as pd
 
 from .config import StructureConfig
@@ -11,9 +15,12 @@ from .schemas import FairValueGap
 from market_data_officer.instrument_registry import INSTRUMENT_REGISTRY
 
 
-def _compact_ts(ts) -> str:
-    """Create a compact timestamp string for deterministic IDs."""
-    return ts.strftime("%Y%m%d%H%M")
+def _compact_ts(times: pd.DatetimeIndex) -> List[str]:
+    """Compact "%Y%m%d%H%M" timestamps for deterministic IDs, in bulk."""
+    if times.tz is not None:
+        times = times.tz_localize(None)
+    iso = np.datetime_as_string(times.to_numpy().astype("datetime64[m]"), unit="m")
+    return [t.replace("-", "").replace("T", "").replace(":", "") for t in iso.tolist()]
 
 
 def detect_fvg(
@@ -27,115 +34,185 @@ def detect_fvg(
     A zone is not emitted until candle 3 closes (no lookahead).
     Minimum gap size filtered per instrument config.
     """
-    # Look up per-instrument FVG min size from the registry; fall back to EURUSD
+    if len(bars) < 3:
+        return []
+
+    bullish, bearish, gap_size, edges = fvg_gaps(bars["open"].to_numpy(), bars["close"].to_numpy())
+    keep = np.flatnonzero((bullish | bearish) & (gap_size >= fvg_min_size(instrument, config)))
+    return build_fvgs(bars.index, keep, bullish, gap_size, edges, timeframe)
+
+
+def fvg_min_size(instrument: str, config: StructureConfig) -> float:
+    """Minimum FVG size for an instrument: the registry's, else EURUSD's."""
     registry_meta = INSTRUMENT_REGISTRY.get(instrument)
     if registry_meta is not None and registry_meta.fvg_min_size > 0:
-        min_size = registry_meta.fvg_min_size
-    else:
-        min_size = config.fvg_min_size_eurusd
+        return registry_meta.fvg_min_size
+    return config.fvg_min_size_eurusd
+
 
+def fvg_gaps(opens: np.ndarray, closes: np.ndarray) -> tuple:
+    """Body gaps for every candle-3 position along the last axis at once.
+
+    Returns (bullish, bearish, gap_size, (c1_high, c1_low, c3_high, c3_low)),
+    each indexed by k = candle-3 position - 2. Works on 1-D bar arrays and
+    on 2-D (series × bars) stacks alike.
+    """
+    # Body boundaries, with max()/min() tie and NaN behaviour
+    body_high = np.where(closes > opens, closes, opens)
+    body_low = np.where(closes < opens, closes, opens)
+
+    # Candle 1 is bar i-2, candle 3 is bar i, for every i >= 2 at once
+    c1_high, c1_low = body_high[..., :-2], body_low[..., :-2]
+    c3_high, c3_low = body_high[..., 2:], body_low[..., 2:]
+    # Bullish FVG: gap between c1 body top and c3 body bottom
+    bullish = c3_low > c1_high
+    # Bearish FVG: gap between c3 body top and c1 body bottom
+    bearish = ~bullish & (c3_high < c1_low)
+    gap_size = np.where(bullish, c3_low - c1_high, c1_low - c3_high)
+    return bullish, bearish, gap_size, (c1_high, c1_low, c3_high, c3_low)
+
+
+def build_fvgs(
+    timestamps: pd.DatetimeIndex,
+    keep: np.ndarray,
+    bullish: np.ndarray,
+    gap_size: np.ndarray,
+    edges: tuple,
+    timeframe: str,
+) -> list:
+    """FairValueGap objects for the kept positions ``keep`` of one series' fvg_gaps."""
+    if len(keep) == 0:
+        return []
+    c1_high, c1_low, c3_high, c3_low = edges
+
+    origins = timestamps[keep + 1]
+    confirms = timestamps[keep + 2]
     zones = []
-    for i in range(2, len(bars)):
-        c1 = bars.iloc[i - 2]
-        c3 = bars.iloc[i]
-
-        # Body boundaries
-        c1_body_high = max(c1["open"], c1["close"])
-        c1_body_low = min(c1["open"], c1["close"])
-        c3_body_high = max(c3["open"], c3["close"])
-        c3_body_low = min(c3["open"], c3["close"])
-
-        # Bullish FVG: gap between c1 body top and c3 body bottom
-        if c3_body_low > c1_body_high:
-            gap_size = c3_body_low - c1_body_high
-            if gap_size >= min_size:
-                origin_ts = bars.index[i - 1]
-                confirm_ts = bars.index[i]
-                fvg_id = f"fvg_{timeframe}_{_compact_ts(origin_ts)}_bull"
-                zones.append(FairValueGap(
-                    id=fvg_id,
-                    fvg_type="bullish_fvg",
-                    zone_high=c3_body_low,
-                    zone_low=c1_body_high,
-                    zone_size=gap_size,
-                    origin_time=origin_ts,
-                    confirm_time=confirm_ts,
-                    timeframe=timeframe,
-                    status="open",
-                ))
-
-        # Bearish FVG: gap between c3 body top and c1 body bottom
-        elif c3_body_high < c1_body_low:
-            gap_size = c1_body_low - c3_body_high
-            if gap_size >= min_size:
-                origin_ts = bars.index[i - 1]
-                confirm_ts = bars.index[i]
-                fvg_id = f"fvg_{timeframe}_{_compact_ts(origin_ts)}_bear"
-                zones.append(FairValueGap(
-                    id=fvg_id,
-                    fvg_type="bearish_fvg",
-                    zone_high=c1_body_low,
-                    zone_low=c3_body_high,
-                    zone_size=gap_size,
-                    origin_time=origin_ts,
-                    confirm_time=confirm_ts,
-                    timeframe=timeframe,
-                    status="open",
-                ))
+    for k, origin_ts, confirm_ts, compact in zip(keep, origins, confirms, _compact_ts(origins)):
+        if bullish[k]:
+            zones.append(FairValueGap(
+                id=f"fvg_{timeframe}_{compact}_bull",
+                fvg_type="bullish_fvg",
+                zone_high=c3_low[k],
+                zone_low=c1_high[k],
+                zone_size=gap_size[k],
+                origin_time=origin_ts,
+                confirm_time=confirm_ts,
+                timeframe=timeframe,
+                status="open",
+            ))
+        else:
+            zones.append(FairValueGap(
+                id=f"fvg_{timeframe}_{compact}_bear",
+                fvg_type="bearish_fvg",
+                zone_high=c1_low[k],
+                zone_low=c3_high[k],
+                zone_size=gap_size[k],
+                origin_time=origin_ts,
+                confirm_time=confirm_ts,
+                timeframe=timeframe,
+                status="open",
+            ))
 
     return zones
 
 
+def _first_true(mask: np.ndarray) -> Optional[int]:
+    if len(mask) == 0 or not mask.any():
+        return None
+    return int(mask.argmax())
+
+
+def _fold_extreme(current: Optional[float], closes: np.ndarray, lower: bool) -> Optional[float]:
+    """Running min (lower) or max of ``current`` and ``closes``, folded bar by bar.
+
+    Matches repeated min(current, close) / max(...): NaN closes never
+    replace the running value, and an absent value starts from the first
+    close.
+    """
+    if len(closes) == 0:
+        return current
+    if current is None:
+        current = closes[0]
+    valid = closes[~np.isnan(closes)]
+    if len(valid):
+        extreme = valid.min() if lower else valid.max()
+        if (extreme < current) if lower else (extreme > current):
+            current = extreme
+    return current
+
+
 def update_fvg_fills(zone: FairValueGap, bars: pd.DataFrame) -> FairValueGap:
     """Process subsequent bars after zone confirmation.
 
     Tracks partial and full fill transitions in order.
     A zone cannot skip from open to fully_filled without partial_fill.
     If price blows through, both transitions fire in sequence on the same bar.
+    Transitions are located with first-index searches over the closes after
+    the zone's confirmation rather than a per-bar loop.
     """
+    return _track_fills(zone, bars.index, bars["close"].to_numpy())
+
+
+def _track_fills(zone: FairValueGap, index: pd.DatetimeIndex, all_closes: np.ndarray) -> FairValueGap:
+    """update_fvg_fills over a precomputed close array (shared across zones)."""
     if zone.status == "invalidated":
         return zone  # terminal state — do not reprocess
+    if zone.fvg_type not in ("bullish_fvg", "bearish_fvg"):
+        return zone
 
-    subsequent = bars[bars.index > zone.confirm_time]
-
-    for ts, bar in subsequent.iterrows():
-        close = bar["close"]
-
-        if zone.fvg_type == "bullish_fvg":
-            # Check for entry into zone: close below zone_high
-            if zone.status == "open" and close < zone.zone_high:
-                zone.status = "partially_filled"
-                zone.first_touch_time = ts
-                zone.partial_fill_time = ts
-                zone.fill_low = close
-
-            # Check for full fill: close at or below zone_low
-            if zone.status == "partially_filled":
-                zone.fill_low = min(zone.fill_low if zone.fill_low is not None else close, close)
-                if close <= zone.zone_low:
-                    zone.status = "invalidated"
-                    zone.full_fill_time = ts
-                    return zone
-
-        elif zone.fvg_type == "bearish_fvg":
-            # Check for entry into zone: close above zone_low
-            if zone.status == "open" and close > zone.zone_low:
-                zone.status = "partially_filled"
-                zone.first_touch_time = ts
-                zone.partial_fill_time = ts
-                zone.fill_high = close
-
-            # Check for full fill: close at or above zone_high
-            if zone.status == "partially_filled":
-                zone.fill_high = max(zone.fill_high if zone.fill_high is not None else close, close)
-                if close >= zone.zone_high:
-                    zone.status = "invalidated"
-                    zone.full_fill_time = ts
-                    return zone
-
+    if index.is_monotonic_increasing:
+        positions = None
+        start = index.searchsorted(zone.confirm_time, side="right")
+        closes = all_closes[start:]
+    else:
+        positions = np.flatnonzero(index > zone.confirm_time)
+        closes = all_closes[positions]
+
+    def time_at(k: int):
+        return index[start + k] if positions is None else index[positions[k]]
+
+    bullish = zone.fvg_type == "bullish_fvg"
+    touch = 0
+    if zone.status == "open":
+        # Entry into zone: close below zone_high (bullish) / above zone_low (bearish)
+        entered = closes < zone.zone_high if bullish else closes > zone.zone_low
+        touch = _first_true(entered)
+        if touch is None:
+            return zone
+        zone.status = "partially_filled"
+        zone.first_touch_time = time_at(touch)
+        zone.partial_fill_time = time_at(touch)
+        if bullish:
+            zone.fill_low = closes[touch]
+        else:
+            zone.fill_high = closes[touch]
+
+    if zone.status != "partially_filled":
+        return zone
+
+    # Full fill: close at or beyond the far edge, from the touch bar onwards
+    remaining = closes[touch:]
+    filled = remaining <= zone.zone_low if bullish else remaining >= zone.zone_high
+    full = _first_true(filled)
+    through = remaining if full is None else remaining[:full + 1]
+    if bullish:
+        zone.fill_low = _fold_extreme(zone.fill_low, through, lower=True)
+    else:
+        zone.fill_high = _fold_extreme(zone.fill_high, through, lower=False)
+    if full is not None:
+        zone.status = "invalidated"
+        zone.full_fill_time = time_at(touch + full)
     return zone
 
 
+def update_zone_fills(zones: list, bars: pd.DataFrame) -> None:
+    """update_fvg_fills for every zone, in place, sharing one close array."""
+    closes = bars["close"].to_numpy()
+    for zone in zones:
+        _track_fills(zone, bars.index, closes)
+
+
 def build_active_zone_registry(zones: list) -> dict:
     """Build the active zone registry from a list of FVG zones.
 
@@ -163,8 +240,7 @@ def process_imbalance(
     zones = detect_fvg(bars, config, instrument, timeframe)
 
     # Step 2: Update fill tracking for each zone
-    for i, zone in enumerate(zones):
-        zones[i] = update_fvg_fills(zone, bars)
+    update_zone_fills(zones, bars)
 
     # Step 3: Build active zone registry
     active_zones = build_active_zone_registry(zones)
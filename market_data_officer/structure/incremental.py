@@ -0,0 +1,364 @@
+"""Incremental structure engine — folds new bars into a kept structure state.
+
+compute_structure_packet derives everything from the full bar window on
+every run. IncrementalStructureEngine keeps, per instrument and timeframe,
+the state that derivation would rebuild and advances it over new bars only:
+
+- pending pivots: the last pivot_right_bars bars, kept with the bars; their
+  swings are detected once the right-hand bars arrive
+- active swings, structural bias and broken swings: the BOS/MSS sweep
+  (events.EventSweep), resumed at the first new bar
+- open FVGs: zones still open or partially filled, tracked over new bars
+- unresolved levels: each level's sweep-scan progress and the extremes of
+  completed sessions (liquidity.LiquidityScanCache). Level definitions and
+  EQH/EQL clusters are re-derived from the swings, which is cheap.
+
+The last bar of a hot package may still be forming, so the state is only
+committed through the bar before it; the packet applies the last bar to a
+copy. ``update`` therefore returns the packet compute_structure_packet would
+build from the hot package (as_of aside).
+
+The kept bars are the last ``retain_bars`` (default: the hot package
+window), as in the package. All of the state above depends on where that
+window starts, so once it slides — a full window gaining a bar — the state
+is rebuilt over the new window. Folding costs O(new bars) while the window
+is still filling and on refreshes that only revise the forming bar.
+
+State lives in <state_dir>/<INSTRUMENT>_<tf>_state.json, with the bars in
+<INSTRUMENT>_<tf>_bars.npy (hot package binary layout). The bars are written
+first, so the state only ever refers to persisted bars. Anything that
+cannot be folded forward — no or unreadable state, a changed config, revised
+bars inside the committed range — goes through ``rebuild``, which is also
+the recovery path: it recomputes the state from the hot package.
+"""
+
+import copy
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from market_data_officer.feed.config import HOT_WINDOW_SIZES
+from market_data_officer.feed.hot_package import (
+    HOT_BINARY_COLUMNS,
+    read_hot_binary,
+    write_hot_binary,
+)
+
+from .config import StructureConfig
+from .engine import assemble_packet
+from .events import EventSweep, update_swing_statuses
+from .imbalance import build_active_zone_registry, detect_fvg, update_zone_fills
+from .io import OUTPUT_DIR, PACKAGES_DIR, load_bars
+from .liquidity import LiquidityScanCache, detect_liquidity
+from .regime import compute_regime
+from .schemas import FairValueGap, StructureEvent, StructurePacket, SwingPoint
+from .swings import detect_swings
+
+STATE_DIR = OUTPUT_DIR / "state"
+STATE_VERSION = 1
+
+# Trailing bars that may still be revised by the next refresh (the forming bar)
+_PROVISIONAL_BARS = 1
+
+_OPEN_ZONE_STATES = ("open", "partially_filled")
+
+
+@dataclass
+class StructureState:
+    """Structure derived from the first ``n_bars`` bars of a series."""
+
+    n_bars: int
+    swings: List[SwingPoint]  # anchor order; status stays "confirmed", events mark breaks
+    sweep: EventSweep  # active swings, bias, broken swings and events
+    zones: List[FairValueGap]
+    liquidity: LiquidityScanCache
+
+    @classmethod
+    def empty(cls, timeframe: str) -> "StructureState":
+        return cls(0, [], EventSweep(timeframe), [], LiquidityScanCache())
+
+    def copy(self) -> "StructureState":
+        """Copy that can be advanced without touching this state."""
+        return StructureState(
+            n_bars=self.n_bars,
+            swings=list(self.swings),
+            sweep=self.sweep.copy(),
+            zones=[copy.copy(z) if z.status in _OPEN_ZONE_STATES else z for z in self.zones],
+            liquidity=self.liquidity.copy(),
+        )
+
+
+def _advance(
+    state: StructureState,
+    bars: pd.DataFrame,
+    end: int,
+    config: StructureConfig,
+    instrument: str,
+    timeframe: str,
+) -> None:
+    """Fold bars ``state.n_bars .. end - 1`` into ``state`` in place."""
+    start = state.n_bars
+    if end <= start:
+        return
+    timestamps = bars.index
+    bar_ns = timestamps.asi8 * pd.Timedelta(1, unit=timestamps.unit).value
+
+    # Pivots whose right-hand bars are now all present: anchors from
+    # start - right on, each needing `left` bars before it
+    left, right = config.pivot_left_bars, config.pivot_right_bars
+    first_anchor = max(start - right, 0)
+    found = detect_swings(bars.iloc[max(first_anchor - left, 0):end], config, timeframe=timeframe)
+    new_swings = [s for s in found if s.anchor_time >= timestamps[first_anchor]]
+    state.swings.extend(new_swings)
+
+    state.sweep.add_swings(new_swings, bar_ns)
+    state.sweep.run(bars["close"].to_numpy(dtype=np.float64), timestamps, start, end)
+
+    open_zones = [z for z in state.zones if z.status in _OPEN_ZONE_STATES]
+    update_zone_fills(open_zones, bars.iloc[start:end])
+    # Candle 3 of a new zone is a new bar; candles 1-2 may precede them
+    fvg_bars = bars.iloc[max(start - 2, 0):end]
+    new_zones = detect_fvg(fvg_bars, config, instrument, timeframe)
+    update_zone_fills(new_zones, fvg_bars)
+    state.zones.extend(new_zones)
+
+    state.n_bars = end
+
+
+def _ohlcv(bars: pd.DataFrame) -> pd.DataFrame:
+    """OHLCV float64 columns on a UTC nanosecond index."""
+    if bars.empty:
+        raise ValueError("No bars to fold")
+    missing = set(HOT_BINARY_COLUMNS) - set(bars.columns)
+    if missing:
+        raise ValueError(f"Missing required columns: {missing}")
+    index = pd.DatetimeIndex(bars.index)
+    index = index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
+    return pd.DataFrame(
+        bars[HOT_BINARY_COLUMNS].to_numpy(dtype=np.float64),
+        index=index.as_unit("ns").rename("timestamp_utc"),
+        columns=HOT_BINARY_COLUMNS,
+    )
+
+
+def _config_fingerprint(config: StructureConfig) -> str:
+    return json.dumps(asdict(config), sort_keys=True)
+
+
+class IncrementalStructureEngine:
+    """Keeps the structure packet of one instrument/timeframe current.
+
+    Usage:
+        engine = IncrementalStructureEngine("EURUSD", "1h", config)
+        packet = engine.update(load_bars("EURUSD", "1h"))   # after each refresh
+
+    ``update`` takes the whole hot package or just the new bars: kept bars
+    before the first incoming timestamp are retained, the incoming bars
+    replace the rest, and the last ``retain_bars`` of those are kept.
+    """
+
+    def __init__(
+        self,
+        instrument: str,
+        timeframe: str,
+        config: StructureConfig,
+        state_dir: Optional[Path] = None,
+        packages_dir: Optional[Path] = None,
+        retain_bars: Optional[int] = None,
+    ) -> None:
+        self.instrument = instrument
+        self.timeframe = timeframe
+        self.config = config
+        self.state_dir = Path(state_dir) if state_dir is not None else STATE_DIR
+        self.packages_dir = Path(packages_dir) if packages_dir is not None else PACKAGES_DIR
+        self.retain_bars = retain_bars if retain_bars is not None else HOT_WINDOW_SIZES.get(timeframe)
+        self.bars: Optional[pd.DataFrame] = None
+        self.state: Optional[StructureState] = None
+        # Serialized swings, events and invalidated zones, which never change
+        self._final_rows: Dict[str, dict] = {}
+        self._load()
+
+    @property
+    def state_path(self) -> Path:
+        return self.state_dir / f"{self.instrument}_{self.timeframe}_state.json"
+
+    @property
+    def bars_path(self) -> Path:
+        return self.state_dir / f"{self.instrument}_{self.timeframe}_bars.npy"
+
+    def update(self, new_bars: pd.DataFrame) -> StructurePacket:
+        """Fold ``new_bars`` in and return the packet for the kept bars.
+
+        Raises:
+            ValueError: If new_bars is empty or missing OHLCV columns.
+        """
+        incoming = _ohlcv(new_bars)
+        if self.state is None:
+            return self.rebuild(incoming)
+
+        first = int(self.bars.index.searchsorted(incoming.index[0]))
+        bars = self._window(pd.concat([self.bars.iloc[:first], incoming]))
+        # The state depends on the window's first bar, so a slid window is rebuilt
+        if bars.index[0] != self.bars.index[0] or not self._keeps_committed(bars, first):
+            return self.rebuild(bars)
+
+        state = self.state.copy()
+        self._commit(state, bars)
+        # Only the forming bar changed: the saved state and bars still hold
+        return self._emit(state, bars, save=not bars.index.equals(self.bars.index))
+
+    def rebuild(self, bars: Optional[pd.DataFrame] = None) -> StructurePacket:
+        """Recompute the state from scratch, from the hot package unless ``bars`` is given.
+
+        Raises:
+            FileNotFoundError: If the hot package cannot be found.
+            ValueError: If bar data is empty or malformed.
+        """
+        if bars is None:
+            bars = load_bars(self.instrument, self.timeframe, self.packages_dir)
+        bars = self._window(_ohlcv(bars))
+        self._final_rows = {}
+        state = StructureState.empty(self.timeframe)
+        self._commit(state, bars)
+        return self._emit(state, bars)
+
+    def _window(self, bars: pd.DataFrame) -> pd.DataFrame:
+        """The last ``retain_bars`` bars, as a hot package of them would hold."""
+        if self.retain_bars and len(bars) > self.retain_bars:
+            return bars.iloc[-self.retain_bars:]
+        return bars
+
+    def _keeps_committed(self, bars: pd.DataFrame, first: int) -> bool:
+        """True if ``bars`` still starts with every committed bar, unrevised."""
+        committed = self.state.n_bars
+        if first >= committed:
+            return True
+        if len(bars) < committed:
+            return False
+        kept = self.bars.iloc[first:committed]
+        merged = bars.iloc[first:committed]
+        return kept.index.equals(merged.index) and np.array_equal(
+            kept.to_numpy(), merged.to_numpy(), equal_nan=True,
+        )
+
+    def _commit(self, state: StructureState, bars: pd.DataFrame) -> None:
+        committed = max(len(bars) - _PROVISIONAL_BARS, 0)
+        _advance(state, bars, committed, self.config, self.instrument, self.timeframe)
+
+    def _emit(self, state: StructureState, bars: pd.DataFrame, save: bool = True) -> StructurePacket:
+        view = state.copy()
+        _advance(view, bars, len(bars), self.config, self.instrument, self.timeframe)
+        packet = self._packet(view, bars)
+
+        # Keep the level scans the packet advanced, cut back to the committed bars
+        if state.n_bars:
+            last_ns = pd.Timestamp(bars.index[state.n_bars - 1]).value
+            state.liquidity = view.liquidity.truncated(state.n_bars, last_ns)
+        self.state, self.bars = state, bars
+        if save:
+            self._save()
+        return packet
+
+    def _packet(self, state: StructureState, bars: pd.DataFrame) -> StructurePacket:
+        # The packet gets its own objects; the kept state is never handed out
+        swings = [copy.copy(s) for s in state.swings]
+        events = [copy.copy(e) for e in state.sweep.events]
+        update_swing_statuses(swings, events)
+        liquidity_levels, sweep_events = detect_liquidity(
+            bars, swings, self.config,
+            timeframe=self.timeframe, instrument=self.instrument,
+            scan_cache=state.liquidity,
+        )
+        zones = [copy.copy(z) for z in state.zones]
+        return assemble_packet(
+            self.instrument, self.timeframe, self.config, len(bars),
+            swings, events, liquidity_levels, sweep_events,
+            zones, build_active_zone_registry(zones), compute_regime(swings, events),
+        )
+
+    def _save(self) -> None:
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        write_hot_binary(self.bars, self.bars_path)
+
+        state, sweep = self.state, self.state.sweep
+        payload = {
+            "version": STATE_VERSION,
+            "instrument": self.instrument,
+            "timeframe": self.timeframe,
+            "config": _config_fingerprint(self.config),
+            "bars": len(self.bars),
+            "last_bar_utc": self.bars.index[-1].isoformat(),
+            "n_bars": state.n_bars,
+            "bias": sweep.current_bias,
+            "admitted": {"high": sweep.highs.next, "low": sweep.lows.next},
+            "active_swings": {
+                "high": [s.id for s in sweep.highs.stack],
+                "low": [s.id for s in sweep.lows.stack],
+            },
+            "swings": self._rows(state.swings),
+            "events": self._rows(sweep.events),
+            "zones": self._rows(state.zones),
+            "liquidity": state.liquidity.to_dict(),
+        }
+        tmp = self.state_path.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(payload))
+        os.replace(tmp, self.state_path)
+
+    def _rows(self, objects: list) -> List[dict]:
+        rows = []
+        for obj in objects:
+            row = self._final_rows.get(obj.id)
+            if row is None:
+                row = obj.to_dict()
+                # Committed swings and events are final; zones once filled
+                if not isinstance(obj, FairValueGap) or obj.status not in _OPEN_ZONE_STATES:
+                    self._final_rows[obj.id] = row
+            rows.append(row)
+        return rows
+
+    def _load(self) -> None:
+        """Restore saved state; leaves it unset if absent, stale or unreadable."""
+        try:
+            raw = json.loads(self.state_path.read_text())
+        except (OSError, ValueError):
+            return
+        if (
+            raw.get("version") != STATE_VERSION
+            or raw.get("config") != _config_fingerprint(self.config)
+        ):
+            return
+        bars = read_hot_binary(self.bars_path)
+        if bars is None or len(bars) != raw["bars"] or bars.index[-1].isoformat() != raw["last_bar_utc"]:
+            return
+        try:
+            self.state = self._state_from_dict(raw, bars)
+        except (KeyError, TypeError, ValueError):
+            return
+        self.bars = bars
+
+    def _state_from_dict(self, raw: dict, bars: pd.DataFrame) -> StructureState:
+        swings = [SwingPoint.from_dict(d) for d in raw["swings"]]
+        events = [StructureEvent.from_dict(d) for d in raw["events"]]
+
+        sweep = EventSweep(self.timeframe)
+        sweep.add_swings(swings, bars.index.asi8)
+        sweep.events = events
+        sweep.current_bias = raw["bias"]
+        sweep.broken_swing_ids = {e.reference_swing_id for e in events}
+        by_id = {s.id: s for s in swings}
+        for side, key in ((sweep.highs, "high"), (sweep.lows, "low")):
+            side.next = raw["admitted"][key]
+            side.stack = [by_id[swing_id] for swing_id in raw["active_swings"][key]]
+
+        return StructureState(
+            n_bars=raw["n_bars"],
+            swings=swings,
+            sweep=sweep,
+            zones=[FairValueGap.from_dict(d) for d in raw["zones"]],
+            liquidity=LiquidityScanCache.from_dict(raw["liquidity"]),
+        )
@@ -1,7 +1,8 @@
 """I/O utilities — load derived bars and write JSON structure packets.
 
-The Structure Engine reads from hot package CSVs (same source as the Officer)
-in market_data/packages/latest/. It writes JSON packets to structure/output/.
+The Structure Engine reads from hot packages (same source as the Officer)
+in market_data/packages/latest/, preferring the binary twin of each CSV.
+It writes JSON packets, each with a compact sidecar, to structure/output/.
 """
 
 import json
@@ -10,6 +11,10 @@ from pathlib import Path
 
 import pandas as pd
 
+from market_data_officer.feed.hot_cache import load_hot_frame
+
+from .codec import json_default, write_packet_sidecar
+
 # Default paths relative to repo root
 PACKAGES_DIR = Path("market_data/packages/latest")
 OUTPUT_DIR = Path("market_data_officer/structure/output")
@@ -22,6 +27,10 @@ def load_bars(
 ) -> pd.DataFrame:
     """Load OHLCV bars for an instrument and timeframe from hot packages.
 
+    Reads the memory-mapped binary package when it is present and at least
+    as new as the CSV; otherwise parses the CSV. Frames come from the
+    process-wide hot package cache; treat their values as read-only.
+
     Args:
         instrument: Instrument symbol, e.g. 'EURUSD'.
         timeframe: Timeframe label, e.g. '1h'.
@@ -35,23 +44,14 @@ def load_bars(
         ValueError: If data is empty or malformed.
     """
     csv_path = packages_dir / f"{instrument}_{timeframe}_latest.csv"
-    if not csv_path.exists():
-        raise FileNotFoundError(
-            f"Hot package CSV not found: {csv_path}. "
-            f"Has the feed pipeline run?"
-        )
-
-    df = pd.read_csv(csv_path, index_col=0, parse_dates=True)
+    try:
+        df = load_hot_frame(packages_dir, instrument, timeframe)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"{e}. Has the feed pipeline run?") from None
 
     if df.empty:
         raise ValueError(f"Empty data file: {csv_path}")
 
-    # Ensure UTC-aware index
-    if df.index.tzinfo is None:
-        df.index = df.index.tz_localize("UTC")
-
-    df.index.name = "timestamp_utc"
-
     required_cols = {"open", "high", "low", "close", "volume"}
     missing = required_cols - set(df.columns)
     if missing:
@@ -61,9 +61,11 @@ def load_bars(
 
 
 def write_packet_atomic(packet: dict, path: str) -> None:
-    """Write a structure packet to JSON atomically.
+    """Write a structure packet to JSON atomically, plus its compact sidecar.
 
-    Writes to a temp file first, then renames to avoid partial writes.
+    Writes to a temp file first, then renames to avoid partial writes. The
+    sidecar (see structure.codec) goes second, so it is never older than the
+    JSON it mirrors.
 
     Args:
         packet: Serialized structure packet dictionary.
@@ -72,8 +74,10 @@ def write_packet_atomic(packet: dict, path: str) -> None:
     os.makedirs(os.path.dirname(path), exist_ok=True)
     tmp = path + ".tmp"
     with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(packet, f, indent=2, default=str)
+        # One write: json.dump issues a write per token
+        f.write(json.dumps(packet, indent=2, default=json_default))
     os.replace(tmp, path)
+    write_packet_sidecar(packet, path)
 
 
 def get_output_path(
@@ -6,11 +6,19 @@ Computes:
 - Equal highs/equal lows from confirmed swing clusters
 - Sweep events when price trades through liquidity levels
 - Phase 3B: Reclaim detection, post-sweep classification, internal/external tagging
+
+Callers that re-run detection over a growing bar series can pass a
+LiquidityScanCache, which carries completed-period extremes and each
+level's sweep-scan progress between calls so only new bars are scanned.
 """
 
+import bisect
+import math
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 from .config import StructureConfig
@@ -20,6 +28,9 @@ from .schemas import LiquidityLevel, SweepEvent, SwingPoint
 # Phase 3B — Terminal states that must not transition further (except to archived)
 _TERMINAL_STATES = {"reclaimed", "accepted_beyond", "invalidated"}
 
+_HIGH_LEVEL_TYPES = ("prior_day_high", "prior_week_high", "equal_highs")
+_LOW_LEVEL_TYPES = ("prior_day_low", "prior_week_low", "equal_lows")
+
 # Phase 3B — Level types that are always external liquidity
 _EXTERNAL_LEVEL_TYPES = {
     "prior_day_high",
@@ -29,6 +40,49 @@ _EXTERNAL_LEVEL_TYPES = {
 }
 
 
+@dataclass
+class LiquidityScanCache:
+    """Detection progress carried between calls over an append-only bar series.
+
+    ``period_extremes`` maps a completed session or week, keyed
+    "<start_ns>:<end_ns>", to its [high, low] (None if it held no bars).
+    ``sweeps`` maps a level key (see _level_key) to [bars scanned, first
+    sweeping bar or None]. Both stay valid only while the bars already
+    scanned are unchanged; the owner must drop the cache otherwise.
+    """
+
+    period_extremes: Dict[str, Optional[list]] = field(default_factory=dict)
+    sweeps: Dict[str, list] = field(default_factory=dict)
+
+    def copy(self) -> "LiquidityScanCache":
+        return LiquidityScanCache(dict(self.period_extremes), dict(self.sweeps))
+
+    def truncated(self, n_bars: int, last_bar_ns: int) -> "LiquidityScanCache":
+        """The part of this cache that holds for the first ``n_bars`` bars alone.
+
+        ``last_bar_ns`` is the time of the last of those bars: periods
+        ending after it are dropped, scans are cut back to ``n_bars`` and
+        sweeps on later bars forgotten.
+        """
+        extremes = {
+            key: value for key, value in self.period_extremes.items()
+            if int(key.split(":")[1]) <= last_bar_ns
+        }
+        sweeps = {
+            key: [min(scanned, n_bars), swept if swept is not None and swept < n_bars else None]
+            for key, (scanned, swept) in self.sweeps.items()
+        }
+        return LiquidityScanCache(extremes, sweeps)
+
+    def to_dict(self) -> dict:
+        """Serialize to JSON-safe dictionary."""
+        return {"period_extremes": self.period_extremes, "sweeps": self.sweeps}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LiquidityScanCache":
+        return cls(dict(data["period_extremes"]), dict(data["sweeps"]))
+
+
 def _get_session_boundaries(
     bars: pd.DataFrame,
     config: StructureConfig,
@@ -144,6 +198,22 @@ def classify_liquidity_scope(
     return "unclassified"
 
 
+def _scope_reference_swings(swings: List[SwingPoint]) -> List[SwingPoint]:
+    """The only swings classify_liquidity_scope consults, found once per call.
+
+    That is the swing high with the latest anchor_time and the swing low
+    with the earliest one (first of equals, as max()/min() pick them).
+    """
+    reference = []
+    highs = [s for s in swings if s.type == "swing_high"]
+    if highs:
+        reference.append(max(highs, key=lambda s: s.anchor_time))
+    lows = [s for s in swings if s.type == "swing_low"]
+    if lows:
+        reference.append(min(lows, key=lambda s: s.anchor_time))
+    return reference
+
+
 def _detect_reclaim(
     level_price: float,
     level_type: str,
@@ -159,60 +229,103 @@ def _detect_reclaim(
     is_high_side = level_type in {
         "prior_day_high", "prior_week_high", "equal_highs"
     }
+    return _reclaim_outcome(
+        level_price, is_high_side, sweep_bar_index,
+        bars["close"].to_numpy(), bars.index, config,
+    )
+
 
+def _reclaim_outcome(
+    level_price: float,
+    is_high_side: bool,
+    sweep_bar_index: int,
+    closes: np.ndarray,
+    timestamps: pd.DatetimeIndex,
+    config: StructureConfig,
+) -> Tuple[str, Optional[datetime], Optional[float]]:
+    """_detect_reclaim over a precomputed close array."""
     # Window: sweep bar + reclaim_window_bars subsequent bars
     window_start = sweep_bar_index if config.allow_same_bar_reclaim else sweep_bar_index + 1
     window_end = sweep_bar_index + config.reclaim_window_bars + 1
 
-    window_bars = bars.iloc[window_start:window_end]
-
-    if window_bars.empty:
+    window = closes[window_start:window_end]
+    if len(window) == 0:
         return "unresolved", None, None
 
-    for _, bar in window_bars.iterrows():
-        if is_high_side and bar["close"] < level_price:
-            return "reclaimed", bar.name.to_pydatetime(), float(bar["close"])
-        if not is_high_side and bar["close"] > level_price:
-            return "reclaimed", bar.name.to_pydatetime(), float(bar["close"])
+    back_inside = window < level_price if is_high_side else window > level_price
+    if back_inside.any():
+        k = window_start + int(back_inside.argmax())
+        return "reclaimed", timestamps[k].to_pydatetime(), float(closes[k])
 
     # Window exhausted, check if we have enough bars to resolve
-    if len(bars) > window_end:
-        post_sweep_close = float(bars.iloc[window_end - 1]["close"])
+    if len(closes) > window_end:
+        post_sweep_close = float(closes[window_end - 1])
         return "accepted_beyond", None, post_sweep_close
 
     return "unresolved", None, None
 
 
+def _period_extremes(
+    bar_ns: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    start: datetime,
+    end: datetime,
+    scan_cache: Optional[LiquidityScanCache],
+) -> Optional[Tuple[float, float]]:
+    """High and low of the bars in [start, end), or None if there are none.
+
+    NaNs are skipped as in Series.max()/min(). Periods handed in are
+    complete, so their extremes are final and safe to cache.
+    """
+    start_ns, end_ns = pd.Timestamp(start).value, pd.Timestamp(end).value
+    key = f"{start_ns}:{end_ns}"
+    if scan_cache is not None and key in scan_cache.period_extremes:
+        cached = scan_cache.period_extremes[key]
+        return tuple(cached) if cached is not None else None
+
+    lo, hi = np.searchsorted(bar_ns, [start_ns, end_ns], side="left")
+    extremes = None
+    if hi > lo:
+        extremes = float(np.fmax.reduce(highs[lo:hi])), float(np.fmin.reduce(lows[lo:hi]))
+    if scan_cache is not None:
+        scan_cache.period_extremes[key] = list(extremes) if extremes is not None else None
+    return extremes
+
+
 def _detect_prior_period_levels(
     bars: pd.DataFrame,
     config: StructureConfig,
     timeframe: str,
+    scan_cache: Optional[LiquidityScanCache] = None,
 ) -> List[LiquidityLevel]:
     """Detect prior day and prior week high/low levels.
 
     Args:
-        bars: DataFrame with DatetimeIndex and OHLCV columns.
+        bars: DataFrame with DatetimeIndex and OHLCV columns, in time order.
         config: Structure engine configuration.
         timeframe: Timeframe label for ID generation.
+        scan_cache: Optional cache of completed-period extremes.
 
     Returns:
         List of LiquidityLevel objects for prior period highs and lows.
     """
     levels: List[LiquidityLevel] = []
 
+    bar_ns = bars.index.asi8 * pd.Timedelta(1, unit=bars.index.unit).value
+    highs = bars["high"].to_numpy(dtype=np.float64)
+    lows = bars["low"].to_numpy(dtype=np.float64)
+
     # Prior day highs and lows
     sessions = _get_session_boundaries(bars, config)
     for i in range(len(sessions) - 1):
         # The "prior" session for the next session
         sess_start, sess_end = sessions[i]
-        # Get bars within this session
-        mask = (bars.index >= sess_start) & (bars.index < sess_end)
-        session_bars = bars[mask]
-        if session_bars.empty:
+        extremes = _period_extremes(bar_ns, highs, lows, sess_start, sess_end, scan_cache)
+        if extremes is None:
             continue
 
-        day_high = float(session_bars["high"].max())
-        day_low = float(session_bars["low"].min())
+        day_high, day_low = extremes
         origin = sess_start
 
         compact_origin = origin.strftime("%Y%m%dT%H%M")
@@ -238,13 +351,11 @@ def _detect_prior_period_levels(
     weeks = _get_week_boundaries(bars, config)
     for i in range(len(weeks) - 1):
         week_start, week_end = weeks[i]
-        mask = (bars.index >= week_start) & (bars.index < week_end)
-        week_bars = bars[mask]
-        if week_bars.empty:
+        extremes = _period_extremes(bar_ns, highs, lows, week_start, week_end, scan_cache)
+        if extremes is None:
             continue
 
-        week_high = float(week_bars["high"].max())
-        week_low = float(week_bars["low"].min())
+        week_high, week_low = extremes
         origin = week_start
 
         compact_origin = origin.strftime("%Y%m%dT%H%M")
@@ -300,6 +411,10 @@ def _detect_equal_levels(
         if len(typed_swings) < 2:
             continue
 
+        # Without NaN prices the list is truly sorted, so a cluster ends at
+        # the first swing priced beyond anchor + tolerance
+        ordered = not any(math.isnan(s.price) for s in typed_swings)
+
         # Greedy clustering: group swings with prices within tolerance
         used = set()
         for i, anchor in enumerate(typed_swings):
@@ -313,6 +428,8 @@ def _detect_equal_levels(
                 if abs(typed_swings[j].price - anchor.price) <= tolerance:
                     cluster.append(typed_swings[j])
                     cluster_indices.append(j)
+                elif ordered and typed_swings[j].price - anchor.price > tolerance:
+                    break
 
             if len(cluster) >= 2:
                 for idx in cluster_indices:
@@ -344,6 +461,7 @@ def _detect_sweeps(
     levels: List[LiquidityLevel],
     timeframe: str,
     config: StructureConfig,
+    scan_cache: Optional[LiquidityScanCache] = None,
 ) -> List[SweepEvent]:
     """Detect sweep events where price trades through liquidity levels.
 
@@ -354,109 +472,208 @@ def _detect_sweeps(
     Phase 3B: Also populates linked_liquidity_id and reclaim_window_bars
     on sweep events, and runs reclaim detection.
 
+    The first sweeping bar of every level is found in a single pass over
+    the bars (see _first_sweep_bars), or by resuming each level's scan
+    from ``scan_cache``; events are emitted in level order.
+
     Args:
         bars: DataFrame with DatetimeIndex and OHLCV columns.
         levels: List of LiquidityLevel objects to check for sweeps.
         timeframe: Timeframe label for ID generation.
         config: Structure engine configuration.
+        scan_cache: Optional sweep-scan progress from earlier calls.
 
     Returns:
         List of SweepEvent objects for detected sweeps.
     """
     sweep_events: List[SweepEvent] = []
 
-    highs = bars["high"].values
-    lows = bars["low"].values
-    closes = bars["close"].values
+    highs = bars["high"].to_numpy(dtype=np.float64)
+    lows = bars["low"].to_numpy(dtype=np.float64)
+    closes = bars["close"].to_numpy(dtype=np.float64)
     timestamps = bars.index
 
-    for level in levels:
-        if level.status != "active":
+    if scan_cache is None:
+        first_sweeps = _first_sweep_bars(levels, highs, lows, closes, timestamps)
+    else:
+        first_sweeps = _resume_sweep_scans(levels, highs, lows, closes, timestamps, scan_cache)
+
+    for pos, level in enumerate(levels):
+        bar_idx = first_sweeps.get(pos)
+        if bar_idx is None:
             continue
+        is_high_level = level.type in _HIGH_LEVEL_TYPES
+        bar_time = timestamps[bar_idx].to_pydatetime()
+
+        # A close through the level takes precedence over a wick
+        if is_high_level:
+            if float(closes[bar_idx]) > level.price:
+                sweep_price, sweep_type_str = float(closes[bar_idx]), "close_sweep"
+            else:
+                sweep_price, sweep_type_str = float(highs[bar_idx]), "wick_sweep"
+        else:
+            if float(closes[bar_idx]) < level.price:
+                sweep_price, sweep_type_str = float(closes[bar_idx]), "close_sweep"
+            else:
+                sweep_price, sweep_type_str = float(lows[bar_idx]), "wick_sweep"
+
+        level.status = "swept"
+        level.swept_time = bar_time
+        level.sweep_type = sweep_type_str
+        level.reclaim_window_bars = config.reclaim_window_bars
+
+        # Phase 3B — Reclaim detection
+        outcome, reclaim_time, post_sweep_close = _reclaim_outcome(
+            level.price, is_high_level, bar_idx, closes, timestamps, config,
+        )
+        level.outcome = outcome
+        level.reclaim_time = reclaim_time
 
-        # Determine sweep direction based on level type
-        is_high_level = level.type in ("prior_day_high", "prior_week_high", "equal_highs")
-        is_low_level = level.type in ("prior_day_low", "prior_week_low", "equal_lows")
+        # Update level status based on outcome
+        if outcome == "reclaimed":
+            level.status = "reclaimed"
+        elif outcome == "accepted_beyond":
+            level.status = "accepted_beyond"
+        # swept stays as-is for unresolved
+
+        compact_time = bar_time.strftime("%Y%m%dT%H%M")
+        # Extract abbreviation from level id for sweep id
+        level_abbrev = level.id.split("_")[2]  # e.g. "pdh", "eqh"
+        sweep_side = "sweep_high" if is_high_level else "sweep_low"
 
-        if not (is_high_level or is_low_level):
+        sweep_events.append(SweepEvent(
+            id=f"swp_{timeframe}_{compact_time}_{level_abbrev}",
+            type=sweep_side,
+            time=bar_time,
+            timeframe=timeframe,
+            liquidity_level_id=level.id,
+            sweep_price=sweep_price,
+            sweep_type=sweep_type_str,
+            status="confirmed",
+            linked_liquidity_id=level.id,
+            post_sweep_close=post_sweep_close,
+            reclaim_time=reclaim_time,
+            outcome=outcome,
+            reclaim_window_bars=config.reclaim_window_bars,
+        ))
+
+    return sweep_events
+
+
+def _first_sweep_bars(
+    levels: List[LiquidityLevel],
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    timestamps: pd.DatetimeIndex,
+) -> Dict[int, int]:
+    """Map each active level's position to the first bar that trades through it.
+
+    One pass over the bars. A level becomes eligible on the first bar after
+    its origin_time and joins a price-sorted pending list for its side. A
+    bar sweeps every pending high level priced below max(close, high) and
+    every pending low level priced above min(close, low); those form a
+    prefix (highs) or suffix (lows) of the sorted list, found by bisection,
+    and are retired. NaN prices and NaN bars never sweep, as with scalar
+    comparisons. Bars must be in time order.
+    """
+    bar_ns = timestamps.asi8 * pd.Timedelta(1, unit=timestamps.unit).value
+    schedule = []
+    for pos, level in enumerate(levels):
+        if level.status != "active" or np.isnan(level.price):
             continue
+        if level.type in _HIGH_LEVEL_TYPES:
+            side = "high"
+        elif level.type in _LOW_LEVEL_TYPES:
+            side = "low"
+        else:
+            continue
+        origin_ns = pd.Timestamp(level.origin_time).value
+        eligible_from = int(np.searchsorted(bar_ns, origin_ns, side="right"))
+        schedule.append((eligible_from, pos, side, level.price))
+    schedule.sort()
 
-        for bar_idx in range(len(bars)):
-            bar_time = timestamps[bar_idx].to_pydatetime()
+    high_reach = np.fmax(closes, highs)
+    low_reach = np.fmin(closes, lows)
+    pending = {"high": [], "low": []}  # sorted (price, level position)
+    first_sweeps: Dict[int, int] = {}
+    next_admission = 0
 
-            # Only check bars after the level's origin time
-            if bar_time <= level.origin_time:
-                continue
+    for bar_idx in range(len(bar_ns)):
+        while next_admission < len(schedule) and schedule[next_admission][0] <= bar_idx:
+            _, pos, side, price = schedule[next_admission]
+            bisect.insort(pending[side], (price, pos))
+            next_admission += 1
 
-            swept = False
-            sweep_price = 0.0
-            sweep_type_str = ""
-
-            if is_high_level:
-                # Sweep high: price trades above the level
-                if float(closes[bar_idx]) > level.price:
-                    swept = True
-                    sweep_price = float(closes[bar_idx])
-                    sweep_type_str = "close_sweep"
-                elif float(highs[bar_idx]) > level.price:
-                    swept = True
-                    sweep_price = float(highs[bar_idx])
-                    sweep_type_str = "wick_sweep"
-
-            elif is_low_level:
-                # Sweep low: price trades below the level
-                if float(closes[bar_idx]) < level.price:
-                    swept = True
-                    sweep_price = float(closes[bar_idx])
-                    sweep_type_str = "close_sweep"
-                elif float(lows[bar_idx]) < level.price:
-                    swept = True
-                    sweep_price = float(lows[bar_idx])
-                    sweep_type_str = "wick_sweep"
-
-            if swept:
-                level.status = "swept"
-                level.swept_time = bar_time
-                level.sweep_type = sweep_type_str
-                level.reclaim_window_bars = config.reclaim_window_bars
-
-                # Phase 3B — Reclaim detection
-                outcome, reclaim_time, post_sweep_close = _detect_reclaim(
-                    level.price, level.type, bar_idx, bars, config,
-                )
-                level.outcome = outcome
-                level.reclaim_time = reclaim_time
-
-                # Update level status based on outcome
-                if outcome == "reclaimed":
-                    level.status = "reclaimed"
-                elif outcome == "accepted_beyond":
-                    level.status = "accepted_beyond"
-                # swept stays as-is for unresolved
-
-                compact_time = bar_time.strftime("%Y%m%dT%H%M")
-                # Extract abbreviation from level id for sweep id
-                level_abbrev = level.id.split("_")[2]  # e.g. "pdh", "eqh"
-                sweep_side = "sweep_high" if is_high_level else "sweep_low"
-
-                sweep_events.append(SweepEvent(
-                    id=f"swp_{timeframe}_{compact_time}_{level_abbrev}",
-                    type=sweep_side,
-                    time=bar_time,
-                    timeframe=timeframe,
-                    liquidity_level_id=level.id,
-                    sweep_price=sweep_price,
-                    sweep_type=sweep_type_str,
-                    status="confirmed",
-                    linked_liquidity_id=level.id,
-                    post_sweep_close=post_sweep_close,
-                    reclaim_time=reclaim_time,
-                    outcome=outcome,
-                    reclaim_window_bars=config.reclaim_window_bars,
-                ))
-                break  # Level is swept, move to next level
+        if pending["high"] and not np.isnan(high_reach[bar_idx]):
+            crossed = bisect.bisect_left(pending["high"], (high_reach[bar_idx],))
+            for _, pos in pending["high"][:crossed]:
+                first_sweeps[pos] = bar_idx
+            del pending["high"][:crossed]
 
-    return sweep_events
+        if pending["low"] and not np.isnan(low_reach[bar_idx]):
+            crossed = bisect.bisect_left(pending["low"], (low_reach[bar_idx], math.inf))
+            for _, pos in pending["low"][crossed:]:
+                first_sweeps[pos] = bar_idx
+            del pending["low"][crossed:]
+
+        if next_admission == len(schedule) and not pending["high"] and not pending["low"]:
+            break
+
+    return first_sweeps
+
+
+def _level_key(level: LiquidityLevel) -> str:
+    """Identity of a level definition; EQH/EQL ids can be reused after reclustering."""
+    return f"{level.id}|{level.price!r}|{pd.Timestamp(level.origin_time).value}"
+
+
+def _resume_sweep_scans(
+    levels: List[LiquidityLevel],
+    highs: np.ndarray,
+    lows: np.ndarray,
+    closes: np.ndarray,
+    timestamps: pd.DatetimeIndex,
+    scan_cache: LiquidityScanCache,
+) -> Dict[int, int]:
+    """_first_sweep_bars, continuing each known level's scan where it stopped.
+
+    A level already swept keeps its sweeping bar; an unswept one is only
+    checked against bars it has not seen. New levels are scanned from
+    their first eligible bar. Entries for levels that no longer exist are
+    dropped from the cache.
+    """
+    bar_ns = timestamps.asi8 * pd.Timedelta(1, unit=timestamps.unit).value
+    n_bars = len(bar_ns)
+    first_sweeps: Dict[int, int] = {}
+    scans: Dict[str, list] = {}
+
+    for pos, level in enumerate(levels):
+        if level.status != "active" or np.isnan(level.price):
+            continue
+        if level.type in _HIGH_LEVEL_TYPES:
+            extremes, reach, crossed = highs, np.fmax, np.greater
+        elif level.type in _LOW_LEVEL_TYPES:
+            extremes, reach, crossed = lows, np.fmin, np.less
+        else:
+            continue
+
+        key = _level_key(level)
+        scanned, swept = scan_cache.sweeps.get(key, (None, None))
+        if swept is None:
+            start = scanned
+            if start is None:
+                origin_ns = pd.Timestamp(level.origin_time).value
+                start = int(np.searchsorted(bar_ns, origin_ns, side="right"))
+            hits = crossed(reach(closes[start:], extremes[start:]), level.price)
+            if hits.any():
+                swept = start + int(hits.argmax())
+        scans[key] = [n_bars, swept]
+        if swept is not None:
+            first_sweeps[pos] = swept
+
+    scan_cache.sweeps = scans
+    return first_sweeps
 
 
 def _resolve_unresolved_levels(
@@ -485,10 +702,13 @@ def _resolve_unresolved_levels(
             continue
 
         # Find the bar index of the sweep
+        swept_time = pd.Timestamp(level.swept_time)
+        if swept_time.tzinfo is None:
+            swept_time = swept_time.tz_localize(bars.index.tz)
+        else:
+            swept_time = swept_time.tz_convert(bars.index.tz)
         try:
-            sweep_idx = bars.index.get_loc(
-                pd.Timestamp(level.swept_time, tz=bars.index.tz)
-            )
+            sweep_idx = bars.index.get_loc(swept_time)
         except KeyError:
             continue
 
@@ -521,6 +741,7 @@ def detect_liquidity(
     config: StructureConfig,
     timeframe: str = "1h",
     instrument: str = "EURUSD",
+    scan_cache: Optional[LiquidityScanCache] = None,
 ) -> Tuple[List[LiquidityLevel], List[SweepEvent]]:
     """Detect all liquidity levels and sweep events.
 
@@ -530,6 +751,8 @@ def detect_liquidity(
         config: Structure engine configuration.
         timeframe: Timeframe label for ID generation.
         instrument: Instrument symbol for tolerance lookup.
+        scan_cache: Optional LiquidityScanCache from an earlier call over a
+            prefix of ``bars``; updated in place.
 
     Returns:
         Tuple of (liquidity_levels, sweep_events).
@@ -546,7 +769,7 @@ def detect_liquidity(
         raise ValueError(f"Missing required columns: {missing}")
 
     # Detect prior period levels
-    levels = _detect_prior_period_levels(bars, config, timeframe)
+    levels = _detect_prior_period_levels(bars, config, timeframe, scan_cache)
 
     # Detect EQH/EQL
     tolerance = config.eqh_eql_tolerance.get(instrument, 0.00010)
@@ -554,13 +777,17 @@ def detect_liquidity(
     levels.extend(eq_levels)
 
     # Phase 3B — Tag liquidity scope at creation time
+    reference_swings = _scope_reference_swings(swings)
     for level in levels:
         level.liquidity_scope = classify_liquidity_scope(
-            level.type, level.price, swings,
+            level.type, level.price, reference_swings,
         )
 
     # Detect sweeps against all levels (includes 3B reclaim detection)
-    sweep_events = _detect_sweeps(bars, levels, timeframe, config)
+    if scan_cache is None:
+        sweep_events = _detect_sweeps(bars, levels, timeframe, config)
+    else:
+        sweep_events = _detect_sweeps(bars, levels, timeframe, config, scan_cache)
 
     # Phase 3B — Resolve any previously unresolved levels
     _resolve_unresolved_levels(bars, levels, sweep_events, config)
@@ -3,15 +3,54 @@
 Provides a clean interface for the Officer to load structure engine outputs.
 The Officer calls this module — it never reads structure JSON files directly
 or imports from the structure engine.
+
+Packets are read from the compact sidecar when it is at least as new as the
+JSON, and kept parsed per file keyed by (mtime, size), so repeated officer
+builds reuse them until the engine rewrites the file. At most
+STRUCTURE_PACKET_CACHE_SIZE packets (default 256) are kept, least recently
+used evicted first; a packet whose file is gone is dropped. Freshness checks
+read only the sidecar header.
 """
 
 import json
+import os
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 
+from .codec import read_packet_header, read_packet_sidecar, sidecar_path
+
 STRUCTURE_OUTPUT_DIR = Path("market_data_officer/structure/output")
 STRUCTURE_STALENESS_MINUTES = 120
 
+PACKET_CACHE_SIZE = int(os.environ.get("STRUCTURE_PACKET_CACHE_SIZE", "256"))
+
+# path -> ((st_mtime_ns, st_size), parsed packet), least recently used first
+_PACKET_CACHE: "OrderedDict[Path, tuple[tuple[int, int], dict]]" = OrderedDict()
+_PACKET_CACHE_LOCK = threading.Lock()
+
+
+def _packet_path(instrument: str, timeframe: str, output_dir: Path) -> Path:
+    return Path(output_dir) / f"{instrument.lower()}_{timeframe}_structure.json"
+
+
+def _fresh_sidecar(path: Path, json_mtime_ns: int) -> Path | None:
+    """The packet's sidecar, unless it is missing or older than the JSON."""
+    sidecar = sidecar_path(path)
+    try:
+        if sidecar.stat().st_mtime_ns >= json_mtime_ns:
+            return sidecar
+    except OSError:
+        pass
+    return None
+
+
+def clear_packet_cache() -> None:
+    """Drop every cached packet."""
+    with _PACKET_CACHE_LOCK:
+        _PACKET_CACHE.clear()
+
 
 def load_structure_packet(
     instrument: str,
@@ -21,7 +60,8 @@ def load_structure_packet(
     """Load the latest structure packet JSON for an instrument/timeframe.
 
     Returns None if file does not exist or cannot be parsed.
-    Never raises on missing files.
+    Never raises on missing files. The dict is shared with later calls
+    until the file changes, so treat it as read-only.
 
     Args:
         instrument: Instrument symbol, e.g. 'EURUSD'.
@@ -31,14 +71,51 @@ def load_structure_packet(
     Returns:
         Parsed structure packet dict, or None if unavailable.
     """
-    path = output_dir / f"{instrument.lower()}_{timeframe}_structure.json"
-    if not path.exists():
+    path = _packet_path(instrument, timeframe, output_dir)
+    try:
+        stat = path.stat()
+    except OSError:
+        with _PACKET_CACHE_LOCK:
+            _PACKET_CACHE.pop(path, None)
         return None
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _PACKET_CACHE_LOCK:
+        cached = _PACKET_CACHE.get(path)
+        if cached is not None and cached[0] == key:
+            _PACKET_CACHE.move_to_end(path)
+            return cached[1]
+
+    packet = None
+    sidecar = _fresh_sidecar(path, stat.st_mtime_ns)
+    if sidecar is not None:
+        packet = read_packet_sidecar(sidecar)
+    if packet is None:
+        try:
+            with open(path, encoding="utf-8") as f:
+                packet = json.load(f)
+        except Exception:
+            return None
+    with _PACKET_CACHE_LOCK:
+        _PACKET_CACHE[path] = (key, packet)
+        _PACKET_CACHE.move_to_end(path)
+        while len(_PACKET_CACHE) > PACKET_CACHE_SIZE:
+            _PACKET_CACHE.popitem(last=False)
+    return packet
+
+
+def _packet_as_of(instrument: str, timeframe: str, output_dir: Path):
+    """as_of of a packet, from the sidecar header when one is current."""
+    path = _packet_path(instrument, timeframe, output_dir)
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
+        stat = path.stat()
+    except OSError:
         return None
+    sidecar = _fresh_sidecar(path, stat.st_mtime_ns)
+    header = read_packet_header(sidecar) if sidecar is not None else None
+    if header is not None:
+        return header.get("as_of")
+    packet = load_structure_packet(instrument, timeframe, output_dir=output_dir)
+    return packet.get("as_of") if isinstance(packet, dict) else None
 
 
 def load_structure_summary(
@@ -82,8 +159,8 @@ def structure_is_available(
         True if at least one fresh structure packet is available.
     """
     for tf in timeframes:
-        packet = load_structure_packet(instrument, tf, output_dir=output_dir)
-        if packet and _is_fresh(packet):
+        as_of = _packet_as_of(instrument, tf, output_dir)
+        if as_of and _is_fresh({"as_of": as_of}):
             return True
     return False
 
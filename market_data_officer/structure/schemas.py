@@ -2,7 +2,9 @@
 
 Defines: SwingPoint, StructureEvent, LiquidityLevel, SweepEvent,
 FairValueGap, RegimeSummary, and StructurePacket. These are the
-canonical contract for downstream consumers.
+canonical contract for downstream consumers. They are slotted: packets
+carry thousands of them. structure.frame holds the same packets
+column-wise.
 """
 
 from dataclasses import dataclass, field
@@ -10,7 +12,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SwingPoint:
     """A confirmed swing high or low detected via fixed-pivot confirmation."""
 
@@ -42,8 +44,17 @@ class SwingPoint:
             "status": self.status,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "SwingPoint":
+        """Rebuild from the output of to_dict."""
+        return cls(**{
+            **data,
+            "anchor_time": datetime.fromisoformat(data["anchor_time"]),
+            "confirm_time": datetime.fromisoformat(data["confirm_time"]),
+        })
 
-@dataclass
+
+@dataclass(slots=True)
 class StructureEvent:
     """A BOS or MSS event confirmed from structural breaks."""
 
@@ -71,8 +82,13 @@ class StructureEvent:
             "status": self.status,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "StructureEvent":
+        """Rebuild from the output of to_dict."""
+        return cls(**{**data, "time": datetime.fromisoformat(data["time"])})
+
 
-@dataclass
+@dataclass(slots=True)
 class LiquidityLevel:
     """A liquidity reference level — prior period high/low or EQH/EQL."""
 
@@ -114,7 +130,7 @@ class LiquidityLevel:
         return d
 
 
-@dataclass
+@dataclass(slots=True)
 class SweepEvent:
     """A confirmed liquidity sweep event."""
 
@@ -152,7 +168,7 @@ class SweepEvent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class FairValueGap:
     """A Fair Value Gap (FVG) zone detected via body-only gap logic."""
 
@@ -192,8 +208,17 @@ class FairValueGap:
             "full_fill_time": self.full_fill_time.isoformat() if self.full_fill_time else None,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "FairValueGap":
+        """Rebuild from the output of to_dict."""
+        times = ("origin_time", "confirm_time", "first_touch_time", "partial_fill_time", "full_fill_time")
+        return cls(**{
+            **data,
+            **{key: datetime.fromisoformat(data[key]) if data[key] else None for key in times},
+        })
+
 
-@dataclass
+@dataclass(slots=True)
 class RegimeSummary:
     """Objective structural regime summary derived from confirmed events."""
 
@@ -214,7 +239,7 @@ class RegimeSummary:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class StructurePacket:
     """Top-level structure packet per instrument per timeframe."""
 
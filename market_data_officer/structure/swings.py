@@ -6,11 +6,17 @@ already-closed bars. Swing lows are symmetric using lows.
 
 No provisional swings in 3A — a swing either meets confirmation criteria
 or does not exist yet.
+
+Pivots are found for all bars at once by comparing each sliding window's
+anchor with its neighbours; SwingPoint objects are built only for the
+pivots.
 """
 
 from typing import List
 
+import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 
 from .config import StructureConfig
 from .schemas import SwingPoint
@@ -49,74 +55,86 @@ def detect_swings(
     if len(bars) < min_bars:
         return []
 
-    swings: List[SwingPoint] = []
-    highs = bars["high"].values
-    lows = bars["low"].values
-    timestamps = bars.index
-
-    for i in range(left, len(bars) - right):
-        # Check swing high: anchor high > all left highs AND all right highs
-        is_swing_high = True
-        for j in range(i - left, i):
-            if highs[i] <= highs[j]:
-                is_swing_high = False
-                break
-        if is_swing_high:
-            for j in range(i + 1, i + right + 1):
-                if highs[i] <= highs[j]:
-                    is_swing_high = False
-                    break
-
-        if is_swing_high:
-            anchor_time = timestamps[i].to_pydatetime()
-            confirm_time = timestamps[i + right].to_pydatetime()
-            compact_time = anchor_time.strftime("%Y%m%dT%H%M")
-            swing_id = f"sw_{timeframe}_{compact_time}_sh"
-
-            swings.append(SwingPoint(
-                id=swing_id,
-                type="swing_high",
-                price=float(highs[i]),
-                anchor_time=anchor_time,
-                confirm_time=confirm_time,
-                timeframe=timeframe,
-                left_bars=left,
-                right_bars=right,
-                strength=right,
-                status="confirmed",
-            ))
-
-        # Check swing low: anchor low < all left lows AND all right lows
-        is_swing_low = True
-        for j in range(i - left, i):
-            if lows[i] >= lows[j]:
-                is_swing_low = False
-                break
-        if is_swing_low:
-            for j in range(i + 1, i + right + 1):
-                if lows[i] >= lows[j]:
-                    is_swing_low = False
-                    break
-
-        if is_swing_low:
-            anchor_time = timestamps[i].to_pydatetime()
-            confirm_time = timestamps[i + right].to_pydatetime()
-            compact_time = anchor_time.strftime("%Y%m%dT%H%M")
-            swing_id = f"sw_{timeframe}_{compact_time}_sl"
-
-            swings.append(SwingPoint(
-                id=swing_id,
-                type="swing_low",
-                price=float(lows[i]),
-                anchor_time=anchor_time,
-                confirm_time=confirm_time,
-                timeframe=timeframe,
-                left_bars=left,
-                right_bars=right,
-                strength=right,
-                status="confirmed",
-            ))
+    highs = bars["high"].to_numpy()
+    lows = bars["low"].to_numpy()
+    high_mask = pivot_mask(highs, left, right, is_high=True)
+    low_mask = pivot_mask(lows, left, right, is_high=False)
+    return build_swings(
+        bars.index, highs, lows,
+        np.flatnonzero(high_mask) + left, np.flatnonzero(low_mask) + left,
+        config, timeframe,
+    )
+
+
+def build_swings(
+    timestamps: pd.DatetimeIndex,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    high_anchors: np.ndarray,
+    low_anchors: np.ndarray,
+    config: StructureConfig,
+    timeframe: str,
+) -> List[SwingPoint]:
+    """SwingPoint objects for pivot anchors (bar positions), ordered by anchor_time."""
+    left = config.pivot_left_bars
+    right = config.pivot_right_bars
+
+    # Same emission order as a bar-by-bar scan: by anchor, high before low
+    anchors = np.concatenate((high_anchors, low_anchors))
+    is_high = np.concatenate((np.ones(len(high_anchors), dtype=bool), np.zeros(len(low_anchors), dtype=bool)))
+    order = np.lexsort((~is_high, anchors))
+    anchors, is_high = anchors[order], is_high[order]
+    if len(anchors) == 0:
+        return []
+
+    anchor_times = timestamps[anchors].to_pydatetime()
+    confirm_times = timestamps[anchors + right].to_pydatetime()
+    compact_times = _compact_minutes(timestamps[anchors])
+    prices = np.where(is_high, highs[anchors], lows[anchors]).tolist()
+
+    swings: List[SwingPoint] = [
+        SwingPoint(
+            id=f"sw_{timeframe}_{compact}_{'sh' if high else 'sl'}",
+            type="swing_high" if high else "swing_low",
+            price=float(price),
+            anchor_time=anchor_time,
+            confirm_time=confirm_time,
+            timeframe=timeframe,
+            left_bars=left,
+            right_bars=right,
+            strength=right,
+            status="confirmed",
+        )
+        for high, price, anchor_time, confirm_time, compact in zip(
+            is_high.tolist(), prices, anchor_times, confirm_times, compact_times,
+        )
+    ]
 
     # Sort by anchor_time for deterministic ordering
     swings.sort(key=lambda s: s.anchor_time)
     return swings
+
+
+def _compact_minutes(times: pd.DatetimeIndex) -> List[str]:
+    """Format wall-clock times as "%Y%m%dT%H%M" in bulk (DatetimeIndex.strftime is slow)."""
+    if times.tz is not None:
+        times = times.tz_localize(None)
+    iso = np.datetime_as_string(times.to_numpy().astype("datetime64[m]"), unit="m")
+    return [t.replace("-", "").replace(":", "") for t in iso.tolist()]
+
+
+def pivot_mask(values: np.ndarray, left: int, right: int, is_high: bool) -> np.ndarray:
+    """Strict pivots among bars ``left .. len - right - 1``, one flag per anchor.
+
+    Each window holds left neighbours, the anchor and right neighbours. An
+    anchor is a pivot high unless some neighbour is >= it (<= for lows);
+    NaN comparisons are false, so NaNs never disqualify an anchor, exactly
+    as in a scalar comparison loop. Windows run along the last axis, so a
+    2-D array gives one row of flags per series.
+    """
+    windows = sliding_window_view(values, left + 1 + right, axis=-1)
+    anchor = windows[..., left:left + 1]
+    neighbours = np.concatenate((windows[..., :left], windows[..., left + 1:]), axis=-1)
+    if is_high:
+        return ~(anchor <= neighbours).any(axis=-1)
+    return ~(anchor >= neighbours).any(axis=-1)
@@ -4,6 +4,7 @@ Creates synthetic hot package data that mimics the feed's export format.
 """
 
 import json
+import time
 from datetime import datetime, timezone, timedelta
 
 import numpy as np
@@ -13,6 +14,42 @@ import pytest
 from market_data_officer.instrument_registry import INSTRUMENT_REGISTRY, get_meta
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-speedups",
+        action="store_true",
+        default=False,
+        help="run the wall-clock speedup checks marked 'speedup'",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "speedup: wall-clock comparison against a reference implementation; "
+        "load-dependent, so skipped unless --run-speedups is given",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-speedups"):
+        return
+    skip = pytest.mark.skip(reason="wall-clock speedup check; run with --run-speedups")
+    for item in items:
+        if "speedup" in item.keywords:
+            item.add_marker(skip)
+
+
+def best_of(fn, repeats=3):
+    """Fastest of ``repeats`` wall-clock timings of ``fn()``, for speedup checks."""
+    timings = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - t0)
+    return min(timings)
+
+
 def _generate_ohlcv(
     periods: int,
     freq: str,
@@ -212,3 +249,52 @@ def stale_packages_dir(hot_packages_dir):
         df.to_csv(csv_file)
 
     return hot_packages_dir
+
+
+class FakePriceStore:
+    """In-memory stand-in for TDP's PriceStoreAdapter over a PriceStore.
+
+    Serves synthetic bars for every instrument and timeframe it is asked
+    for, records each read, and can be made unhealthy or failing.
+    """
+
+    _FREQ = {"1m": "1min", "5m": "5min", "15m": "15min", "1h": "1h", "4h": "4h", "1d": "1D"}
+    _ROWS = {"1m": 3000, "5m": 1200, "15m": 600, "1h": 240, "4h": 120, "1d": 30}
+
+    def __init__(self):
+        self.reads = []
+        self.healthy = True
+        self.fail = False
+
+    def health_check(self) -> bool:
+        return self.healthy
+
+    def get_timeframes(self, instrument, timeframes, source=None, price_basis=None):
+        self.reads.append((instrument, tuple(timeframes), source, price_basis))
+        if self.fail:
+            raise OSError("PriceStore read failed")
+        return {tf: _generate_ohlcv(self._ROWS[tf], self._FREQ[tf]) for tf in timeframes}
+
+
+@pytest.fixture
+def fake_pricestore(tmp_path, monkeypatch):
+    """Route the loader's PriceStore path to fresh FakePriceStore instances.
+
+    Returns the list of adapters built, in order; the last is current.
+    """
+    from market_data_officer.officer.pricestore import PRICESTORE
+
+    built = []
+
+    def factory():
+        built.append(FakePriceStore())
+        return built[-1]
+
+    data_dir = tmp_path / "tdp_data"
+    data_dir.mkdir()
+    monkeypatch.setenv("TDP_SRC_DIR", "")
+    monkeypatch.setenv("TDP_DATA_DIR", str(data_dir))
+    PRICESTORE.clear()
+    monkeypatch.setattr(PRICESTORE, "factory", factory)
+    yield built
+    PRICESTORE.clear()
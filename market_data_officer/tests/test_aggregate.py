@@ -0,0 +1,155 @@
+"""Tests for the tick-to-1m aggregation layer."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_data_officer.feed.aggregate import tick_arrays_to_1m_ohlcv, ticks_to_1m_ohlcv
+from market_data_officer.feed.decode import TickArrays
+from market_data_officer.tests.conftest import best_of
+
+
+def _reference_aggregate(tick_df: pd.DataFrame) -> pd.DataFrame:
+    """The previous two-pass resample implementation, kept as the parity oracle."""
+    if tick_df.empty:
+        return pd.DataFrame()
+    ohlcv = tick_df["mid"].resample("1min").agg(
+        open="first", high="max", low="min", close="last",
+    )
+    ohlcv["volume"] = tick_df["volume"].resample("1min").sum()
+    return ohlcv.dropna(subset=["open"])
+
+
+def _hour_arrays(hour_start: datetime, n_ticks: int, seed: int, quiet_minutes=()) -> TickArrays:
+    """Sorted synthetic ticks for one hour, leaving ``quiet_minutes`` empty."""
+    rng = np.random.default_rng(seed)
+    offset_ms = np.sort(rng.integers(0, 3_600_000, n_ticks))
+    if quiet_minutes:
+        offset_ms = offset_ms[~np.isin(offset_ms // 60_000, quiet_minutes)]
+    n = len(offset_ms)
+    start_ns = int(pd.Timestamp(hour_start).value)
+    return TickArrays(
+        timestamp_ns=start_ns + offset_ms.astype(np.int64) * 1_000_000,
+        mid=2694.1 + np.cumsum(rng.normal(0.0, 0.05, n)),
+        volume=rng.uniform(0.0001, 5.0, n),
+    )
+
+
+def _assert_matches_reference(bars: pd.DataFrame, tick_df: pd.DataFrame) -> None:
+    expected = _reference_aggregate(tick_df)
+    pd.testing.assert_frame_equal(
+        bars[["open", "high", "low", "close"]],
+        expected[["open", "high", "low", "close"]],
+        check_freq=False,
+    )
+    # pandas sums with compensated arithmetic, reduceat does not
+    np.testing.assert_allclose(bars["volume"], expected["volume"], rtol=1e-12)
+
+
+class TestSinglePassParity:
+    """The reduceat aggregator must reproduce the resample path."""
+
+    def setup_method(self):
+        self.hour_start = datetime(2025, 1, 15, 14, 0, 0, tzinfo=timezone.utc)
+
+    @pytest.mark.parametrize("n_ticks,seed", [(1, 1), (50, 2), (5_000, 3), (28_906, 4)])
+    def test_hour_matches_reference(self, n_ticks, seed):
+        arrays = _hour_arrays(self.hour_start, n_ticks, seed)
+        tick_df = arrays.to_frame()
+        _assert_matches_reference(ticks_to_1m_ohlcv(tick_df), tick_df)
+
+    def test_only_occupied_minutes_emitted(self):
+        arrays = _hour_arrays(self.hour_start, 2_000, seed=5, quiet_minutes=(0, 17, 18, 59))
+        bars = tick_arrays_to_1m_ohlcv(arrays)
+
+        minutes = set(bars.index.minute)
+        assert minutes.isdisjoint({0, 17, 18, 59})
+        assert len(bars) == 56
+        _assert_matches_reference(bars, arrays.to_frame())
+
+    def test_frame_shape(self):
+        bars = tick_arrays_to_1m_ohlcv(_hour_arrays(self.hour_start, 500, seed=6))
+        assert list(bars.columns) == ["open", "high", "low", "close", "volume"]
+        assert bars.index.name == "timestamp_utc"
+        assert str(bars.index.tz) == "UTC"
+        assert bars.index.is_monotonic_increasing
+        assert (bars["high"] >= bars[["open", "close"]].max(axis=1)).all()
+        assert (bars["low"] <= bars[["open", "close"]].min(axis=1)).all()
+
+    def test_duplicate_timestamps_keep_first_and_last(self):
+        ts = int(pd.Timestamp(self.hour_start).value)
+        arrays = TickArrays(
+            timestamp_ns=np.array([ts, ts, ts + 1_000_000], dtype=np.int64),
+            mid=np.array([1.0, 3.0, 2.0]),
+            volume=np.array([1.0, 1.0, 1.0]),
+        )
+        bars = tick_arrays_to_1m_ohlcv(arrays)
+        assert bars.iloc[0].tolist() == [1.0, 3.0, 1.0, 2.0, 3.0]
+
+    def test_unsorted_input_is_sorted_first(self):
+        arrays = _hour_arrays(self.hour_start, 1_000, seed=8)
+        order = np.random.default_rng(0).permutation(len(arrays))
+        shuffled = TickArrays(
+            timestamp_ns=arrays.timestamp_ns[order],
+            mid=arrays.mid[order],
+            volume=arrays.volume[order],
+        )
+        pd.testing.assert_frame_equal(
+            tick_arrays_to_1m_ohlcv(shuffled), tick_arrays_to_1m_ohlcv(arrays),
+            check_exact=False, rtol=1e-12,
+        )
+
+    def test_empty_input(self):
+        assert ticks_to_1m_ohlcv(pd.DataFrame()).empty
+        empty = TickArrays(
+            timestamp_ns=np.empty(0, dtype=np.int64),
+            mid=np.empty(0), volume=np.empty(0),
+        )
+        assert tick_arrays_to_1m_ohlcv(empty).empty
+        assert tick_arrays_to_1m_ohlcv([]).empty
+
+    def test_frame_input_keeps_index_name_and_tz(self):
+        tick_df = _hour_arrays(self.hour_start, 300, seed=9).to_frame()
+        tick_df.index = tick_df.index.tz_convert("Europe/London").rename("ts")
+        bars = ticks_to_1m_ohlcv(tick_df)
+        assert bars.index.name == "ts"
+        assert str(bars.index.tz) == "Europe/London"
+        _assert_matches_reference(bars, tick_df)
+
+
+class TestWholeDayAggregation:
+    """A day of hourly TickArrays aggregates in one call."""
+
+    def test_day_matches_per_hour_concat(self):
+        day = datetime(2025, 1, 15, tzinfo=timezone.utc)
+        hours = [
+            _hour_arrays(day + timedelta(hours=h), 3_000, seed=h)
+            for h in range(24) if h not in (5, 6)  # two missing hours
+        ]
+        day_bars = tick_arrays_to_1m_ohlcv(hours)
+        per_hour = pd.concat([tick_arrays_to_1m_ohlcv(h) for h in hours])
+
+        pd.testing.assert_frame_equal(day_bars, per_hour)
+        assert len(day_bars) == 22 * 60
+        assert not ((day_bars.index.hour == 5) | (day_bars.index.hour == 6)).any()
+
+
+@pytest.mark.speedup
+class TestSinglePassBenchmark:
+    """Microbenchmark on one trading day of XAUUSD-sized hours (~29k ticks each)."""
+
+    def test_single_pass_faster_than_resample(self):
+        day = datetime(2025, 1, 15, tzinfo=timezone.utc)
+        hours = [_hour_arrays(day + timedelta(hours=h), 28_906, seed=h) for h in range(24)]
+        frames = [h.to_frame() for h in hours]
+
+        reference_s = best_of(lambda: [_reference_aggregate(f) for f in frames])
+        per_hour_s = best_of(lambda: [ticks_to_1m_ohlcv(f) for f in frames])
+        whole_day_s = best_of(lambda: tick_arrays_to_1m_ohlcv(hours))
+        print(f"\n[bench] aggregate 24h x 28906 ticks: resample={reference_s * 1e3:.1f}ms "
+              f"single-pass={per_hour_s * 1e3:.1f}ms whole-day={whole_day_s * 1e3:.1f}ms")
+
+        assert per_hour_s * 2 < reference_s
+        assert whole_day_s * 2 < reference_s
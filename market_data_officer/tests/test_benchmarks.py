@@ -0,0 +1,129 @@
+"""Tests for the offline structure benchmark harness."""
+
+import json
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_data_officer import run_benchmarks as cli
+from market_data_officer.benchmarks.structure_bench import (
+    BENCH_FORMAT,
+    FUNCTIONS,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    write_results,
+)
+from market_data_officer.benchmarks.synthetic import SCENARIOS
+from market_data_officer.feed.validate import validate_ohlcv
+
+
+def _results(seconds: dict) -> dict:
+    return {
+        "format": BENCH_FORMAT,
+        "results": [{"scenario": "trending", "bars": 1000, "function": fn, "seconds": s}
+                    for fn, s in seconds.items()],
+    }
+
+
+class TestSynthetic:
+
+    @pytest.mark.parametrize("name", list(SCENARIOS))
+    def test_valid_and_deterministic(self, name):
+        bars = SCENARIOS[name](5000, seed=3)
+        validate_ohlcv(bars, name)
+        assert len(bars) == 5000
+        assert str(bars.index.tz) == "UTC" and bars.index.name == "timestamp_utc"
+        assert (bars[["open", "high", "low", "close"]] > 0).all().all()
+        pd.testing.assert_frame_equal(bars, SCENARIOS[name](5000, seed=3))
+        assert not bars.equals(SCENARIOS[name](5000, seed=4))
+
+    def test_scenario_shapes(self):
+        step = pd.Timedelta("15min")
+        assert (np.diff(SCENARIOS["trending"](3000).index) == step).all()
+
+        ranging = SCENARIOS["ranging"](50_000)
+        assert ranging["close"].max() - ranging["close"].min() < 0.05
+
+        gaps = np.diff(SCENARIOS["gappy"](5000).index)
+        assert (gaps > step).sum() > 20
+
+        weekend = SCENARIOS["weekend"](5000)
+        assert not (weekend.index.dayofweek == 5).any()
+        weekend_gaps = np.diff(weekend.index) > step
+        assert weekend_gaps.sum() == len(weekend) // 480
+        assert (weekend.index[1:][weekend_gaps].dayofweek == 6).all()
+
+
+class TestRun:
+
+    def test_results_cover_every_function(self, tmp_path):
+        results = run_benchmarks(scenarios=["gappy", "weekend"], sizes=[400], repeat=1, progress=None)
+        assert results["format"] == BENCH_FORMAT
+        assert [(r["scenario"], r["function"]) for r in results["results"]] == [
+            (s, fn) for s in ("gappy", "weekend") for fn in FUNCTIONS
+        ]
+        assert all(r["seconds"] > 0 and r["bars"] == 400 for r in results["results"])
+
+        path = tmp_path / "out" / "bench.json"
+        write_results(results, path)
+        assert load_results(path) == json.loads(json.dumps(results))
+
+    def test_unknown_names_rejected(self):
+        with pytest.raises(ValueError):
+            run_benchmarks(scenarios=["sideways"], sizes=[100], progress=None)
+        with pytest.raises(ValueError):
+            run_benchmarks(functions=["detect_orderblocks"], sizes=[100], progress=None)
+
+    def test_load_rejects_other_files(self, tmp_path):
+        path = tmp_path / "other.json"
+        path.write_text(json.dumps({"results": []}))
+        with pytest.raises(ValueError):
+            load_results(path)
+
+
+class TestCompare:
+
+    def test_flags_slowdown_beyond_threshold(self):
+        baseline = _results({"detect_swings": 0.010, "detect_events": 0.020, "compute_regime": 0.0001})
+        current = _results({"detect_swings": 0.0124, "detect_events": 0.030, "compute_regime": 0.0009})
+
+        regressions = compare_results(current, baseline, threshold=0.25)
+        assert [r.function for r in regressions] == ["detect_events"]
+        assert regressions[0].ratio == pytest.approx(1.5)
+        # compute_regime is 9x slower, but by less than the noise floor
+        assert compare_results(current, baseline, threshold=0.1)[0].function == "detect_swings"
+
+    def test_entries_missing_from_baseline_ignored(self):
+        baseline = _results({"detect_swings": 0.010})
+        current = _results({"detect_swings": 0.010, "detect_events": 10.0})
+        assert compare_results(current, baseline) == []
+
+
+class TestCli:
+
+    def _run(self, monkeypatch, *args):
+        monkeypatch.setattr(sys, "argv", ["run_benchmarks.py", "--scenarios", "trending", "--sizes", "300",
+                                          "--functions", "compute_structure_packet", "--repeat", "1", *args])
+        cli.main()
+
+    def test_gate_passes_against_itself_and_fails_on_regression(self, tmp_path, monkeypatch):
+        baseline = tmp_path / "baseline.json"
+        self._run(monkeypatch, "--output", str(baseline))
+        self._run(monkeypatch, "--output", str(tmp_path / "run.json"),
+                  "--baseline", str(baseline), "--threshold", "10")
+
+        fast = load_results(baseline)
+        for r in fast["results"]:
+            r["seconds"] /= 1000
+        write_results(fast, baseline)
+        with pytest.raises(SystemExit) as exc:
+            self._run(monkeypatch, "--output", str(tmp_path / "run.json"), "--baseline", str(baseline))
+        assert exc.value.code == 1
+
+    def test_missing_baseline(self, tmp_path, monkeypatch):
+        with pytest.raises(SystemExit) as exc:
+            self._run(monkeypatch, "--baseline", str(tmp_path / "none.json"))
+        assert exc.value.code == 2
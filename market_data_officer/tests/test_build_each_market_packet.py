@@ -0,0 +1,95 @@
+"""Tests for building the market packets of several instruments."""
+
+import json
+
+import pandas as pd
+import pytest
+
+from market_data_officer.benchmarks.synthetic import SCENARIOS
+from market_data_officer.feed import hot_cache
+from market_data_officer.feed.export import export_hot_packages
+from market_data_officer.feed.hot_cache import HOT_PACKAGE_CACHE
+from market_data_officer.officer.service import build_market_packet, build_each_market_packet
+from market_data_officer.structure.config import StructureConfig
+from market_data_officer.structure.engine import run_engine
+
+INSTRUMENTS = ["EURUSD", "GBPUSD", "XAUUSD", "XAGUSD"]
+
+
+def _packet_json(packet) -> str:
+    d = packet.to_dict()
+    d.pop("as_of_utc")
+    return json.dumps(d)
+
+
+def _timeframes(bars: pd.DataFrame) -> dict:
+    ohlc = {"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"}
+    return {
+        "15m": bars,
+        "1h": bars.resample("1h").agg(ohlc).dropna(),
+        "4h": bars.resample("4h").agg(ohlc).dropna(),
+        "1d": bars.resample("1D").agg(ohlc).dropna(),
+    }
+
+
+@pytest.fixture(scope="module")
+def dirs(tmp_path_factory):
+    """Hot packages for four instruments plus structure outputs for them."""
+    root = tmp_path_factory.mktemp("watchlist")
+    packages, structure = root / "packages", root / "structure"
+    for i, (instrument, scenario) in enumerate(zip(INSTRUMENTS, ["trending", "gappy", "weekend", "ranging"])):
+        export_hot_packages(_timeframes(SCENARIOS[scenario](4000, seed=i)), instrument, output_dir=packages)
+    run_engine(INSTRUMENTS, StructureConfig(timeframes=["15m", "1h", "4h"]), packages_dir=packages,
+               output_dir=structure)
+    return packages, structure
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    HOT_PACKAGE_CACHE.clear()
+    yield
+    HOT_PACKAGE_CACHE.clear()
+
+
+class TestBuildEachMarketPacket:
+
+    @pytest.mark.parametrize("row_layout", ["rows", "columnar"])
+    def test_match_single_builds(self, dirs, row_layout):
+        packages, structure = dirs
+        results = build_each_market_packet(INSTRUMENTS, packages_dir=packages, structure_output_dir=structure,
+                                           row_layout=row_layout)
+        assert list(results) == INSTRUMENTS
+        for instrument, result in results.items():
+            assert result.status == "ok" and result.error is None and result.wall_s > 0
+            assert result.packet.structure.available
+            expected = build_market_packet(instrument, packages_dir=packages, structure_output_dir=structure,
+                                           row_layout=row_layout)
+            assert _packet_json(result.packet) == _packet_json(expected), instrument
+
+    def test_each_file_parsed_once(self, dirs, monkeypatch):
+        packages, structure = dirs
+        parsed = []
+        real = hot_cache.read_hot_frame
+
+        def counting(csv_path, binary_path):
+            frame = real(csv_path, binary_path)
+            parsed.append(csv_path.name)
+            return frame
+
+        monkeypatch.setattr(hot_cache, "read_hot_frame", counting)
+        build_each_market_packet(INSTRUMENTS, packages_dir=packages, structure_output_dir=structure)
+        assert sorted(parsed) == sorted(p.name for p in packages.glob("*_latest.csv"))
+
+    def test_failures_are_isolated(self, dirs):
+        packages, structure = dirs
+        # A trusted instrument without a manifest fails; an unknown one gets the no-data packet
+        results = build_each_market_packet(["EURUSD", "XPTUSD", "ZZZUSD", "EURUSD"], packages_dir=packages,
+                                           structure_output_dir=structure)
+        assert list(results) == ["EURUSD", "XPTUSD", "ZZZUSD"]
+        assert results["EURUSD"].status == "ok"
+        assert results["XPTUSD"].status == "failed" and results["XPTUSD"].packet is None
+        assert "FileNotFoundError" in results["XPTUSD"].error
+        assert results["ZZZUSD"].status == "ok"
+        assert results["ZZZUSD"].packet.quality.flags == ["instrument_not_verified", "no_data_available"]
+        with pytest.raises(ValueError):
+            build_each_market_packet(["EURUSD"], packages_dir=packages, row_layout="arrays")
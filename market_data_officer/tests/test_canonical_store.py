@@ -0,0 +1,182 @@
+"""Tests for the partitioned canonical store."""
+
+import json
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_data_officer.feed.canonical_store import (
+    META_FILENAME,
+    CanonicalStore,
+    read_canonical,
+)
+
+
+def _make_canonical(start: str, periods: int, base_price: float = 1.09) -> pd.DataFrame:
+    """Synthetic canonical 1m frame with the pipeline's metadata columns."""
+    idx = pd.date_range(start, periods=periods, freq="1min", tz="UTC", name="timestamp_utc")
+    close = base_price + np.cumsum(np.full(periods, 0.00001))
+    df = pd.DataFrame(
+        {
+            "open": close - 0.00002,
+            "high": close + 0.0005,
+            "low": close - 0.0005,
+            "close": close,
+            "volume": np.arange(periods, dtype=float) + 100.0,
+        },
+        index=idx,
+    )
+    df["vendor"] = "dukascopy"
+    df["build_method"] = "tick_to_1m"
+    df["quality_flag"] = "ok"
+    return df
+
+
+def _mtimes(store: CanonicalStore) -> dict:
+    return {
+        p.relative_to(store.dir).as_posix(): p.stat().st_mtime_ns
+        for p in store.dir.rglob("*.parquet")
+    }
+
+
+class TestPartitionedLayout:
+
+    def test_month_partitions_and_watermark(self, tmp_path):
+        df = _make_canonical("2025-01-31 23:00", 60 * 24 * 3)  # spans Jan/Feb
+        store = CanonicalStore("EURUSD", root=tmp_path)
+        assert store.write(df) == ["2025/01", "2025/02"]
+
+        assert (tmp_path / "EURUSD" / "2025" / "01.parquet").exists()
+        assert (tmp_path / "EURUSD" / "2025" / "02.parquet").exists()
+        assert store.watermark() == df.index[-1]
+
+        meta = json.loads((tmp_path / "EURUSD" / META_FILENAME).read_text())
+        assert meta["rows"] == len(df)
+        assert meta["partition"] == "month"
+        assert meta["partitions"]["2025/01"]["rows"] == 60
+
+    def test_day_partitions(self, tmp_path):
+        df = _make_canonical("2025-01-13 12:00", 60 * 36)
+        store = CanonicalStore("EURUSD", root=tmp_path, partition="day")
+        assert store.write(df) == ["2025/01/13", "2025/01/14"]
+        assert (tmp_path / "EURUSD" / "2025" / "01" / "14.parquet").exists()
+
+    def test_existing_store_keeps_its_scheme(self, tmp_path):
+        CanonicalStore("EURUSD", root=tmp_path, partition="day").write(
+            _make_canonical("2025-01-13 00:00", 10))
+        assert CanonicalStore("EURUSD", root=tmp_path, partition="month").partition == "day"
+
+    def test_unknown_scheme_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown partition scheme"):
+            CanonicalStore("EURUSD", root=tmp_path, partition="week")
+
+    def test_read_returns_same_frame(self, tmp_path):
+        df = _make_canonical("2025-01-30 00:00", 60 * 24 * 4)
+        store = CanonicalStore("EURUSD", root=tmp_path)
+        store.write(df)
+        pd.testing.assert_frame_equal(store.read(), df, check_freq=False)
+        pd.testing.assert_frame_equal(read_canonical("EURUSD", root=tmp_path), df, check_freq=False)
+
+    def test_read_since_returns_whole_partitions(self, tmp_path):
+        df = _make_canonical("2025-01-30 00:00", 60 * 24 * 4)  # Jan 30 → Feb 2
+        store = CanonicalStore("EURUSD", root=tmp_path)
+        store.write(df)
+
+        tail = store.read(since=pd.Timestamp("2025-02-01 12:00", tz="UTC"))
+        assert tail.index[0] == pd.Timestamp("2025-02-01 00:00", tz="UTC")
+        assert tail.index[-1] == df.index[-1]
+
+    def test_missing_store_reads_none(self, tmp_path):
+        assert CanonicalStore("EURUSD", root=tmp_path).read() is None
+        assert CanonicalStore("EURUSD", root=tmp_path).watermark() is None
+
+
+class TestAppendOnlyWrites:
+
+    def test_append_rewrites_only_changed_partition(self, tmp_path):
+        df = _make_canonical("2025-01-30 00:00", 60 * 24 * 4)
+        store = CanonicalStore("EURUSD", root=tmp_path)
+        store.write(df)
+        before = _mtimes(store)
+
+        extra = _make_canonical(str(df.index[-1] + pd.Timedelta(minutes=1)), 120)
+        tail = store.read(since=store.watermark())
+        assert store.write(pd.concat([tail, extra])) == ["2025/02"]
+
+        after = _mtimes(store)
+        assert after["2025/01.parquet"] == before["2025/01.parquet"]
+        assert after["2025/02.parquet"] != before["2025/02.parquet"]
+        assert store.watermark() == extra.index[-1]
+        assert len(store.read()) == len(df) + 120
+
+    def test_unchanged_write_touches_nothing(self, tmp_path):
+        df = _make_canonical("2025-01-30 00:00", 60 * 24 * 4)
+        store = CanonicalStore("EURUSD", root=tmp_path)
+        store.write(df)
+        assert store.write(df) == []
+
+    def test_shrinking_partition_rejected(self, tmp_path):
+        df = _make_canonical("2025-01-13 00:00", 120)
+        store = CanonicalStore("EURUSD", root=tmp_path)
+        store.write(df)
+        with pytest.raises(ValueError, match="append-only"):
+            store.write(df.iloc[:60])
+
+    def test_invalid_partition_not_written(self, tmp_path):
+        df = _make_canonical("2025-01-13 00:00", 120)
+        df.iloc[5, df.columns.get_loc("high")] = 0.0
+        store = CanonicalStore("EURUSD", root=tmp_path)
+        with pytest.raises(ValueError, match="invalid high"):
+            store.write(df)
+        assert not store.exists()
+
+    def test_metadata_is_commit_point(self, tmp_path):
+        """Rows in a partition file beyond the watermark are not visible."""
+        df = _make_canonical("2025-01-13 00:00", 120)
+        store = CanonicalStore("EURUSD", root=tmp_path)
+        store.write(df.iloc[:60])
+
+        # Simulate a crash after the partition swap but before the meta write
+        df.to_parquet(store.partition_path("2025/01"), compression="zstd")
+        assert len(store.read()) == 60
+        assert store.watermark() == df.index[59]
+
+
+class TestLegacyMigration:
+
+    def test_legacy_file_readable_before_migration(self, tmp_path):
+        df = _make_canonical("2025-01-13 00:00", 300)
+        df.to_parquet(tmp_path / "EURUSD_1m.parquet", compression="zstd")
+        pd.testing.assert_frame_equal(read_canonical("EURUSD", root=tmp_path), df, check_freq=False)
+
+    def test_migration_round_trip(self, tmp_path):
+        df = _make_canonical("2025-01-31 22:00", 300)
+        legacy = tmp_path / "EURUSD_1m.parquet"
+        df.to_parquet(legacy, compression="zstd")
+
+        store = CanonicalStore("EURUSD", root=tmp_path)
+        assert store.migrate_legacy() == 300
+        assert not legacy.exists()
+        assert (tmp_path / "EURUSD_1m.parquet.migrated").exists()
+        pd.testing.assert_frame_equal(store.read(), df, check_freq=False)
+        assert store.watermark() == df.index[-1]
+
+    def test_pipeline_loader_migrates_on_first_use(self, tmp_path):
+        from market_data_officer.feed.pipeline import _load_existing_canonical, _save_canonical
+
+        df = _make_canonical("2025-01-31 22:00", 300)
+        df.to_parquet(tmp_path / "EURUSD_1m.parquet", compression="zstd")
+
+        with patch("market_data_officer.feed.canonical_store.CANONICAL_DIR", tmp_path):
+            loaded = _load_existing_canonical("EURUSD")
+            pd.testing.assert_frame_equal(loaded, df, check_freq=False)
+            assert CanonicalStore("EURUSD").exists()
+
+            extra = _make_canonical("2025-02-01 03:00", 60)
+            _save_canonical(pd.concat([loaded, extra]), "EURUSD")
+            tail = _load_existing_canonical("EURUSD", since=pd.Timestamp("2025-02-01", tz="UTC"))
+
+        assert tail.index[0] == pd.Timestamp("2025-02-01 00:00", tz="UTC")
+        assert tail.index[-1] == extra.index[-1]
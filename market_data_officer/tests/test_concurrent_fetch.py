@@ -0,0 +1,233 @@
+"""Tests for concurrent hour fetching in run_pipeline.
+
+All network traffic goes to a local HTTP stand-in that serves synthetic
+bi5 archives at Dukascopy-shaped URLs — no live provider dependency.
+"""
+
+import lzma
+import struct
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import urlsplit
+
+import pandas as pd
+import pytest
+
+from market_data_officer.feed.fetch import HostRateLimiter, build_bi5_url, fetch_bi5
+from market_data_officer.feed.pipeline import _iter_hour_fetches, run_pipeline
+
+
+DAY = datetime(2025, 1, 15, tzinfo=timezone.utc)
+EMPTY_HOURS = {3, 17}  # served as 404 → exercises the fallback gate
+
+
+def _hour_payload(hour: int) -> bytes:
+    """Build a small deterministic bi5 archive for one hour."""
+    raw = b""
+    for i in range(120):
+        ask = 109_000 + hour * 10 + (i % 7)
+        raw += struct.pack(">IIIff", i * 30_000, ask, ask - 20, 1.0, 0.5)
+    return lzma.compress(raw)
+
+
+class _Bi5StandIn:
+    """Threaded local HTTP server serving fixture bi5 files by URL path."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.files = {}
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.request_times = []
+        self._lock = threading.Lock()
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with stand_in._lock:
+                    stand_in.in_flight += 1
+                    stand_in.max_in_flight = max(stand_in.max_in_flight, stand_in.in_flight)
+                    stand_in.request_times.append(time.monotonic())
+                try:
+                    time.sleep(stand_in.delay)
+                    body = stand_in.files.get(self.path)
+                    if body is None:
+                        self.send_response(404)
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    self.send_response(200)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                finally:
+                    with stand_in._lock:
+                        stand_in.in_flight -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}/datafeed"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stand_in():
+    with _Bi5StandIn(delay=0.02) as server:
+        with patch("market_data_officer.feed.fetch.DUKASCOPY_BASE_URL", server.base_url):
+            for hour in range(24):
+                if hour in EMPTY_HOURS:
+                    continue
+                url = build_bi5_url("EURUSD", DAY + timedelta(hours=hour))
+                server.files[urlsplit(url).path] = _hour_payload(hour)
+            yield server
+
+
+def _run(workers: int, diagnostics: bool = False, existing=None):
+    """Run the pipeline for DAY and capture the canonical frame and fallbacks."""
+    saved = []
+    fallback_hours = []
+
+    def fake_fallback(symbol, hour):
+        fallback_hours.append(hour)
+        return pd.DataFrame()
+
+    with patch("market_data_officer.feed.pipeline._load_existing_canonical", return_value=existing), \
+         patch("market_data_officer.feed.pipeline._save_canonical",
+               side_effect=lambda df, sym: saved.append(df.copy())), \
+         patch("market_data_officer.feed.pipeline._rebuild_derived_and_export"), \
+         patch("market_data_officer.feed.pipeline.fetch_1m_ohlcv_yfinance",
+               side_effect=fake_fallback), \
+         patch("market_data_officer.feed.diagnostics.DiagnosticsCollector.save_report"), \
+         patch("market_data_officer.feed.pipeline.verify_decode_assumptions",
+               return_value={}):
+        run_pipeline("EURUSD", DAY, DAY, diagnostics=diagnostics, fetch_workers=workers)
+
+    return (saved[0] if saved else None), fallback_hours
+
+
+class TestConcurrentPipeline:
+    """Concurrent mode must produce exactly what the serial mode produces."""
+
+    def test_concurrent_matches_serial(self, stand_in):
+        serial, serial_fb = _run(workers=1)
+        concurrent, concurrent_fb = _run(workers=6)
+
+        assert serial is not None and len(serial) == 22 * 60
+        pd.testing.assert_frame_equal(serial, concurrent)
+        assert serial_fb == concurrent_fb
+        assert sorted(h.hour for h in concurrent_fb) == sorted(EMPTY_HOURS)
+
+    def test_concurrent_requests_overlap(self, stand_in):
+        _run(workers=6)
+        assert stand_in.max_in_flight > 1
+        assert stand_in.max_in_flight <= 6
+
+    def test_serial_mode_never_overlaps(self, stand_in):
+        _run(workers=1)
+        assert stand_in.max_in_flight == 1
+
+    def test_diagnostics_match_serial(self, stand_in):
+        from market_data_officer.feed.diagnostics import DiagnosticsCollector
+
+        reports = []
+        original_build = DiagnosticsCollector.build_report
+
+        def capture(self):
+            report = original_build(self)
+            reports.append(report)
+            return report
+
+        with patch.object(DiagnosticsCollector, "build_report", capture):
+            _run(workers=1, diagnostics=True)
+            _run(workers=6, diagnostics=True)
+
+        def strip(report):
+            hours = []
+            for h in report["hours"]:
+                fetch = {k: v for k, v in h["fetch"].items() if k != "fetch_utc"}
+                hours.append({**h, "fetch": fetch})
+            return report["summary"], hours
+
+        assert strip(reports[0]) == strip(reports[1])
+        assert reports[1]["summary"]["fetched"] == 24
+        assert reports[1]["summary"]["hours_with_ticks"] == 22
+
+    def test_incremental_skip_unchanged(self, stand_in):
+        idx = pd.date_range(DAY, periods=12 * 60, freq="1min", tz="UTC")
+        existing = pd.DataFrame(
+            {"open": 1.09, "high": 1.091, "low": 1.089, "close": 1.09, "volume": 1.0,
+             "vendor": "dukascopy", "build_method": "tick_to_1m", "quality_flag": "ok"},
+            index=idx,
+        )
+        _run(workers=6, existing=existing)
+        assert len(stand_in.request_times) == 12
+
+
+class TestIterHourFetches:
+    """Ordered reassembly of out-of-order completions."""
+
+    def test_results_yielded_in_hour_order(self):
+        hours = [DAY + timedelta(hours=h) for h in range(12)]
+
+        def slow_first(symbol, hour, **kwargs):
+            # Earlier hours take longer, so completions arrive reversed.
+            time.sleep(0.005 * (12 - hour.hour))
+            return hour.hour
+
+        results = [(hour, fetched()) for hour, fetched in
+                   _iter_hour_fetches(slow_first, "EURUSD", hours, workers=4)]
+        assert [h for h, _ in results] == hours
+        assert [r for _, r in results] == list(range(12))
+
+    def test_exceptions_surface_at_their_hour(self):
+        import requests
+
+        hours = [DAY + timedelta(hours=h) for h in range(3)]
+
+        def flaky(symbol, hour, **kwargs):
+            if hour.hour == 1:
+                raise requests.ConnectionError("reset")
+            return hour.hour
+
+        outcomes = []
+        for hour, fetched in _iter_hour_fetches(flaky, "EURUSD", hours, workers=3):
+            try:
+                outcomes.append(fetched())
+            except requests.RequestException:
+                outcomes.append("error")
+        assert outcomes == [0, "error", 2]
+
+
+class TestHostRateLimiter:
+    def test_requests_spaced_per_host(self, stand_in):
+        limiter = HostRateLimiter(max_per_second=50)
+        for hour in range(5):
+            fetch_bi5("EURUSD", DAY + timedelta(hours=hour), rate_limiter=limiter)
+        gaps = [b - a for a, b in zip(stand_in.request_times, stand_in.request_times[1:])]
+        assert all(gap >= 0.018 for gap in gaps)
+
+    def test_hosts_are_independent(self):
+        limiter = HostRateLimiter(max_per_second=1)
+        t0 = time.monotonic()
+        limiter.wait("http://a.example/x")
+        limiter.wait("http://b.example/x")
+        assert time.monotonic() - t0 < 0.5
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            HostRateLimiter(max_per_second=0)
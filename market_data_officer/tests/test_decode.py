@@ -1,14 +1,22 @@
 """Tests for the decode layer."""
 
+import dataclasses
 import lzma
 import struct
 from datetime import datetime, timezone
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from market_data_officer.feed.config import INSTRUMENTS
-from market_data_officer.feed.decode import decode_dukascopy_ticks
+from market_data_officer.feed.decode import (
+    TICK_DTYPE,
+    decode_dukascopy_ticks,
+    decode_tick_arrays,
+    decode_with_diagnostics,
+)
+from market_data_officer.tests.conftest import best_of
 
 
 def _make_bi5_payload(ticks: list[tuple]) -> bytes:
@@ -136,3 +144,143 @@ class TestDecodeXAUUSD:
 
         assert len(df) == 4
         assert df["mid"].between(2000.0, 4000.0).all()
+
+
+# ---------------------------------------------------------------------------
+# Vectorized decoder parity and microbenchmark
+# ---------------------------------------------------------------------------
+
+def _reference_decode(raw_bytes: bytes, hour_start: datetime, meta) -> pd.DataFrame:
+    """Per-tick struct.unpack decoder the vectorized path replaced."""
+    from datetime import timedelta
+
+    decompressed = lzma.decompress(raw_bytes)
+    ticks = []
+    for i in range(len(decompressed) // 20):
+        chunk = decompressed[i * 20 : (i + 1) * 20]
+        time_ms, ask_raw, bid_raw, ask_vol, bid_vol = struct.unpack(">IIIff", chunk)
+        ask = ask_raw / meta.price_scale
+        bid = bid_raw / meta.price_scale
+        volume = ask_vol + bid_vol
+        if meta.volume_divisor is not None:
+            volume = volume / meta.volume_divisor
+        ticks.append({
+            "timestamp_utc": hour_start + timedelta(milliseconds=time_ms),
+            "mid": (ask + bid) / 2.0,
+            "volume": volume,
+        })
+    df = pd.DataFrame(ticks)
+    df["timestamp_utc"] = pd.to_datetime(df["timestamp_utc"], utc=True)
+    return df.set_index("timestamp_utc").sort_index()
+
+
+def _recorded_hour_payload(n_ticks: int, base_raw: int, seed: int = 7) -> bytes:
+    """Build a deterministic bi5 hour shaped like a recorded Dukascopy archive.
+
+    Ticks are spread over the hour with repeated millisecond stamps, a
+    random-walk ask, a 1-20 point spread and float32 lot volumes.
+    """
+    rng = np.random.default_rng(seed)
+    time_ms = np.sort(rng.integers(0, 3_600_000, n_ticks)).astype(">u4")
+    ask = (base_raw + np.cumsum(rng.integers(-5, 6, n_ticks))).astype(">u4")
+    bid = (ask - rng.integers(1, 21, n_ticks)).astype(">u4")
+    ask_vol = rng.uniform(0.0001, 5.0, n_ticks).astype(">f4")
+    bid_vol = rng.uniform(0.0001, 5.0, n_ticks).astype(">f4")
+
+    buf = np.empty(n_ticks, dtype=TICK_DTYPE)
+    buf["time_ms"], buf["ask_raw"], buf["bid_raw"] = time_ms, ask, bid
+    buf["ask_vol"], buf["bid_vol"] = ask_vol, bid_vol
+    return lzma.compress(buf.tobytes())
+
+
+class TestVectorizedDecodeParity:
+    """The NumPy decoder must reproduce the struct.unpack decoder exactly."""
+
+    @pytest.mark.parametrize("symbol,base_raw", [
+        ("EURUSD", 109_000),
+        ("XAUUSD", 2_694_105),
+    ])
+    def test_frame_matches_reference(self, symbol, base_raw):
+        meta = INSTRUMENTS[symbol]
+        hour_start = datetime(2025, 1, 15, 14, 0, 0, tzinfo=timezone.utc)
+        payload = _recorded_hour_payload(5_000, base_raw)
+
+        expected = _reference_decode(payload, hour_start, meta)
+        actual = decode_dukascopy_ticks(payload, hour_start, meta)
+
+        assert list(actual.columns) == ["mid", "volume"]
+        assert actual.index.name == "timestamp_utc"
+        assert (actual.index.as_unit("ns").asi8 == expected.index.as_unit("ns").asi8).all()
+        np.testing.assert_array_equal(actual["mid"].to_numpy(), expected["mid"].to_numpy())
+        np.testing.assert_array_equal(actual["volume"].to_numpy(), expected["volume"].to_numpy())
+
+    def test_volume_divisor_applied(self):
+        meta = dataclasses.replace(INSTRUMENTS["EURUSD"], volume_divisor=1_000_000.0)
+        hour_start = datetime(2025, 1, 15, 14, 0, 0, tzinfo=timezone.utc)
+        payload = _recorded_hour_payload(200, 109_000)
+
+        expected = _reference_decode(payload, hour_start, meta)
+        actual = decode_dukascopy_ticks(payload, hour_start, meta)
+        np.testing.assert_array_equal(actual["volume"].to_numpy(), expected["volume"].to_numpy())
+
+    def test_trailing_partial_struct_ignored(self):
+        meta = INSTRUMENTS["EURUSD"]
+        hour_start = datetime(2025, 1, 15, 14, 0, 0, tzinfo=timezone.utc)
+        raw = struct.pack(">IIIff", 0, 109000, 108980, 1.0, 1.0) + b"\x00" * 7
+        df = decode_dukascopy_ticks(lzma.compress(raw), hour_start, meta)
+        assert len(df) == 1
+
+    def test_out_of_order_ticks_sorted(self):
+        meta = INSTRUMENTS["EURUSD"]
+        hour_start = datetime(2025, 1, 15, 14, 0, 0, tzinfo=timezone.utc)
+        payload = _make_bi5_payload([
+            (2000, 109020, 109000, 1.0, 1.0),
+            (1000, 109010, 108990, 1.0, 1.0),
+        ])
+        df = decode_dukascopy_ticks(payload, hour_start, meta)
+        assert df.index.is_monotonic_increasing
+        assert abs(df["mid"].iloc[0] - 1.0900) < 1e-9
+
+    def test_arrays_are_int64_ns_and_float64(self):
+        meta = INSTRUMENTS["EURUSD"]
+        hour_start = datetime(2025, 1, 15, 14, 0, 0, tzinfo=timezone.utc)
+        arrays = decode_tick_arrays(_make_bi5_payload([(1500, 109000, 108980, 1.0, 1.0)]),
+                                    hour_start, meta)
+        assert arrays.timestamp_ns.dtype == np.int64
+        assert arrays.mid.dtype == np.float64
+        assert arrays.volume.dtype == np.float64
+        assert arrays.timestamp_ns[0] == pd.Timestamp("2025-01-15 14:00:01.500", tz="UTC").value
+
+    def test_diagnostics_stats_match_reference(self):
+        meta = INSTRUMENTS["XAUUSD"]
+        hour_start = datetime(2025, 1, 15, 14, 0, 0, tzinfo=timezone.utc)
+        payload = _recorded_hour_payload(3_000, 2_694_105)
+
+        expected = _reference_decode(payload, hour_start, meta)
+        df, stats = decode_with_diagnostics(payload, hour_start, meta)
+
+        assert stats.error == ""
+        assert stats.tick_count == len(expected) == len(df)
+        assert stats.price_min == float(expected["mid"].min())
+        assert stats.price_max == float(expected["mid"].max())
+        assert stats.volume_total == pytest.approx(float(expected["volume"].sum()), rel=1e-12)
+
+
+@pytest.mark.speedup
+class TestVectorizedDecodeBenchmark:
+    """Microbenchmark on a full XAUUSD-sized hour (~29k ticks)."""
+
+    def test_vectorized_decode_faster_than_reference(self):
+        meta = INSTRUMENTS["XAUUSD"]
+        hour_start = datetime(2025, 1, 15, 14, 0, 0, tzinfo=timezone.utc)
+        payload = _recorded_hour_payload(28_906, 2_694_105)
+
+        reference_s = best_of(lambda: _reference_decode(payload, hour_start, meta))
+        vectorized_s = best_of(lambda: decode_dukascopy_ticks(payload, hour_start, meta))
+        print(f"\n[bench] decode 28906 ticks: reference={reference_s * 1e3:.1f}ms "
+              f"vectorized={vectorized_s * 1e3:.1f}ms "
+              f"speedup={reference_s / vectorized_s:.1f}x")
+
+        # LZMA decompression is shared by both paths, so the ratio is a
+        # conservative floor rather than the raw struct-loop speedup.
+        assert vectorized_s * 2 < reference_s
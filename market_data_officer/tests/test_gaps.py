@@ -1,11 +1,18 @@
 """Tests for the gap detection and reporting layer."""
 
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from market_data_officer.feed.gaps import detect_gaps, generate_gap_report, is_fx_trading_hour
+from market_data_officer.feed.gaps import (
+    detect_gaps,
+    generate_gap_report,
+    is_fx_trading_hour,
+    update_gap_report,
+)
 
 
 def _make_1m_ohlcv(
@@ -172,3 +179,115 @@ class TestGenerateGapReport:
         # generated_utc may differ by a few ms, compare everything else
         assert r1["summary"] == r2["summary"]
         assert r1["trading_hour_gaps"] == r2["trading_hour_gaps"]
+
+
+def _reference_detect_gaps(canonical_df: pd.DataFrame) -> list:
+    """Minute-by-minute implementation the vectorized detector replaced."""
+    expected = pd.date_range(canonical_df.index[0], canonical_df.index[-1], freq="1min", tz="UTC")
+    missing = sorted(set(expected) - set(canonical_df.index))
+    runs, run = [], []
+    for ts in missing:
+        if run and ts - run[-1] > timedelta(minutes=1):
+            runs.append(run)
+            run = []
+        run.append(ts)
+    if run:
+        runs.append(run)
+    return [
+        {
+            "gap_start": r[0].isoformat(),
+            "gap_end": r[-1].isoformat(),
+            "missing_minutes": len(r),
+            "classification": "trading_hours" if any(is_fx_trading_hour(t) for t in r) else "weekend",
+        }
+        for r in runs
+    ]
+
+
+def _gappy_weeks(seed: int, weeks: int = 3) -> pd.DataFrame:
+    """Weeks of 1m bars with closed weekends and random holes, some at the edges of the session."""
+    rng = np.random.default_rng(seed)
+    df = _make_1m_ohlcv("2025-01-12 20:00", 60 * 24 * 7 * weeks)
+    df = df[[is_fx_trading_hour(ts) for ts in df.index] | (rng.random(len(df)) < 0.01)]
+    holes = rng.choice(len(df), size=60, replace=False)
+    keep = np.ones(len(df), dtype=bool)
+    for h in holes:
+        keep[h:h + rng.integers(1, 90)] = False
+    keep[0] = keep[-1] = True
+    return df[keep]
+
+
+class TestVectorizedDetection:
+    """The np.diff detector must reproduce the minute-by-minute records."""
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_matches_reference(self, seed):
+        df = _gappy_weeks(seed)
+        assert detect_gaps(df, "EURUSD") == _reference_detect_gaps(df)
+
+    def test_metals_use_their_session_policy(self):
+        df = _gappy_weeks(3)
+        assert detect_gaps(df, "XAUUSD") == _reference_detect_gaps(df)
+
+    def test_explicit_range_reports_edge_gaps(self):
+        df = _make_1m_ohlcv("2025-01-13 10:00", 60)
+        gaps = detect_gaps(
+            df, "EURUSD",
+            start=datetime(2025, 1, 13, 9, 50, tzinfo=timezone.utc),
+            end=datetime(2025, 1, 13, 11, 4, tzinfo=timezone.utc),
+        )
+        assert [(g["gap_start"], g["missing_minutes"]) for g in gaps] == [
+            ("2025-01-13T09:50:00+00:00", 10),
+            ("2025-01-13T11:00:00+00:00", 5),
+        ]
+
+    def test_gap_touching_session_open_is_trading_hours(self):
+        # Sunday 21:00 → 22:30, with 21:30–22:00 missing: the last missing minute is 21:59 (closed)
+        df = _make_1m_ohlcv("2025-01-12 21:00", 90, drop_indices=list(range(30, 60)))
+        assert detect_gaps(df, "EURUSD")[0]["classification"] == "weekend"
+        # ...and 21:30–22:00 inclusive reaches the open
+        df = _make_1m_ohlcv("2025-01-12 21:00", 90, drop_indices=list(range(30, 61)))
+        assert detect_gaps(df, "EURUSD")[0]["classification"] == "trading_hours"
+
+    @pytest.mark.speedup
+    def test_benchmark_year_of_bars(self):
+        df = _gappy_weeks(4, weeks=52)
+        t0 = time.perf_counter()
+        gaps = detect_gaps(df, "EURUSD")
+        elapsed = time.perf_counter() - t0
+        print(f"\n[bench] detect_gaps {len(df)} bars, {len(gaps)} gaps: {elapsed * 1000:.1f}ms")
+        assert elapsed < 1.0
+
+
+class TestUpdateGapReport:
+    """Extending a saved report over new bars must equal a full regeneration."""
+
+    @staticmethod
+    def _without_timestamp(report: dict) -> dict:
+        return {k: v for k, v in report.items() if k != "generated_utc"}
+
+    @pytest.mark.parametrize("cut", [2000, 9000, 15000])
+    def test_append_matches_full_report(self, cut):
+        df = _gappy_weeks(5)
+        history, window = df.iloc[:cut], df.iloc[cut - 500:]
+        updated = update_gap_report(generate_gap_report("EURUSD", history), window, df.index[cut])
+        assert self._without_timestamp(updated) == self._without_timestamp(generate_gap_report("EURUSD", df))
+
+    def test_new_bars_filling_a_saved_gap(self):
+        full = _make_1m_ohlcv("2025-01-13 09:00", 300)
+        history = full.drop(full.index[100:150])
+        report = generate_gap_report("EURUSD", history)
+        assert report["summary"]["total_gaps"] == 1
+
+        # A late fetch fills 09:40-10:00 inside the gap and appends new bars
+        filled = pd.concat([history, full.iloc[100:120]]).sort_index()
+        updated = update_gap_report(report, filled.iloc[50:], since=full.index[100])
+        assert self._without_timestamp(updated) == self._without_timestamp(generate_gap_report("EURUSD", filled))
+        assert updated["trading_hour_gaps"][0]["gap_start"] == full.index[120].isoformat()
+
+    def test_returns_none_when_window_too_short(self):
+        df = _make_1m_ohlcv("2025-01-13 09:00", 300, drop_indices=[150])
+        report = generate_gap_report("EURUSD", df.iloc[:200])
+        assert update_gap_report(report, df.iloc[250:], since=df.index[260]) is None
+        assert update_gap_report(report, df, since=df.index[0]) is None
+        assert update_gap_report({"symbol": "EURUSD", "error": "x"}, df, since=df.index[260]) is None
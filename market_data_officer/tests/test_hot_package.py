@@ -0,0 +1,128 @@
+"""Tests for the binary hot package written next to the CSVs."""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_data_officer.feed.export import export_hot_packages
+from market_data_officer.feed.hot_package import (
+    HOT_BINARY_FORMAT,
+    hot_binary_path,
+    read_hot_binary,
+    write_hot_binary,
+)
+from market_data_officer.officer.loader import load_timeframe
+from market_data_officer.structure.io import load_bars
+from market_data_officer.tests.conftest import best_of
+
+OHLCV = ["open", "high", "low", "close", "volume"]
+
+
+def _make_bars(periods: int, freq: str = "1h", seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range("2025-01-13", periods=periods, freq=freq, tz="UTC", name="timestamp_utc")
+    close = 1.09 + np.cumsum(rng.normal(0, 0.0005, periods))
+    open_ = np.concatenate(([1.09], close[:-1]))
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + rng.uniform(0, 0.001, periods),
+            "low": np.minimum(open_, close) - rng.uniform(0, 0.001, periods),
+            "close": close,
+            "volume": rng.uniform(100, 5000, periods),
+        },
+        index=idx,
+    )
+
+
+def _csv_frame(path) -> pd.DataFrame:
+    df = pd.read_csv(path, index_col=0, parse_dates=True)
+    df.index.name = "timestamp_utc"
+    return df
+
+
+class TestExport:
+
+    def test_export_writes_binary_and_advertises_it(self, tmp_path):
+        export_hot_packages({"1h": _make_bars(300)}, "EURUSD", output_dir=tmp_path)
+
+        window = json.loads((tmp_path / "EURUSD_hot.json").read_text())["windows"]["1h"]
+        assert window["count"] == 240
+        assert window["binary"] == {"file": "EURUSD_1h_latest.npy", "format": HOT_BINARY_FORMAT}
+        assert (tmp_path / "EURUSD_1h_latest.npy").exists()
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_binary_matches_csv(self, tmp_path):
+        export_hot_packages({"1h": _make_bars(300)}, "EURUSD", output_dir=tmp_path)
+
+        binary = read_hot_binary(tmp_path / "EURUSD_1h_latest.npy")
+        csv = _csv_frame(tmp_path / "EURUSD_1h_latest.csv")
+        pd.testing.assert_frame_equal(binary, csv, check_index_type=False)
+        assert binary.index.equals(csv.index)
+
+
+class TestReadHotBinary:
+
+    def test_round_trip_is_exact(self, tmp_path):
+        df = _make_bars(500)
+        path = tmp_path / "EURUSD_1h_latest.npy"
+        write_hot_binary(df, path)
+        pd.testing.assert_frame_equal(read_hot_binary(path), df, check_index_type=False, check_freq=False)
+
+    def test_frame_is_a_view_of_the_file(self, tmp_path):
+        path = tmp_path / "EURUSD_1h_latest.npy"
+        write_hot_binary(_make_bars(50), path)
+        df = read_hot_binary(path)
+        assert not df["close"].to_numpy().flags.owndata
+
+        # Writes go to private copy-on-write pages, never to the file
+        df.iloc[0, 0] = 99.0
+        assert read_hot_binary(path).iloc[0, 0] != 99.0
+
+    def test_stale_binary_ignored(self, tmp_path):
+        path, csv = tmp_path / "EURUSD_1h_latest.npy", tmp_path / "EURUSD_1h_latest.csv"
+        write_hot_binary(_make_bars(50), path)
+        _make_bars(60).to_csv(csv)
+        os.utime(path, ns=(1, 1))
+        assert read_hot_binary(path, csv) is None
+
+    def test_missing_or_foreign_file_ignored(self, tmp_path):
+        path = tmp_path / "EURUSD_1h_latest.npy"
+        assert read_hot_binary(path) is None
+        np.save(path, np.zeros((3, 4)))
+        assert read_hot_binary(path) is None
+        path.write_bytes(b"not numpy")
+        assert read_hot_binary(path) is None
+
+
+class TestReaders:
+
+    def test_loaders_prefer_binary(self, tmp_path):
+        export_hot_packages({"1h": _make_bars(300)}, "EURUSD", output_dir=tmp_path)
+        expected = read_hot_binary(hot_binary_path(tmp_path, "EURUSD", "1h"))
+
+        pd.testing.assert_frame_equal(load_timeframe("EURUSD", "1h", tmp_path), expected)
+        pd.testing.assert_frame_equal(load_bars("EURUSD", "1h", tmp_path), expected)
+
+    def test_loaders_fall_back_to_newer_csv(self, tmp_path):
+        export_hot_packages({"1h": _make_bars(300)}, "EURUSD", output_dir=tmp_path)
+        newer = _make_bars(100, seed=1)
+        newer.to_csv(tmp_path / "EURUSD_1h_latest.csv")
+        os.utime(hot_binary_path(tmp_path, "EURUSD", "1h"), ns=(1, 1))
+
+        assert len(load_timeframe("EURUSD", "1h", tmp_path)) == 100
+        assert len(load_bars("EURUSD", "1h", tmp_path)) == 100
+
+    @pytest.mark.speedup
+    def test_benchmark_binary_vs_csv(self, tmp_path):
+        export_hot_packages({"1m": _make_bars(3000, freq="1min")}, "EURUSD", output_dir=tmp_path)
+        csv_path = tmp_path / "EURUSD_1m_latest.csv"
+        binary_path = hot_binary_path(tmp_path, "EURUSD", "1m")
+
+        csv_time = best_of(lambda: pd.read_csv(csv_path, index_col=0, parse_dates=True), repeats=5)
+        binary_time = best_of(lambda: read_hot_binary(binary_path, csv_path), repeats=5)
+        print(f"\n[bench] 3000-bar hot package: csv {csv_time * 1000:.2f}ms, binary {binary_time * 1000:.2f}ms")
+        assert binary_time * 3 < csv_time
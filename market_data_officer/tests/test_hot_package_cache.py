@@ -0,0 +1,141 @@
+"""Tests for the process-wide hot package frame cache."""
+
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from market_data_officer.feed import hot_cache
+from market_data_officer.feed.hot_cache import HOT_PACKAGE_CACHE, HotPackageCache
+from market_data_officer.officer.loader import load_manifest, load_timeframe
+from market_data_officer.officer.service import build_market_packet
+from market_data_officer.structure.io import load_bars
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    HOT_PACKAGE_CACHE.clear()
+    yield
+    HOT_PACKAGE_CACHE.clear()
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    """Paths parsed through read_hot_frame, in order."""
+    paths = []
+    real = hot_cache.read_hot_frame
+
+    def counting(csv_path, binary_path):
+        paths.append(csv_path.name)
+        return real(csv_path, binary_path)
+
+    monkeypatch.setattr(hot_cache, "read_hot_frame", counting)
+    return paths
+
+
+def _bump(path, seconds=5):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 10**9))
+
+
+class TestLoaders:
+
+    def test_repeated_loads_parse_once(self, hot_packages_dir, reads):
+        first = load_timeframe("EURUSD", "1h", hot_packages_dir)
+        second = load_timeframe("EURUSD", "1h", hot_packages_dir)
+        bars = load_bars("EURUSD", "1h", packages_dir=hot_packages_dir)
+
+        assert reads == ["EURUSD_1h_latest.csv"]
+        pd.testing.assert_frame_equal(first, second)
+        pd.testing.assert_frame_equal(first, bars)
+        assert HOT_PACKAGE_CACHE.stats()["hits"] == 2
+
+    def test_rewrite_reparses(self, hot_packages_dir, reads):
+        path = hot_packages_dir / "EURUSD_1h_latest.csv"
+        before = load_timeframe("EURUSD", "1h", hot_packages_dir)
+        pd.read_csv(path, index_col=0).iloc[:-10].to_csv(path)
+        _bump(path)
+
+        after = load_timeframe("EURUSD", "1h", hot_packages_dir)
+        assert len(reads) == 2 and len(after) == len(before) - 10
+
+    def test_callers_cannot_change_cached_frame(self, hot_packages_dir):
+        df = load_timeframe("EURUSD", "1h", hot_packages_dir)
+        df["atr"] = 1.0
+        df.index = df.index.tz_convert("Europe/London")
+        again = load_timeframe("EURUSD", "1h", hot_packages_dir)
+        assert "atr" not in again.columns and str(again.index.tz) == "UTC"
+
+    def test_missing_and_empty_not_cached(self, hot_packages_dir, reads):
+        with pytest.raises(FileNotFoundError):
+            load_timeframe("EURUSD", "2h", hot_packages_dir)
+        (hot_packages_dir / "EURUSD_1h_latest.csv").write_text("timestamp_utc,open,high,low,close,volume\n")
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                load_bars("EURUSD", "1h", packages_dir=hot_packages_dir)
+        assert len(reads) == 3
+        assert HOT_PACKAGE_CACHE.stats()["entries"] == 0
+
+    def test_manifest_refresh_invalidates_instrument(self, hot_packages_dir, reads):
+        manifest_path = hot_packages_dir / "EURUSD_hot.json"
+        load_manifest("EURUSD", hot_packages_dir)
+        load_timeframe("EURUSD", "1h", hot_packages_dir)
+        load_timeframe("EURUSD", "4h", hot_packages_dir)
+
+        load_manifest("EURUSD", hot_packages_dir)  # unchanged: frames stay
+        load_timeframe("EURUSD", "1h", hot_packages_dir)
+        assert len(reads) == 2
+
+        manifest = json.loads(manifest_path.read_text())
+        manifest["as_of_utc"] = "2099-01-01T00:00:00Z"
+        manifest_path.write_text(json.dumps(manifest))
+        load_manifest("EURUSD", hot_packages_dir)
+        load_timeframe("EURUSD", "1h", hot_packages_dir)
+        assert len(reads) == 3
+        assert HOT_PACKAGE_CACHE.stats()["invalidations"] == 2
+
+    def test_market_packet_builds_parse_each_timeframe_once(self, hot_packages_dir, reads):
+        for _ in range(3):
+            build_market_packet("EURUSD", packages_dir=hot_packages_dir)
+        assert sorted(reads) == sorted(set(reads))
+        assert HOT_PACKAGE_CACHE.stats()["hits"] > len(reads)
+
+
+class TestLru:
+
+    def _frame(self, rows):
+        return pd.DataFrame({"close": [1.0] * rows}, index=pd.RangeIndex(rows))
+
+    def test_evicts_least_recently_used_past_budget(self, tmp_path):
+        size = int(self._frame(100).memory_usage(index=True).sum())
+        cache = HotPackageCache(max_bytes=3 * size)
+        paths = {}
+        for name in "abcd":
+            paths[name] = tmp_path / f"X_{name}_latest.csv"
+            paths[name].write_text(name)
+
+        def load(name, parse=lambda: self._frame(100)):
+            return cache.load(paths[name], tmp_path / "none.npy", parse)
+
+        def cached(name):
+            load(name, lambda: pytest.fail(f"{name} re-parsed"))
+
+        for name in "abc":
+            load(name)
+        cached("a")
+        load("d")  # b is least recently used
+        cached("a")
+        cached("c")
+        cached("d")
+        stats = cache.stats()
+        assert stats["entries"] == 3 and stats["evictions"] == 1
+        assert stats["bytes"] == 3 * size
+        assert stats["misses"] == 4 and stats["hits"] == 4
+
+    def test_oversized_frame_not_kept(self, tmp_path):
+        cache = HotPackageCache(max_bytes=100)
+        path = tmp_path / "X_1h_latest.csv"
+        path.write_text("x")
+        frame = cache.load(path, tmp_path / "none.npy", lambda: self._frame(1000))
+        assert len(frame) == 1000 and cache.stats()["entries"] == 0
@@ -0,0 +1,148 @@
+"""Tests for the shared indicator kernels and per-build indicator cache."""
+
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_data_officer import indicators as indicators_module
+from market_data_officer.benchmarks.synthetic import SCENARIOS
+from market_data_officer.indicators import (
+    Indicators,
+    ema,
+    indicator_scope,
+    indicators,
+    roc,
+    sma,
+    tail_quantile,
+    true_range,
+    wilder_atr,
+)
+from market_data_officer.officer.features import compute_core_features
+from market_data_officer.officer.summarizer import build_state_summary
+from market_data_officer.tests.conftest import best_of
+
+
+def _wilder_loop(highs, lows, closes, period):
+    """The former autotune ATR, kept as the reference."""
+    n = len(highs)
+    tr = np.empty(n)
+    tr[0] = highs[0] - lows[0]
+    for i in range(1, n):
+        tr[i] = max(highs[i] - lows[i], abs(highs[i] - closes[i - 1]), abs(lows[i] - closes[i - 1]))
+    atr = np.full(n, np.nan)
+    if n < period:
+        return atr
+    atr[period - 1] = np.mean(tr[:period])
+    for i in range(period, n):
+        atr[i] = ((atr[i - 1] * (period - 1)) + tr[i]) / period
+    return atr
+
+
+@pytest.fixture(scope="module")
+def bars():
+    df = SCENARIOS["gappy"](2000, seed=3)
+    df.iloc[[50, 51, 900], df.columns.get_loc("close")] = np.nan
+    return df
+
+
+class TestKernels:
+
+    def test_match_pandas(self, bars):
+        high, low, close = bars["high"], bars["low"], bars["close"]
+        prev = close.shift(1)
+        expected_tr = pd.concat([high - low, (high - prev).abs(), (low - prev).abs()], axis=1).max(axis=1)
+        tr = true_range(high, low, close)
+        np.testing.assert_array_equal(tr, expected_tr.to_numpy())
+        for period in (1, 14, 200):
+            np.testing.assert_allclose(sma(close, period), close.rolling(period).mean(), rtol=1e-12)
+        np.testing.assert_array_equal(roc(close, 14), (close - close.shift(14)) / close.shift(14))
+        history = pd.Series(sma(tr, 14)).dropna().tail(50)
+        assert tail_quantile(sma(tr, 14), [0.25, 0.75], 50).tolist() == [history.quantile(0.25),
+                                                                         history.quantile(0.75)]
+
+    def test_stacked_rows_equal_single_series(self, bars):
+        close = bars["close"].to_numpy()
+        stack = np.full((3, len(close)), np.nan)
+        stack[0] = close
+        stack[1, 500:] = close[:-500]
+        stack[2, -20:] = close[:20]
+        for kernel in (lambda v: sma(v, 14)[..., -1], lambda v: roc(v, 14)[..., -1],
+                       lambda v: tail_quantile(sma(v, 3), 0.5, 50)):
+            np.testing.assert_array_equal(kernel(stack), [kernel(close), kernel(close[:-500]), kernel(close[:20])])
+
+    def test_recursive_averages_match_loops(self, bars):
+        clean = bars.dropna()
+        highs, lows, closes = (clean[c].to_numpy() for c in ("high", "low", "close"))
+        for period in (3, 14):
+            np.testing.assert_array_equal(wilder_atr(highs, lows, closes, period),
+                                          _wilder_loop(highs, lows, closes, period))
+        assert np.isnan(wilder_atr(highs[:5], lows[:5], closes[:5], 14)).all()
+
+        alpha = 2.0 / 21
+        expected = [closes[0]]
+        for value in closes[1:]:
+            expected.append(alpha * value + (1 - alpha) * expected[-1])
+        np.testing.assert_array_equal(ema(closes, 20), expected)
+        assert len(ema(np.array([]), 20)) == 0
+
+    def test_edge_cases(self):
+        assert roc(np.array([0.0, 1.0, 2.0]), 1)[1:].tolist() == [0.0, 1.0]
+        assert np.isnan(sma(np.arange(3.0), 5)).all()
+        assert np.isnan(tail_quantile(np.full(10, np.nan), 0.5, 5))
+        with pytest.raises(ValueError):
+            sma(np.arange(3.0), 0)
+        with pytest.raises(ValueError):
+            Indicators({}).atr(14, method="ema")
+
+
+class TestCache:
+
+    def test_memoized_per_parameters(self, bars):
+        ind = Indicators(bars)
+        assert ind.atr(14) is ind.atr(14)
+        assert ind.atr(14) is not ind.atr(20)
+        assert ind.sma(50) is not ind.sma(50, column="high")
+
+    def test_scope_shares_per_source(self, bars):
+        assert indicators(bars) is not indicators(bars)
+        with indicator_scope():
+            shared = indicators(bars)
+            with indicator_scope():
+                assert indicators(bars) is shared
+            assert indicators(bars.copy()) is not shared
+            seen = []
+            thread = threading.Thread(target=lambda: seen.append(indicators(bars)))
+            thread.start()
+            thread.join()
+            assert seen[0] is not shared
+        assert indicators(bars) is not shared
+
+    def test_packet_features_compute_true_range_once(self, bars, monkeypatch):
+        calls = []
+        real = indicators_module.true_range
+
+        def counting(*args):
+            calls.append(1)
+            return real(*args)
+
+        monkeypatch.setattr(indicators_module, "true_range", counting)
+        with indicator_scope():
+            features = compute_core_features(bars)
+            summary = build_state_summary(features, {"1h": bars})
+        assert len(calls) == 1
+        assert summary.volatility_regime == features.volatility_regime
+
+
+@pytest.mark.speedup
+class TestBenchmark:
+
+    def test_kernels_beat_python_loop(self):
+        df = SCENARIOS["trending"](20_000, seed=1)
+        highs, lows, closes = (df[c].to_numpy() for c in ("high", "low", "close"))
+
+        loop = best_of(lambda: _wilder_loop(highs, lows, closes, 14))
+        kernel = best_of(lambda: wilder_atr(highs, lows, closes, 14))
+        print(f"\n[bench] Wilder ATR over 20k bars: loop {loop * 1000:.1f}ms, kernel {kernel * 1000:.1f}ms")
+        assert kernel * 3 < loop
@@ -0,0 +1,152 @@
+"""Tests for the process-wide PriceStore adapter and its result cache."""
+
+import threading
+import time
+
+import pytest
+
+from market_data_officer.officer.loader import load_all_timeframes, load_from_pricestore
+from market_data_officer.officer.pricestore import PRICESTORE, PriceStoreConnection
+from market_data_officer.officer.service import build_market_packet
+
+from market_data_officer.tests.conftest import FakePriceStore
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def tdp_env(tmp_path, monkeypatch):
+    data_dir = tmp_path / "tdp_data"
+    data_dir.mkdir()
+    monkeypatch.setenv("TDP_SRC_DIR", "")
+    monkeypatch.setenv("TDP_DATA_DIR", str(data_dir))
+    return data_dir
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+def _connection(clock, factory=FakePriceStore, **kwargs):
+    built = []
+
+    def build():
+        adapter = factory()
+        built.append(adapter)
+        return adapter
+
+    return PriceStoreConnection(factory=build, ttl_s=60, health_check_s=30, clock=clock, **kwargs), built
+
+
+class TestAdapter:
+
+    def test_built_once_across_threads(self, tdp_env, clock):
+        def slow():
+            time.sleep(0.05)
+            return FakePriceStore()
+
+        connection, built = _connection(clock, factory=slow)
+        adapters = []
+        threads = [threading.Thread(target=lambda: adapters.append(connection.adapter())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(built) == 1 and all(a is built[0] for a in adapters)
+
+    def test_rebuilt_after_failed_health_check(self, tdp_env, clock):
+        connection, built = _connection(clock)
+        first = connection.adapter()
+        first.healthy = False
+        assert connection.adapter() is first  # not checked again yet
+        clock.now += 31
+        assert connection.adapter() is built[1]
+        clock.now += 31
+        assert connection.adapter() is built[1]  # healthy: kept
+        assert connection.stats()["creations"] == 2
+
+    def test_rebuilt_when_settings_change(self, tdp_env, clock, tmp_path, monkeypatch):
+        connection, built = _connection(clock)
+        connection.adapter()
+        other = tmp_path / "other"
+        other.mkdir()
+        monkeypatch.setenv("TDP_DATA_DIR", str(other))
+        assert connection.adapter() is built[1]
+
+    def test_unavailable_is_remembered(self, tdp_env, clock):
+        connection, built = _connection(clock, factory=lambda: None)
+        assert connection.adapter() is None and connection.adapter() is None
+        assert len(built) == 1
+        clock.now += 31
+        connection.adapter()
+        assert len(built) == 2
+
+    def test_failed_read_discards_adapter(self, tdp_env, clock):
+        connection, built = _connection(clock)
+        adapter = connection.adapter()
+        adapter.fail = True
+        with pytest.raises(OSError):
+            connection.get_timeframes(adapter, "EURUSD", ("1h",))
+        assert connection.adapter() is built[1]
+
+
+class TestResultCache:
+
+    def test_reads_only_missing_or_expired(self, tdp_env, clock):
+        connection, _ = _connection(clock)
+        adapter = connection.adapter()
+        first = connection.get_timeframes(adapter, "EURUSD", ("1h", "4h"))
+        connection.get_timeframes(adapter, "EURUSD", ("4h", "1d", "1h"))
+        connection.get_timeframes(adapter, "EURUSD", ("1h",), source="oanda")
+        clock.now += 61
+        connection.get_timeframes(adapter, "EURUSD", ("1h",))
+        assert adapter.reads == [
+            ("EURUSD", ("1h", "4h"), None, None),
+            ("EURUSD", ("1d",), None, None),
+            ("EURUSD", ("1h",), "oanda", None),
+            ("EURUSD", ("1h",), None, None),
+        ]
+        assert list(first) == ["1h", "4h"]
+
+    def test_callers_cannot_change_cached_frame(self, tdp_env, clock):
+        connection, _ = _connection(clock)
+        adapter = connection.adapter()
+        df = connection.get_timeframes(adapter, "EURUSD", ("1h",))["1h"]
+        df["atr"] = 1.0
+        again = connection.get_timeframes(adapter, "EURUSD", ("1h",))["1h"]
+        assert "atr" not in again.columns and len(adapter.reads) == 1
+
+    def test_zero_ttl_disables_cache(self, tdp_env, clock):
+        connection, _ = _connection(clock)
+        connection.ttl_s = 0
+        adapter = connection.adapter()
+        for _ in range(2):
+            connection.get_timeframes(adapter, "EURUSD", ("1h",))
+        assert len(adapter.reads) == 2
+
+
+class TestLoader:
+
+    def test_setup_paid_once_per_process(self, fake_pricestore):
+        for _ in range(3):
+            frames = load_all_timeframes("EURUSD")
+        assert set(frames) == {"5m", "15m", "1h", "4h", "1d"}
+        assert len(fake_pricestore) == 1
+        assert fake_pricestore[0].reads == [("EURUSD", ("5m", "15m", "1h", "4h", "1d"), None, None)]
+        load_from_pricestore("XAUUSD", source="capital")
+        assert len(fake_pricestore[0].reads) == 2
+        assert PRICESTORE.stats()["hits"] == 10
+
+    def test_market_packet_on_pricestore_path(self, fake_pricestore):
+        for _ in range(2):
+            packet = build_market_packet("EURUSD")
+        assert packet.source["vendor"] == "pricestore"
+        assert packet.quality.manifest_valid and not packet.quality.stale
+        assert len(fake_pricestore) == 1 and len(fake_pricestore[0].reads) == 1
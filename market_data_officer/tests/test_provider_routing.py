@@ -371,15 +371,18 @@ class TestRoutingGuardRails:
     """Hard constraints from the routing spec."""
 
     def test_no_hardcoded_provider_in_pipeline_fallback_gate(self):
-        """The fallback gate in pipeline.py reads meta.fallback_enabled,
-        not a hardcoded boolean."""
+        """The fallback gate every ingest path shares (staged.merge_hour)
+        reads meta.fallback_enabled, not a hardcoded boolean."""
         import inspect
         from market_data_officer.feed.pipeline import run_pipeline
+        from market_data_officer.feed.staged import merge_hour
 
-        source = inspect.getsource(run_pipeline)
+        # Both inline branches go through the shared helper
+        assert inspect.getsource(run_pipeline).count("merge_hour(") == 2
+        source = inspect.getsource(merge_hour)
         # The fallback gate should reference meta.fallback_enabled
         assert "meta.fallback_enabled" in source, (
-            "pipeline.run_pipeline does not read meta.fallback_enabled"
+            "staged.merge_hour does not read meta.fallback_enabled"
         )
 
     def test_no_hardcoded_vendor_stamp_in_pipeline(self):
@@ -0,0 +1,213 @@
+"""Tests for the read-through raw bi5 cache (feed/raw_cache.py).
+
+Network access is replaced by a fake transport so every test is offline.
+"""
+
+import lzma
+import struct
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from market_data_officer.feed.diagnostics import generate_cache_inventory
+from market_data_officer.feed.fetch import fetch_bi5, fetch_bi5_detailed
+from market_data_officer.feed.raw_cache import Bi5Cache, load_index
+from market_data_officer.feed.pipeline import run_pipeline
+
+
+DAY = datetime(2025, 1, 15, tzinfo=timezone.utc)
+NOW = datetime(2025, 2, 1, tzinfo=timezone.utc)
+
+
+def _hour_payload(hour: int) -> bytes:
+    raw = b""
+    for i in range(60):
+        ask = 109_000 + hour * 10 + (i % 5)
+        raw += struct.pack(">IIIff", i * 60_000, ask, ask - 20, 1.0, 1.0)
+    return lzma.compress(raw)
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, content: bytes) -> None:
+        self.status_code = status_code
+        self.content = content
+
+
+class _FakeTransport:
+    """Stands in for fetch._http_get, serving payloads keyed by hour."""
+
+    def __init__(self, payloads: dict) -> None:
+        self.payloads = payloads
+        self.calls = []
+
+    def __call__(self, url, timeout, session, rate_limiter):
+        self.calls.append(url)
+        hour = int(url.rsplit("/", 1)[-1][:2])
+        data = self.payloads.get(hour)
+        if data is None:
+            return _FakeResponse(404, b"")
+        return _FakeResponse(200, data)
+
+
+@pytest.fixture
+def transport():
+    fake = _FakeTransport({h: _hour_payload(h) for h in range(24) if h != 5})
+    with patch("market_data_officer.feed.fetch._http_get", fake):
+        yield fake
+
+
+def _cache(tmp_path, **kwargs) -> Bi5Cache:
+    return Bi5Cache(root=tmp_path / "raw", now_fn=lambda: NOW, **kwargs)
+
+
+class TestReadThrough:
+    def test_second_fetch_served_from_disk(self, tmp_path, transport):
+        cache = _cache(tmp_path)
+        hour = DAY + timedelta(hours=9)
+
+        first = fetch_bi5("EURUSD", hour, cache=cache)
+        second = fetch_bi5("EURUSD", hour, cache=cache)
+
+        assert first == second == _hour_payload(9)
+        assert len(transport.calls) == 1
+        assert cache.archive_path("EURUSD", hour).exists()
+
+    def test_negative_entry_for_404(self, tmp_path, transport):
+        cache = _cache(tmp_path)
+        hour = DAY + timedelta(hours=5)
+
+        assert fetch_bi5("EURUSD", hour, cache=cache) == b""
+        assert fetch_bi5("EURUSD", hour, cache=cache) == b""
+        assert len(transport.calls) == 1
+
+    def test_detailed_replays_status_and_flags_cache(self, tmp_path, transport):
+        cache = _cache(tmp_path)
+        missing = DAY + timedelta(hours=5)
+        present = DAY + timedelta(hours=6)
+
+        fetch_bi5_detailed("EURUSD", missing, cache=cache)
+        fetch_bi5_detailed("EURUSD", present, cache=cache)
+        neg = fetch_bi5_detailed("EURUSD", missing, cache=cache)
+        pos = fetch_bi5_detailed("EURUSD", present, cache=cache)
+
+        assert neg.from_cache and neg.http_status == 404 and neg.error == "http_404"
+        assert pos.from_cache and pos.http_status == 200 and pos.data == _hour_payload(6)
+        assert pos.cached_path.endswith("06h_ticks.bi5")
+
+    def test_recent_hours_always_refetched(self, tmp_path, transport):
+        cache = Bi5Cache(root=tmp_path / "raw", now_fn=lambda: DAY + timedelta(hours=12))
+        hour = DAY + timedelta(hours=9)
+
+        fetch_bi5("EURUSD", hour, cache=cache)
+        fetch_bi5("EURUSD", hour, cache=cache)
+        assert len(transport.calls) == 2
+
+    def test_entry_stored_while_live_is_refetched_once(self, tmp_path, transport):
+        hour = DAY + timedelta(hours=9)
+        clock = {"now": DAY + timedelta(hours=10)}
+        cache = Bi5Cache(root=tmp_path / "raw", now_fn=lambda: clock["now"])
+
+        fetch_bi5("EURUSD", hour, cache=cache)  # live hour, stored
+        clock["now"] = NOW
+        fetch_bi5("EURUSD", hour, cache=cache)  # stale entry → refetch
+        fetch_bi5("EURUSD", hour, cache=cache)  # now pinned
+        assert len(transport.calls) == 2
+
+    def test_server_errors_not_cached(self, tmp_path):
+        cache = _cache(tmp_path)
+        hour = DAY + timedelta(hours=9)
+        with patch("market_data_officer.feed.fetch._http_get",
+                   return_value=_FakeResponse(503, b"")) as mock_get:
+            fetch_bi5("EURUSD", hour, cache=cache)
+            fetch_bi5("EURUSD", hour, cache=cache)
+        assert mock_get.call_count == 2
+
+    def test_corrupt_archive_is_a_miss(self, tmp_path, transport):
+        cache = _cache(tmp_path)
+        hour = DAY + timedelta(hours=9)
+        fetch_bi5("EURUSD", hour, cache=cache)
+        cache.archive_path("EURUSD", hour).write_bytes(b"truncated")
+
+        assert fetch_bi5("EURUSD", hour, cache=cache) == _hour_payload(9)
+        assert len(transport.calls) == 2
+
+    def test_legacy_save_raw_archive_adopted(self, tmp_path, transport):
+        hour = DAY + timedelta(hours=9)
+        fetch_bi5("EURUSD", hour, save_raw=True, raw_dir=tmp_path / "raw")
+        # Archive written today (mtime) — long after the hour became immutable
+        cache = Bi5Cache(root=tmp_path / "raw")
+
+        assert fetch_bi5("EURUSD", hour, cache=cache) == _hour_payload(9)
+        assert len(transport.calls) == 1
+
+
+class TestIndexAndEviction:
+    def test_flush_persists_index(self, tmp_path, transport):
+        cache = _cache(tmp_path)
+        fetch_bi5("EURUSD", DAY + timedelta(hours=5), cache=cache)
+        fetch_bi5("EURUSD", DAY + timedelta(hours=6), cache=cache)
+        cache.flush()
+
+        index = load_index(tmp_path / "raw" / "EURUSD")
+        assert len(index) == 2
+        assert sum(1 for e in index.values() if e.is_negative) == 1
+
+        reopened = _cache(tmp_path)
+        fetch_bi5("EURUSD", DAY + timedelta(hours=6), cache=reopened)
+        assert len(transport.calls) == 2
+
+    def test_lru_eviction_bounds_size(self, tmp_path, transport):
+        one = len(_hour_payload(0))
+        clock = {"now": NOW}
+        cache = Bi5Cache(root=tmp_path / "raw", now_fn=lambda: clock["now"],
+                         max_bytes=int(one * 2.5))
+
+        for h in (0, 1):
+            fetch_bi5("EURUSD", DAY + timedelta(hours=h), cache=cache)
+            clock["now"] += timedelta(seconds=1)
+        fetch_bi5("EURUSD", DAY, cache=cache)  # touch hour 0 → hour 1 is LRU
+        clock["now"] += timedelta(seconds=1)
+        fetch_bi5("EURUSD", DAY + timedelta(hours=2), cache=cache)
+
+        assert cache.total_bytes("EURUSD") <= cache.max_bytes
+        assert cache.archive_path("EURUSD", DAY).exists()
+        assert not cache.archive_path("EURUSD", DAY + timedelta(hours=1)).exists()
+
+    def test_inventory_reuses_index_hashes(self, tmp_path, transport):
+        cache = _cache(tmp_path)
+        for h in (4, 5, 6):
+            fetch_bi5("EURUSD", DAY + timedelta(hours=h), cache=cache)
+        cache.flush()
+
+        with patch("market_data_officer.feed.diagnostics.hashlib.sha256") as mock_sha:
+            inv = generate_cache_inventory("EURUSD", raw_dir=tmp_path / "raw")
+
+        assert not mock_sha.called
+        assert inv["summary"]["total_files"] == 2
+        assert inv["summary"]["negative_entries"] == 1
+
+
+class TestPipelineRebuildFromCache:
+    def test_rebuild_uses_no_network(self, tmp_path, transport):
+        def run(cache):
+            saved = []
+            with patch("market_data_officer.feed.pipeline._load_existing_canonical",
+                       return_value=None), \
+                 patch("market_data_officer.feed.pipeline._save_canonical",
+                       side_effect=lambda df, sym: saved.append(df.copy())), \
+                 patch("market_data_officer.feed.pipeline._rebuild_derived_and_export"), \
+                 patch("market_data_officer.feed.pipeline.fetch_1m_ohlcv_yfinance",
+                       return_value=pd.DataFrame()):
+                run_pipeline("EURUSD", DAY, DAY, raw_cache=cache, fetch_workers=4)
+            return saved[0]
+
+        first = run(_cache(tmp_path))
+        assert len(transport.calls) == 24
+
+        transport.payloads.clear()  # any network call would now return 404
+        rebuilt = run(_cache(tmp_path))
+
+        assert len(transport.calls) == 24
+        pd.testing.assert_frame_equal(first, rebuilt)
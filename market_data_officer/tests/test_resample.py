@@ -1,9 +1,19 @@
 """Tests for the resample layer."""
 
+
+import numpy as np
 import pandas as pd
 import pytest
 
-from market_data_officer.feed.resample import resample_from_1m
+from market_data_officer.feed.config import DERIVED_TIMEFRAMES
+from market_data_officer.feed.resample import (
+    TIMEFRAME_ALIGNMENT,
+    Alignment,
+    cascade_plan,
+    resample_cascade,
+    resample_from_1m,
+)
+from market_data_officer.tests.conftest import best_of
 
 
 def _make_canonical(n: int = 60) -> pd.DataFrame:
@@ -67,3 +77,91 @@ def test_no_mid_column_in_resample():
     df = _make_canonical()
     df_5m = resample_from_1m(df, "5min")
     assert "mid" not in df_5m.columns
+
+
+# ---------------------------------------------------------------------------
+# Cascaded resampling (1m → 5m → 15m → 1h → 4h → 1D)
+# ---------------------------------------------------------------------------
+
+def _make_trading_1m(start: str, days: int, seed: int = 0) -> pd.DataFrame:
+    """Random-walk 1m bars without weekends and with scattered missing minutes."""
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range(start, periods=days * 1440, freq="1min", tz="UTC", name="timestamp_utc")
+    n = len(idx)
+    close = 1.09 + np.cumsum(rng.normal(0, 0.0001, n))
+    open_ = np.concatenate(([1.09], close[:-1]))
+    df = pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + rng.uniform(0, 0.0002, n),
+            "low": np.minimum(open_, close) - rng.uniform(0, 0.0002, n),
+            "close": close,
+            "volume": rng.uniform(1, 100, n),
+        },
+        index=idx,
+    )
+    keep = (df.index.dayofweek < 5) & (rng.random(n) > 0.02)
+    return df[keep]
+
+
+def _assert_parity(cascaded: pd.DataFrame, reference: pd.DataFrame) -> None:
+    pd.testing.assert_frame_equal(
+        cascaded.drop(columns="volume"), reference.drop(columns="volume"),
+    )
+    # Volume is summed from partial sums rather than 1m bars directly
+    np.testing.assert_allclose(cascaded["volume"], reference["volume"], rtol=1e-12)
+
+
+@pytest.mark.parametrize("rule", DERIVED_TIMEFRAMES)
+def test_cascade_matches_resample_from_1m(rule):
+    """Every cascaded timeframe reproduces an independent resample_from_1m."""
+    df = _make_trading_1m("2025-01-27 13:17", days=12, seed=1)
+    _assert_parity(resample_cascade(df)[rule], resample_from_1m(df, rule))
+
+
+def test_cascade_contiguous_keeps_freq():
+    """Without empty buckets the index carries the rule as freq, like resample."""
+    df = _make_canonical(240)
+    for rule, cascaded in resample_cascade(df, ["5min", "15min", "1h"]).items():
+        pd.testing.assert_frame_equal(cascaded, resample_from_1m(df, rule))
+
+
+def test_cascade_plan_default_chain():
+    assert cascade_plan(DERIVED_TIMEFRAMES) == [
+        ("5min", None), ("15min", "5min"), ("1h", "15min"), ("4h", "1h"), ("1D", "4h"),
+    ]
+
+
+def test_cascade_session_anchor_skips_non_nesting_parent():
+    """A 22:00 UTC day does not nest in 00:00-anchored 4h bars; it builds from 1h."""
+    alignments = dict(TIMEFRAME_ALIGNMENT)
+    alignments["1D"] = Alignment(pd.Timedelta(days=1), anchor=pd.Timedelta(hours=22))
+    assert dict(cascade_plan(DERIVED_TIMEFRAMES, alignments))["1D"] == "1h"
+
+    df = _make_trading_1m("2025-01-27 00:00", days=10, seed=2)
+    cascaded = resample_cascade(df, DERIVED_TIMEFRAMES, alignments)["1D"]
+    reference = df.resample("24h", offset="22h").agg({
+        "open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum",
+    }).dropna(subset=["open"])
+    assert cascaded.index[0] == pd.Timestamp("2025-01-26 22:00", tz="UTC")
+    _assert_parity(cascaded[["open", "high", "low", "close", "volume"]], reference)
+
+
+def test_cascade_empty_input():
+    result = resample_cascade(pd.DataFrame())
+    assert set(result) == set(DERIVED_TIMEFRAMES)
+    assert all(df.empty for df in result.values())
+
+
+@pytest.mark.speedup
+def test_cascade_benchmark_multi_year():
+    """Two years of 1m bars: one cascade vs five independent resamples."""
+    df = _make_trading_1m("2023-01-02 00:00", days=730, seed=3)
+
+    independent_s = best_of(lambda: [resample_from_1m(df, rule) for rule in DERIVED_TIMEFRAMES])
+    cascade_s = best_of(lambda: resample_cascade(df))
+    print(f"\n[bench] derive 5 timeframes from {len(df)} 1m bars: "
+          f"independent={independent_s * 1e3:.0f}ms cascade={cascade_s * 1e3:.0f}ms "
+          f"speedup={independent_s / cascade_s:.1f}x")
+
+    assert cascade_s * 2 < independent_s
@@ -0,0 +1,159 @@
+"""Tests for incremental derived-timeframe rollup."""
+
+from contextlib import contextmanager
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_data_officer.feed.canonical_store import CanonicalStore
+from market_data_officer.feed.config import DERIVED_TIMEFRAMES, TIMEFRAME_LABELS
+from market_data_officer.feed.resample import resample_from_1m
+from market_data_officer.feed.rollup import IncrementalRollup, load_state
+
+OHLCV = ["open", "high", "low", "close", "volume"]
+LABELS = [TIMEFRAME_LABELS[rule] for rule in DERIVED_TIMEFRAMES]
+
+
+def _make_1m(start: str, periods: int, seed: int = 0, drop_weekends: bool = True) -> pd.DataFrame:
+    """Random-walk 1m canonical bars, optionally without Saturday/Sunday bars."""
+    rng = np.random.default_rng(seed)
+    idx = pd.date_range(start, periods=periods, freq="1min", tz="UTC", name="timestamp_utc")
+    close = 1.09 + np.cumsum(rng.normal(0, 0.0001, periods))
+    open_ = np.concatenate(([1.09], close[:-1]))
+    df = pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + rng.uniform(0, 0.0002, periods),
+            "low": np.minimum(open_, close) - rng.uniform(0, 0.0002, periods),
+            "close": close,
+            "volume": rng.uniform(1, 100, periods).round(2),
+        },
+        index=idx,
+    )
+    if drop_weekends:
+        df = df[df.index.dayofweek < 5]
+    return df
+
+
+def _full_derived(canonical: pd.DataFrame) -> dict:
+    return {TIMEFRAME_LABELS[rule]: resample_from_1m(canonical[OHLCV], rule) for rule in DERIVED_TIMEFRAMES}
+
+
+def _assert_derived_equal(actual: pd.DataFrame, expected: pd.DataFrame) -> None:
+    pd.testing.assert_frame_equal(
+        actual[["open", "high", "low", "close"]],
+        expected[["open", "high", "low", "close"]],
+        check_freq=False,
+    )
+    np.testing.assert_allclose(actual["volume"], expected["volume"], rtol=1e-12)
+
+
+@contextmanager
+def _derived_root(tmp_path):
+    with patch("market_data_officer.feed.canonical_store.DERIVED_DIR", tmp_path / "derived"), \
+         patch("market_data_officer.feed.canonical_store.CANONICAL_DIR", tmp_path / "canonical"), \
+         patch("market_data_officer.feed.rollup.DERIVED_DIR", tmp_path / "derived"):
+        yield
+
+
+def _seeded_rollup(tmp_path, history: pd.DataFrame) -> IncrementalRollup:
+    rollup = IncrementalRollup("EURUSD", root=tmp_path)
+    derived = _full_derived(history)
+    for label, df in derived.items():
+        rollup.store(label).write(df)
+    rollup.seed(derived, history.index[-1])
+    return rollup
+
+
+class TestIncrementalRollup:
+
+    def test_updates_match_full_resample(self, tmp_path):
+        canonical = _make_1m("2025-01-27 00:00", 60 * 24 * 9, seed=3)  # across month end + weekend
+        history, new = canonical.iloc[:5000], canonical.iloc[5000:]
+        rollup = _seeded_rollup(tmp_path, history)
+
+        # Fold the remaining bars in uneven scheduler-sized chunks
+        for lo in range(0, len(new), 777):
+            window = pd.concat([history, new.iloc[:lo + 777]])
+            assert rollup.can_fold(window, new.index[lo])
+            rollup.update(window)
+
+        expected = _full_derived(canonical)
+        for label in LABELS:
+            _assert_derived_equal(rollup.store(label).read(), expected[label])
+        assert rollup.watermark == canonical.index[-1]
+
+    def test_update_continues_open_bar(self, tmp_path):
+        bars = _make_1m("2025-01-13 09:00", 90, seed=2)
+        rollup = _seeded_rollup(tmp_path, bars.iloc[:37])
+
+        changed = rollup.update(bars)
+        expected = resample_from_1m(bars, "1h")
+        _assert_derived_equal(changed["1h"], expected.iloc[-2:])
+        _assert_derived_equal(rollup.store("1h").read(), expected)
+
+    def test_only_tail_partitions_rewritten(self, tmp_path):
+        canonical = _make_1m("2025-01-27 00:00", 60 * 24 * 8, seed=4)
+        history = canonical[canonical.index < "2025-02-04 10:00"]
+        rollup = _seeded_rollup(tmp_path, history)
+        jan = rollup.store("5m").partition_path("2025/01")
+        jan_mtime = jan.stat().st_mtime_ns
+
+        rollup.update(canonical)
+        assert jan.stat().st_mtime_ns == jan_mtime
+
+    def test_state_persisted(self, tmp_path):
+        canonical = _make_1m("2025-01-13 00:00", 600, seed=5)
+        rollup = _seeded_rollup(tmp_path, canonical.iloc[:300])
+        rollup.update(canonical)
+
+        state = load_state("EURUSD", root=tmp_path)
+        assert pd.Timestamp(state.watermark_utc) == canonical.index[-1]
+        assert set(state.open_bars) == set(LABELS)
+        reloaded = IncrementalRollup("EURUSD", root=tmp_path)
+        assert reloaded.watermark == canonical.index[-1]
+
+    def test_cannot_fold_without_state(self, tmp_path):
+        canonical = _make_1m("2025-01-13 00:00", 600, seed=6)
+        assert not IncrementalRollup("EURUSD", root=tmp_path).can_fold(canonical, canonical.index[300])
+
+    def test_cannot_fold_late_or_unreachable_bars(self, tmp_path):
+        canonical = _make_1m("2025-01-13 00:00", 600, seed=7)
+        rollup = _seeded_rollup(tmp_path, canonical.iloc[:300])
+        watermark = canonical.index[299]
+
+        assert not rollup.can_fold(canonical, watermark)  # gap fill at/before watermark
+        assert not rollup.can_fold(canonical, None)
+        assert not rollup.can_fold(canonical.iloc[400:], canonical.index[450])
+        assert rollup.can_fold(canonical, canonical.index[300])
+
+
+class TestPipelineRollup:
+
+    def test_rebuild_then_fold(self, tmp_path):
+        from market_data_officer.feed.pipeline import _rebuild_derived_and_export
+
+        canonical = _make_1m("2025-01-27 00:00", 60 * 24 * 6, seed=8)
+        canonical["vendor"] = "dukascopy"
+        first, second = canonical.iloc[:4000], canonical
+
+        exports = []
+        with _derived_root(tmp_path), \
+             patch("market_data_officer.feed.pipeline.export_hot_packages",
+                   side_effect=lambda dfs, sym, vendors: exports.append(dfs)):
+            _rebuild_derived_and_export(first, "EURUSD", new_data_start=None)
+            assert IncrementalRollup("EURUSD").watermark == first.index[-1]
+
+            with patch("market_data_officer.feed.pipeline._derive_timeframes") as full_path:
+                _rebuild_derived_and_export(second, "EURUSD", new_data_start=canonical.index[4000])
+                full_path.assert_not_called()
+
+            expected = _full_derived(canonical)
+            for label in LABELS:
+                _assert_derived_equal(CanonicalStore("EURUSD", timeframe=label).read(), expected[label])
+
+        hot = exports[-1]
+        _assert_derived_equal(hot["1h"], expected["1h"].tail(240))
+        _assert_derived_equal(hot["1d"], expected["1d"].tail(30))
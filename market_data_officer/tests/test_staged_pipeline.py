@@ -0,0 +1,128 @@
+"""Tests for the staged (process-pool decode) ingestion path (feed/staged.py).
+
+The staged path must produce the same canonical bars, fallback calls and
+diagnostics as the inline path. Network access is faked.
+"""
+
+import lzma
+import struct
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from market_data_officer.feed.config import INSTRUMENTS
+from market_data_officer.feed.diagnostics import DiagnosticsCollector
+from market_data_officer.feed.pipeline import run_pipeline
+from market_data_officer.feed.staged import decode_hour_to_bars
+
+
+DAY = datetime(2025, 1, 15, tzinfo=timezone.utc)
+MISSING_HOURS = {2, 21}
+
+
+def _hour_payload(hour: int) -> bytes:
+    raw = b""
+    for i in range(240):
+        ask = 109_000 + hour * 10 + (i % 9)
+        raw += struct.pack(">IIIff", i * 15_000, ask, ask - 15, 0.5, 0.25)
+    return lzma.compress(raw)
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int, content: bytes) -> None:
+        self.status_code = status_code
+        self.content = content
+
+
+def _fake_http_get(url, timeout, session, rate_limiter):
+    hour = int(url.rsplit("/", 1)[-1][:2])
+    if hour in MISSING_HOURS:
+        return _FakeResponse(404, b"")
+    return _FakeResponse(200, _hour_payload(hour))
+
+
+def _run(decode_workers: int, diagnostics: bool):
+    saved, fallback_hours, reports = [], [], []
+    original_build = DiagnosticsCollector.build_report
+
+    def capture(self):
+        report = original_build(self)
+        reports.append(report)
+        return report
+
+    def fake_fallback(symbol, hour):
+        fallback_hours.append(hour)
+        return pd.DataFrame()
+
+    with patch("market_data_officer.feed.fetch._http_get", _fake_http_get), \
+         patch("market_data_officer.feed.pipeline._load_existing_canonical", return_value=None), \
+         patch("market_data_officer.feed.pipeline._save_canonical",
+               side_effect=lambda df, sym: saved.append(df.copy())), \
+         patch("market_data_officer.feed.pipeline._rebuild_derived_and_export"), \
+         patch("market_data_officer.feed.pipeline.fetch_1m_ohlcv_yfinance",
+               side_effect=fake_fallback), \
+         patch.object(DiagnosticsCollector, "build_report", capture), \
+         patch.object(DiagnosticsCollector, "save_report"), \
+         patch("market_data_officer.feed.pipeline.verify_decode_assumptions", return_value={}):
+        run_pipeline("EURUSD", DAY, DAY, diagnostics=diagnostics,
+                     fetch_workers=3, decode_workers=decode_workers)
+
+    return saved[0], fallback_hours, (reports[0] if reports else None)
+
+
+class TestStagedParity:
+    @pytest.mark.parametrize("diagnostics", [False, True])
+    def test_bars_and_fallback_match_inline(self, diagnostics):
+        inline, inline_fb, _ = _run(decode_workers=0, diagnostics=diagnostics)
+        staged, staged_fb, _ = _run(decode_workers=2, diagnostics=diagnostics)
+
+        assert len(inline) == 22 * 60
+        pd.testing.assert_frame_equal(inline, staged)
+        assert inline_fb == staged_fb
+        assert {h.hour for h in staged_fb} == MISSING_HOURS
+
+    def test_diagnostics_match_inline(self):
+        _, _, inline = _run(decode_workers=0, diagnostics=True)
+        _, _, staged = _run(decode_workers=2, diagnostics=True)
+
+        def comparable(report):
+            summary = {k: v for k, v in report["summary"].items() if k != "stages"}
+            decodes = [h.get("decode") for h in report["hours"]]
+            return summary, decodes
+
+        assert comparable(inline) == comparable(staged)
+
+    def test_stage_metrics_reported(self):
+        _, _, report = _run(decode_workers=2, diagnostics=True)
+
+        stages = report["summary"]["stages"]
+        assert stages["hours_staged"] == 24
+        assert 1 <= stages["max_queue_depth"] <= 4  # bounded at 2 × decode_workers
+        assert stages["decode_s_p50"] is not None
+        assert stages["backpressure_s_total"] >= 0
+        staged_hour = next(h for h in report["hours"] if h["hour_utc"].startswith("2025-01-15T10"))
+        assert staged_hour["stage"]["decode_s"] > 0
+
+
+class TestDecodeHourToBars:
+    def test_matches_inline_decode_and_aggregate(self):
+        from market_data_officer.feed.aggregate import ticks_to_1m_ohlcv
+        from market_data_officer.feed.decode import decode_with_diagnostics
+
+        meta = INSTRUMENTS["EURUSD"]
+        hour = DAY + timedelta(hours=9)
+        payload = _hour_payload(9)
+
+        bars, stats, elapsed = decode_hour_to_bars(payload, hour, meta)
+        ticks, expected_stats = decode_with_diagnostics(payload, hour, meta)
+
+        pd.testing.assert_frame_equal(bars, ticks_to_1m_ohlcv(ticks))
+        assert stats == expected_stats
+        assert elapsed >= 0
+
+    def test_corrupt_payload_yields_no_bars(self):
+        bars, stats, _ = decode_hour_to_bars(b"garbage", DAY, INSTRUMENTS["EURUSD"])
+        assert bars.empty
+        assert stats.tick_count == 0
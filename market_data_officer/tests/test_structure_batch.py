@@ -0,0 +1,169 @@
+"""Tests for the multi-instrument batch Structure Engine."""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_data_officer.benchmarks.synthetic import SCENARIOS
+from market_data_officer.feed.export import export_hot_packages
+from market_data_officer.structure.batch import (
+    BarStack,
+    batch_pivots,
+    compute_structure_packets,
+    load_bar_stack,
+)
+from market_data_officer.structure.config import StructureConfig
+from market_data_officer.structure.engine import compute_structure_packet, run_engine
+from market_data_officer.structure.imbalance import process_imbalance
+from market_data_officer.structure.swings import detect_swings
+from market_data_officer.tests.conftest import best_of
+
+
+def _packet_json(packet) -> str:
+    d = packet.to_dict()
+    d.pop("as_of")
+    return json.dumps(d)
+
+
+@pytest.fixture(scope="module")
+def frames():
+    """Instruments with different lengths, gaps, calendars and one too-short series."""
+    return {
+        "EURUSD": SCENARIOS["trending"](3000, seed=1),
+        "GBPUSD": SCENARIOS["gappy"](2500, seed=2),
+        "XAUUSD": SCENARIOS["weekend"](3000, seed=3) * [2000, 2000, 2000, 2000, 1],
+        "USDJPY": SCENARIOS["ranging"](1800, seed=4),
+        "AUDUSD": SCENARIOS["trending"](5, seed=5),
+    }
+
+
+@pytest.fixture(scope="module")
+def config():
+    return StructureConfig(timeframes=["15m"])
+
+
+class TestBarStack:
+
+    def test_aligned_on_union_grid(self, frames):
+        stack = BarStack.from_frames(frames, "15m")
+        assert stack.instruments == list(frames)
+        assert stack.timestamps.is_monotonic_increasing and str(stack.timestamps.tz) == "UTC"
+        assert list(stack.lengths) == [len(f) for f in frames.values()]
+        for c in ("high", "close"):
+            assert np.isnan(stack.values[c][~stack.present]).all()
+            assert not np.isnan(stack.values[c][stack.present]).any()
+
+    @pytest.mark.parametrize("row", range(5))
+    def test_frame_round_trip(self, frames, row):
+        stack = BarStack.from_frames(frames, "15m")
+        original = list(frames.values())[row]
+        pd.testing.assert_frame_equal(stack.frame(row), original, check_index_type=False, check_freq=False)
+
+    def test_rejects_unsorted_or_incomplete(self, frames):
+        bars = frames["EURUSD"]
+        with pytest.raises(ValueError):
+            BarStack.from_frames({"EURUSD": bars.iloc[::-1]}, "15m")
+        with pytest.raises(ValueError):
+            BarStack.from_frames({"EURUSD": bars.drop(columns="volume")}, "15m")
+
+    def test_load_reports_missing_packages(self, tmp_path, frames):
+        export_hot_packages({"15m": frames["EURUSD"]}, "EURUSD", output_dir=tmp_path)
+        stack, errors = load_bar_stack(["EURUSD", "GBPUSD"], "15m", packages_dir=tmp_path)
+        assert stack.instruments == ["EURUSD"]
+        assert isinstance(errors["GBPUSD"], FileNotFoundError)
+
+
+class TestKernels:
+
+    def test_pivots_match_detect_swings(self, frames, config):
+        stack = BarStack.from_frames(frames, "15m")
+        highs, lows = batch_pivots(stack, config)
+        for row, bars in enumerate(frames.values()):
+            swings = detect_swings(bars, config, timeframe="15m")
+            anchors = bars.index.get_indexer([s.anchor_time for s in swings])
+            types = [s.type for s in swings]
+            assert sorted(anchors[[t == "swing_high" for t in types]]) == highs[row].tolist()
+            assert sorted(anchors[[t == "swing_low" for t in types]]) == lows[row].tolist()
+
+
+class TestPackets:
+
+    def test_match_single_instrument_engine(self, frames, config):
+        packets = compute_structure_packets(BarStack.from_frames(frames, "15m"), config)
+        assert list(packets) == list(frames)
+        for instrument, bars in frames.items():
+            expected = compute_structure_packet(instrument, "15m", config, bars=bars)
+            assert _packet_json(packets[instrument]) == _packet_json(expected), instrument
+        # The fixture exercises every fill state
+        statuses = {z.status for p in packets.values() for z in p.imbalance}
+        assert statuses == {"open", "partially_filled", "invalidated"}
+
+    def test_nan_closes_match(self, frames, config):
+        bars = frames["EURUSD"].copy()
+        bars.iloc[100:400:7, bars.columns.get_loc("close")] = np.nan
+        packets = compute_structure_packets(BarStack.from_frames({"EURUSD": bars}, "15m"), config)
+        expected_zones, _ = process_imbalance(bars, config, instrument="EURUSD", timeframe="15m")
+        assert [z.to_dict() for z in packets["EURUSD"].imbalance] == [z.to_dict() for z in expected_zones]
+
+
+class TestRunEngineBatch:
+
+    @pytest.fixture
+    def packages(self, tmp_path, frames):
+        packages = tmp_path / "packages"
+        for instrument in ("EURUSD", "GBPUSD", "XAUUSD"):
+            bars = frames[instrument]
+            export_hot_packages({"15m": bars, "1h": bars.iloc[::4]}, instrument, output_dir=packages)
+        return packages
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_per_task_run(self, tmp_path, packages, workers):
+        config = StructureConfig(timeframes=["15m", "1h"])
+        instruments = ["EURUSD", "GBPUSD", "XAUUSD", "USDJPY"]
+        serial = run_engine(instruments, config, packages_dir=packages, output_dir=tmp_path / "serial")
+        batch = run_engine(instruments, config, packages_dir=packages, output_dir=tmp_path / "batch",
+                           batch=True, workers=workers)
+
+        assert list(batch) == list(serial)
+        for key, result in batch.items():
+            assert result.status == serial[key].status
+            if result.status == "ok":
+                assert result.wall_s > 0
+                assert _packet_json(result.packet) == _packet_json(serial[key].packet)
+        assert batch["USDJPY_1h"].status == "skipped"
+        assert len(list((tmp_path / "batch").glob("*.json"))) == 6
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_unexpected_load_exception_isolated(self, tmp_path, packages, workers):
+        # Reading a directory raises IsADirectoryError: neither skipped nor invalid bars
+        (packages / "GBPUSD_1h_latest.npy").unlink()
+        (packages / "GBPUSD_1h_latest.csv").unlink()
+        (packages / "GBPUSD_1h_latest.csv").mkdir()
+
+        results = run_engine(["EURUSD", "GBPUSD", "XAUUSD"], StructureConfig(timeframes=["15m", "1h"]),
+                             packages_dir=packages, output_dir=tmp_path, batch=True, workers=workers)
+
+        assert {k: r.status for k, r in results.items() if r.status != "ok"} == {"GBPUSD_1h": "failed"}
+        assert results["GBPUSD_1h"].error.startswith("IsADirectoryError")
+
+    def test_incremental_state_rejected(self, tmp_path, packages):
+        with pytest.raises(ValueError):
+            run_engine(["EURUSD"], StructureConfig(timeframes=["15m"]), packages_dir=packages,
+                       state_dir=tmp_path / "state", batch=True)
+
+
+@pytest.mark.speedup
+class TestBenchmark:
+
+    def test_batch_beats_per_instrument_loop(self, config):
+        frames = {f"SYM{i}": SCENARIOS[name](20_000, seed=i)
+                  for i, name in enumerate(["trending", "gappy", "weekend", "ranging", "trending", "gappy"])}
+
+        loop = best_of(lambda: [compute_structure_packet(i, "15m", config, bars=b) for i, b in frames.items()],
+                       repeats=2)
+        batch = best_of(lambda: compute_structure_packets(BarStack.from_frames(frames, "15m"), config), repeats=2)
+        print(f"\n[bench] {len(frames)} instruments x 20k bars: per-instrument {loop * 1000:.0f}ms, "
+              f"batch {batch * 1000:.0f}ms")
+        assert batch < loop
@@ -0,0 +1,187 @@
+"""Tests for the compact structure packet sidecar and the cached reader."""
+
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_data_officer.structure import codec, reader
+from market_data_officer.structure.config import StructureConfig
+from market_data_officer.structure.engine import compute_structure_packet
+from market_data_officer.structure.io import get_output_path, write_packet_atomic
+from market_data_officer.structure.reader import (
+    load_structure_packet,
+    load_structure_summary,
+    structure_is_available,
+)
+from market_data_officer.tests.conftest import best_of
+
+AVAILABLE_CODECS = ["json"] + [name for name, module in (("orjson", codec.orjson), ("msgpack", codec.msgpack))
+                               if module is not None]
+
+
+def _random_walk_bars(periods: int, seed: int, freq: str = "15min") -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = (1.085 + np.cumsum(rng.normal(0, 0.0008, periods))).round(4)
+    idx = pd.date_range(datetime(2026, 1, 5, 21, 0, tzinfo=timezone.utc), periods=periods, freq=freq, tz="UTC")
+    open_ = np.concatenate(([1.085], close[:-1]))
+    return pd.DataFrame({
+        "open": open_,
+        "high": np.maximum(open_, close) + rng.uniform(0, 0.0015, periods).round(4),
+        "low": np.minimum(open_, close) - rng.uniform(0, 0.0015, periods).round(4),
+        "close": close,
+        "volume": 100.0,
+    }, index=idx)
+
+
+@pytest.fixture(scope="module")
+def raw_packet():
+    """packet.to_dict() as the engine writes it, NumPy scalars included."""
+    packet = compute_structure_packet("EURUSD", "15m", StructureConfig(timeframes=["15m"]),
+                                      bars=_random_walk_bars(3000, 1))
+    return packet.to_dict()
+
+
+@pytest.fixture(scope="module")
+def packet_dict(raw_packet):
+    return json.loads(json.dumps(raw_packet, default=codec.json_default))
+
+
+def _write(packet: dict, output_dir, timeframe="15m", as_of=None) -> str:
+    packet = {**packet, "timeframe": timeframe, "as_of": as_of or datetime.now(timezone.utc).isoformat()}
+    path = get_output_path("EURUSD", timeframe, output_dir=output_dir)
+    write_packet_atomic(packet, path)
+    return path
+
+
+class TestSidecar:
+
+    def test_written_next_to_json(self, tmp_path, packet_dict):
+        path = _write(packet_dict, tmp_path)
+        sidecar = codec.sidecar_path(path)
+        with open(path, encoding="utf-8") as f:
+            pretty = json.load(f)
+
+        assert sidecar.name == "eurusd_15m_structure.pkt"
+        assert codec.read_packet_sidecar(sidecar) == pretty
+        header = codec.read_packet_header(sidecar)
+        assert header["codec"] == codec.default_codec()
+        assert header["as_of"] == pretty["as_of"] and header["schema_version"] == pretty["schema_version"]
+        assert sidecar.stat().st_size < os.path.getsize(path)
+        assert not list(tmp_path.glob("*.tmp"))
+
+    @pytest.mark.parametrize("name", AVAILABLE_CODECS)
+    def test_codec_round_trip(self, tmp_path, packet_dict, name):
+        path = codec.write_packet_sidecar(packet_dict, tmp_path / "p.json", codec=name)
+        assert codec.read_packet_header(path)["codec"] == name
+        assert codec.read_packet_sidecar(path) == packet_dict
+
+    @pytest.mark.parametrize("name", AVAILABLE_CODECS)
+    def test_numpy_scalars_decode_like_json(self, tmp_path, raw_packet, name):
+        assert any(isinstance(v, np.generic) for zone in raw_packet["imbalance"] for v in zone.values())
+        path = get_output_path("EURUSD", "15m", output_dir=tmp_path)
+        write_packet_atomic(raw_packet, path)
+        sidecar = codec.write_packet_sidecar(raw_packet, path, codec=name)
+        with open(path, encoding="utf-8") as f:
+            pretty = json.load(f)
+        decoded = codec.read_packet_sidecar(sidecar)
+        assert decoded == pretty
+        zone = decoded["imbalance"][0]
+        assert isinstance(zone["zone_high"], float) and isinstance(zone["zone_size"], float)
+
+    def test_foreign_or_newer_version_ignored(self, tmp_path, packet_dict):
+        path = codec.write_packet_sidecar(packet_dict, tmp_path / "p.json")
+        data = path.read_bytes()
+        path.write_bytes(data[:4] + (codec.PACKET_FORMAT_VERSION + 1).to_bytes(2, "little") + data[6:])
+        assert codec.read_packet_header(path) is None
+        assert codec.read_packet_sidecar(path) is None
+        path.write_bytes(b"{}")
+        assert codec.read_packet_sidecar(path) is None
+        assert codec.read_packet_sidecar(tmp_path / "missing.pkt") is None
+
+
+class TestCachedReader:
+
+    def test_reads_reuse_parsed_packet(self, tmp_path, packet_dict):
+        _write(packet_dict, tmp_path)
+        first = load_structure_packet("EURUSD", "15m", output_dir=tmp_path)
+        assert first["swings"] == packet_dict["swings"]
+        assert load_structure_packet("EURUSD", "15m", output_dir=tmp_path) is first
+
+    def test_rewrite_invalidates(self, tmp_path, packet_dict):
+        _write(packet_dict, tmp_path)
+        first = load_structure_packet("EURUSD", "15m", output_dir=tmp_path)
+        _write({**packet_dict, "swings": []}, tmp_path)
+        assert load_structure_packet("EURUSD", "15m", output_dir=tmp_path)["swings"] == []
+        assert first["swings"]
+
+    def test_stale_sidecar_falls_back_to_json(self, tmp_path, packet_dict):
+        path = _write(packet_dict, tmp_path)
+        # A writer that only knows the JSON has replaced it since
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({**packet_dict, "swings": []}, f)
+        os.utime(codec.sidecar_path(path), ns=(1, 1))
+        assert load_structure_packet("EURUSD", "15m", output_dir=tmp_path)["swings"] == []
+
+    def test_freshness_reads_header_only(self, tmp_path, packet_dict, monkeypatch):
+        stale = (datetime.now(timezone.utc) - timedelta(hours=5)).isoformat()
+        _write(packet_dict, tmp_path, timeframe="1h", as_of=stale)
+        _write(packet_dict, tmp_path, timeframe="4h")
+        reader.clear_packet_cache()
+
+        def no_body(*args, **kwargs):
+            raise AssertionError("packet body read")
+
+        monkeypatch.setattr(reader, "read_packet_sidecar", no_body)
+        monkeypatch.setattr(reader.json, "load", no_body)
+        assert structure_is_available("EURUSD", timeframes=("1h", "4h"), output_dir=tmp_path)
+        assert not structure_is_available("EURUSD", timeframes=("15m", "1h"), output_dir=tmp_path)
+
+    def test_summary_decodes_each_packet_once(self, tmp_path, packet_dict, monkeypatch):
+        for tf in ("15m", "1h", "4h"):
+            _write(packet_dict, tmp_path, timeframe=tf)
+        reader.clear_packet_cache()
+        decoded = []
+        real = reader.read_packet_sidecar
+        monkeypatch.setattr(reader, "read_packet_sidecar", lambda path: decoded.append(path) or real(path))
+
+        for _ in range(3):
+            assert structure_is_available("EURUSD", output_dir=tmp_path)
+            assert set(load_structure_summary("EURUSD", output_dir=tmp_path)) == {"15m", "1h", "4h"}
+        assert len(decoded) == 3
+
+    def test_cache_is_bounded_and_forgets_deleted_files(self, tmp_path, packet_dict, monkeypatch):
+        monkeypatch.setattr(reader, "PACKET_CACHE_SIZE", 2)
+        reader.clear_packet_cache()
+        paths = [_write(packet_dict, tmp_path, timeframe=tf) for tf in ("15m", "1h", "4h")]
+        for tf in ("15m", "1h", "4h"):
+            load_structure_packet("EURUSD", tf, output_dir=tmp_path)
+        assert list(reader._PACKET_CACHE) == [reader._packet_path("EURUSD", tf, tmp_path) for tf in ("1h", "4h")]
+        os.remove(paths[2])
+        assert load_structure_packet("EURUSD", "4h", output_dir=tmp_path) is None
+        assert list(reader._PACKET_CACHE) == [reader._packet_path("EURUSD", "1h", tmp_path)]
+
+
+@pytest.mark.speedup
+class TestBenchmark:
+
+    def test_cached_and_header_reads_beat_json_parse(self, tmp_path, packet_dict):
+        path = _write(packet_dict, tmp_path)
+
+        def parse_json():
+            with open(path, encoding="utf-8") as f:
+                json.load(f)
+
+        json_time = best_of(parse_json, repeats=5)
+        sidecar_time = best_of(lambda: codec.read_packet_sidecar(codec.sidecar_path(path)), repeats=5)
+        header_time = best_of(lambda: structure_is_available("EURUSD", timeframes=("15m",), output_dir=tmp_path),
+                              repeats=5)
+        cached_time = best_of(lambda: load_structure_packet("EURUSD", "15m", output_dir=tmp_path), repeats=5)
+        print(f"\n[bench] {os.path.getsize(path) // 1024}KB packet: json {json_time * 1000:.2f}ms, "
+              f"sidecar ({codec.default_codec()}) {sidecar_time * 1000:.2f}ms, "
+              f"freshness {header_time * 1000:.3f}ms, cached read {cached_time * 1000:.3f}ms")
+        assert header_time * 10 < json_time
+        assert cached_time * 10 < json_time
@@ -4,13 +4,16 @@ Tests BOS close-confirmation, wick-only rejection, MSS directional
 transitions, and event ordering constraints.
 """
 
+import time
 from datetime import datetime, timezone
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from market_data_officer.structure.config import StructureConfig
 from market_data_officer.structure.events import detect_events
+from market_data_officer.structure.schemas import StructureEvent
 from market_data_officer.structure.swings import detect_swings
 
 
@@ -158,3 +161,84 @@ class TestGroupB_BOS_MSS:
             if ref_swing:
                 assert event.time >= ref_swing.confirm_time, \
                     f"BOS {event.id} fires before reference swing confirmed"
+
+
+def _reference_detect_events(bars: pd.DataFrame, swings: list, timeframe: str) -> list:
+    """Per-bar rescan of all swings — the O(bars × swings) detector the sweep replaced."""
+    highs = sorted([s for s in swings if s.type == "swing_high"], key=lambda s: s.confirm_time)
+    lows = sorted([s for s in swings if s.type == "swing_low"], key=lambda s: s.confirm_time)
+    bias, broken, events = None, set(), []
+    for ts, close in zip(bars.index, bars["close"].values):
+        bar_time, bar_close = ts.to_pydatetime(), float(close)
+        active = [
+            next((s for s in reversed(side) if s.confirm_time < bar_time and s.id not in broken), None)
+            for side in (highs, lows)
+        ]
+        for swing, broke, direction, opposite in (
+            (active[0], lambda c, p: c > p, "bull", "bearish"),
+            (active[1], lambda c, p: c < p, "bear", "bullish"),
+        ):
+            if swing and broke(bar_close, swing.price):
+                event_type = f"mss_{direction}" if bias == opposite else f"bos_{direction}"
+                events.append(StructureEvent(
+                    id=f"ev_{timeframe}_{bar_time.strftime('%Y%m%dT%H%M')}_{event_type}",
+                    type=event_type,
+                    time=bar_time,
+                    timeframe=timeframe,
+                    reference_swing_id=swing.id,
+                    reference_price=swing.price,
+                    break_close=bar_close,
+                    prior_bias=opposite if bias == opposite else None,
+                    status="confirmed",
+                ))
+                broken.add(swing.id)
+                bias = "bullish" if direction == "bull" else "bearish"
+    events.sort(key=lambda e: e.time)
+    return events
+
+
+def _random_walk(periods: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 1.08 + np.cumsum(rng.normal(0, 0.0004, periods)).round(5)
+    idx = pd.date_range("2025-01-06", periods=periods, freq="15min", tz="UTC")
+    return pd.DataFrame(
+        {
+            "open": np.concatenate(([1.08], close[:-1])),
+            "high": close + rng.uniform(0, 0.0006, periods).round(5),
+            "low": close - rng.uniform(0, 0.0006, periods).round(5),
+            "close": close,
+            "volume": 100.0,
+        },
+        index=idx,
+    )
+
+
+class TestForwardSweepParity:
+    """The active-swing sweep must emit exactly the per-bar rescan's events."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    @pytest.mark.parametrize("pivots", [(3, 3), (1, 1), (5, 2)])
+    def test_matches_reference(self, seed, pivots):
+        config = StructureConfig(pivot_left_bars=pivots[0], pivot_right_bars=pivots[1])
+        bars = _random_walk(2000, seed)
+        swings = detect_swings(bars, config, "15m")
+        expected = [e.to_dict() for e in _reference_detect_events(bars, swings, "15m")]
+        assert [e.to_dict() for e in detect_events(bars, swings, config, "15m")] == expected
+
+    @pytest.mark.speedup
+    def test_benchmark_scales_linearly(self):
+        config = StructureConfig()
+        bars = _random_walk(20_000, 9)
+        swings = detect_swings(bars, config, "15m")
+
+        t0 = time.perf_counter()
+        fast = detect_events(bars, swings, config, "15m")
+        fast_time = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        slow = _reference_detect_events(bars, swings, "15m")
+        slow_time = time.perf_counter() - t0
+
+        print(f"\n[bench] detect_events 20k bars, {len(swings)} swings: "
+              f"rescan {slow_time * 1000:.0f}ms, sweep {fast_time * 1000:.0f}ms")
+        assert [e.to_dict() for e in fast] == [e.to_dict() for e in slow]
+        assert fast_time * 5 < slow_time
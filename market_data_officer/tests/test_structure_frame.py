@@ -0,0 +1,120 @@
+"""Tests for the columnar structure frame."""
+
+import json
+import pickle
+import sys
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_data_officer.structure.config import StructureConfig
+from market_data_officer.structure.engine import compute_structure_packet
+from market_data_officer.structure.frame import StructureFrame
+from market_data_officer.structure.schemas import LiquidityLevel, SwingPoint
+from market_data_officer.tests.conftest import best_of
+
+
+def _random_walk_bars(periods: int, seed: int, freq: str = "15min") -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = (1.085 + np.cumsum(rng.normal(0, 0.0008, periods))).round(4)
+    idx = pd.date_range(datetime(2026, 1, 5, 21, 0, tzinfo=timezone.utc), periods=periods, freq=freq, tz="UTC")
+    open_ = np.concatenate(([1.085], close[:-1]))
+    return pd.DataFrame({
+        "open": open_,
+        "high": np.maximum(open_, close) + rng.uniform(0, 0.0015, periods).round(4),
+        "low": np.minimum(open_, close) - rng.uniform(0, 0.0015, periods).round(4),
+        "close": close,
+        "volume": 100.0,
+    }, index=idx)
+
+
+@pytest.fixture(scope="module")
+def packet():
+    config = StructureConfig(timeframes=["15m"])
+    return compute_structure_packet("EURUSD", "15m", config, bars=_random_walk_bars(6000, 1))
+
+
+def _deep_size(obj, seen=None) -> int:
+    """Bytes reachable from ``obj``, counting shared objects once."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen or obj is None or isinstance(obj, type):
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, np.ndarray):
+        if obj.dtype == object:
+            size += sum(_deep_size(v, seen) for v in obj.ravel())
+    elif isinstance(obj, dict):
+        size += sum(_deep_size(k, seen) + _deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(_deep_size(v, seen) for v in obj)
+    elif hasattr(obj, "__slots__"):
+        size += sum(_deep_size(getattr(obj, name, None), seen) for name in obj.__slots__)
+    return size
+
+
+class TestFrame:
+
+    def test_to_dict_matches_packet(self, packet):
+        frame = StructureFrame.from_packet(packet)
+        assert json.dumps(frame.to_dict()) == json.dumps(packet.to_dict())
+
+    def test_round_trips_through_json(self, packet):
+        data = json.loads(json.dumps(packet.to_dict()))
+        frame = StructureFrame.from_dict(data)
+        assert json.dumps(frame.to_dict()) == json.dumps(data)
+        assert json.dumps(frame.to_packet().to_dict()) == json.dumps(data)
+
+    def test_object_views(self, packet):
+        frame = StructureFrame.from_packet(packet)
+        assert len(frame.swings) == len(packet.swings)
+        assert frame.swings[0] == packet.swings[0]
+        assert list(frame.liquidity) == packet.liquidity
+        assert frame.swings[-1] is frame.swings[-1]
+        assert frame.active_zones["zones"][0] is frame.imbalance[frame.active_zone_index[0]]
+        assert frame.to_packet().sweep_events == packet.sweep_events
+
+    def test_optional_fields_and_members(self):
+        t = datetime(2026, 1, 6, 9, 30, 15, 250000, tzinfo=timezone.utc)
+        levels = [
+            LiquidityLevel("liq_a", "equal_highs", 1.1, t, "1h",
+                           member_swing_ids=["sw_1", "sw_2"], tolerance_used=0.0001),
+            LiquidityLevel("liq_b", "prior_day_high", 1.2, t, "1h", status="swept",
+                           swept_time=t, reclaim_window_bars=3, outcome="reclaimed"),
+        ]
+        swings = [SwingPoint("sw_1", "swing_high", 1.1, t, t, "1h")]
+        packet = compute_structure_packet("EURUSD", "1h", StructureConfig(), bars=_random_walk_bars(50, 2, "1h"))
+        packet.swings, packet.liquidity = swings, levels
+
+        frame = StructureFrame.from_packet(packet)
+        assert json.dumps(frame.to_dict()) == json.dumps(packet.to_dict())
+        assert list(frame.liquidity) == levels
+        assert frame.liquidity[1].tolerance_used is None
+
+    def test_pickle_drops_views(self, packet):
+        frame = StructureFrame.from_packet(packet)
+        list(frame.swings)
+        restored = pickle.loads(pickle.dumps(frame))
+        assert restored.swings._views is None
+        assert list(restored.swings) == packet.swings
+
+
+@pytest.mark.speedup
+class TestBenchmark:
+
+    def test_smaller_and_faster_to_serialize(self, packet):
+        frame = StructureFrame.from_packet(packet)
+        objects = _deep_size([packet.swings, packet.events, packet.liquidity,
+                              packet.sweep_events, packet.imbalance])
+        columns = _deep_size([frame.swings.columns, frame.events.columns, frame.liquidity.columns,
+                              frame.sweep_events.columns, frame.imbalance.columns])
+
+        packet_time = best_of(packet.to_dict, repeats=5)
+        frame_time = best_of(frame.to_dict, repeats=5)
+        print(f"\n[bench] {sum(map(len, (frame.swings, frame.events, frame.liquidity, frame.sweep_events, frame.imbalance)))} entities: "
+              f"objects {objects / 1e6:.2f}MB, columns {columns / 1e6:.2f}MB; "
+              f"to_dict {packet_time * 1000:.1f}ms vs {frame_time * 1000:.1f}ms")
+        assert columns * 3 < objects
+        assert frame_time * 2.5 < packet_time
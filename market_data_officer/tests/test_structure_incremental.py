@@ -0,0 +1,241 @@
+"""Tests for the incremental structure engine."""
+
+import json
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_data_officer.feed.export import export_hot_packages
+from market_data_officer.structure.config import StructureConfig
+from market_data_officer.structure.engine import compute_structure_packet, run_engine
+from market_data_officer.structure.incremental import IncrementalStructureEngine
+from market_data_officer.structure.io import load_bars
+
+
+@pytest.fixture
+def config():
+    return StructureConfig(pivot_left_bars=3, pivot_right_bars=3)
+
+
+def _random_walk_bars(days: int, seed: int, freq: str = "1h") -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    periods = days * int(pd.Timedelta("1D") / pd.Timedelta(freq))
+    close = (1.085 + np.cumsum(rng.normal(0, 0.0008, periods))).round(4)
+    idx = pd.date_range(datetime(2026, 1, 5, 21, 0, tzinfo=timezone.utc), periods=periods, freq=freq, tz="UTC")
+    open_ = np.concatenate(([1.085], close[:-1]))
+    return pd.DataFrame({
+        "open": open_,
+        "high": np.maximum(open_, close) + rng.uniform(0, 0.0015, periods).round(4),
+        "low": np.minimum(open_, close) - rng.uniform(0, 0.0015, periods).round(4),
+        "close": close,
+        "volume": 100.0,
+    }, index=idx)
+
+
+def _packet_json(packet) -> str:
+    d = packet.to_dict()
+    d.pop("as_of")
+    return json.dumps(d)
+
+
+def _assert_matches_full(packet, bars, config, timeframe="1h"):
+    expected = compute_structure_packet("EURUSD", timeframe, config, bars=bars)
+    assert _packet_json(packet) == _packet_json(expected)
+
+
+def _export(bars: pd.DataFrame, packages) -> None:
+    export_hot_packages({"1h": bars}, "EURUSD", output_dir=packages)
+
+
+def _engine(tmp_path, config, timeframe="1h", **kwargs):
+    kwargs.setdefault("retain_bars", 100_000)
+    return IncrementalStructureEngine("EURUSD", timeframe, config, state_dir=tmp_path / "state", **kwargs)
+
+
+class TestParity:
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_uneven_refreshes_match_full_recompute(self, tmp_path, config, seed):
+        bars = _random_walk_bars(18, seed)
+        engine = _engine(tmp_path, config)
+        engine.update(bars.iloc[:200])
+
+        hi = 200
+        for step, k in zip([1, 5, 2, 24, 3, 11] * 20, range(1000)):
+            if hi >= len(bars):
+                break
+            hi = min(hi + step, len(bars))
+            # Alternate hot-package-sized windows with just the new bars
+            window = bars.iloc[max(hi - 240, 0):hi] if k % 2 else bars.iloc[hi - step:hi]
+            packet = engine.update(window)
+            _assert_matches_full(packet, bars.iloc[:hi], config)
+
+        assert len(engine.bars) == len(bars)
+        assert packet.events and packet.sweep_events and packet.imbalance
+        statuses = {lv.status for lv in packet.liquidity}
+        assert {"reclaimed", "accepted_beyond"} <= statuses
+
+    def test_15m_single_bar_refreshes(self, tmp_path, config):
+        bars = _random_walk_bars(12, 5, freq="15min")
+        engine = _engine(tmp_path, config, timeframe="15m")
+        engine.update(bars.iloc[:900])
+        for hi in range(901, len(bars), 7):
+            packet = engine.update(bars.iloc[hi - 600:hi])
+        _assert_matches_full(packet, bars.iloc[:hi], config, timeframe="15m")
+
+    def test_forming_bar_revised_between_refreshes(self, tmp_path, config):
+        bars = _random_walk_bars(20, 6)
+        engine = _engine(tmp_path, config)
+        for hi in range(300, 340, 4):
+            forming = bars.iloc[:hi].copy()
+            forming.iloc[-1, forming.columns.get_loc("close")] += 0.004
+            forming.iloc[-1, forming.columns.get_loc("high")] += 0.004
+            _assert_matches_full(engine.update(forming), forming, config)
+            _assert_matches_full(engine.update(bars.iloc[:hi]), bars.iloc[:hi], config)
+
+    def test_revised_history_rebuilds(self, tmp_path, config):
+        bars = _random_walk_bars(20, 7)
+        engine = _engine(tmp_path, config)
+        engine.update(bars.iloc[:400])
+
+        revised = bars.iloc[:410].copy()
+        revised.iloc[350, revised.columns.get_loc("low")] -= 0.01
+        packet = engine.update(revised.iloc[300:])
+        assert engine.bars.iloc[350]["low"] == revised.iloc[350]["low"]
+        _assert_matches_full(packet, revised, config)
+
+    def test_packet_objects_not_shared_with_state(self, tmp_path, config):
+        bars = _random_walk_bars(20, 8)
+        engine = _engine(tmp_path, config)
+        packet = engine.update(bars.iloc[:400])
+        for swing in packet.swings:
+            swing.status = "mutated"
+        for zone in packet.imbalance:
+            zone.status = "mutated"
+        _assert_matches_full(engine.update(bars.iloc[:420]), bars.iloc[:420], config)
+
+
+class TestState:
+
+    def test_state_persisted_and_resumed(self, tmp_path, config):
+        bars = _random_walk_bars(20, 9)
+        engine = _engine(tmp_path, config)
+        engine.update(bars.iloc[:400])
+
+        saved = json.loads(engine.state_path.read_text())
+        assert saved["n_bars"] == 399
+        assert saved["bias"] in ("bullish", "bearish")
+        assert set(saved["active_swings"]) == {"high", "low"}
+
+        resumed = _engine(tmp_path, config)
+        assert resumed.state is not None and resumed.state.n_bars == 399
+        packet = resumed.update(bars.iloc[380:430])
+        _assert_matches_full(packet, bars.iloc[:430], config)
+
+    def test_resumed_after_forming_bar_refresh(self, tmp_path, config):
+        bars = _random_walk_bars(20, 17)
+        forming = bars.iloc[:400].copy()
+        forming.iloc[-1, forming.columns.get_loc("low")] -= 0.004
+        engine = _engine(tmp_path, config)
+        engine.update(bars.iloc[:400])
+        _assert_matches_full(engine.update(forming), forming, config)
+
+        resumed = _engine(tmp_path, config)
+        assert resumed.state.n_bars == 399
+        _assert_matches_full(resumed.update(bars.iloc[:401]), bars.iloc[:401], config)
+
+    def test_changed_config_discards_state(self, tmp_path, config):
+        bars = _random_walk_bars(10, 10)
+        _engine(tmp_path, config).update(bars)
+        assert _engine(tmp_path, StructureConfig(pivot_left_bars=2)).state is None
+
+    def test_unreadable_state_ignored(self, tmp_path, config):
+        bars = _random_walk_bars(10, 11)
+        engine = _engine(tmp_path, config)
+        engine.update(bars)
+        engine.state_path.write_text("{not json")
+        assert _engine(tmp_path, config).state is None
+
+    def test_recovery_rebuilds_from_hot_package(self, tmp_path, config):
+        bars = _random_walk_bars(20, 12)
+        packages = tmp_path / "packages"
+        export_hot_packages({"1h": bars}, "EURUSD", output_dir=packages)
+
+        engine = _engine(tmp_path, config, packages_dir=packages)
+        packet = engine.rebuild()
+        expected = compute_structure_packet("EURUSD", "1h", config, packages_dir=packages)
+        assert len(engine.bars) == 240
+        assert _packet_json(packet) == _packet_json(expected)
+
+    def test_kept_bars_bounded(self, tmp_path, config):
+        bars = _random_walk_bars(20, 13)
+        engine = _engine(tmp_path, config, retain_bars=100)
+        engine.update(bars.iloc[:100])
+        for hi in range(110, len(bars), 10):
+            # Just the new bars: the window is the last retain_bars of the series
+            packet = engine.update(bars.iloc[hi - 10:hi])
+            assert len(engine.bars) == 100
+            _assert_matches_full(packet, bars.iloc[hi - 100:hi], config)
+
+    def test_hot_package_exports_match_recompute(self, tmp_path, config):
+        bars = _random_walk_bars(20, 16)
+        forming = bars.iloc[:330].copy()
+        forming.iloc[-1, forming.columns.get_loc("close")] += 0.004
+        forming.iloc[-1, forming.columns.get_loc("high")] += 0.004
+        packages = tmp_path / "packages"
+        engine = IncrementalStructureEngine("EURUSD", "1h", config, state_dir=tmp_path / "state",
+                                            packages_dir=packages)
+
+        # Filling, then sliding, 240-bar hot windows
+        for series in (bars.iloc[:200], bars.iloc[:230], bars.iloc[:300], forming,
+                       bars.iloc[:330], bars.iloc[:331], bars.iloc[:400]):
+            _export(series, packages)
+            packet = engine.update(load_bars("EURUSD", "1h", packages))
+            expected = compute_structure_packet("EURUSD", "1h", config, packages_dir=packages)
+            assert len(engine.bars) == min(len(series), 240)
+            assert _packet_json(packet) == _packet_json(expected)
+
+    def test_run_engine_incremental(self, tmp_path, config):
+        bars = _random_walk_bars(20, 14)
+        packages, output = tmp_path / "packages", tmp_path / "output"
+        single_tf = StructureConfig(timeframes=["1h"])
+
+        for n in (200, 300, 330, 400):
+            _export(bars.iloc[:n], packages)
+            results = run_engine(["EURUSD"], single_tf, packages_dir=packages, output_dir=output,
+                                 state_dir=tmp_path / "state")
+            full = compute_structure_packet("EURUSD", "1h", single_tf, packages_dir=packages)
+            assert _packet_json(results["EURUSD_1h"].packet) == _packet_json(full), n
+            assert results["EURUSD_1h"].packet.diagnostics["bars_processed"] == min(n, 240)
+        assert (tmp_path / "state" / "EURUSD_1h_state.json").exists()
+        assert (output / "eurusd_1h_structure.json").exists()
+
+
+@pytest.mark.speedup
+class TestBenchmark:
+
+    def test_forming_bar_refresh_cheaper_than_recompute(self, tmp_path, config):
+        bars = _random_walk_bars(40, 15, freq="15min")
+        engine = _engine(tmp_path, config, timeframe="15m", retain_bars=None)
+        window = bars.iloc[2400:3000].copy()
+        engine.update(window)
+
+        incremental, full = [], []
+        for k in range(10):
+            # Same hot window, only the forming bar revised
+            window.iloc[-1, window.columns.get_loc("close")] = window["close"].iloc[-1] + 0.0001 * (k % 3 - 1)
+            window.iloc[-1, window.columns.get_loc("high")] = window[["open", "close", "high"]].iloc[-1].max()
+            window.iloc[-1, window.columns.get_loc("low")] = window[["open", "close", "low"]].iloc[-1].min()
+            t0 = time.perf_counter()
+            engine.update(window)
+            incremental.append(time.perf_counter() - t0)
+            t0 = time.perf_counter()
+            compute_structure_packet("EURUSD", "15m", config, bars=window)
+            full.append(time.perf_counter() - t0)
+
+        print(f"\n[bench] forming-bar refresh over {len(engine.bars)} 15m bars: "
+              f"full recompute {min(full) * 1000:.1f}ms, incremental {min(incremental) * 1000:.1f}ms")
+        assert min(incremental) * 1.5 < min(full)
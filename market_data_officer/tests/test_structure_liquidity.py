@@ -5,7 +5,10 @@ instrument-specific tolerance, reclaim detection, post-sweep
 classification, lifecycle, internal/external tagging, and replay.
 """
 
+import json
+import time
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -17,7 +20,7 @@ from market_data_officer.structure.liquidity import (
     detect_liquidity,
     _detect_reclaim,
 )
-from market_data_officer.structure.schemas import LiquidityLevel, SwingPoint
+from market_data_officer.structure.schemas import LiquidityLevel, SweepEvent, SwingPoint
 from market_data_officer.structure.swings import detect_swings
 
 
@@ -647,3 +650,135 @@ class TestGroup3B_E_Determinism:
         for lid, outcome in resolved_before.items():
             if lid in resolved_after:
                 assert resolved_after[lid] == outcome
+
+
+# ── Sorted-level sweep engine parity ────────────────────────────────────
+
+def _reference_reclaim(level_price, level_type, sweep_bar_index, bars, config):
+    """iterrows() reclaim check the array lookup replaced."""
+    is_high_side = level_type in {"prior_day_high", "prior_week_high", "equal_highs"}
+    window_start = sweep_bar_index if config.allow_same_bar_reclaim else sweep_bar_index + 1
+    window_end = sweep_bar_index + config.reclaim_window_bars + 1
+    window_bars = bars.iloc[window_start:window_end]
+    if window_bars.empty:
+        return "unresolved", None, None
+    for _, bar in window_bars.iterrows():
+        if (bar["close"] < level_price) if is_high_side else (bar["close"] > level_price):
+            return "reclaimed", bar.name.to_pydatetime(), float(bar["close"])
+    if len(bars) > window_end:
+        return "accepted_beyond", None, float(bars.iloc[window_end - 1]["close"])
+    return "unresolved", None, None
+
+
+def _reference_sweeps(bars, levels, timeframe, config):
+    """Level × bar scan the single-pass engine replaced."""
+    events = []
+    for level in levels:
+        is_high = level.type in ("prior_day_high", "prior_week_high", "equal_highs")
+        is_low = level.type in ("prior_day_low", "prior_week_low", "equal_lows")
+        if level.status != "active" or not (is_high or is_low):
+            continue
+        closes, extremes = bars["close"].values, bars["high" if is_high else "low"].values
+        for bar_idx in range(len(bars)):
+            bar_time = bars.index[bar_idx].to_pydatetime()
+            if bar_time <= level.origin_time:
+                continue
+            close, extreme = float(closes[bar_idx]), float(extremes[bar_idx])
+            if (close > level.price) if is_high else (close < level.price):
+                sweep_price, sweep_type = close, "close_sweep"
+            elif (extreme > level.price) if is_high else (extreme < level.price):
+                sweep_price, sweep_type = extreme, "wick_sweep"
+            else:
+                continue
+            outcome, reclaim_time, post_close = _reference_reclaim(level.price, level.type, bar_idx, bars, config)
+            level.status = {"reclaimed": "reclaimed", "accepted_beyond": "accepted_beyond"}.get(outcome, "swept")
+            level.swept_time, level.sweep_type = bar_time, sweep_type
+            level.reclaim_window_bars = config.reclaim_window_bars
+            level.outcome, level.reclaim_time = outcome, reclaim_time
+            events.append(SweepEvent(
+                id=f"swp_{timeframe}_{bar_time.strftime('%Y%m%dT%H%M')}_{level.id.split('_')[2]}",
+                type="sweep_high" if is_high else "sweep_low",
+                time=bar_time,
+                timeframe=timeframe,
+                liquidity_level_id=level.id,
+                sweep_price=sweep_price,
+                sweep_type=sweep_type,
+                status="confirmed",
+                linked_liquidity_id=level.id,
+                post_sweep_close=post_close,
+                reclaim_time=reclaim_time,
+                outcome=outcome,
+                reclaim_window_bars=config.reclaim_window_bars,
+            ))
+            break
+    return events
+
+
+def _random_walk_bars(days: int, seed: int, freq: str = "1h") -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    periods = days * int(pd.Timedelta("1D") / pd.Timedelta(freq))
+    close = (1.085 + np.cumsum(rng.normal(0, 0.0008, periods))).round(4)
+    idx = pd.date_range(datetime(2026, 1, 5, 21, 0, tzinfo=timezone.utc), periods=periods, freq=freq, tz="UTC")
+    return pd.DataFrame({
+        "open": np.concatenate(([1.085], close[:-1])),
+        "high": close + rng.uniform(0, 0.0015, periods).round(4),
+        "low": close - rng.uniform(0, 0.0015, periods).round(4),
+        "close": close,
+        "volume": 100.0,
+    }, index=idx)
+
+
+def _liquidity_json(bars, config, timeframe):
+    swings = detect_swings(bars, config, timeframe)
+    levels, sweeps = detect_liquidity(bars, swings, config, timeframe)
+    return json.dumps([lv.to_dict() for lv in levels]), json.dumps([sw.to_dict() for sw in sweeps])
+
+
+class TestGroup3B_F_SweepEngineParity:
+
+    @pytest.mark.parametrize("seed", range(4))
+    @pytest.mark.parametrize("reclaim", [(True, 1), (False, 3)])
+    def test_matches_reference(self, seed, reclaim):
+        config = StructureConfig(allow_same_bar_reclaim=reclaim[0], reclaim_window_bars=reclaim[1])
+        bars = _random_walk_bars(20, seed)
+        actual = _liquidity_json(bars, config, "1h")
+        with patch("market_data_officer.structure.liquidity._detect_sweeps", _reference_sweeps), \
+             patch("market_data_officer.structure.liquidity._detect_reclaim", _reference_reclaim):
+            expected = _liquidity_json(bars, config, "1h")
+        assert actual == expected
+        assert '"outcome": "reclaimed"' in actual[1] and '"outcome": "accepted_beyond"' in actual[1]
+
+    def test_nan_bars_match_reference(self, config):
+        bars = _random_walk_bars(10, 7)
+        bars.iloc[::29, bars.columns.get_loc("close")] = np.nan
+        bars.iloc[::41, bars.columns.get_loc("high")] = np.nan
+        actual = _liquidity_json(bars, config, "1h")
+        with patch("market_data_officer.structure.liquidity._detect_sweeps", _reference_sweeps), \
+             patch("market_data_officer.structure.liquidity._detect_reclaim", _reference_reclaim):
+            assert actual == _liquidity_json(bars, config, "1h")
+
+    def test_sweep_on_last_bars_stays_unresolved(self, config):
+        # Re-checking an unresolved level used to fail on tz-aware swept_time
+        bars = _random_walk_bars(40, 1).iloc[:450]
+        swings = detect_swings(bars, config, "1h")
+        levels, sweeps = detect_liquidity(bars, swings, config, "1h")
+        unresolved = [lv for lv in levels if lv.outcome == "unresolved"]
+        assert unresolved and all(lv.status == "swept" for lv in unresolved)
+
+    @pytest.mark.speedup
+    def test_benchmark_15m(self, config):
+        bars = _random_walk_bars(30, 8, freq="15min")
+        swings = detect_swings(bars, config, "15m")
+
+        t0 = time.perf_counter()
+        _, fast = detect_liquidity(bars, swings, config, "15m")
+        fast_time = time.perf_counter() - t0
+        with patch("market_data_officer.structure.liquidity._detect_sweeps", _reference_sweeps):
+            t0 = time.perf_counter()
+            _, slow = detect_liquidity(bars, swings, config, "15m")
+            slow_time = time.perf_counter() - t0
+
+        print(f"\n[bench] detect_liquidity {len(bars)} 15m bars, {len(fast)} sweeps: "
+              f"per-level scan {slow_time * 1000:.0f}ms, single pass {fast_time * 1000:.0f}ms")
+        assert [s.to_dict() for s in fast] == [s.to_dict() for s in slow]
+        assert fast_time * 3 < slow_time
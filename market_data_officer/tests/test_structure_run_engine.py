@@ -0,0 +1,115 @@
+"""Tests for run_engine task fan-out and per-task reporting."""
+
+import json
+import os
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from market_data_officer.feed.export import export_hot_packages
+from market_data_officer.structure.config import StructureConfig
+from market_data_officer.structure.engine import run_engine
+
+INSTRUMENTS = ["EURUSD", "GBPUSD", "XAUUSD"]
+
+
+def _random_walk_bars(periods: int, seed: int, freq: str = "1h") -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = (1.085 + np.cumsum(rng.normal(0, 0.0008, periods))).round(4)
+    idx = pd.date_range(datetime(2026, 1, 5, tzinfo=timezone.utc), periods=periods, freq=freq, tz="UTC")
+    open_ = np.concatenate(([1.085], close[:-1]))
+    return pd.DataFrame({
+        "open": open_,
+        "high": np.maximum(open_, close) + rng.uniform(0, 0.0015, periods).round(4),
+        "low": np.minimum(open_, close) - rng.uniform(0, 0.0015, periods).round(4),
+        "close": close,
+        "volume": 100.0,
+    }, index=idx)
+
+
+@pytest.fixture
+def packages(tmp_path):
+    packages = tmp_path / "packages"
+    for seed, instrument in enumerate(INSTRUMENTS):
+        frames = {"15m": _random_walk_bars(2000, seed, "15min"), "1h": _random_walk_bars(600, seed)}
+        export_hot_packages(frames, instrument, output_dir=packages)
+    return packages
+
+
+@pytest.fixture
+def config():
+    return StructureConfig(timeframes=["15m", "1h"])
+
+
+def _packet_json(packet) -> str:
+    d = packet.to_dict()
+    d.pop("as_of")
+    return json.dumps(d)
+
+
+class TestRunEngine:
+
+    def test_parallel_matches_serial(self, tmp_path, packages, config):
+        serial = run_engine(INSTRUMENTS, config, packages_dir=packages, output_dir=tmp_path / "serial")
+        parallel = run_engine(INSTRUMENTS, config, packages_dir=packages, output_dir=tmp_path / "parallel",
+                              workers=3)
+
+        assert list(parallel) == list(serial) == [f"{i}_{tf}" for i in INSTRUMENTS for tf in ("15m", "1h")]
+        for key, result in parallel.items():
+            assert result.status == "ok"
+            assert _packet_json(result.packet) == _packet_json(serial[key].packet)
+            name = f"{result.instrument.lower()}_{result.timeframe}_structure.json"
+            assert (tmp_path / "parallel" / name).read_text() != ""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_timing_and_peak_rss_reported(self, tmp_path, packages, config, workers):
+        results = run_engine(["EURUSD"], config, packages_dir=packages, output_dir=tmp_path, workers=workers)
+        for result in results.values():
+            assert result.wall_s > 0
+            if os.path.exists("/proc/self/status"):
+                assert result.peak_rss_bytes > 0
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_missing_and_invalid_packages_isolated(self, tmp_path, packages, config, workers):
+        (packages / "GBPUSD_1h_latest.npy").unlink()
+        (packages / "GBPUSD_1h_latest.csv").write_text("timestamp_utc,open,high,low,close,volume\n")
+
+        results = run_engine(["EURUSD", "GBPUSD", "USDJPY"], config, packages_dir=packages,
+                             output_dir=tmp_path / "out", workers=workers)
+
+        assert results["EURUSD_15m"].status == results["EURUSD_1h"].status == "ok"
+        assert results["GBPUSD_15m"].status == "ok"
+        assert results["GBPUSD_1h"].status == "error"
+        assert results["USDJPY_1h"].status == "skipped" and results["USDJPY_1h"].packet is None
+        assert "USDJPY" in results["USDJPY_1h"].error
+        assert len(list((tmp_path / "out").glob("*.json"))) == 3
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_unexpected_exception_isolated(self, tmp_path, packages, config, workers):
+        # Reading a directory raises IsADirectoryError: neither skipped nor invalid bars
+        (packages / "GBPUSD_1h_latest.npy").unlink()
+        (packages / "GBPUSD_1h_latest.csv").unlink()
+        (packages / "GBPUSD_1h_latest.csv").mkdir()
+
+        results = run_engine(INSTRUMENTS, config, packages_dir=packages, output_dir=tmp_path, workers=workers)
+
+        assert {k: r.status for k, r in results.items() if r.status != "ok"} == {"GBPUSD_1h": "failed"}
+        assert results["GBPUSD_1h"].error.startswith("IsADirectoryError")
+        assert results["GBPUSD_1h"].packet is None
+
+@pytest.mark.speedup
+class TestBenchmark:
+
+    @pytest.mark.skipif((os.cpu_count() or 1) < 4, reason="needs at least 4 CPUs")
+    def test_registry_refresh_close_to_slowest_task(self, tmp_path, packages, config):
+        t0 = time.perf_counter()
+        results = run_engine(INSTRUMENTS, config, packages_dir=packages, output_dir=tmp_path, workers=6)
+        total = time.perf_counter() - t0
+
+        task_times = [r.wall_s for r in results.values()]
+        print(f"\n[bench] {len(task_times)} tasks on 6 workers: wall {total * 1000:.0f}ms, "
+              f"slowest task {max(task_times) * 1000:.0f}ms, sum {sum(task_times) * 1000:.0f}ms")
+        assert total < sum(task_times)